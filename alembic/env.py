@@ -11,6 +11,7 @@ import sys
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from src.config import settings
+from src.integrations.odoo.mirror import mirror_metadata
 
 config = context.config
 
@@ -20,7 +21,7 @@ if config.config_file_name is not None:
 # Set the database URL from settings
 config.set_main_option("sqlalchemy.url", settings.database_url)
 
-target_metadata = None
+target_metadata = mirror_metadata
 
 
 def run_migrations_offline() -> None:
@@ -0,0 +1,43 @@
+"""Add the Odoo mirror tables
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-19 00:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0001'
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'odoo_mirror_records',
+        sa.Column('source', sa.String(255), primary_key=True),
+        sa.Column('model', sa.String(128), primary_key=True),
+        sa.Column('record_id', sa.Integer, primary_key=True, autoincrement=False),
+        sa.Column('write_date', sa.String(32)),
+        sa.Column('data', sa.Text, nullable=False),
+    )
+    op.create_table(
+        'odoo_mirror_state',
+        sa.Column('source', sa.String(255), primary_key=True),
+        sa.Column('model', sa.String(128), primary_key=True),
+        sa.Column('fields', sa.Text, nullable=False),
+        sa.Column('last_write_date', sa.String(32)),
+        sa.Column('synced_at', sa.Float),
+        sa.Column('reconciled_at', sa.Float),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('odoo_mirror_state')
+    op.drop_table('odoo_mirror_records')
@@ -0,0 +1,184 @@
+"""
+Benchmark Odoo Operations
+
+Runs FinanceOperations, HROperations, ContractOperations and the agent tools
+against a local fake Odoo server with a deterministic synthetic dataset, and
+reports wall-clock latency, Odoo round trips, bytes on the wire and the
+response compression ratio per operation. No real Odoo server is needed; results are reproducible for a
+given seed, dataset size and injected latency.
+Usage: python scripts/benchmark_odoo_operations.py [--invoices 10000] [--latency 20] [--bandwidth 2000] [--repeat 3]
+"""
+
+import argparse
+import statistics
+import sys
+import os
+import time
+from datetime import date, timedelta
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.config import settings
+from src.integrations.odoo.fake import FakeOdooServer, LatencyModel, ReplayBackend, generate_dataset
+from src.integrations.odoo.tracing import odoo_trace
+from src.integrations.odoo.transport import TRANSPORTS
+from src.core.logging import setup_logging, get_logger
+
+setup_logging(level="WARNING")
+logger = get_logger(__name__)
+
+
+def workloads(client):
+    """
+    Get the operations to benchmark.
+
+    Args:
+        client: OdooClient connected to the fake server
+
+    Returns:
+        List of (label, callable) pairs
+    """
+    from src.integrations.odoo.models.contracts import ContractOperations
+    from src.integrations.odoo.models.finance import FinanceOperations
+    from src.integrations.odoo.models.hr import HROperations
+    from src.agents.contracts import tools as contract_tools
+    from src.agents.finance import tools as finance_tools
+    from src.agents.hr import tools as hr_tools
+
+    finance = FinanceOperations(client)
+    hr = HROperations(client)
+    contracts = ContractOperations(client)
+    today = date.today()
+    quarter_start = (today - timedelta(days=90)).isoformat()
+
+    return [
+        ('finance.financial_summary', finance.get_financial_summary),
+        ('finance.profit_loss', lambda: finance.get_profit_loss(quarter_start, today.isoformat())),
+        ('finance.cash_flow', lambda: finance.get_cash_flow(quarter_start, today.isoformat())),
+        ('finance.expense_breakdown', lambda: finance.get_expense_breakdown(quarter_start, today.isoformat())),
+        ('finance.revenue_breakdown', lambda: finance.get_revenue_breakdown(quarter_start, today.isoformat())),
+        ('finance.all_alerts', finance.get_all_alerts),
+        ('finance.sales_summary', finance.get_sales_summary),
+        ('finance.outstanding_invoices', finance.get_outstanding_invoices),
+        ('finance.receivable_aging', finance.get_aging),
+        ('hr.search_employees', lambda: hr.search_employees(limit=100)),
+        ('hr.employee_statistics', hr.get_employee_statistics),
+        ('hr.pending_leaves', hr.get_pending_leave_requests),
+        ('hr.org_chart', lambda: hr.get_department_org_chart(1)),
+        ('contracts.search', lambda: contracts.search_contracts()),
+        ('contracts.summary', lambda: contracts.get_contract_summary()),
+        ('tool.get_financial_summary', lambda: finance_tools.get_financial_summary.invoke({})),
+        ('tool.get_profit_loss_report', lambda: finance_tools.get_profit_loss_report.invoke({})),
+        ('tool.get_employee_statistics', lambda: hr_tools.get_employee_statistics.invoke({})),
+        ('tool.get_expiring_contracts', lambda: contract_tools.get_expiring_contracts.invoke({'days': 60})),
+    ]
+
+
+def run_workload(client, label: str, func, repeat: int):
+    """
+    Benchmark a single operation.
+
+    Args:
+        client: OdooClient connected to the fake server
+        label: Operation name
+        func: Operation to call
+        repeat: Number of runs
+
+    Returns:
+        Result row
+    """
+    timings = []
+    calls = 0
+    client.transport.stats.reset()
+    for _ in range(repeat):
+        with odoo_trace(label) as trace:
+            started = time.perf_counter()
+            func()
+            timings.append(time.perf_counter() - started)
+        calls = trace.call_count
+    stats = client.transport.stats
+    return {
+        'operation': label,
+        'calls': calls,
+        'bytes_sent': stats.bytes_sent // repeat,
+        'bytes_received': stats.bytes_received // repeat,
+        'ratio': stats.snapshot()['response_compression_ratio'],
+        'median_ms': statistics.median(timings) * 1000,
+        'max_ms': max(timings) * 1000,
+    }
+
+
+def main():
+    """Start a fake Odoo server and benchmark the operations against it."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--invoices', type=int, default=10000, help='Invoices/bills in the dataset')
+    parser.add_argument('--employees', type=int, default=1000, help='Employees in the dataset')
+    parser.add_argument('--contracts', type=int, default=500, help='Contracts in the dataset')
+    parser.add_argument('--seed', type=int, default=42, help='Random seed for the dataset and latency jitter')
+    parser.add_argument('--latency', type=float, default=0.0, help='Injected latency per call in ms')
+    parser.add_argument('--latency-per-row', type=float, default=0.0, help='Injected latency per returned row in ms')
+    parser.add_argument('--bandwidth', type=float, default=0.0, help='Response bandwidth cap in KB/s (0 = unlimited)')
+    parser.add_argument('--no-compression', action='store_true', help='Do not negotiate gzip responses')
+    parser.add_argument('--replay', metavar='PATH', help='Serve responses recorded with --record instead of synthetic data')
+    parser.add_argument('--transport', default='xmlrpc', choices=list(TRANSPORTS), help='Odoo transport')
+    parser.add_argument('--repeat', type=int, default=3, help='Runs per operation')
+    parser.add_argument('--cache', action='store_true', help='Keep the Odoo result cache enabled')
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    dataset = generate_dataset(args.invoices, args.employees, args.contracts, seed=args.seed)
+    print(f"Generated dataset in {time.perf_counter() - started:.1f}s ({sum(dataset.counts().values())} records)")
+
+    backend = None
+    if args.replay:
+        from src.integrations.odoo.fake import DatasetBackend
+        backend = ReplayBackend(args.replay, fallback=DatasetBackend(dataset))
+    latency = None
+    if args.latency or args.latency_per_row or args.bandwidth:
+        latency = LatencyModel(
+            args.latency / 1000, args.latency_per_row / 1000, seed=args.seed, bandwidth=args.bandwidth * 1000
+        )
+
+    with FakeOdooServer(dataset=dataset, backend=backend, latency=latency) as server:
+        # Point the singleton client (used by the agent tools) at the fake server
+        settings.odoo_url = server.url
+        settings.odoo_db = 'fake'
+        settings.odoo_username = 'admin'
+        settings.odoo_password = 'admin'
+        settings.odoo_transport = args.transport
+        settings.odoo_metadata_dir = ''
+        settings.odoo_cache_enabled = args.cache
+        settings.odoo_compression_enabled = not args.no_compression
+
+        from src.integrations.odoo.client import get_odoo_client
+        client = get_odoo_client()
+        client.authenticate()
+
+        print("=" * 100)
+        print(
+            f"Odoo Operations Benchmark - {args.transport}, latency {args.latency:g} ms "
+            f"+ {args.latency_per_row:g} ms/row, "
+            f"{'compressed' if settings.odoo_compression_enabled else 'uncompressed'}, {args.repeat} runs"
+        )
+        print("=" * 100)
+
+        results = []
+        for label, func in workloads(client):
+            try:
+                results.append(run_workload(client, label, func, args.repeat))
+            except Exception as e:
+                print(f"   {label}: FAILED - {e}")
+
+    header = f"{'operation':<34}{'calls':>7}{'sent B':>10}{'recv B':>12}{'ratio':>7}{'median ms':>12}{'max ms':>10}"
+    print(header)
+    print("-" * len(header))
+    for row in results:
+        print(
+            f"{row['operation']:<34}{row['calls']:>7}{row['bytes_sent']:>10}"
+            f"{row['bytes_received']:>12}{row['ratio']:>7.1f}{row['median_ms']:>12.1f}{row['max_ms']:>10.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
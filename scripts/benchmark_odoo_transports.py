@@ -0,0 +1,160 @@
+"""
+Benchmark Odoo Transports
+
+Runs the same finance queries over each Odoo transport and compares bytes on
+the wire, encode/decode time and wall-clock latency.
+Usage: python scripts/benchmark_odoo_transports.py [--repeat 3] [--transports xmlrpc,jsonrpc]
+"""
+
+import argparse
+import sys
+import os
+import time
+from datetime import date
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.config import settings
+from src.integrations.odoo.client import OdooClient, OdooConfig
+from src.integrations.odoo.transport import TRANSPORTS
+from src.core.logging import setup_logging, get_logger
+
+setup_logging(level="WARNING")
+logger = get_logger(__name__)
+
+
+def finance_queries():
+    """
+    Get the finance queries to benchmark.
+
+    Mirrors the reads issued by FinanceOperations (summary and cash flow).
+    """
+    today = date.today()
+    month_start = today.replace(day=1).isoformat()
+    return [
+        (
+            'receivables',
+            'account.move',
+            [
+                ['move_type', '=', 'out_invoice'],
+                ['state', '=', 'posted'],
+                ['payment_state', 'in', ['not_paid', 'partial']]
+            ],
+            {'fields': ['amount_residual'], 'limit': 1000},
+        ),
+        (
+            'invoice_search',
+            'account.move',
+            [['move_type', 'in', ['out_invoice', 'in_invoice']]],
+            {
+                'fields': [
+                    'name', 'partner_id', 'invoice_date', 'invoice_date_due',
+                    'amount_total', 'amount_residual', 'state', 'payment_state'
+                ],
+                'limit': 500,
+            },
+        ),
+        (
+            'cash_flow_lines',
+            'account.move.line',
+            [
+                ['journal_id.type', 'in', ['bank', 'cash']],
+                ['date', '>=', month_start],
+                ['parent_state', '=', 'posted']
+            ],
+            {'fields': ['debit', 'credit', 'balance']},
+        ),
+        (
+            'cash_balance_lines',
+            'account.move.line',
+            [
+                ['journal_id.type', 'in', ['bank', 'cash']],
+                ['parent_state', '=', 'posted']
+            ],
+            {'fields': ['balance'], 'limit': 10000},
+        ),
+    ]
+
+
+def run_transport(name: str, repeat: int):
+    """
+    Benchmark a single transport.
+
+    Args:
+        name: Transport name
+        repeat: Number of runs per query
+
+    Returns:
+        List of result rows, one per query
+    """
+    config = OdooConfig(
+        url=settings.odoo_url,
+        database=settings.odoo_db,
+        username=settings.odoo_username,
+        password=settings.odoo_password,
+        timeout=settings.odoo_timeout,
+        transport=name
+    )
+    client = OdooClient(config)
+    client.authenticate()
+
+    rows = []
+    for label, model, domain, kwargs in finance_queries():
+        client.transport.stats.reset()
+        records = 0
+        started = time.perf_counter()
+        for _ in range(repeat):
+            records = len(client.search_read(model, domain, **kwargs))
+        wall = (time.perf_counter() - started) / repeat
+        stats = client.transport.stats
+        rows.append({
+            'transport': name,
+            'query': label,
+            'records': records,
+            'bytes_sent': stats.bytes_sent // repeat,
+            'bytes_received': stats.bytes_received // repeat,
+            'ratio': stats.snapshot()['response_compression_ratio'],
+            'encode_ms': stats.encode_seconds / repeat * 1000,
+            'decode_ms': stats.decode_seconds / repeat * 1000,
+            'wall_ms': wall * 1000,
+        })
+    client.transport.close()
+    return rows
+
+
+def main():
+    """Benchmark the configured transports against the configured Odoo server."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--repeat', type=int, default=3, help='Runs per query')
+    parser.add_argument(
+        '--transports',
+        default=','.join(TRANSPORTS),
+        help='Comma-separated transports to compare'
+    )
+    args = parser.parse_args()
+
+    print("=" * 100)
+    print(f"Odoo Transport Benchmark - {settings.odoo_url} ({settings.odoo_db})")
+    print("=" * 100)
+
+    results = []
+    for name in args.transports.split(','):
+        try:
+            results.extend(run_transport(name.strip(), args.repeat))
+        except Exception as e:
+            print(f"   {name}: FAILED - {e}")
+
+    header = f"{'transport':<16}{'query':<20}{'records':>9}{'sent B':>10}{'recv B':>12}{'ratio':>7}{'enc ms':>9}{'dec ms':>9}{'wall ms':>10}"
+    print(header)
+    print("-" * len(header))
+    for row in results:
+        print(
+            f"{row['transport']:<16}{row['query']:<20}{row['records']:>9}"
+            f"{row['bytes_sent']:>10}{row['bytes_received']:>12}{row['ratio']:>7.1f}"
+            f"{row['encode_ms']:>9.2f}{row['decode_ms']:>9.2f}{row['wall_ms']:>10.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
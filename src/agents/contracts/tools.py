@@ -12,6 +12,7 @@ from langchain_core.tools import tool
 
 from src.integrations.odoo.client import get_odoo_client
 from src.integrations.odoo.models.contracts import ContractOperations
+from src.integrations.odoo.records import many2one_name
 
 logger = logging.getLogger(__name__)
 
@@ -54,7 +55,7 @@ def search_contracts(
             formatted.append({
                 "id": c.get('id'),
                 "name": c.get('name'),
-                "partner": c.get('partner_id', [None, 'Unknown'])[1] if c.get('partner_id') else 'Unknown',
+                "partner": many2one_name(c.get('partner_id'), 'Unknown'),
                 "start_date": c.get('date_start'),
                 "end_date": c.get('date_end'),
                 "state": c.get('state'),
@@ -80,7 +81,7 @@ def get_contract_details(contract_id: int) -> Dict[str, Any]:
     """
     try:
         ops = _get_contract_ops()
-        contract = ops.get_contract_details(contract_id)
+        contract = ops.get_contract_details(contract_id, profile='agent')
 
         if not contract:
             return {"error": f"Contract with ID {contract_id} not found"}
@@ -88,7 +89,7 @@ def get_contract_details(contract_id: int) -> Dict[str, Any]:
         result = {
             "id": contract.get('id'),
             "name": contract.get('name'),
-            "partner": contract.get('partner_id', [None, 'Unknown'])[1] if contract.get('partner_id') else 'Unknown',
+            "partner": many2one_name(contract.get('partner_id'), 'Unknown'),
             "partner_id": contract.get('partner_id', [None])[0] if contract.get('partner_id') else None,
             "state": contract.get('state'),
             "start_date": contract.get('date_start'),
@@ -146,7 +147,7 @@ def get_expiring_contracts(days: int = 30) -> List[Dict[str, Any]]:
             formatted.append({
                 "id": c.get('id'),
                 "name": c.get('name'),
-                "partner": c.get('partner_id', [None, 'Unknown'])[1] if c.get('partner_id') else 'Unknown',
+                "partner": many2one_name(c.get('partner_id'), 'Unknown'),
                 "end_date": end_date_str,
                 "days_until_expiry": days_until,
                 "urgency": urgency
@@ -49,10 +49,12 @@ Interpret finance queries intelligently:
 ### Report Queries
 - "P&L" / "profit and loss" / "profit report" → get_profit_loss_report()
 - "Cash flow" / "cash position" → get_cash_flow_summary()
+- "AR aging" / "aged receivables" / "AP aging" → get_aging_report()
 - "Expenses breakdown" / "where's the money going" → get_expense_analysis()
 - "Revenue breakdown" / "income sources" → get_revenue_analysis()
 - "أرباح وخسائر" / "تقرير الأرباح" → get_profit_loss_report()
 - "تدفق نقدي" / "الكاش" → get_cash_flow_summary()
+- "أعمار الديون" / "تقادم الذمم" → get_aging_report()
 - "المصروفات" → get_expense_analysis()
 - "الإيرادات" → get_revenue_analysis()
 
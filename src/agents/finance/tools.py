@@ -12,6 +12,7 @@ from langchain_core.tools import tool
 
 from src.integrations.odoo.client import get_odoo_client
 from src.integrations.odoo.models.finance import FinanceOperations
+from src.integrations.odoo.records import many2one_name
 
 logger = logging.getLogger(__name__)
 
@@ -48,7 +49,8 @@ def get_financial_summary() -> Dict[str, Any]:
             "overdue_invoices": {
                 "count": summary.get('overdue_count', 0),
                 "amount": summary.get('overdue_amount', 0)
-            }
+            },
+            "as_of": summary.get('as_of')
         }
 
     except Exception as e:
@@ -102,7 +104,7 @@ def search_invoices(
             {
                 "id": inv.get('id'),
                 "number": inv.get('name'),
-                "partner": inv.get('partner_id', [None, 'N/A'])[1] if inv.get('partner_id') else 'N/A',
+                "partner": many2one_name(inv.get('partner_id')),
                 "date": inv.get('invoice_date'),
                 "due_date": inv.get('invoice_date_due'),
                 "total": inv.get('amount_total', 0),
@@ -139,7 +141,7 @@ def get_invoice_details(invoice_id: int) -> Dict[str, Any]:
     """
     try:
         ops = _get_finance_ops()
-        invoice = ops.get_invoice_details(invoice_id)
+        invoice = ops.get_invoice_details(invoice_id, profile='agent')
 
         if not invoice:
             return {"error": f"Invoice with ID {invoice_id} not found"}
@@ -147,7 +149,7 @@ def get_invoice_details(invoice_id: int) -> Dict[str, Any]:
         result = {
             "id": invoice.get('id'),
             "number": invoice.get('name'),
-            "partner": invoice.get('partner_id', [None, 'N/A'])[1] if invoice.get('partner_id') else 'N/A',
+            "partner": many2one_name(invoice.get('partner_id')),
             "date": invoice.get('invoice_date'),
             "due_date": invoice.get('invoice_date_due'),
             "total": invoice.get('amount_total', 0),
@@ -202,7 +204,7 @@ def get_outstanding_invoices(days_overdue: int = 0) -> List[Dict[str, Any]]:
             {
                 "id": inv.get('id'),
                 "number": inv.get('name'),
-                "customer": inv.get('partner_id', [None, 'Unknown'])[1] if inv.get('partner_id') else 'Unknown',
+                "customer": many2one_name(inv.get('partner_id'), 'Unknown'),
                 "invoice_date": inv.get('invoice_date'),
                 "due_date": inv.get('invoice_date_due'),
                 "total": inv.get('amount_total', 0),
@@ -218,6 +220,59 @@ def get_outstanding_invoices(days_overdue: int = 0) -> List[Dict[str, Any]]:
         return [{"error": str(e)}]
 
 
+@tool
+def get_aging_report(
+    kind: str = "receivable",
+    as_of: Optional[str] = None,
+    limit: int = 15
+) -> Dict[str, Any]:
+    """
+    Get an aging report of open receivables or payables.
+
+    Use this tool when the user asks about:
+    - AR/AP aging or aged receivables/payables
+    - How old unpaid customer invoices or vendor bills are
+    - Which customers or vendors have the most overdue balance
+    - Amounts 30/60/90+ days past due
+
+    Args:
+        kind: "receivable" (customer invoices) or "payable" (vendor bills)
+        as_of: Day to age against (YYYY-MM-DD). Defaults to today.
+        limit: Maximum partners listed, largest balance first
+
+    Returns:
+        Amounts per bucket (current, 1-30, 31-60, 61-90, 90+) by currency and by partner
+    """
+    try:
+        ops = _get_finance_ops()
+        aging = ops.get_aging(kind=kind, as_of=as_of, limit=limit)
+        if aging.get('error'):
+            return {"error": aging['error']}
+
+        return {
+            "kind": aging['kind'],
+            "as_of": aging['as_of'],
+            "open_items": aging['item_count'],
+            "partners": aging['partner_count'],
+            "by_currency": aging['by_currency'],
+            "top_partners": [
+                {
+                    "partner": p['partner'],
+                    "currency": p['currency'],
+                    "total": p['total'],
+                    "overdue": p['overdue'],
+                    "buckets": p['buckets'],
+                    "max_days_past_due": p['max_days_past_due']
+                }
+                for p in aging['by_partner']
+            ]
+        }
+
+    except Exception as e:
+        logger.error(f"Error getting aging report: {e}")
+        return {"error": str(e)}
+
+
 # ==================== Payment Tools ====================
 
 @tool
@@ -261,11 +316,11 @@ def search_payments(
             {
                 "id": pay.get('id'),
                 "reference": pay.get('name'),
-                "partner": pay.get('partner_id', [None, 'N/A'])[1] if pay.get('partner_id') else 'N/A',
+                "partner": many2one_name(pay.get('partner_id')),
                 "amount": pay.get('amount', 0),
                 "date": pay.get('date'),
                 "type": "Received" if pay.get('payment_type') == 'inbound' else "Sent",
-                "journal": pay.get('journal_id', [None, 'N/A'])[1] if pay.get('journal_id') else 'N/A',
+                "journal": many2one_name(pay.get('journal_id')),
                 "status": pay.get('state')
             }
             for pay in payments
@@ -293,7 +348,7 @@ def get_payment_details(payment_id: int) -> Dict[str, Any]:
     """
     try:
         ops = _get_finance_ops()
-        payment = ops.get_payment_details(payment_id)
+        payment = ops.get_payment_details(payment_id, profile='agent')
 
         if not payment:
             return {"error": f"Payment with ID {payment_id} not found"}
@@ -301,11 +356,11 @@ def get_payment_details(payment_id: int) -> Dict[str, Any]:
         result = {
             "id": payment.get('id'),
             "reference": payment.get('name'),
-            "partner": payment.get('partner_id', [None, 'N/A'])[1] if payment.get('partner_id') else 'N/A',
+            "partner": many2one_name(payment.get('partner_id')),
             "amount": payment.get('amount', 0),
             "date": payment.get('date'),
             "type": "Received" if payment.get('payment_type') == 'inbound' else "Sent",
-            "journal": payment.get('journal_id', [None, 'N/A'])[1] if payment.get('journal_id') else 'N/A',
+            "journal": many2one_name(payment.get('journal_id')),
             "status": payment.get('state'),
             "related_invoices": payment.get('related_invoices', [])
         }
@@ -322,7 +377,8 @@ def get_payment_details(payment_id: int) -> Dict[str, Any]:
 @tool
 def get_profit_loss_report(
     date_from: Optional[str] = None,
-    date_to: Optional[str] = None
+    date_to: Optional[str] = None,
+    compare: Optional[List[str]] = None
 ) -> Dict[str, Any]:
     """
     Get Profit & Loss report.
@@ -333,19 +389,21 @@ def get_profit_loss_report(
     - Revenue vs expenses
     - How profitable the company is
     - Monthly/quarterly earnings
+    - Profit compared with last month/quarter or the same period last year
 
     Args:
         date_from: Start date (YYYY-MM-DD). Defaults to start of current month.
         date_to: End date (YYYY-MM-DD). Defaults to today.
+        compare: Periods to compare with: "previous_period" and/or "previous_year"
 
     Returns:
         P&L summary with revenue and expense breakdown
     """
     try:
         ops = _get_finance_ops()
-        pl = ops.get_profit_loss(date_from=date_from, date_to=date_to)
+        pl = ops.get_profit_loss(date_from=date_from, date_to=date_to, compare=compare)
 
-        return {
+        report = {
             "period": {
                 "from": pl.get('date_from'),
                 "to": pl.get('date_to')
@@ -355,8 +413,18 @@ def get_profit_loss_report(
             "net_profit": pl.get('net_profit', 0),
             "profit_margin": round(pl.get('net_profit', 0) / pl.get('total_revenue', 1) * 100, 1) if pl.get('total_revenue', 0) > 0 else 0,
             "revenue_breakdown": pl.get('revenue_breakdown', [])[:10],  # Top 10
-            "expense_breakdown": pl.get('expense_breakdown', [])[:10]   # Top 10
+            "expense_breakdown": pl.get('expense_breakdown', [])[:10],  # Top 10
+            "sections": [
+                {"name": section['name'], "amount": section['amount']}
+                for section in pl.get('sections', [])
+            ]
         }
+        if pl.get('comparisons'):
+            report["comparisons"] = pl['comparisons']
+        if pl.get('error'):
+            report["error"] = pl['error']
+
+        return report
 
     except Exception as e:
         logger.error(f"Error getting P&L report: {e}")
@@ -366,7 +434,8 @@ def get_profit_loss_report(
 @tool
 def get_cash_flow_summary(
     date_from: Optional[str] = None,
-    date_to: Optional[str] = None
+    date_to: Optional[str] = None,
+    granularity: str = "month"
 ) -> Dict[str, Any]:
     """
     Get cash flow summary.
@@ -377,17 +446,19 @@ def get_cash_flow_summary(
     - Money coming in/going out
     - Bank balance
     - Liquidity
+    - Cash trend per day, week or month
 
     Args:
         date_from: Start date (YYYY-MM-DD). Defaults to start of current month.
         date_to: End date (YYYY-MM-DD). Defaults to today.
+        granularity: Period of the trend series: "day", "week" or "month"
 
     Returns:
-        Cash flow with inflows, outflows, and balance by account
+        Cash flow with inflows, outflows, a running-balance series, and totals by account
     """
     try:
         ops = _get_finance_ops()
-        cf = ops.get_cash_flow(date_from=date_from, date_to=date_to)
+        cf = ops.get_cash_flow(date_from=date_from, date_to=date_to, granularity=granularity)
 
         return {
             "period": {
@@ -397,8 +468,13 @@ def get_cash_flow_summary(
             "total_inflows": cf.get('total_inflows', 0),
             "total_outflows": cf.get('total_outflows', 0),
             "net_cash_flow": cf.get('net_cash_flow', 0),
+            "opening_balance": cf.get('opening_balance', 0),
             "current_balance": cf.get('current_balance', 0),
-            "by_account": cf.get('by_journal', [])
+            "series": cf.get('series', []),
+            "by_account": [
+                {k: v for k, v in journal.items() if k != 'series'}
+                for journal in cf.get('by_journal', [])
+            ]
         }
 
     except Exception as e:
@@ -525,7 +601,7 @@ def get_journal_entries(
                 "id": entry.get('id'),
                 "number": entry.get('name'),
                 "date": entry.get('date'),
-                "journal": entry.get('journal_id', [None, 'N/A'])[1] if entry.get('journal_id') else 'N/A',
+                "journal": many2one_name(entry.get('journal_id')),
                 "reference": entry.get('ref'),
                 "amount": entry.get('amount_total', 0),
                 "status": entry.get('state')
@@ -710,9 +786,9 @@ def search_sales_orders(
             {
                 "id": order.get('id'),
                 "number": order.get('name'),
-                "customer": order.get('partner_id', [None, 'N/A'])[1] if order.get('partner_id') else 'N/A',
+                "customer": many2one_name(order.get('partner_id')),
                 "date": order.get('date_order'),
-                "salesperson": order.get('user_id', [None, 'N/A'])[1] if order.get('user_id') else 'N/A',
+                "salesperson": many2one_name(order.get('user_id')),
                 "total": order.get('amount_total', 0),
                 "status": order.get('state'),
                 "invoice_status": order.get('invoice_status')
@@ -743,7 +819,7 @@ def get_sales_order_details(order_id: int) -> Dict[str, Any]:
     """
     try:
         ops = _get_finance_ops()
-        order = ops.get_sales_order_details(order_id)
+        order = ops.get_sales_order_details(order_id, profile='agent')
 
         if not order:
             return {"error": f"Sales order with ID {order_id} not found"}
@@ -751,9 +827,9 @@ def get_sales_order_details(order_id: int) -> Dict[str, Any]:
         return {
             "id": order.get('id'),
             "number": order.get('name'),
-            "customer": order.get('partner_id', [None, 'N/A'])[1] if order.get('partner_id') else 'N/A',
+            "customer": many2one_name(order.get('partner_id')),
             "date": order.get('date_order'),
-            "salesperson": order.get('user_id', [None, 'N/A'])[1] if order.get('user_id') else 'N/A',
+            "salesperson": many2one_name(order.get('user_id')),
             "total": order.get('amount_total', 0),
             "subtotal": order.get('amount_untaxed', 0),
             "tax": order.get('amount_tax', 0),
@@ -867,6 +943,7 @@ finance_tools = [
     # Reports
     get_profit_loss_report,
     get_cash_flow_summary,
+    get_aging_report,
     get_expense_analysis,
     get_revenue_analysis,
     # Journals
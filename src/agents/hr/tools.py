@@ -12,6 +12,7 @@ from langchain_core.tools import tool
 
 from src.integrations.odoo.client import get_odoo_client
 from src.integrations.odoo.models.hr import HROperations
+from src.integrations.odoo.records import many2one_name
 
 logger = logging.getLogger(__name__)
 
@@ -52,8 +53,8 @@ def search_employees(
                 "name": e.get('name'),
                 "email": e.get('work_email'),
                 "phone": e.get('work_phone'),
-                "department": e.get('department_id', [None, 'N/A'])[1] if e.get('department_id') else 'N/A',
-                "job_title": e.get('job_id', [None, 'N/A'])[1] if e.get('job_id') else 'N/A',
+                "department": many2one_name(e.get('department_id')),
+                "job_title": many2one_name(e.get('job_id')),
             }
             for e in employees
         ]
@@ -76,7 +77,7 @@ def get_employee_details(employee_id: int) -> Dict[str, Any]:
     """
     try:
         ops = _get_hr_ops()
-        employee = ops.get_employee_details(employee_id)
+        employee = ops.get_employee_details(employee_id, profile='agent')
 
         if not employee:
             return {"error": f"Employee with ID {employee_id} not found"}
@@ -87,9 +88,9 @@ def get_employee_details(employee_id: int) -> Dict[str, Any]:
             "work_email": employee.get('work_email'),
             "work_phone": employee.get('work_phone'),
             "mobile": employee.get('mobile_phone'),
-            "department": employee.get('department_id', [None, 'N/A'])[1] if employee.get('department_id') else 'N/A',
-            "job_title": employee.get('job_id', [None, 'N/A'])[1] if employee.get('job_id') else 'N/A',
-            "manager": employee.get('parent_id', [None, 'N/A'])[1] if employee.get('parent_id') else 'N/A',
+            "department": many2one_name(employee.get('department_id')),
+            "job_title": many2one_name(employee.get('job_id')),
+            "manager": many2one_name(employee.get('parent_id')),
         }
 
         return result
@@ -119,8 +120,8 @@ def get_pending_leave_requests(
         return [
             {
                 "id": r.get('id'),
-                "employee": r.get('employee_id', [None, 'Unknown'])[1] if r.get('employee_id') else 'Unknown',
-                "leave_type": r.get('holiday_status_id', [None, 'Unknown'])[1] if r.get('holiday_status_id') else 'Unknown',
+                "employee": many2one_name(r.get('employee_id'), 'Unknown'),
+                "leave_type": many2one_name(r.get('holiday_status_id'), 'Unknown'),
                 "date_from": r.get('date_from'),
                 "date_to": r.get('date_to'),
                 "days": r.get('number_of_days'),
@@ -175,7 +176,7 @@ def get_departments() -> List[Dict[str, Any]]:
             {
                 "id": d.get('id'),
                 "name": d.get('name'),
-                "manager": d.get('manager_id', [None, 'N/A'])[1] if d.get('manager_id') else 'N/A'
+                "manager": many2one_name(d.get('manager_id'))
             }
             for d in departments
         ]
@@ -201,7 +202,7 @@ def get_job_positions() -> List[Dict[str, Any]]:
             {
                 "id": j.get('id'),
                 "name": j.get('name'),
-                "department": j.get('department_id', [None, 'N/A'])[1] if j.get('department_id') else 'N/A',
+                "department": many2one_name(j.get('department_id')),
             }
             for j in jobs
         ]
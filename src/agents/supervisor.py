@@ -5,6 +5,7 @@ Direct multi-agent system without complex state management.
 """
 
 from typing import Optional, Dict, Any, List
+import asyncio
 import logging
 
 from langchain_google_genai import ChatGoogleGenerativeAI
@@ -18,6 +19,8 @@ from src.agents.hr.tools import hr_tools
 from src.agents.finance.prompts import get_finance_prompt
 from src.agents.finance.tools import finance_tools
 from src.agents.executive.prompts import get_executive_prompt
+from src.integrations.odoo.resilience import odoo_deadline
+from src.integrations.odoo.tracing import odoo_trace
 
 logger = logging.getLogger(__name__)
 
@@ -224,7 +227,11 @@ async def process_with_agent(
                 for tool in tools:
                     if tool.name == tool_name:
                         try:
-                            result = tool.invoke(tool_args)
+                            # Tools call the sync Odoo client; run them off the event loop
+                            # (the trace, deadline and tenant context carry over)
+                            with odoo_trace(f"tool:{tool_name}"), \
+                                    odoo_deadline(settings.odoo_tool_deadline):
+                                result = await asyncio.to_thread(tool.invoke, tool_args)
                             tool_results.append(f"{tool_name} result:\n{result}")
                         except Exception as e:
                             tool_results.append(f"{tool_name} error: {str(e)}")
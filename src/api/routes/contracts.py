@@ -9,7 +9,7 @@ from fastapi import APIRouter, HTTPException, Query
 from pydantic import BaseModel
 import logging
 
-from src.integrations.odoo.client import get_odoo_client
+from src.integrations.odoo.async_client import AsyncOperations
 from src.integrations.odoo.models.contracts import ContractOperations
 
 router = APIRouter(prefix="/api/v1/contracts", tags=["Contracts"])
@@ -33,9 +33,9 @@ class ContractUpdate(BaseModel):
     state: Optional[str] = None
 
 
-def get_contract_ops() -> ContractOperations:
+def get_contract_ops() -> AsyncOperations:
     """Get contract operations instance."""
-    return ContractOperations(get_odoo_client())
+    return AsyncOperations(ContractOperations)
 
 
 @router.get("")
@@ -47,7 +47,7 @@ async def list_contracts(
     """List contracts with optional filters."""
     try:
         ops = get_contract_ops()
-        contracts = ops.search_contracts(
+        contracts = await ops.search_contracts(
             partner_name=partner_name,
             state=state,
             limit=limit
@@ -65,7 +65,7 @@ async def get_expiring_contracts(
     """Get contracts expiring within the specified number of days."""
     try:
         ops = get_contract_ops()
-        contracts = ops.get_expiring_contracts(days=days)
+        contracts = await ops.get_expiring_contracts(days=days)
         result = {
             "contracts": contracts,
             "count": len(contracts),
@@ -85,7 +85,7 @@ async def get_contract_summary():
     """Get contract summary statistics."""
     try:
         ops = get_contract_ops()
-        summary = ops.get_contract_summary()
+        summary = await ops.get_contract_summary()
         return summary
     except Exception as e:
         logger.error(f"Error getting summary: {e}")
@@ -97,7 +97,7 @@ async def get_contract(contract_id: int):
     """Get detailed information about a specific contract."""
     try:
         ops = get_contract_ops()
-        contract = ops.get_contract_details(contract_id)
+        contract = await ops.get_contract_details(contract_id)
         if not contract:
             raise HTTPException(status_code=404, detail="Contract not found")
         return contract
@@ -113,7 +113,7 @@ async def create_contract(contract: ContractCreate):
     """Create a new contract."""
     try:
         ops = get_contract_ops()
-        result = ops.create_contract(
+        result = await ops.create_contract(
             name=contract.name,
             partner_id=contract.partner_id,
             date_start=contract.date_start,
@@ -145,7 +145,7 @@ async def update_contract(contract_id: int, contract: ContractUpdate):
         if not updates:
             raise HTTPException(status_code=400, detail="No updates provided")
 
-        success = ops.update_contract(contract_id, updates)
+        success = await ops.update_contract(contract_id, updates)
         return {"success": success}
     except HTTPException:
         raise
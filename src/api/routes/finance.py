@@ -9,7 +9,7 @@ from fastapi import APIRouter, HTTPException, Query
 from pydantic import BaseModel
 import logging
 
-from src.integrations.odoo.client import get_odoo_client
+from src.integrations.odoo.async_client import AsyncOperations
 from src.integrations.odoo.models.finance import FinanceOperations
 
 router = APIRouter(prefix="/api/v1/finance", tags=["Finance"])
@@ -38,9 +38,9 @@ class JournalEntryCreate(BaseModel):
 
 # ==================== Helper Functions ====================
 
-def get_finance_ops() -> FinanceOperations:
+def get_finance_ops() -> AsyncOperations:
     """Get finance operations instance."""
-    return FinanceOperations(get_odoo_client())
+    return AsyncOperations(FinanceOperations)
 
 
 # ==================== Summary Endpoints ====================
@@ -54,7 +54,7 @@ async def get_financial_summary():
     """
     try:
         ops = get_finance_ops()
-        summary = ops.get_financial_summary()
+        summary = await ops.get_financial_summary()
         return summary
     except Exception as e:
         logger.error(f"Error getting financial summary: {e}")
@@ -74,7 +74,7 @@ async def get_all_alerts(
     """
     try:
         ops = get_finance_ops()
-        alerts = ops.get_all_alerts(
+        alerts = await ops.get_all_alerts(
             overdue_threshold=overdue_threshold,
             cash_threshold=cash_threshold,
             transaction_threshold=transaction_threshold
@@ -108,7 +108,7 @@ async def list_invoices(
     """List invoices with optional filters."""
     try:
         ops = get_finance_ops()
-        invoices = ops.search_invoices(
+        invoices = await ops.search_invoices(
             partner_name=partner_name,
             state=state,
             move_type=move_type,
@@ -130,7 +130,7 @@ async def get_outstanding_invoices(
     """Get unpaid or overdue invoices."""
     try:
         ops = get_finance_ops()
-        invoices = ops.get_outstanding_invoices(days_overdue=days_overdue)
+        invoices = await ops.get_outstanding_invoices(days_overdue=days_overdue)
 
         total_amount = sum(inv.get('amount_residual', 0) for inv in invoices)
 
@@ -149,7 +149,7 @@ async def get_invoice(invoice_id: int):
     """Get detailed invoice information."""
     try:
         ops = get_finance_ops()
-        invoice = ops.get_invoice_details(invoice_id)
+        invoice = await ops.get_invoice_details(invoice_id)
 
         if not invoice:
             raise HTTPException(status_code=404, detail="Invoice not found")
@@ -175,7 +175,7 @@ async def list_payments(
     """List payment records with optional filters."""
     try:
         ops = get_finance_ops()
-        payments = ops.search_payments(
+        payments = await ops.search_payments(
             partner_name=partner_name,
             payment_type=payment_type,
             date_from=date_from,
@@ -193,7 +193,7 @@ async def get_payment(payment_id: int):
     """Get detailed payment information."""
     try:
         ops = get_finance_ops()
-        payment = ops.get_payment_details(payment_id)
+        payment = await ops.get_payment_details(payment_id)
 
         if not payment:
             raise HTTPException(status_code=404, detail="Payment not found")
@@ -211,13 +211,24 @@ async def get_payment(payment_id: int):
 @router.get("/reports/profit-loss")
 async def get_profit_loss_report(
     date_from: Optional[str] = Query(None, description="Start date (YYYY-MM-DD)"),
-    date_to: Optional[str] = Query(None, description="End date (YYYY-MM-DD)")
+    date_to: Optional[str] = Query(None, description="End date (YYYY-MM-DD)"),
+    compare: Optional[str] = Query(
+        None, description="Comparison periods, comma-separated (previous_period, previous_year)"
+    ),
+    partner_id: Optional[int] = Query(None, description="Only count journal items of this partner")
 ):
     """Get Profit & Loss report."""
     try:
         ops = get_finance_ops()
-        report = ops.get_profit_loss(date_from=date_from, date_to=date_to)
+        report = await ops.get_profit_loss(
+            date_from=date_from,
+            date_to=date_to,
+            compare=[name.strip() for name in compare.split(',') if name.strip()] if compare else None,
+            partner_id=partner_id
+        )
         return report
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         logger.error(f"Error getting P&L report: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -226,18 +237,39 @@ async def get_profit_loss_report(
 @router.get("/reports/cash-flow")
 async def get_cash_flow_report(
     date_from: Optional[str] = Query(None, description="Start date (YYYY-MM-DD)"),
-    date_to: Optional[str] = Query(None, description="End date (YYYY-MM-DD)")
+    date_to: Optional[str] = Query(None, description="End date (YYYY-MM-DD)"),
+    granularity: str = Query("month", description="Series period: day, week or month")
 ):
-    """Get cash flow report."""
+    """Get cash flow report with a running-balance series."""
     try:
         ops = get_finance_ops()
-        report = ops.get_cash_flow(date_from=date_from, date_to=date_to)
+        report = await ops.get_cash_flow(date_from=date_from, date_to=date_to, granularity=granularity)
         return report
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         logger.error(f"Error getting cash flow report: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.get("/reports/aging")
+async def get_aging_report(
+    kind: str = Query("receivable", description="receivable or payable"),
+    as_of: Optional[str] = Query(None, description="Day to age against (YYYY-MM-DD)"),
+    limit: Optional[int] = Query(None, ge=1, description="Maximum partners, largest balance first")
+):
+    """Get receivable or payable aging by partner and currency."""
+    try:
+        ops = get_finance_ops()
+        report = await ops.get_aging(kind=kind, as_of=as_of, limit=limit)
+        return report
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.error(f"Error getting aging report: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
 @router.get("/reports/expenses")
 async def get_expense_report(
     date_from: Optional[str] = Query(None, description="Start date (YYYY-MM-DD)"),
@@ -246,7 +278,7 @@ async def get_expense_report(
     """Get expense breakdown report."""
     try:
         ops = get_finance_ops()
-        report = ops.get_expense_breakdown(date_from=date_from, date_to=date_to)
+        report = await ops.get_expense_breakdown(date_from=date_from, date_to=date_to)
         return report
     except Exception as e:
         logger.error(f"Error getting expense report: {e}")
@@ -261,7 +293,7 @@ async def get_revenue_report(
     """Get revenue breakdown report."""
     try:
         ops = get_finance_ops()
-        report = ops.get_revenue_breakdown(date_from=date_from, date_to=date_to)
+        report = await ops.get_revenue_breakdown(date_from=date_from, date_to=date_to)
         return report
     except Exception as e:
         logger.error(f"Error getting revenue report: {e}")
@@ -277,7 +309,7 @@ async def list_journals(
     """List accounting journals."""
     try:
         ops = get_finance_ops()
-        journals = ops.get_journals(journal_type=journal_type)
+        journals = await ops.get_journals(journal_type=journal_type)
         return {"journals": journals, "count": len(journals)}
     except Exception as e:
         logger.error(f"Error listing journals: {e}")
@@ -294,7 +326,7 @@ async def list_journal_entries(
     """List journal entries."""
     try:
         ops = get_finance_ops()
-        entries = ops.search_journal_entries(
+        entries = await ops.search_journal_entries(
             journal_id=journal_id,
             date_from=date_from,
             date_to=date_to,
@@ -328,7 +360,7 @@ async def create_journal_entry(entry: JournalEntryCreate):
             for line in entry.lines
         ]
 
-        result = ops.create_journal_entry(
+        result = await ops.create_journal_entry(
             journal_id=entry.journal_id,
             date=entry.date,
             ref=entry.reference,
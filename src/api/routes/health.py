@@ -8,7 +8,9 @@ from fastapi import APIRouter
 from datetime import datetime
 
 from src.config import settings
-from src.integrations.odoo.client import get_odoo_client
+from src.integrations.odoo.async_client import get_async_odoo_client
+from src.integrations.odoo.ledger import get_odoo_ledger
+from src.integrations.odoo.mirror import get_odoo_mirror
 
 router = APIRouter(prefix="/health", tags=["Health"])
 
@@ -34,17 +36,31 @@ async def detailed_health_check():
     }
 
     # Check Odoo connection
+    client = get_async_odoo_client()
+    breaker = client.breaker_stats()
     try:
-        client = get_odoo_client()
-        version = client.get_version()
+        version = await client.get_version()
         health["components"]["odoo"] = {
             "status": "healthy",
-            "version": version.get("server_version", "unknown")
+            "version": version.get("server_version", "unknown"),
+            "circuit_breaker": breaker,
+            "cache": client.cache_stats(),
+            "coalescing": client.coalescing_stats()
         }
+        mirror = get_odoo_mirror(client.config)
+        if mirror is not None:
+            health["components"]["odoo"]["mirror"] = mirror.status()
+        ledger = get_odoo_ledger(client.config)
+        if ledger is not None:
+            health["components"]["odoo"]["ledger"] = ledger.status()
+        if breaker.get("state", "closed") != "closed":
+            health["components"]["odoo"]["status"] = "recovering"
+            health["status"] = "degraded"
     except Exception as e:
         health["components"]["odoo"] = {
             "status": "unhealthy",
-            "error": str(e)
+            "error": str(e),
+            "circuit_breaker": breaker
         }
         health["status"] = "degraded"
 
@@ -4,12 +4,12 @@ HR Routes
 REST API endpoints for HR operations.
 """
 
-from typing import Optional
+from typing import List, Optional
 from fastapi import APIRouter, HTTPException, Query
 from pydantic import BaseModel
 import logging
 
-from src.integrations.odoo.client import get_odoo_client
+from src.integrations.odoo.async_client import AsyncOperations
 from src.integrations.odoo.models.hr import HROperations
 
 router = APIRouter(prefix="/api/v1", tags=["HR"])
@@ -25,9 +25,15 @@ class LeaveRequest(BaseModel):
     description: Optional[str] = None
 
 
-def get_hr_ops() -> HROperations:
+class LeaveBatchRequest(BaseModel):
+    """Bulk leave approval/rejection model."""
+    leave_ids: List[int]
+    reason: Optional[str] = None
+
+
+def get_hr_ops() -> AsyncOperations:
     """Get HR operations instance."""
-    return HROperations(get_odoo_client())
+    return AsyncOperations(HROperations)
 
 
 # ==================== Employee Endpoints ====================
@@ -41,7 +47,7 @@ async def list_employees(
     """List employees with optional filters."""
     try:
         ops = get_hr_ops()
-        employees = ops.search_employees(
+        employees = await ops.search_employees(
             department=department,
             job_title=job_title,
             limit=limit
@@ -57,7 +63,7 @@ async def get_employee(employee_id: int):
     """Get detailed information about a specific employee."""
     try:
         ops = get_hr_ops()
-        employee = ops.get_employee_details(employee_id)
+        employee = await ops.get_employee_details(employee_id)
         if not employee:
             raise HTTPException(status_code=404, detail="Employee not found")
         return employee
@@ -78,7 +84,7 @@ async def list_leaves(
     """List leave requests."""
     try:
         ops = get_hr_ops()
-        leaves = ops.get_pending_leave_requests(department_id=department_id)
+        leaves = await ops.get_pending_leave_requests(department_id=department_id)
 
         if state:
             leaves = [l for l in leaves if l.get("state") == state]
@@ -94,7 +100,7 @@ async def create_leave(request: LeaveRequest):
     """Create a new leave request."""
     try:
         ops = get_hr_ops()
-        result = ops.create_leave_request(
+        result = await ops.create_leave_request(
             employee_id=request.employee_id,
             leave_type_id=request.leave_type_id,
             date_from=request.date_from,
@@ -107,12 +113,34 @@ async def create_leave(request: LeaveRequest):
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.post("/leaves/approve")
+async def approve_leaves(request: LeaveBatchRequest):
+    """Approve many leave requests at once."""
+    try:
+        ops = get_hr_ops()
+        return await ops.approve_leave_requests(request.leave_ids)
+    except Exception as e:
+        logger.error(f"Error approving leaves {request.leave_ids}: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.post("/leaves/reject")
+async def reject_leaves(request: LeaveBatchRequest):
+    """Reject many leave requests at once."""
+    try:
+        ops = get_hr_ops()
+        return await ops.reject_leave_requests(request.leave_ids, reason=request.reason)
+    except Exception as e:
+        logger.error(f"Error rejecting leaves {request.leave_ids}: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
 @router.post("/leaves/{leave_id}/approve")
 async def approve_leave(leave_id: int):
     """Approve a leave request."""
     try:
         ops = get_hr_ops()
-        success = ops.approve_leave_request(leave_id)
+        success = await ops.approve_leave_request(leave_id)
         return {"success": success}
     except Exception as e:
         logger.error(f"Error approving leave {leave_id}: {e}")
@@ -124,7 +152,7 @@ async def reject_leave(leave_id: int, reason: Optional[str] = None):
     """Reject a leave request."""
     try:
         ops = get_hr_ops()
-        success = ops.reject_leave_request(leave_id, reason=reason)
+        success = await ops.reject_leave_request(leave_id, reason=reason)
         return {"success": success}
     except Exception as e:
         logger.error(f"Error rejecting leave {leave_id}: {e}")
@@ -136,7 +164,7 @@ async def get_leave_types():
     """Get available leave types."""
     try:
         ops = get_hr_ops()
-        types = ops.get_leave_types()
+        types = await ops.get_leave_types()
         return {"leave_types": types}
     except Exception as e:
         logger.error(f"Error getting leave types: {e}")
@@ -148,7 +176,7 @@ async def get_leave_balance(employee_id: int):
     """Get leave balance for an employee."""
     try:
         ops = get_hr_ops()
-        balance = ops.get_leave_balance(employee_id)
+        balance = await ops.get_leave_balance(employee_id)
         return balance
     except Exception as e:
         logger.error(f"Error getting leave balance: {e}")
@@ -162,7 +190,7 @@ async def list_departments():
     """List all departments."""
     try:
         ops = get_hr_ops()
-        departments = ops.get_departments()
+        departments = await ops.get_departments()
         return {"departments": departments, "count": len(departments)}
     except Exception as e:
         logger.error(f"Error listing departments: {e}")
@@ -174,7 +202,7 @@ async def get_department_org_chart(department_id: int):
     """Get organizational chart for a department."""
     try:
         ops = get_hr_ops()
-        org_chart = ops.get_department_org_chart(department_id)
+        org_chart = await ops.get_department_org_chart(department_id)
         return org_chart
     except Exception as e:
         logger.error(f"Error getting org chart: {e}")
@@ -192,7 +220,7 @@ async def list_applicants(
     """List job applicants."""
     try:
         ops = get_hr_ops()
-        applicants = ops.search_applicants(
+        applicants = await ops.search_applicants(
             job_id=job_id,
             stage=stage,
             limit=limit
@@ -208,7 +236,7 @@ async def list_jobs(published_only: bool = Query(True)):
     """List job positions."""
     try:
         ops = get_hr_ops()
-        jobs = ops.get_job_positions(published_only=published_only)
+        jobs = await ops.get_job_positions(published_only=published_only)
         return {"jobs": jobs, "count": len(jobs)}
     except Exception as e:
         logger.error(f"Error listing jobs: {e}")
@@ -226,7 +254,7 @@ async def get_attendance(
     """Get attendance summary for an employee."""
     try:
         ops = get_hr_ops()
-        summary = ops.get_attendance_summary(
+        summary = await ops.get_attendance_summary(
             employee_id=employee_id,
             date_from=date_from,
             date_to=date_to
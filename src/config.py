@@ -5,7 +5,7 @@ Centralized configuration using Pydantic Settings with environment variable supp
 """
 
 from functools import lru_cache
-from typing import Optional
+from typing import Any, Dict, List, Optional
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -25,6 +25,65 @@ class Settings(BaseSettings):
     odoo_username: str = ""
     odoo_password: str = ""
     odoo_timeout: int = 30
+    odoo_max_connections: int = 20
+    odoo_idle_timeout: float = 60.0
+    odoo_transport: str = "xmlrpc"  # xmlrpc, jsonrpc or jsonrpc-session
+    odoo_compression_enabled: bool = True  # accept gzip/deflate responses
+    odoo_request_compression_min_bytes: int = 0  # gzip larger request bodies; 0 = never (needs an inflating proxy)
+
+    # Odoo Result Cache
+    odoo_cache_enabled: bool = True
+    odoo_cache_max_entries: int = 2048
+    odoo_cache_default_ttl: float = 0  # seconds; 0 = only models with a TTL policy
+    odoo_cache_ttls: Dict[str, float] = {}  # JSON, e.g. {"res.partner": 60}
+    odoo_coalesce_enabled: bool = True  # share identical in-flight reads
+    odoo_fanout_max_parallel: int = 8  # concurrent calls per execute_many()
+    odoo_bulk_chunk_size: int = 100  # records per RPC in create_many()/write_many()/...
+    odoo_metrics_enabled: bool = True  # per-call latency/size metrics at /metrics
+    odoo_call_budget: int = 0  # max Odoo calls per request/tool/job; 0 = unlimited
+    odoo_call_budget_action: str = "log"  # log or raise
+    odoo_n_plus_one_threshold: int = 5  # repeats differing only by id that flag N+1
+    odoo_projection_guard: str = "warn"  # warn, raise or off for reads that request every field
+    odoo_cash_flow_closed_ttl: float = 900  # seconds closed cash-flow buckets are reused; 0 = always query
+
+    # Odoo Resilience
+    odoo_retry_attempts: int = 3  # attempts per idempotent read; 1 disables retries
+    odoo_retry_base_delay: float = 0.2  # seconds; doubles per attempt, jittered
+    odoo_retry_max_delay: float = 2.0
+    odoo_breaker_enabled: bool = True
+    odoo_breaker_failure_threshold: int = 5  # consecutive failures that open the circuit
+    odoo_breaker_reset_timeout: float = 30  # seconds open before a probe call
+    odoo_stale_ttl: float = 3600  # seconds past expiry a cached read may serve while Odoo is down
+    odoo_tool_deadline: float = 20  # seconds of Odoo time per agent tool call; 0 = none
+
+    # Odoo Metadata Registry
+    odoo_metadata_dir: str = ".cache/odoo_metadata"  # empty to disable persistence
+    odoo_metadata_refresh_interval: float = 3600  # seconds; 0 disables refresh
+
+    # Odoo Tenants (one process serving several Odoo databases)
+    odoo_tenants: Dict[str, Dict[str, Any]] = {}  # JSON, e.g. {"acme": {"db": "acme", "username": "bot", "password": "..."}}
+    odoo_tenant_header: str = "X-Odoo-Tenant"  # request header selecting the tenant
+    odoo_telegram_tenants: Dict[str, str] = {}  # JSON, Telegram user id -> tenant
+
+    # Odoo Local Mirror
+    odoo_mirror_enabled: bool = False
+    odoo_mirror_models: Dict[str, List[str]] = {  # JSON; an empty list mirrors every stored field
+        "account.move": [],
+        "hr.employee": [],
+        "hr.leave": [],
+        "contract.contract": [],
+    }
+    odoo_mirror_database_url: str = ""  # separate mirror DB, set up by the mirror; empty = database_url (run alembic upgrade head)
+    odoo_mirror_poll_interval: float = 30  # seconds between write_date polls
+    odoo_mirror_reconcile_interval: float = 900  # seconds between full id/write_date diffs
+    odoo_mirror_max_staleness: float = 120  # seconds; older mirrored models are read from Odoo
+
+    # Odoo Ledger Cache (posted journal items in memory for finance reports)
+    odoo_ledger_enabled: bool = False
+    odoo_ledger_horizon_days: int = 730  # days of journal items held; older periods are queried from Odoo
+    odoo_ledger_poll_interval: float = 60  # seconds between write_date polls
+    odoo_ledger_reconcile_interval: float = 900  # seconds between full id diffs
+    odoo_ledger_max_staleness: float = 300  # seconds; reports fall back to Odoo once the ledger is older
 
     # Google AI Configuration
     google_api_key: str = ""
@@ -63,6 +63,73 @@ class OdooOperationError(AgentSystemError):
         )
 
 
+class OdooCallBudgetExceeded(AgentSystemError):
+    """Raised when an operation makes more Odoo calls than its budget allows."""
+
+    def __init__(self, message: str, details: Optional[Dict[str, Any]] = None):
+        super().__init__(
+            message=message,
+            code="ODOO_CALL_BUDGET_EXCEEDED",
+            details=details
+        )
+
+
+class OdooUnavailableError(AgentSystemError):
+    """Raised when Odoo is unhealthy: the circuit is open or retries were exhausted."""
+
+    def __init__(self, message: str, details: Optional[Dict[str, Any]] = None):
+        super().__init__(
+            message=message,
+            code="ODOO_UNAVAILABLE",
+            details=details
+        )
+
+
+class OdooDeadlineExceeded(OdooUnavailableError):
+    """Raised when an Odoo call's deadline has passed."""
+
+    def __init__(self, message: str, details: Optional[Dict[str, Any]] = None):
+        AgentSystemError.__init__(
+            self,
+            message=message,
+            code="ODOO_DEADLINE_EXCEEDED",
+            details=details
+        )
+
+
+class OdooDomainError(AgentSystemError):
+    """Raised when a search domain is malformed or cannot be evaluated locally."""
+
+    def __init__(self, message: str, details: Optional[Dict[str, Any]] = None):
+        super().__init__(
+            message=message,
+            code="ODOO_DOMAIN_ERROR",
+            details=details
+        )
+
+
+class OdooTenantError(AgentSystemError):
+    """Raised when an unknown or misconfigured Odoo tenant is selected."""
+
+    def __init__(self, message: str, details: Optional[Dict[str, Any]] = None):
+        super().__init__(
+            message=message,
+            code="ODOO_TENANT_ERROR",
+            details=details
+        )
+
+
+class OdooProjectionError(AgentSystemError):
+    """Raised when a read requests every field and the projection guard is set to raise."""
+
+    def __init__(self, message: str, details: Optional[Dict[str, Any]] = None):
+        super().__init__(
+            message=message,
+            code="ODOO_PROJECTION_ERROR",
+            details=details
+        )
+
+
 class TelegramError(AgentSystemError):
     """Raised when a Telegram operation fails."""
 
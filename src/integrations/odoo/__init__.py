@@ -1,5 +1,15 @@
 """Odoo ERP integration via XML-RPC."""
 
 from .client import OdooClient, get_odoo_client
+from .fanout import CallResult, OdooCall
+from .async_client import AsyncOdooClient, AsyncOperations, get_async_odoo_client
 
-__all__ = ["OdooClient", "get_odoo_client"]
+__all__ = [
+    "OdooClient",
+    "get_odoo_client",
+    "OdooCall",
+    "CallResult",
+    "AsyncOdooClient",
+    "AsyncOperations",
+    "get_async_odoo_client",
+]
@@ -0,0 +1,867 @@
+"""
+Async Odoo Client
+
+Native asyncio client for Odoo over a pooled HTTP transport.
+Mirrors the OdooClient surface so async routes never block the event loop.
+Uses the same wire protocols as OdooClient (see transport.py).
+"""
+
+import asyncio
+import time
+import xmlrpc.client
+from typing import Any, AsyncIterator, Coroutine, Dict, List, Optional, Sequence, Tuple, Type, Union
+import logging
+
+import httpx
+
+from src.config import settings
+from src.core.exceptions import OdooConnectionError, OdooUnavailableError
+from src.integrations.odoo.bulk import BulkResult, arun_chunked
+from src.integrations.odoo.cache import READ_METHODS, ResultCache, get_result_cache
+from src.integrations.odoo.cash_flow import invalidate_closed_buckets
+from src.integrations.odoo.client import OdooClient, OdooConfig
+from src.integrations.odoo.fanout import CallResult, OdooCall
+from src.integrations.odoo.instrumentation import (
+    OdooMetrics,
+    count_rows,
+    detect_caller,
+    get_odoo_metrics,
+    run_as_caller,
+    take_response_size,
+)
+from src.integrations.odoo.ledger import get_odoo_ledger
+from src.integrations.odoo.mirror import get_odoo_mirror
+from src.integrations.odoo.read_group import ReadGroupRow, parse_read_group
+from src.integrations.odoo.records import OdooRecord, RecordBatch, shape_rows
+from src.integrations.odoo.resilience import (
+    CircuitBreaker,
+    RetryPolicy,
+    circuit_open_error,
+    get_circuit_breaker,
+    map_call_error,
+    remaining_timeout,
+)
+from src.integrations.odoo.singleflight import AsyncSingleFlight
+from src.integrations.odoo.tenants import current_tenant_config
+from src.integrations.odoo.projections import check_projection
+from src.integrations.odoo.tracing import trace_call
+from src.integrations.odoo.transport import OdooTransport, RpcRequest, create_transport
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncOdooClient:
+    """
+    Asyncio wrapper for Odoo RPC operations.
+
+    Requests are encoded by the configured transport (XML-RPC by default) and
+    sent through a shared httpx.AsyncClient, so keep-alive connections are
+    pooled and concurrent calls only wait on I/O.
+
+    Usage:
+        client = AsyncOdooClient(OdooConfig(...))
+        await client.authenticate()
+        partners = await client.search_read('res.partner', [['is_company', '=', True]])
+    """
+
+    def __init__(
+        self,
+        config: Optional[OdooConfig] = None,
+        max_connections: Optional[int] = None
+    ):
+        """
+        Initialize async Odoo client.
+
+        Args:
+            config: Optional configuration. Uses settings if not provided.
+            max_connections: Connection pool size. Uses config if not provided.
+        """
+        if config is None:
+            config = OdooConfig.from_settings()
+        self.config = config
+        self.transport: OdooTransport = create_transport(config)
+        self.max_connections = max_connections or config.max_connections
+        self._uid: Optional[int] = None
+        self._http: Optional[httpx.AsyncClient] = None
+        self._auth_lock: Optional[asyncio.Lock] = None
+        self._bridge: Optional["BridgedOdooClient"] = None
+        self.cache: Optional[ResultCache] = get_result_cache(config)
+        self.flights: Optional[AsyncSingleFlight] = (
+            AsyncSingleFlight() if settings.odoo_coalesce_enabled else None
+        )
+        self.metrics: Optional[OdooMetrics] = (
+            get_odoo_metrics() if settings.odoo_metrics_enabled else None
+        )
+        self.retry: Optional[RetryPolicy] = (
+            RetryPolicy() if settings.odoo_retry_attempts > 1 else None
+        )
+        self.breaker: Optional[CircuitBreaker] = get_circuit_breaker(config)
+
+    @property
+    def http(self) -> httpx.AsyncClient:
+        """Get pooled HTTP client (lazy initialization)."""
+        if self._http is None:
+            self._http = httpx.AsyncClient(
+                base_url=self.config.url,
+                timeout=self.config.timeout,
+                limits=httpx.Limits(
+                    max_connections=self.max_connections,
+                    max_keepalive_connections=self.max_connections,
+                    keepalive_expiry=self.config.idle_timeout
+                )
+            )
+        return self._http
+
+    @property
+    def is_authenticated(self) -> bool:
+        """Check if client is authenticated."""
+        return self._uid is not None
+
+    async def _send(self, request: RpcRequest, timeout: Optional[float] = None) -> Any:
+        """
+        Send an encoded transport request and decode the response.
+
+        Args:
+            request: Request built by the transport
+            timeout: Timeout for this request (defaults to the client's)
+
+        Returns:
+            Decoded result
+        """
+        http_request = self.http.build_request(
+            'POST',
+            request.path,
+            content=request.body,
+            headers=request.headers,
+            timeout=httpx.USE_CLIENT_DEFAULT if timeout is None else timeout
+        )
+        # Read the raw body: the transport inflates compressed responses itself
+        response = await self.http.send(http_request, stream=True)
+        try:
+            self.transport.handle_response_headers(response.headers)
+            response.raise_for_status()
+            body = b''.join([chunk async for chunk in response.aiter_raw()])
+        finally:
+            await response.aclose()
+        return self.transport.parse_response(body, response.headers.get('Content-Encoding', ''))
+
+    async def get_uid(self) -> int:
+        """Get authenticated user ID, authenticating if necessary."""
+        if self._uid is None:
+            await self.authenticate()
+        return self._uid
+
+    async def authenticate(self) -> int:
+        """
+        Authenticate with Odoo server.
+
+        Concurrent callers share a single authentication round trip.
+
+        Returns:
+            User ID if authentication successful
+
+        Raises:
+            OdooConnectionError: If authentication fails
+        """
+        if self._auth_lock is None:
+            self._auth_lock = asyncio.Lock()
+
+        async with self._auth_lock:
+            if self._uid is not None:
+                return self._uid
+            try:
+                logger.info(f"Authenticating to Odoo at {self.config.url} (async)")
+                uid = self.transport.parse_uid(
+                    await self._send(self.transport.encode(self.transport.authenticate_request))
+                )
+            except xmlrpc.client.Fault as e:
+                raise OdooConnectionError(
+                    f"Odoo fault during authentication: {e.faultString}",
+                    details={"fault_code": e.faultCode}
+                )
+            except Exception as e:
+                raise OdooConnectionError(
+                    f"Connection error: {str(e)}",
+                    details={"url": self.config.url}
+                )
+            if not uid:
+                raise OdooConnectionError(
+                    "Authentication failed - invalid credentials",
+                    details={"url": self.config.url, "database": self.config.database}
+                )
+            self._uid = uid
+            logger.info(f"Successfully authenticated as user ID: {self._uid}")
+            return self._uid
+
+    async def execute(
+        self,
+        model: str,
+        method: str,
+        *args,
+        **kwargs
+    ) -> Any:
+        """
+        Execute an Odoo model method.
+
+        Uses the same result cache, retry, circuit breaker and stale
+        fallback policy as OdooClient.execute, and joins identical reads
+        already in flight on this client.
+
+        Args:
+            model: Odoo model name (e.g., 'res.partner')
+            method: Method to call (e.g., 'search_read')
+            *args: Positional arguments for the method
+            **kwargs: Keyword arguments for the method
+
+        Returns:
+            Result from Odoo
+
+        Raises:
+            OdooOperationError: If the operation fails
+            OdooUnavailableError: If Odoo is unreachable and no stale result is cached
+            OdooDeadlineExceeded: If the active odoo_deadline() has passed
+        """
+        trace_call(model, method, args, kwargs)
+        check_projection(model, method, args, kwargs)
+        cache, flights = self.cache, self.flights
+
+        if method not in READ_METHODS:
+            try:
+                return await self._call(model, method, args, kwargs)
+            finally:
+                if cache is not None:
+                    cache.invalidate_model(model)
+                if flights is not None:
+                    flights.forget_model(model)
+                mirror = get_odoo_mirror(self.config)
+                if mirror is not None:
+                    mirror.mark_dirty(model)
+                ledger = get_odoo_ledger(self.config)
+                if ledger is not None:
+                    ledger.mark_dirty(model)
+                invalidate_closed_buckets(self.config, model)
+
+        cacheable = cache is not None and cache.is_cacheable(model, method)
+        if not cacheable and flights is None:
+            return await self._call(model, method, args, kwargs)
+
+        key = ResultCache.make_key(model, method, args, kwargs)
+        if cacheable:
+            hit, value = cache.get(key)
+            if hit:
+                return value
+            generation = cache.generation(model)
+
+        async def fetch() -> Any:
+            try:
+                value = await self._call(model, method, args, kwargs)
+            except OdooUnavailableError:
+                if cacheable:
+                    hit, value = cache.get_stale(key)
+                    if hit:
+                        logger.warning(f"Odoo unavailable, serving stale {model}.{method} result")
+                        return value
+                raise
+            if cacheable:
+                cache.set(key, model, value, generation=generation)
+            return value
+
+        if flights is None:
+            return await fetch()
+        return await flights.do(key, model, fetch)
+
+    async def _call(
+        self,
+        model: str,
+        method: str,
+        args: tuple,
+        kwargs: Dict[str, Any]
+    ) -> Any:
+        """Execute a call and record its metrics."""
+        metrics = self.metrics
+        if metrics is None:
+            return await self._call_uninstrumented(model, method, args, kwargs)
+
+        caller = detect_caller()
+        take_response_size()
+        started = time.perf_counter()
+        try:
+            result = await self._call_uninstrumented(model, method, args, kwargs)
+        except Exception:
+            metrics.record(model, method, caller, time.perf_counter() - started,
+                           response=take_response_size(), error=True)
+            raise
+        metrics.record(model, method, caller, time.perf_counter() - started,
+                       rows=count_rows(result), response=take_response_size())
+        return result
+
+    async def _call_uninstrumented(
+        self,
+        model: str,
+        method: str,
+        args: tuple,
+        kwargs: Dict[str, Any]
+    ) -> Any:
+        """Send a call with deadline, breaker and retries. See OdooClient._call_uninstrumented."""
+        breaker, retry = self.breaker, self.retry
+        args, kwargs = list(args), kwargs or {}
+        attempt = 0
+        while True:
+            timeout = remaining_timeout(self.config.timeout)
+            if breaker is not None and not breaker.allow():
+                raise circuit_open_error(model, method)
+            try:
+                result = await self._execute_kw(model, method, args, kwargs, timeout)
+            except Exception as e:
+                if breaker is not None:
+                    breaker.record(e)
+                delay = retry.backoff(method, e, attempt) if retry is not None else None
+                if delay is None:
+                    raise map_call_error(e, model, method, attempt + 1)
+                logger.info(f"Retrying {model}.{method} in {delay:.2f}s after: {e}")
+                await asyncio.sleep(remaining_timeout(delay))
+                attempt += 1
+                continue
+            except BaseException:
+                # Cancelled or interrupted: no outcome to record, but free a half_open probe
+                if breaker is not None:
+                    breaker.release()
+                raise
+            if breaker is not None:
+                breaker.record()
+            return result
+
+    async def _execute_kw(
+        self,
+        model: str,
+        method: str,
+        args: List[Any],
+        kwargs: Dict[str, Any],
+        timeout: Optional[float] = None
+    ) -> Any:
+        """Send one execute_kw request, re-authenticating once if the session expired."""
+        uid = await self.get_uid()
+        request = self.transport.encode(
+            self.transport.execute_request, uid, model, method, args, kwargs
+        )
+        try:
+            return await self._send(request, timeout)
+        except Exception as e:
+            if not self.transport.should_reauthenticate(e):
+                raise
+            logger.info("Odoo session expired, re-authenticating")
+            self._uid = None
+            uid = await self.get_uid()
+            request = self.transport.encode(
+                self.transport.execute_request, uid, model, method, args, kwargs
+            )
+            return await self._send(request, timeout)
+
+    async def execute_many(
+        self,
+        calls: Sequence[OdooCall],
+        max_parallel: Optional[int] = None
+    ) -> List[CallResult]:
+        """Execute independent calls concurrently. See OdooClient.execute_many."""
+        semaphore = asyncio.Semaphore(max_parallel or settings.odoo_fanout_max_parallel)
+
+        async def run(call: OdooCall) -> CallResult:
+            async with semaphore:
+                start = time.perf_counter()
+                try:
+                    value = await self.execute(call.model, call.method, *call.args, **call.kwargs)
+                    return CallResult(
+                        value=call.parse(value) if call.parse else value,
+                        elapsed=time.perf_counter() - start
+                    )
+                except Exception as e:
+                    return CallResult(error=e, elapsed=time.perf_counter() - start)
+
+        return list(await asyncio.gather(*(run(call) for call in calls)))
+
+    async def search(
+        self,
+        model: str,
+        domain: List[Union[Tuple, List]],
+        limit: Optional[int] = None,
+        offset: int = 0,
+        order: Optional[str] = None
+    ) -> List[int]:
+        """Search for record IDs matching domain. See OdooClient.search."""
+        kwargs = {}
+        if limit is not None:
+            kwargs['limit'] = limit
+        if offset:
+            kwargs['offset'] = offset
+        if order:
+            kwargs['order'] = order
+
+        return await self.execute(model, 'search', domain, **kwargs)
+
+    async def read(
+        self,
+        model: str,
+        ids: List[int],
+        fields: Optional[List[str]] = None
+    ) -> List[Dict[str, Any]]:
+        """Read records by ID. See OdooClient.read."""
+        kwargs = {}
+        if fields:
+            kwargs['fields'] = fields
+
+        mirror = get_odoo_mirror(self.config)
+        if mirror is not None:
+            hit, rows = mirror.read(model, ids, fields)
+            if hit:
+                trace_call(model, 'read', (ids,), kwargs)
+                return rows
+
+        return await self.execute(model, 'read', ids, **kwargs)
+
+    async def search_read(
+        self,
+        model: str,
+        domain: List[Union[Tuple, List]],
+        fields: Optional[List[str]] = None,
+        limit: Optional[int] = None,
+        offset: int = 0,
+        order: Optional[str] = None,
+        result: str = 'dicts'
+    ) -> Union[List[Dict[str, Any]], List[OdooRecord], RecordBatch]:
+        """Search and read in one operation. See OdooClient.search_read."""
+        kwargs = {}
+        if fields:
+            kwargs['fields'] = fields
+        if limit is not None:
+            kwargs['limit'] = limit
+        if offset:
+            kwargs['offset'] = offset
+        if order:
+            kwargs['order'] = order
+
+        mirror = get_odoo_mirror(self.config)
+        if mirror is not None:
+            hit, rows = mirror.search_read(model, domain, fields, offset, limit, order)
+            if hit:
+                trace_call(model, 'search_read', (domain,), kwargs)
+                return await self._shape(model, rows, result, fields)
+
+        rows = await self.execute(model, 'search_read', domain, **kwargs)
+        return await self._shape(model, rows, result, fields)
+
+    async def _shape(
+        self,
+        model: str,
+        rows: List[Dict[str, Any]],
+        result: str,
+        fields: Optional[List[str]]
+    ) -> Union[List[Dict[str, Any]], List[OdooRecord], RecordBatch]:
+        """Convert search_read rows to a result mode. See OdooClient._shape."""
+        if result == 'dicts':
+            return rows
+        try:
+            definitions = await asyncio.to_thread(self.sync_bridge().metadata.fields, model)
+        except Exception as e:
+            logger.debug(f"No field definitions for {model}, inferring types: {e}")
+            definitions = {}
+        return shape_rows(model, rows, result, fields, definitions)
+
+    async def iter_search_read(
+        self,
+        model: str,
+        domain: List[Union[Tuple, List]],
+        fields: Optional[List[str]] = None,
+        batch_size: int = 1000,
+        result: str = 'dicts'
+    ) -> AsyncIterator[Union[List[Dict[str, Any]], List[OdooRecord], RecordBatch]]:
+        """Stream matching records in keyset-paginated batches. See OdooClient.iter_search_read."""
+        mirror = get_odoo_mirror(self.config)
+        if mirror is not None:
+            # One local filter pass instead of one per page
+            hit, rows = mirror.search_read(model, domain, fields, order='id asc')
+            if hit:
+                trace_call(model, 'search_read', (domain,), {'fields': fields, 'order': 'id asc'})
+                for start in range(0, len(rows), batch_size):
+                    yield await self._shape(model, rows[start:start + batch_size], result, fields)
+                return
+
+        last_id = 0
+        while True:
+            batch = await self.search_read(
+                model,
+                [['id', '>', last_id]] + list(domain),
+                fields=fields,
+                limit=batch_size,
+                order='id asc'
+            )
+            if not batch:
+                return
+            yield await self._shape(model, batch, result, fields)
+            if len(batch) < batch_size:
+                return
+            last_id = batch[-1]['id']
+
+    async def search_count(
+        self,
+        model: str,
+        domain: List[Union[Tuple, List]]
+    ) -> int:
+        """Count records matching domain. See OdooClient.search_count."""
+        mirror = get_odoo_mirror(self.config)
+        if mirror is not None:
+            hit, count = mirror.search_count(model, domain)
+            if hit:
+                trace_call(model, 'search_count', (domain,), {})
+                return count
+        return await self.execute(model, 'search_count', domain)
+
+    async def read_group(
+        self,
+        model: str,
+        domain: List[Union[Tuple, List]],
+        fields: List[str],
+        groupby: List[str],
+        lazy: bool = False,
+        orderby: Optional[str] = None,
+        limit: Optional[int] = None
+    ) -> List[ReadGroupRow]:
+        """Aggregate records server-side. See OdooClient.read_group."""
+        kwargs = {'lazy': lazy}
+        if orderby:
+            kwargs['orderby'] = orderby
+        if limit is not None:
+            kwargs['limit'] = limit
+
+        rows = await self.execute(model, 'read_group', domain, fields, groupby, **kwargs)
+        return parse_read_group(rows, fields, groupby, lazy=lazy)
+
+    async def create(
+        self,
+        model: str,
+        values: Dict[str, Any]
+    ) -> int:
+        """Create a new record. See OdooClient.create."""
+        logger.debug(f"Creating {model} with values: {values}")
+        record_id = await self.execute(model, 'create', values)
+        logger.info(f"Created {model} record with ID: {record_id}")
+        return record_id
+
+    async def write(
+        self,
+        model: str,
+        ids: List[int],
+        values: Dict[str, Any]
+    ) -> bool:
+        """Update existing records. See OdooClient.write."""
+        logger.debug(f"Updating {model} records {ids} with: {values}")
+        result = await self.execute(model, 'write', ids, values)
+        logger.info(f"Updated {model} records: {ids}")
+        return result
+
+    async def unlink(
+        self,
+        model: str,
+        ids: List[int]
+    ) -> bool:
+        """Delete records. See OdooClient.unlink."""
+        logger.debug(f"Deleting {model} records: {ids}")
+        result = await self.execute(model, 'unlink', ids)
+        logger.info(f"Deleted {model} records: {ids}")
+        return result
+
+    async def call_method(
+        self,
+        model: str,
+        method: str,
+        ids: List[int],
+        *args,
+        **kwargs
+    ) -> Any:
+        """Call a custom method on records. See OdooClient.call_method."""
+        return await self.execute(model, method, ids, *args, **kwargs)
+
+    async def create_many(
+        self,
+        model: str,
+        values_list: Sequence[Dict[str, Any]],
+        chunk_size: Optional[int] = None
+    ) -> BulkResult:
+        """Create many records. See OdooClient.create_many."""
+        result = await arun_chunked(
+            values_list,
+            lambda chunk: self.execute(model, 'create', chunk),
+            chunk_size or settings.odoo_bulk_chunk_size,
+            per_item=True
+        )
+        logger.info(f"Created {len(values_list) - len(result.errors)} {model} records in {result.calls} calls")
+        return result
+
+    async def write_many(
+        self,
+        model: str,
+        ids: Sequence[int],
+        values: Dict[str, Any],
+        chunk_size: Optional[int] = None
+    ) -> BulkResult:
+        """Apply the same values to many records. See OdooClient.write_many."""
+        ids = list(ids)
+        result = await arun_chunked(
+            ids,
+            lambda chunk: self.execute(model, 'write', chunk, values),
+            chunk_size or settings.odoo_bulk_chunk_size,
+            record_ids=ids
+        )
+        logger.info(f"Updated {len(ids) - len(result.errors)} {model} records in {result.calls} calls")
+        return result
+
+    async def unlink_many(
+        self,
+        model: str,
+        ids: Sequence[int],
+        chunk_size: Optional[int] = None
+    ) -> BulkResult:
+        """Delete many records. See OdooClient.unlink_many."""
+        ids = list(ids)
+        result = await arun_chunked(
+            ids,
+            lambda chunk: self.execute(model, 'unlink', chunk),
+            chunk_size or settings.odoo_bulk_chunk_size,
+            record_ids=ids
+        )
+        logger.info(f"Deleted {len(ids) - len(result.errors)} {model} records in {result.calls} calls")
+        return result
+
+    async def call_method_many(
+        self,
+        model: str,
+        method: str,
+        ids: Sequence[int],
+        *args,
+        chunk_size: Optional[int] = None,
+        **kwargs
+    ) -> BulkResult:
+        """Call a record method on many records. See OdooClient.call_method_many."""
+        ids = list(ids)
+        return await arun_chunked(
+            ids,
+            lambda chunk: self.execute(model, method, chunk, *args, **kwargs),
+            chunk_size or settings.odoo_bulk_chunk_size,
+            record_ids=ids
+        )
+
+    async def fields_get(
+        self,
+        model: str,
+        attributes: Optional[List[str]] = None
+    ) -> Dict[str, Any]:
+        """Get field definitions for a model. See OdooClient.fields_get."""
+        kwargs = {}
+        if attributes:
+            kwargs['attributes'] = attributes
+        return await self.execute(model, 'fields_get', **kwargs)
+
+    async def check_model_exists(self, model: str) -> bool:
+        """Check if a model exists in Odoo. See OdooClient.check_model_exists."""
+        metadata = self.sync_bridge().metadata
+        if not metadata.is_loaded:
+            await asyncio.to_thread(metadata.load)
+        return metadata.has_model(model)
+
+    async def get_version(self) -> Dict[str, Any]:
+        """Get Odoo server version information."""
+        return await self._send(self.transport.encode(self.transport.version_request))
+
+    def cache_stats(self) -> Dict[str, Any]:
+        """Get result cache counters. See OdooClient.cache_stats."""
+        if self.cache is None:
+            return {'enabled': False}
+        return {'enabled': True, **self.cache.stats()}
+
+    def coalescing_stats(self) -> Dict[str, Any]:
+        """Get single-flight counters. See OdooClient.coalescing_stats."""
+        if self.flights is None:
+            return {'enabled': False}
+        return {'enabled': True, **self.flights.stats()}
+
+    def breaker_stats(self) -> Dict[str, Any]:
+        """Get circuit breaker state. See OdooClient.breaker_stats."""
+        if self.breaker is None:
+            return {'enabled': False}
+        return {'enabled': True, **self.breaker.stats()}
+
+    def sync_bridge(self) -> "BridgedOdooClient":
+        """
+        Get a blocking OdooClient that routes its RPCs through this client.
+
+        Must be called from the event loop that owns this client. The bridge
+        is meant to be used from worker threads (see AsyncOperations).
+        """
+        loop = asyncio.get_running_loop()
+        if self._bridge is None or self._bridge.loop is not loop:
+            self._bridge = BridgedOdooClient(self, loop)
+        return self._bridge
+
+    async def aclose(self) -> None:
+        """Close pooled HTTP connections."""
+        if self._bridge is not None:
+            self._bridge.close()
+            self._bridge = None
+        if self._http is not None:
+            await self._http.aclose()
+            self._http = None
+
+    async def __aenter__(self) -> "AsyncOdooClient":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+
+class BridgedOdooClient(OdooClient):
+    """
+    Blocking OdooClient backed by an AsyncOdooClient.
+
+    Sync code running in a worker thread (e.g. the operations classes) submits
+    its RPCs to the owning event loop, so the I/O itself is multiplexed over the
+    async connection pool.
+    """
+
+    def __init__(self, async_client: AsyncOdooClient, loop: asyncio.AbstractEventLoop):
+        super().__init__(async_client.config)
+        self.async_client = async_client
+        self.loop = loop
+        # Caching, coalescing, metrics, tracing, the projection guard, retries
+        # and circuit breaking happen in the async client's execute(), which
+        # sees this thread's context variables (including the deadline); a
+        # second single-flight layer here would deadlock the leader thread
+        # against its own in-flight entry
+        self.cache = None
+        self.flights = None
+        self.metrics = None
+        self.tracing = False
+        self.retry = None
+        self.breaker = None
+
+    def _run(self, coro: Coroutine) -> Any:
+        """Run a coroutine on the owning loop and wait for its result."""
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is self.loop:
+            coro.close()
+            raise RuntimeError(
+                "BridgedOdooClient called from its own event loop; "
+                "await the AsyncOdooClient directly instead"
+            )
+        return asyncio.run_coroutine_threadsafe(coro, self.loop).result()
+
+    def _trace_served(self, model: str, method: str, args: tuple, kwargs: Dict[str, Any]) -> None:
+        """Count a mirror-served call; it never reaches the async client's execute()."""
+        trace_call(model, method, args, kwargs)
+
+    def authenticate(self) -> int:
+        """Authenticate through the async client."""
+        self._uid = self._run(self.async_client.authenticate())
+        return self._uid
+
+    def _execute_kw(
+        self,
+        model: str,
+        method: str,
+        args: List[Any],
+        kwargs: Dict[str, Any],
+        timeout: Optional[float] = None
+    ) -> Any:
+        """Send execute_kw through the async client, keeping this thread's caller."""
+        return self._run(run_as_caller(
+            detect_caller(),
+            self.async_client.execute(model, method, *args, **kwargs)
+        ))
+
+    def execute_many(
+        self,
+        calls: Sequence[OdooCall],
+        max_parallel: Optional[int] = None
+    ) -> List[CallResult]:
+        """Fan out on the event loop instead of worker threads."""
+        return self._run(run_as_caller(
+            detect_caller(),
+            self.async_client.execute_many(calls, max_parallel)
+        ))
+
+    def get_version(self) -> Dict[str, Any]:
+        """Get server version through the async client."""
+        return self._run(self.async_client.get_version())
+
+
+class AsyncOperations:
+    """
+    Awaitable facade over an operations class bound to an AsyncOdooClient.
+
+    Public methods of the wrapped operations object become coroutines that run
+    in a worker thread; their Odoo calls go through the async client's pool.
+    Private helpers and plain attributes are returned unchanged.
+
+    Usage:
+        ops = AsyncOperations(FinanceOperations)
+        summary = await ops.get_financial_summary()
+    """
+
+    def __init__(
+        self,
+        operations_class: Type,
+        client: Optional[AsyncOdooClient] = None
+    ):
+        """
+        Initialize the facade.
+
+        Args:
+            operations_class: Operations class taking an OdooClient (e.g. HROperations)
+            client: Optional async client. The active tenant's shared client if not provided.
+        """
+        self.client = client or get_async_odoo_client()
+        self.operations = operations_class(self.client.sync_bridge())
+
+    def __getattr__(self, name: str) -> Any:
+        attr = getattr(self.operations, name)
+        if name.startswith('_') or not callable(attr):
+            return attr
+
+        async def run_in_thread(*args, **kwargs):
+            return await asyncio.to_thread(attr, *args, **kwargs)
+
+        run_in_thread.__name__ = name
+        run_in_thread.__doc__ = attr.__doc__
+        return run_in_thread
+
+
+# Shared clients by connection identity (one per tenant)
+_async_clients: Dict[Tuple[str, str, str], AsyncOdooClient] = {}
+
+
+def get_async_odoo_client(config: Optional[OdooConfig] = None) -> AsyncOdooClient:
+    """
+    Get or create the shared async Odoo client for a connection.
+
+    Args:
+        config: Connection to use. The active tenant's (see tenants.py) if not provided.
+
+    Returns:
+        Configured AsyncOdooClient instance
+    """
+    if config is None:
+        config = current_tenant_config()
+    key = (config.url, config.database, config.username)
+    client = _async_clients.get(key)
+    if client is None:
+        client = _async_clients[key] = AsyncOdooClient(config)
+    return client
+
+
+async def close_async_odoo_client() -> None:
+    """Close and forget every shared async client."""
+    clients = list(_async_clients.values())
+    _async_clients.clear()
+    for client in clients:
+        await client.aclose()
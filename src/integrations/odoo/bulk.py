@@ -0,0 +1,180 @@
+"""
+Bulk Odoo Operations
+
+Chunked execution of multi-record create/write/unlink/method calls with
+per-record results.
+
+Odoo runs each RPC in one transaction, so a chunk either applies completely
+or not at all. When a chunk is rejected with a fault (e.g. one record fails
+validation), it is split in half and each half is resent until the failing
+records are isolated; every other record still goes through. A chunk that
+fails any other way (Odoo unavailable, a deadline or call budget, a
+client-side error) is not resent: its outcome is unknown, so all of its
+records are reported as failed.
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence
+import logging
+
+from src.integrations.odoo.resilience import is_fault
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class BulkError:
+    """A record that could not be processed."""
+    index: int
+    record_id: Optional[int]
+    error: str
+
+
+@dataclass
+class BulkResult:
+    """
+    Outcome of a bulk operation.
+
+    Attributes:
+        results: One entry per input item, in input order (the created id
+            for create_many, the call's return value otherwise; None where
+            the item failed)
+        errors: Failed items
+        calls: Round trips made
+    """
+    results: List[Any] = field(default_factory=list)
+    errors: List[BulkError] = field(default_factory=list)
+    calls: int = 0
+
+    @property
+    def ok(self) -> bool:
+        """Check if every item succeeded."""
+        return not self.errors
+
+    @property
+    def failed_indexes(self) -> List[int]:
+        """Get the input positions of failed items."""
+        return [e.index for e in self.errors]
+
+    def succeeded_ids(self, ids: Optional[Sequence[int]] = None) -> List[int]:
+        """
+        Get the ids of items that succeeded.
+
+        Args:
+            ids: Input ids (write/unlink/method calls). Created ids are used if not provided.
+        """
+        failed = set(self.failed_indexes)
+        source = ids if ids is not None else self.results
+        return [source[i] for i in range(len(self.results)) if i not in failed]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a dictionary for API responses."""
+        return {
+            'succeeded': len(self.results) - len(self.errors),
+            'failed': len(self.errors),
+            'results': self.results,
+            'errors': [vars(e).copy() for e in self.errors],
+            'calls': self.calls,
+        }
+
+
+def _chunks(size: int, chunk_size: int) -> List[range]:
+    """Split range(size) into consecutive chunks."""
+    chunk_size = max(chunk_size, 1)
+    return [range(i, min(i + chunk_size, size)) for i in range(0, size, chunk_size)]
+
+
+def _record_failure(
+    result: BulkResult,
+    positions: range,
+    record_ids: Optional[Sequence[int]],
+    error: Exception
+) -> None:
+    """Mark every item in a chunk as failed."""
+    for i in positions:
+        result.errors.append(BulkError(
+            index=i,
+            record_id=record_ids[i] if record_ids is not None else None,
+            error=str(error)
+        ))
+
+
+def _spread(value: Any, count: int, per_item: bool) -> List[Any]:
+    """Map one chunk's return value onto its items."""
+    if per_item and isinstance(value, list) and len(value) == count:
+        return value
+    return [value] * count
+
+
+def run_chunked(
+    items: Sequence[Any],
+    send: Callable[[List[Any]], Any],
+    chunk_size: int,
+    record_ids: Optional[Sequence[int]] = None,
+    per_item: bool = False
+) -> BulkResult:
+    """
+    Send items in chunks, isolating items rejected by a fault by bisection.
+
+    Args:
+        items: Items to send (values dicts or record ids)
+        send: Sends one chunk of items in a single RPC
+        chunk_size: Items per RPC
+        record_ids: Record ids matching items, for error reports
+        per_item: The RPC returns a list with one value per item (e.g. create)
+
+    Returns:
+        BulkResult with one result per item
+    """
+    result = BulkResult(results=[None] * len(items))
+    pending = _chunks(len(items), chunk_size)
+    while pending:
+        positions = pending.pop(0)
+        result.calls += 1
+        try:
+            value = send([items[i] for i in positions])
+        except Exception as e:
+            if not is_fault(e) or len(positions) == 1:
+                _record_failure(result, positions, record_ids, e)
+                continue
+            middle = len(positions) // 2
+            pending[:0] = [positions[:middle], positions[middle:]]
+            continue
+        for i, item_value in zip(positions, _spread(value, len(positions), per_item)):
+            result.results[i] = item_value
+
+    result.errors.sort(key=lambda e: e.index)
+    if result.errors:
+        logger.warning(f"Bulk operation: {len(result.errors)} of {len(items)} items failed")
+    return result
+
+
+async def arun_chunked(
+    items: Sequence[Any],
+    send: Callable[[List[Any]], Awaitable[Any]],
+    chunk_size: int,
+    record_ids: Optional[Sequence[int]] = None,
+    per_item: bool = False
+) -> BulkResult:
+    """Send items in chunks from a coroutine. See run_chunked."""
+    result = BulkResult(results=[None] * len(items))
+    pending = _chunks(len(items), chunk_size)
+    while pending:
+        positions = pending.pop(0)
+        result.calls += 1
+        try:
+            value = await send([items[i] for i in positions])
+        except Exception as e:
+            if not is_fault(e) or len(positions) == 1:
+                _record_failure(result, positions, record_ids, e)
+                continue
+            middle = len(positions) // 2
+            pending[:0] = [positions[:middle], positions[middle:]]
+            continue
+        for i, item_value in zip(positions, _spread(value, len(positions), per_item)):
+            result.results[i] = item_value
+
+    result.errors.sort(key=lambda e: e.index)
+    if result.errors:
+        logger.warning(f"Bulk operation: {len(result.errors)} of {len(items)} items failed")
+    return result
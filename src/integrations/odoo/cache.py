@@ -0,0 +1,291 @@
+"""
+Odoo Result Cache
+
+TTL + LRU cache for read-only Odoo calls.
+
+Entries are keyed by a canonical form of (model, method, arguments), with
+search domains normalized so equivalent domains share an entry. They expire
+after a per-model TTL and are evicted least-recently-used once the cache is
+full. Any write-type call on a model through the client drops every cached
+entry for that model. Expired entries are kept for a further stale TTL so
+the client can fall back to them while Odoo is unavailable.
+"""
+
+import copy
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Set, Tuple
+import logging
+
+from src.config import settings
+from src.core.exceptions import OdooDomainError
+from src.integrations.odoo.domain import normalize
+
+logger = logging.getLogger(__name__)
+
+
+# Methods whose results may be cached; any other method is treated as a write
+READ_METHODS = frozenset({
+    'search_read',
+    'read',
+    'search_count',
+    'fields_get',
+    'search',
+    'read_group',
+})
+
+# Read methods taking a search domain as their first argument
+DOMAIN_METHODS = frozenset({'search_read', 'search_count', 'search', 'read_group'})
+
+# Default TTLs (seconds) for near-static models. Models not listed use the
+# default TTL, which is 0 (not cached) unless configured otherwise.
+DEFAULT_MODEL_TTLS: Dict[str, float] = {
+    'ir.model': 3600,
+    'ir.model.fields': 3600,
+    'ir.module.module': 3600,
+    'res.company': 3600,
+    'res.currency': 3600,
+    'account.journal': 600,
+    'account.account': 600,
+    'hr.department': 600,
+    'hr.job': 600,
+    'hr.leave.type': 1800,
+}
+
+
+class ResultCache:
+    """
+    Thread-safe TTL + LRU cache for Odoo call results.
+
+    Values are deep-copied on the way in and out, so callers may freely
+    mutate the records they get back.
+
+    Usage:
+        cache = ResultCache(max_entries=1024, model_ttls={'hr.department': 600})
+        key = cache.make_key('hr.department', 'search_read', ([],), {})
+        hit, value = cache.get(key)
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 2048,
+        default_ttl: float = 0,
+        model_ttls: Optional[Dict[str, float]] = None,
+        stale_ttl: float = 0
+    ):
+        """
+        Initialize cache.
+
+        Args:
+            max_entries: Maximum number of cached results
+            default_ttl: TTL in seconds for models without a policy (0 disables)
+            model_ttls: Per-model TTL overrides merged over DEFAULT_MODEL_TTLS
+            stale_ttl: Seconds past expiry an entry stays available to get_stale()
+        """
+        self.max_entries = max_entries
+        self.default_ttl = default_ttl
+        self.stale_ttl = stale_ttl
+        self.model_ttls = {**DEFAULT_MODEL_TTLS, **(model_ttls or {})}
+
+        self._entries: "OrderedDict[str, Tuple[float, str, Any]]" = OrderedDict()
+        self._by_model: Dict[str, Set[str]] = {}
+        self._generations: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        self._counters: Dict[str, int] = {
+            'hits': 0,
+            'misses': 0,
+            'evictions': 0,
+            'expirations': 0,
+            'invalidations': 0,
+            'stale_hits': 0,
+        }
+
+    @staticmethod
+    def make_key(model: str, method: str, args: tuple, kwargs: Dict[str, Any]) -> str:
+        """
+        Build a canonical cache key.
+
+        Keyword arguments are sorted and search domains normalized, so calls
+        that differ only in argument or term order share an entry.
+        """
+        if method in DOMAIN_METHODS:
+            if args:
+                args = (_canonical_domain(args[0]),) + tuple(args[1:])
+            if 'domain' in kwargs:
+                kwargs = {**kwargs, 'domain': _canonical_domain(kwargs['domain'])}
+        return json.dumps(
+            [model, method, list(args), kwargs],
+            sort_keys=True,
+            separators=(',', ':'),
+            default=str
+        )
+
+    def ttl_for(self, model: str) -> float:
+        """Get the TTL in seconds for a model (0 means not cached)."""
+        return self.model_ttls.get(model, self.default_ttl)
+
+    def is_cacheable(self, model: str, method: str) -> bool:
+        """Check if a call's result may be served from cache."""
+        return method in READ_METHODS and self.ttl_for(model) > 0
+
+    def get(self, key: str) -> Tuple[bool, Any]:
+        """
+        Look up a cached result.
+
+        Returns:
+            Tuple of (hit, value)
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._counters['misses'] += 1
+                return False, None
+            expires_at, model, value = entry
+            now = time.monotonic()
+            if expires_at <= now:
+                if expires_at + self.stale_ttl <= now:
+                    self._remove(key, model)
+                    self._counters['expirations'] += 1
+                self._counters['misses'] += 1
+                return False, None
+            self._entries.move_to_end(key)
+            self._counters['hits'] += 1
+        return True, copy.deepcopy(value)
+
+    def get_stale(self, key: str) -> Tuple[bool, Any]:
+        """
+        Look up a result that may have expired up to stale_ttl seconds ago.
+
+        Used as a fallback when Odoo cannot be reached.
+
+        Returns:
+            Tuple of (hit, value)
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] + self.stale_ttl <= time.monotonic():
+                return False, None
+            self._counters['stale_hits'] += 1
+            value = entry[2]
+        return True, copy.deepcopy(value)
+
+    def generation(self, model: str) -> int:
+        """Get the model's invalidation counter (see set())."""
+        with self._lock:
+            return self._generations.get(model, 0)
+
+    def set(
+        self,
+        key: str,
+        model: str,
+        value: Any,
+        generation: Optional[int] = None
+    ) -> None:
+        """
+        Store a result using the model's TTL.
+
+        Args:
+            key: Cache key from make_key()
+            model: Odoo model name
+            value: Result to cache
+            generation: generation(model) taken before the call was sent; the
+                result is dropped if the model was invalidated since
+        """
+        ttl = self.ttl_for(model)
+        if ttl <= 0:
+            return
+        value = copy.deepcopy(value)
+        with self._lock:
+            if generation is not None and generation != self._generations.get(model, 0):
+                return
+            if key in self._entries:
+                self._entries.move_to_end(key)
+            self._entries[key] = (time.monotonic() + ttl, model, value)
+            self._by_model.setdefault(model, set()).add(key)
+            while len(self._entries) > self.max_entries:
+                old_key, (_, old_model, _) = self._entries.popitem(last=False)
+                self._by_model.get(old_model, set()).discard(old_key)
+                self._counters['evictions'] += 1
+
+    def _remove(self, key: str, model: str) -> None:
+        """Remove one entry (lock held)."""
+        self._entries.pop(key, None)
+        self._by_model.get(model, set()).discard(key)
+
+    def invalidate_model(self, model: str) -> int:
+        """
+        Drop every cached entry for a model.
+
+        Returns:
+            Number of entries removed
+        """
+        with self._lock:
+            self._generations[model] = self._generations.get(model, 0) + 1
+            keys = self._by_model.pop(model, set())
+            for key in keys:
+                self._entries.pop(key, None)
+            if keys:
+                self._counters['invalidations'] += len(keys)
+                logger.debug(f"Invalidated {len(keys)} cached {model} results")
+            return len(keys)
+
+    def clear(self) -> None:
+        """Drop all entries (counters are kept)."""
+        with self._lock:
+            self._entries.clear()
+            self._by_model.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Get hit/miss/eviction counters and current size."""
+        with self._lock:
+            lookups = self._counters['hits'] + self._counters['misses']
+            return {
+                **self._counters,
+                'hit_ratio': round(self._counters['hits'] / lookups, 3) if lookups else 0.0,
+                'size': len(self._entries),
+                'max_entries': self.max_entries,
+            }
+
+
+# One cache per Odoo connection identity, shared by sync and async clients
+_caches: Dict[Tuple[str, str, str], ResultCache] = {}
+_caches_lock = threading.Lock()
+
+
+def get_result_cache(config) -> Optional[ResultCache]:
+    """
+    Get the shared result cache for an Odoo connection.
+
+    Args:
+        config: OdooConfig identifying the server, database and user
+
+    Returns:
+        ResultCache instance, or None if caching is disabled
+    """
+    if not settings.odoo_cache_enabled:
+        return None
+    key = (config.url, config.database, config.username)
+    with _caches_lock:
+        if key not in _caches:
+            _caches[key] = ResultCache(
+                max_entries=settings.odoo_cache_max_entries,
+                default_ttl=settings.odoo_cache_default_ttl,
+                model_ttls=settings.odoo_cache_ttls,
+                stale_ttl=settings.odoo_stale_ttl
+            )
+        return _caches[key]
+
+
+def _canonical_domain(domain: Any) -> Any:
+    """
+    Normalize a domain for keying; malformed domains are keyed as given.
+
+    Keys use the sorted form only: without field types, intersecting terms
+    could give different queries (e.g. on x2many fields) the same key.
+    """
+    try:
+        return normalize(domain)
+    except (OdooDomainError, TypeError):
+        return domain
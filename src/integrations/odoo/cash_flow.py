@@ -0,0 +1,308 @@
+"""
+Cash-Flow Series
+
+Daily, weekly or monthly inflows, outflows and running balances per bank
+and cash journal.
+
+A series costs one read_group of debit/credit by journal_id and
+date:<granularity> over the requested range, sent concurrently with the
+journal list and the opening balances (a read_group by journal_id of
+everything before the range). Running balances are the opening balance
+plus a cumulative sum over the bucket columns.
+
+Buckets that ended before the current one ("closed" buckets) are kept per
+Odoo connection for ODOO_CASH_FLOW_CLOSED_TTL seconds, and so are opening
+balances taken before the current bucket; a repeated report only queries
+the buckets that are still open. Writes through an Odoo client to the
+accounting models below drop a connection's cached buckets, since a
+backdated posting or a reset to draft changes closed periods too. While the ledger cache (see ledger.py)
+covers the range, ledger_totals() computes the buckets and opening
+balances from memory instead.
+"""
+
+import calendar
+import threading
+from dataclasses import dataclass
+from datetime import date, timedelta
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+import logging
+
+import numpy as np
+
+from src.config import settings
+from src.integrations.odoo.cache import ResultCache
+from src.integrations.odoo.domain import LIQUIDITY_JOURNALS
+from src.integrations.odoo.ledger import LedgerSnapshot, epoch_day
+from src.integrations.odoo.read_group import ReadGroupRow
+
+logger = logging.getLogger(__name__)
+
+GRANULARITIES = ('day', 'week', 'month')
+
+# Model whose TTL policy applies to the cached buckets
+_MODEL = 'account.move.line'
+
+# Models whose writes can change posted journal items (payments and
+# statement lines post their own moves)
+INVALIDATING_MODELS = frozenset({
+    'account.move', 'account.move.line', 'account.payment', 'account.bank.statement.line',
+})
+
+
+@dataclass(frozen=True)
+class Bucket:
+    """
+    One period of a series.
+
+    Attributes:
+        start: Calendar start of the period (the read_group key)
+        date_from: First day included (start, or the report start for the first bucket)
+        date_to: Last day included (period end, or the report end for the last bucket)
+    """
+    start: date
+    date_from: date
+    date_to: date
+
+
+def bucket_start(day: date, granularity: str) -> date:
+    """Get the calendar start of the period containing a day (weeks start on Monday)."""
+    if granularity == 'month':
+        return day.replace(day=1)
+    if granularity == 'week':
+        return day - timedelta(days=day.weekday())
+    return day
+
+
+def _next_start(start: date, granularity: str) -> date:
+    if granularity == 'month':
+        return start + timedelta(days=calendar.monthrange(start.year, start.month)[1])
+    if granularity == 'week':
+        return start + timedelta(days=7)
+    return start + timedelta(days=1)
+
+
+def buckets(date_from: date, date_to: date, granularity: str) -> List[Bucket]:
+    """
+    Split a date range into periods.
+
+    Args:
+        date_from: First day of the range
+        date_to: Last day of the range
+        granularity: 'day', 'week' or 'month'
+
+    Returns:
+        Buckets covering the range, the first and last clipped to it
+
+    Raises:
+        ValueError: For an unknown granularity, or date_from after date_to
+    """
+    if granularity not in GRANULARITIES:
+        raise ValueError(f"Unknown granularity '{granularity}'; expected one of {', '.join(GRANULARITIES)}")
+    if date_from > date_to:
+        raise ValueError(f"date_from {date_from} is after date_to {date_to}")
+    result = []
+    start = bucket_start(date_from, granularity)
+    while start <= date_to:
+        following = _next_start(start, granularity)
+        result.append(Bucket(start, max(start, date_from), min(following - timedelta(days=1), date_to)))
+        start = following
+    return result
+
+
+def group_start(group: ReadGroupRow, spec: str) -> Optional[date]:
+    """
+    Get the period start of a date-grouped read_group row.
+
+    Uses the range Odoo 16+ returns, falling back to the lower date bound
+    in the group's domain for servers that only return a display label.
+    """
+    field_name = spec.split(':', 1)[0]
+    candidates = [group.key(spec)] + [
+        term[2] for term in group.domain
+        if isinstance(term, (list, tuple)) and len(term) == 3 and term[0] == field_name and term[1] == '>='
+    ]
+    for value in candidates:
+        try:
+            return date.fromisoformat(str(value)[:10])
+        except (TypeError, ValueError):
+            continue
+    return None
+
+
+# ==================== Closed Bucket Cache ====================
+
+_caches: Dict[Tuple[str, str, str], ResultCache] = {}
+_caches_lock = threading.Lock()
+
+
+def closed_bucket_cache(config) -> Optional[ResultCache]:
+    """
+    Get the closed-bucket cache of an Odoo connection.
+
+    Args:
+        config: OdooConfig identifying the server, database and user
+
+    Returns:
+        ResultCache, or None if ODOO_CASH_FLOW_CLOSED_TTL is 0
+    """
+    if settings.odoo_cash_flow_closed_ttl <= 0:
+        return None
+    key = (config.url, config.database, config.username)
+    with _caches_lock:
+        cache = _caches.get(key)
+        if cache is None:
+            cache = _caches[key] = ResultCache(
+                max_entries=settings.odoo_cache_max_entries,
+                model_ttls={_MODEL: settings.odoo_cash_flow_closed_ttl}
+            )
+    return cache
+
+
+def invalidate_closed_buckets(config, model: str) -> None:
+    """
+    Drop the cached buckets and opening balances of a connection after a write.
+
+    Args:
+        config: OdooConfig identifying the server, database and user
+        model: Odoo model written to; only INVALIDATING_MODELS clear the cache
+    """
+    if model not in INVALIDATING_MODELS:
+        return
+    with _caches_lock:
+        cache = _caches.get((config.url, config.database, config.username))
+    if cache is not None:
+        cache.invalidate_model(_MODEL)
+
+
+def bucket_key(bucket: Bucket) -> str:
+    """Cache key of a bucket's (inflow, outflow) per journal."""
+    return ResultCache.make_key(
+        _MODEL, 'cash_flow_bucket', (bucket.date_from.isoformat(), bucket.date_to.isoformat()), {}
+    )
+
+
+def opening_key(day: date) -> str:
+    """Cache key of the balance per journal before a day."""
+    return ResultCache.make_key(_MODEL, 'cash_flow_opening', (day.isoformat(),), {})
+
+
+# ==================== Ledger ====================
+
+def ledger_totals(
+    snapshot: LedgerSnapshot,
+    date_from: date,
+    date_to: date,
+    series_buckets: Sequence[Bucket]
+) -> Tuple[List[Dict[str, Any]], Dict[date, Dict[int, Tuple[float, float]]], Dict[int, float]]:
+    """
+    Get bank and cash journals, bucket totals and opening balances from the ledger cache.
+
+    Args:
+        snapshot: Ledger snapshot covering date_from on
+        date_from: First day of the report
+        date_to: Last day of the report
+        series_buckets: Buckets of the report (see buckets())
+
+    Returns:
+        Tuple of (journal rows, (inflow, outflow) per journal per bucket
+        start, balance per journal before date_from), as build_series takes them
+    """
+    journals = [j for j in snapshot.journals.values() if j.get('type') in LIQUIDITY_JOURNALS[0][2]]
+    journal_ids = [j['id'] for j in journals]
+    columns = snapshot.columns
+
+    before = columns.sum_by(
+        'journal_id', 'balance', columns.mask(date_to=date_from - timedelta(days=1), journal_id=journal_ids)
+    )
+    opening = {
+        journal_id: snapshot.carried.get(journal_id, 0.0) + before.get(journal_id, 0.0)
+        for journal_id in journal_ids
+    }
+
+    totals: Dict[date, Dict[int, Tuple[float, float]]] = {}
+    if not series_buckets:
+        return journals, totals, opening
+    mask = columns.mask(date_from, date_to, journal_id=journal_ids)
+    starts = np.array([epoch_day(bucket.date_from) for bucket in series_buckets])
+    # One key per (journal, bucket)
+    width = len(series_buckets)
+    keys = columns.journal_id * width + np.searchsorted(starts, columns.date, side='right') - 1
+    debits = columns.sum_by(keys, 'debit', mask)
+    credits = columns.sum_by(keys, 'credit', mask)
+    for key, debit in debits.items():
+        journal_id, index = divmod(key, width)
+        totals.setdefault(series_buckets[index].start, {})[journal_id] = (debit, credits[key])
+    return journals, totals, opening
+
+
+# ==================== Series ====================
+
+def build_series(
+    journals: Sequence[Dict[str, Any]],
+    series_buckets: Sequence[Bucket],
+    totals: Dict[date, Dict[int, Tuple[float, float]]],
+    opening: Dict[int, float]
+) -> Dict[str, Any]:
+    """
+    Assemble a cash-flow series.
+
+    Args:
+        journals: account.journal rows with id, name and type
+        series_buckets: Buckets of the report (see buckets())
+        totals: (inflow, outflow) per journal id, per bucket start
+        opening: Balance per journal id before the first bucket
+
+    Returns:
+        Totals, a combined series and one series per journal; each point has
+        date_from, date_to, inflows, outflows, net and the running balance
+    """
+    shape = (len(journals), len(series_buckets))
+    inflows = np.zeros(shape)
+    outflows = np.zeros(shape)
+    for j, journal in enumerate(journals):
+        for b, bucket in enumerate(series_buckets):
+            inflows[j, b], outflows[j, b] = totals.get(bucket.start, {}).get(journal['id'], (0.0, 0.0))
+
+    net = inflows - outflows
+    openings = np.array([opening.get(journal['id'], 0.0) for journal in journals])
+    balances = openings[:, None] + np.cumsum(net, axis=1)
+
+    def points(inflow: np.ndarray, outflow: np.ndarray, balance: np.ndarray) -> List[Dict[str, Any]]:
+        return [
+            {
+                'date_from': bucket.date_from.isoformat(),
+                'date_to': bucket.date_to.isoformat(),
+                'inflows': float(inflow[b]),
+                'outflows': float(outflow[b]),
+                'net': float(inflow[b] - outflow[b]),
+                'balance': float(balance[b]),
+            }
+            for b, bucket in enumerate(series_buckets)
+        ]
+
+    by_journal = []
+    for j, journal in enumerate(journals):
+        closing = float(balances[j, -1]) if series_buckets else float(openings[j])
+        by_journal.append({
+            'journal_id': journal['id'],
+            'journal': journal['name'],
+            'type': journal['type'],
+            'inflows': float(inflows[j].sum()),
+            'outflows': float(outflows[j].sum()),
+            'net': float(net[j].sum()),
+            'opening_balance': float(openings[j]),
+            'closing_balance': closing,
+            'series': points(inflows[j], outflows[j], balances[j]),
+        })
+
+    opening_balance = float(openings.sum())
+    total_in, total_out = float(inflows.sum()), float(outflows.sum())
+    return {
+        'total_inflows': total_in,
+        'total_outflows': total_out,
+        'net_cash_flow': total_in - total_out,
+        'opening_balance': opening_balance,
+        'closing_balance': opening_balance + total_in - total_out,
+        'series': points(inflows.sum(axis=0), outflows.sum(axis=0), balances.sum(axis=0)),
+        'by_journal': by_journal,
+    }
@@ -1,18 +1,48 @@
 """
-Odoo XML-RPC Client
+Odoo RPC Client
 
-A robust client for interacting with Odoo ERP via XML-RPC protocol.
+A robust client for interacting with Odoo ERP via XML-RPC or JSON-RPC.
 Provides connection management, CRUD operations, and error handling.
 """
 
+import threading
+import time
 import xmlrpc.client
-from typing import Any, Dict, List, Optional, Union, Tuple
-from functools import lru_cache
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Union, Tuple
+from functools import lru_cache, partial
 from dataclasses import dataclass
 import logging
 
 from src.config import settings
-from src.core.exceptions import OdooConnectionError, OdooOperationError
+from src.core.exceptions import OdooConnectionError, OdooUnavailableError
+from src.integrations.odoo.bulk import BulkResult, run_chunked
+from src.integrations.odoo.cache import READ_METHODS, ResultCache, get_result_cache
+from src.integrations.odoo.cash_flow import invalidate_closed_buckets
+from src.integrations.odoo.fanout import CallResult, OdooCall, fan_out
+from src.integrations.odoo.instrumentation import (
+    OdooMetrics,
+    count_rows,
+    detect_caller,
+    get_odoo_metrics,
+    take_response_size,
+)
+from src.integrations.odoo.metadata import MetadataRegistry
+from src.integrations.odoo.ledger import get_odoo_ledger
+from src.integrations.odoo.mirror import get_odoo_mirror
+from src.integrations.odoo.projections import check_projection, projection
+from src.integrations.odoo.read_group import ReadGroupRow, parse_read_group
+from src.integrations.odoo.records import OdooRecord, RecordBatch, shape_rows
+from src.integrations.odoo.resilience import (
+    CircuitBreaker,
+    RetryPolicy,
+    circuit_open_error,
+    get_circuit_breaker,
+    map_call_error,
+    remaining_timeout,
+)
+from src.integrations.odoo.singleflight import SingleFlight
+from src.integrations.odoo.tracing import trace_call
+from src.integrations.odoo.transport import OdooTransport, create_transport
 
 logger = logging.getLogger(__name__)
 
@@ -25,14 +55,43 @@ class OdooConfig:
     username: str
     password: str
     timeout: int = 30
+    transport: str = "xmlrpc"
+    max_connections: int = 20
+    idle_timeout: float = 60.0
+    compression: bool = True
+    request_compression_min_bytes: int = 0
+
+    @classmethod
+    def from_settings(cls, **overrides: Any) -> "OdooConfig":
+        """
+        Build a configuration from the ODOO_* settings.
+
+        Args:
+            **overrides: Field values replacing the settings (e.g. database='acme')
+        """
+        values = {
+            'url': settings.odoo_url,
+            'database': settings.odoo_db,
+            'username': settings.odoo_username,
+            'password': settings.odoo_password,
+            'timeout': settings.odoo_timeout,
+            'transport': settings.odoo_transport,
+            'max_connections': settings.odoo_max_connections,
+            'idle_timeout': settings.odoo_idle_timeout,
+            'compression': settings.odoo_compression_enabled,
+            'request_compression_min_bytes': settings.odoo_request_compression_min_bytes,
+        }
+        values.update(overrides)
+        return cls(**values)
 
 
 class OdooClient:
     """
-    Wrapper for Odoo XML-RPC operations.
+    Wrapper for Odoo RPC operations.
 
     Provides CRUD operations, connection management, and error handling.
-    Thread-safe for concurrent access.
+    Thread-safe for concurrent access: every call checks out its own
+    keep-alive connection from the transport's bounded pool.
 
     Usage:
         client = OdooClient(OdooConfig(...))
@@ -40,51 +99,61 @@ class OdooClient:
         partners = client.search_read('res.partner', [['is_company', '=', True]])
     """
 
-    def __init__(self, config: Optional[OdooConfig] = None):
+    def __init__(
+        self,
+        config: Optional[OdooConfig] = None,
+        transport: Optional[OdooTransport] = None
+    ):
         """
         Initialize Odoo client.
 
         Args:
             config: Optional configuration. Uses settings if not provided.
+            transport: Optional transport. Built from config.transport if not provided.
         """
         if config is None:
-            config = OdooConfig(
-                url=settings.odoo_url,
-                database=settings.odoo_db,
-                username=settings.odoo_username,
-                password=settings.odoo_password,
-                timeout=settings.odoo_timeout
-            )
+            config = OdooConfig.from_settings()
         self.config = config
         self._uid: Optional[int] = None
-        self._common: Optional[xmlrpc.client.ServerProxy] = None
-        self._models: Optional[xmlrpc.client.ServerProxy] = None
+        self._transport = transport
+        self._auth_lock = threading.Lock()
+        self.cache: Optional[ResultCache] = get_result_cache(config)
+        self.flights: Optional[SingleFlight] = (
+            SingleFlight() if settings.odoo_coalesce_enabled else None
+        )
+        self._metadata: Optional[MetadataRegistry] = None
+        self.metrics: Optional[OdooMetrics] = (
+            get_odoo_metrics() if settings.odoo_metrics_enabled else None
+        )
+        self.tracing = True
+        self.retry: Optional[RetryPolicy] = (
+            RetryPolicy() if settings.odoo_retry_attempts > 1 else None
+        )
+        self.breaker: Optional[CircuitBreaker] = get_circuit_breaker(config)
 
     @property
-    def common(self) -> xmlrpc.client.ServerProxy:
-        """Get common endpoint proxy (lazy initialization)."""
-        if self._common is None:
-            self._common = xmlrpc.client.ServerProxy(
-                f'{self.config.url}/xmlrpc/2/common',
-                allow_none=True
-            )
-        return self._common
+    def transport(self) -> OdooTransport:
+        """Get wire transport (lazy initialization)."""
+        if self._transport is None:
+            self._transport = create_transport(self.config)
+        return self._transport
 
     @property
-    def models(self) -> xmlrpc.client.ServerProxy:
-        """Get models endpoint proxy (lazy initialization)."""
-        if self._models is None:
-            self._models = xmlrpc.client.ServerProxy(
-                f'{self.config.url}/xmlrpc/2/object',
-                allow_none=True
-            )
-        return self._models
+    def metadata(self) -> MetadataRegistry:
+        """Get model/field metadata registry (lazy initialization)."""
+        if self._metadata is None:
+            with self._auth_lock:
+                if self._metadata is None:
+                    self._metadata = MetadataRegistry(self)
+        return self._metadata
 
     @property
     def uid(self) -> int:
         """Get authenticated user ID, authenticating if necessary."""
         if self._uid is None:
-            self.authenticate()
+            with self._auth_lock:
+                if self._uid is None:
+                    self.authenticate()
         return self._uid
 
     @property
@@ -103,13 +172,8 @@ class OdooClient:
             OdooConnectionError: If authentication fails
         """
         try:
-            logger.info(f"Authenticating to Odoo at {self.config.url}")
-            self._uid = self.common.authenticate(
-                self.config.database,
-                self.config.username,
-                self.config.password,
-                {}
-            )
+            logger.info(f"Authenticating to Odoo at {self.config.url} ({self.transport.name})")
+            self._uid = self.transport.authenticate()
             if not self._uid:
                 raise OdooConnectionError(
                     "Authentication failed - invalid credentials",
@@ -117,6 +181,8 @@ class OdooClient:
                 )
             logger.info(f"Successfully authenticated as user ID: {self._uid}")
             return self._uid
+        except OdooConnectionError:
+            raise
         except xmlrpc.client.Fault as e:
             raise OdooConnectionError(
                 f"Odoo fault during authentication: {e.faultString}",
@@ -138,6 +204,13 @@ class OdooClient:
         """
         Execute an Odoo model method.
 
+        Read-only calls on models with a cache TTL are served from the
+        result cache, and identical reads already in flight on another
+        thread are joined instead of sent again. Write-type calls invalidate
+        the model's cached results and mark its local mirror dirty. While
+        Odoo is unavailable, cached reads fall back to their last (possibly
+        expired) result.
+
         Args:
             model: Odoo model name (e.g., 'res.partner')
             method: Method to call (e.g., 'search_read')
@@ -149,31 +222,179 @@ class OdooClient:
 
         Raises:
             OdooOperationError: If the operation fails
+            OdooUnavailableError: If Odoo is unreachable and no stale result is cached
+            OdooDeadlineExceeded: If the active odoo_deadline() has passed
         """
+        if self.tracing:
+            trace_call(model, method, args, kwargs)
+            check_projection(model, method, args, kwargs)
+        cache, flights = self.cache, self.flights
+
+        if method not in READ_METHODS:
+            # Anything else may modify the model; drop its cached reads even
+            # if the call fails, since it may have partially applied
+            try:
+                return self._call(model, method, args, kwargs)
+            finally:
+                if cache is not None:
+                    cache.invalidate_model(model)
+                if flights is not None:
+                    flights.forget_model(model)
+                mirror = get_odoo_mirror(self.config)
+                if mirror is not None:
+                    mirror.mark_dirty(model)
+                ledger = get_odoo_ledger(self.config)
+                if ledger is not None:
+                    ledger.mark_dirty(model)
+                invalidate_closed_buckets(self.config, model)
+
+        cacheable = cache is not None and cache.is_cacheable(model, method)
+        if not cacheable and flights is None:
+            return self._call(model, method, args, kwargs)
+
+        key = ResultCache.make_key(model, method, args, kwargs)
+        if cacheable:
+            hit, value = cache.get(key)
+            if hit:
+                return value
+            generation = cache.generation(model)
+
+        def fetch() -> Any:
+            try:
+                value = self._call(model, method, args, kwargs)
+            except OdooUnavailableError:
+                if cacheable:
+                    hit, value = cache.get_stale(key)
+                    if hit:
+                        logger.warning(f"Odoo unavailable, serving stale {model}.{method} result")
+                        return value
+                raise
+            if cacheable:
+                cache.set(key, model, value, generation=generation)
+            return value
+
+        if flights is None:
+            return fetch()
+        return flights.do(key, model, fetch)
+
+    def _trace_served(self, model: str, method: str, args: tuple, kwargs: Dict[str, Any]) -> None:
+        """Count a call answered from the local mirror in the active trace, as execute() would."""
+        if self.tracing:
+            trace_call(model, method, args, kwargs)
+
+    def _call(
+        self,
+        model: str,
+        method: str,
+        args: tuple,
+        kwargs: Dict[str, Any]
+    ) -> Any:
+        """Execute a call and record its metrics."""
+        metrics = self.metrics
+        if metrics is None:
+            return self._call_uninstrumented(model, method, args, kwargs)
+
+        caller = detect_caller()
+        take_response_size()
+        started = time.perf_counter()
         try:
-            result = self.models.execute_kw(
-                self.config.database,
-                self.uid,
-                self.config.password,
-                model,
-                method,
-                list(args),
-                kwargs or {}
-            )
+            result = self._call_uninstrumented(model, method, args, kwargs)
+        except Exception:
+            metrics.record(model, method, caller, time.perf_counter() - started,
+                           response=take_response_size(), error=True)
+            raise
+        metrics.record(model, method, caller, time.perf_counter() - started,
+                       rows=count_rows(result), response=take_response_size())
+        return result
+
+    def _call_uninstrumented(
+        self,
+        model: str,
+        method: str,
+        args: tuple,
+        kwargs: Dict[str, Any]
+    ) -> Any:
+        """
+        Send a call and map transport errors (see map_call_error).
+
+        Each attempt is gated by the circuit breaker and gets the time left
+        before the active deadline as its timeout. Failed attempts are
+        retried with backoff where the retry policy allows it.
+        """
+        breaker, retry = self.breaker, self.retry
+        args, kwargs = list(args), kwargs or {}
+        attempt = 0
+        while True:
+            timeout = remaining_timeout(self.config.timeout)
+            if breaker is not None and not breaker.allow():
+                raise circuit_open_error(model, method)
+            try:
+                result = self._execute_kw(model, method, args, kwargs, timeout)
+            except Exception as e:
+                if breaker is not None:
+                    breaker.record(e)
+                delay = retry.backoff(method, e, attempt) if retry is not None else None
+                if delay is None:
+                    raise map_call_error(e, model, method, attempt + 1)
+                logger.info(f"Retrying {model}.{method} in {delay:.2f}s after: {e}")
+                time.sleep(remaining_timeout(delay))
+                attempt += 1
+                continue
+            except BaseException:
+                # Cancelled or interrupted: no outcome to record, but free a half_open probe
+                if breaker is not None:
+                    breaker.release()
+                raise
+            if breaker is not None:
+                breaker.record()
             return result
-        except xmlrpc.client.Fault as e:
-            raise OdooOperationError(
-                f"Operation failed: {e.faultString}",
-                model=model,
-                method=method,
-                details={"fault_code": e.faultCode}
-            )
-        except Exception as e:
-            raise OdooOperationError(
-                f"Operation error: {str(e)}",
-                model=model,
-                method=method
-            )
+
+    def _execute_kw(
+        self,
+        model: str,
+        method: str,
+        args: List[Any],
+        kwargs: Dict[str, Any],
+        timeout: Optional[float] = None
+    ) -> Any:
+        """
+        Send a raw execute_kw call through the transport.
+
+        Subclasses override this to route calls elsewhere while keeping
+        the error handling in execute().
+        """
+        return self.transport.execute_kw(self.uid, model, method, args, kwargs, timeout)
+
+    def execute_many(
+        self,
+        calls: Sequence[OdooCall],
+        max_parallel: Optional[int] = None
+    ) -> List[CallResult]:
+        """
+        Execute independent calls concurrently.
+
+        Args:
+            calls: Call specifications (see OdooCall)
+            max_parallel: Maximum calls in flight. Uses settings if not provided.
+
+        Returns:
+            One CallResult per call, in input order; a failed call carries
+            its OdooOperationError instead of a value
+
+        Usage:
+            receivables, count = client.execute_many([
+                OdooCall.read_group('account.move', domain, ['amount_residual:sum'], []),
+                OdooCall.search_count('sale.order', [['state', '=', 'draft']]),
+            ])
+        """
+        def run(call: OdooCall) -> Any:
+            value = self.execute(call.model, call.method, *call.args, **call.kwargs)
+            return call.parse(value) if call.parse else value
+
+        return fan_out(
+            [partial(run, call) for call in calls],
+            max_parallel or settings.odoo_fanout_max_parallel
+        )
 
     def search(
         self,
@@ -226,6 +447,14 @@ class OdooClient:
         kwargs = {}
         if fields:
             kwargs['fields'] = fields
+
+        mirror = get_odoo_mirror(self.config)
+        if mirror is not None:
+            hit, rows = mirror.read(model, ids, fields)
+            if hit:
+                self._trace_served(model, 'read', (ids,), kwargs)
+                return rows
+
         return self.execute(model, 'read', ids, **kwargs)
 
     def search_read(
@@ -235,11 +464,15 @@ class OdooClient:
         fields: Optional[List[str]] = None,
         limit: Optional[int] = None,
         offset: int = 0,
-        order: Optional[str] = None
-    ) -> List[Dict[str, Any]]:
+        order: Optional[str] = None,
+        result: str = 'dicts'
+    ) -> Union[List[Dict[str, Any]], List[OdooRecord], RecordBatch]:
         """
         Search and read in one operation (more efficient).
 
+        Answered from the local mirror (see mirror.py) when it holds the
+        model and fields and is fresh.
+
         Args:
             model: Odoo model name
             domain: Search domain
@@ -247,9 +480,11 @@ class OdooClient:
             limit: Maximum records
             offset: Records to skip
             order: Sort order
+            result: 'dicts' (Odoo's rows), 'records' (slotted typed records)
+                or 'columns' (a columnar RecordBatch); see records.py
 
         Returns:
-            List of matching records with specified fields
+            Matching records with specified fields, in the requested shape
         """
         kwargs = {}
         if fields:
@@ -261,7 +496,83 @@ class OdooClient:
         if order:
             kwargs['order'] = order
 
-        return self.execute(model, 'search_read', domain, **kwargs)
+        mirror = get_odoo_mirror(self.config)
+        if mirror is not None:
+            hit, rows = mirror.search_read(model, domain, fields, offset, limit, order)
+            if hit:
+                self._trace_served(model, 'search_read', (domain,), kwargs)
+                return self._shape(model, rows, result, fields)
+
+        rows = self.execute(model, 'search_read', domain, **kwargs)
+        return self._shape(model, rows, result, fields)
+
+    def _shape(
+        self,
+        model: str,
+        rows: List[Dict[str, Any]],
+        result: str,
+        fields: Optional[List[str]]
+    ) -> Union[List[Dict[str, Any]], List[OdooRecord], RecordBatch]:
+        """Convert search_read rows to a result mode, typing fields from the metadata registry."""
+        if result == 'dicts':
+            return rows
+        try:
+            definitions = self.metadata.fields(model)
+        except Exception as e:
+            logger.debug(f"No field definitions for {model}, inferring types: {e}")
+            definitions = {}
+        return shape_rows(model, rows, result, fields, definitions)
+
+    def iter_search_read(
+        self,
+        model: str,
+        domain: List[Union[Tuple, List]],
+        fields: Optional[List[str]] = None,
+        batch_size: int = 1000,
+        result: str = 'dicts'
+    ) -> Iterator[Union[List[Dict[str, Any]], List[OdooRecord], RecordBatch]]:
+        """
+        Stream all matching records in batches using keyset pagination.
+
+        Each page is fetched with an extra ``id > last_id`` condition ordered
+        by id, so pages stay cheap for the server at any depth and memory use
+        is bounded by batch_size regardless of the total result size.
+
+        Args:
+            model: Odoo model name
+            domain: Search domain
+            fields: Fields to read
+            batch_size: Records per round trip
+            result: Shape of each batch ('dicts', 'records' or 'columns'); see search_read
+
+        Yields:
+            Batches of up to batch_size records, in ascending id order
+        """
+        mirror = get_odoo_mirror(self.config)
+        if mirror is not None:
+            # One local filter pass instead of one per page
+            hit, rows = mirror.search_read(model, domain, fields, order='id asc')
+            if hit:
+                self._trace_served(model, 'search_read', (domain,), {'fields': fields, 'order': 'id asc'})
+                for start in range(0, len(rows), batch_size):
+                    yield self._shape(model, rows[start:start + batch_size], result, fields)
+                return
+
+        last_id = 0
+        while True:
+            batch = self.search_read(
+                model,
+                [['id', '>', last_id]] + list(domain),
+                fields=fields,
+                limit=batch_size,
+                order='id asc'
+            )
+            if not batch:
+                return
+            yield self._shape(model, batch, result, fields)
+            if len(batch) < batch_size:
+                return
+            last_id = batch[-1]['id']
 
     def search_count(
         self,
@@ -278,8 +589,49 @@ class OdooClient:
         Returns:
             Number of matching records
         """
+        mirror = get_odoo_mirror(self.config)
+        if mirror is not None:
+            hit, count = mirror.search_count(model, domain)
+            if hit:
+                self._trace_served(model, 'search_count', (domain,), {})
+                return count
         return self.execute(model, 'search_count', domain)
 
+    def read_group(
+        self,
+        model: str,
+        domain: List[Union[Tuple, List]],
+        fields: List[str],
+        groupby: List[str],
+        lazy: bool = False,
+        orderby: Optional[str] = None,
+        limit: Optional[int] = None
+    ) -> List[ReadGroupRow]:
+        """
+        Aggregate records server-side, grouped by one or more fields.
+
+        Args:
+            model: Odoo model name
+            domain: Search domain
+            fields: Aggregate specs (e.g. ['amount_residual:sum'])
+            groupby: Group specs, with optional date granularity
+                (e.g. ['journal_id', 'date:month']); [] for a single total row
+            lazy: Only group by the first groupby (Odoo's default is True)
+            orderby: Sort order for groups
+            limit: Maximum groups to return
+
+        Returns:
+            List of typed grouped rows
+        """
+        kwargs = {'lazy': lazy}
+        if orderby:
+            kwargs['orderby'] = orderby
+        if limit is not None:
+            kwargs['limit'] = limit
+
+        rows = self.execute(model, 'read_group', domain, fields, groupby, **kwargs)
+        return parse_read_group(rows, fields, groupby, lazy=lazy)
+
     def create(
         self,
         model: str,
@@ -365,6 +717,121 @@ class OdooClient:
         """
         return self.execute(model, method, ids, *args, **kwargs)
 
+    # ==================== Bulk Operations ====================
+
+    def create_many(
+        self,
+        model: str,
+        values_list: Sequence[Dict[str, Any]],
+        chunk_size: Optional[int] = None
+    ) -> BulkResult:
+        """
+        Create many records using Odoo's multi-create form.
+
+        Args:
+            model: Odoo model name
+            values_list: Field values, one dict per record
+            chunk_size: Records per RPC. Uses settings if not provided.
+
+        Returns:
+            BulkResult whose results are the created ids, in input order
+        """
+        result = run_chunked(
+            values_list,
+            lambda chunk: self.execute(model, 'create', chunk),
+            chunk_size or settings.odoo_bulk_chunk_size,
+            per_item=True
+        )
+        logger.info(f"Created {len(values_list) - len(result.errors)} {model} records in {result.calls} calls")
+        return result
+
+    def write_many(
+        self,
+        model: str,
+        ids: Sequence[int],
+        values: Dict[str, Any],
+        chunk_size: Optional[int] = None
+    ) -> BulkResult:
+        """
+        Apply the same values to many records.
+
+        Args:
+            model: Odoo model name
+            ids: Record IDs to update
+            values: Field values to update
+            chunk_size: Records per RPC. Uses settings if not provided.
+
+        Returns:
+            BulkResult with one entry per id
+        """
+        ids = list(ids)
+        result = run_chunked(
+            ids,
+            lambda chunk: self.execute(model, 'write', chunk, values),
+            chunk_size or settings.odoo_bulk_chunk_size,
+            record_ids=ids
+        )
+        logger.info(f"Updated {len(ids) - len(result.errors)} {model} records in {result.calls} calls")
+        return result
+
+    def unlink_many(
+        self,
+        model: str,
+        ids: Sequence[int],
+        chunk_size: Optional[int] = None
+    ) -> BulkResult:
+        """
+        Delete many records.
+
+        Args:
+            model: Odoo model name
+            ids: Record IDs to delete
+            chunk_size: Records per RPC. Uses settings if not provided.
+
+        Returns:
+            BulkResult with one entry per id
+        """
+        ids = list(ids)
+        result = run_chunked(
+            ids,
+            lambda chunk: self.execute(model, 'unlink', chunk),
+            chunk_size or settings.odoo_bulk_chunk_size,
+            record_ids=ids
+        )
+        logger.info(f"Deleted {len(ids) - len(result.errors)} {model} records in {result.calls} calls")
+        return result
+
+    def call_method_many(
+        self,
+        model: str,
+        method: str,
+        ids: Sequence[int],
+        *args,
+        chunk_size: Optional[int] = None,
+        **kwargs
+    ) -> BulkResult:
+        """
+        Call a record method (e.g. a workflow action) on many records.
+
+        Args:
+            model: Odoo model name
+            method: Method name to call
+            ids: Record IDs
+            *args: Additional arguments
+            chunk_size: Records per RPC. Uses settings if not provided.
+            **kwargs: Keyword arguments
+
+        Returns:
+            BulkResult whose results are each chunk's return value, per id
+        """
+        ids = list(ids)
+        return run_chunked(
+            ids,
+            lambda chunk: self.execute(model, method, chunk, *args, **kwargs),
+            chunk_size or settings.odoo_bulk_chunk_size,
+            record_ids=ids
+        )
+
     def fields_get(
         self,
         model: str,
@@ -436,14 +903,28 @@ class OdooClient:
         """
         Check if a model exists in Odoo.
 
+        Served from the metadata registry after its first load.
+
         Args:
             model: Model name to check
 
         Returns:
             True if model exists
         """
-        count = self.search_count('ir.model', [['model', '=', model]])
-        return count > 0
+        return self.metadata.has_model(model)
+
+    def fields_for(self, model: str, profile: str = 'summary') -> List[str]:
+        """
+        Get a projection profile's fields that exist on this database.
+
+        Args:
+            model: Model name
+            profile: 'summary', 'detail' or 'agent' (see projections.py)
+
+        Returns:
+            Field names to pass as fields
+        """
+        return projection(model, profile, self.metadata.fields(model))
 
     def get_version(self) -> Dict[str, Any]:
         """
@@ -452,30 +933,96 @@ class OdooClient:
         Returns:
             Version information dictionary
         """
-        return self.common.version()
+        return self.transport.version()
 
+    def pool_stats(self) -> Dict[str, int]:
+        """
+        Get connection pool usage counters.
+
+        Returns:
+            Dictionary with pool size, idle/in-use counts and reuse counters
+        """
+        return self.transport.pool.stats()
+
+    def cache_stats(self) -> Dict[str, Any]:
+        """
+        Get result cache counters.
+
+        Returns:
+            Dictionary with hit/miss/eviction counters and size, or
+            {'enabled': False} if caching is disabled
+        """
+        if self.cache is None:
+            return {'enabled': False}
+        return {'enabled': True, **self.cache.stats()}
+
+    def coalescing_stats(self) -> Dict[str, Any]:
+        """
+        Get single-flight counters.
 
-# Singleton instance
-_client_instance: Optional[OdooClient] = None
+        Returns:
+            Dictionary with leader/coalesced counts and calls in flight, or
+            {'enabled': False} if coalescing is disabled
+        """
+        if self.flights is None:
+            return {'enabled': False}
+        return {'enabled': True, **self.flights.stats()}
+
+    def breaker_stats(self) -> Dict[str, Any]:
+        """
+        Get circuit breaker state.
+
+        Returns:
+            Dictionary with state, failure count and trip/rejection counters,
+            or {'enabled': False} if circuit breaking is disabled
+        """
+        if self.breaker is None:
+            return {'enabled': False}
+        return {'enabled': True, **self.breaker.stats()}
+
+    def close(self) -> None:
+        """Close pooled connections and stop metadata refreshes."""
+        if self._metadata is not None:
+            self._metadata.stop_background_refresh()
+        if self._transport is not None:
+            self._transport.close()
+
+
+# Shared clients by connection identity (one per tenant)
+_clients: Dict[Tuple[str, str, str], OdooClient] = {}
+_client_lock = threading.Lock()
 
 
 def get_odoo_client(config: Optional[OdooConfig] = None) -> OdooClient:
     """
-    Get or create singleton Odoo client instance.
+    Get or create the shared Odoo client for a connection.
+
+    Each server/database/user gets its own client, and with it its own
+    connection pool, metadata registry and result cache.
 
     Args:
-        config: Optional configuration override
+        config: Connection to use. The active tenant's (see tenants.py) if not provided.
 
     Returns:
         Configured OdooClient instance
     """
-    global _client_instance
-    if _client_instance is None:
-        _client_instance = OdooClient(config)
-    return _client_instance
+    if config is None:
+        from src.integrations.odoo.tenants import current_tenant_config
+        config = current_tenant_config()
+    key = (config.url, config.database, config.username)
+    client = _clients.get(key)
+    if client is None:
+        with _client_lock:
+            client = _clients.get(key)
+            if client is None:
+                client = _clients[key] = OdooClient(config)
+    return client
 
 
 def reset_odoo_client() -> None:
-    """Reset the singleton client instance (useful for testing)."""
-    global _client_instance
-    _client_instance = None
+    """Close and forget every shared client (useful for testing)."""
+    with _client_lock:
+        clients = list(_clients.values())
+        _clients.clear()
+    for client in clients:
+        client.close()
@@ -0,0 +1,555 @@
+"""
+Odoo Search Domains
+
+Canonical form, hashing, reusable fragments and local evaluation for Odoo
+search domains.
+
+- normalize(): equivalent domains (terms in another order, duplicate or
+  redundant terms, nested conjunctions, single-value 'in') map to one
+  canonical domain. Given the model's field definitions, '=' / 'in' terms
+  on the same single-valued field are also intersected.
+- domain_key()/domain_hash(): stable identity of the canonical form, for
+  cache keys.
+- Fragments: named, immutable domains such as POSTED_UNPAID_CUSTOMER_INVOICES,
+  combined with and_domains()/or_domains().
+- compile_domain()/filter_records(): evaluate a domain against records
+  already in memory (cached search_read rows, a local mirror), so filtered
+  queries can be answered without an RPC.
+"""
+
+import hashlib
+import json
+import re
+from datetime import date, datetime
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+from src.core.exceptions import OdooDomainError
+
+
+# Always-true and always-false terms (as used by Odoo itself)
+TRUE_LEAF = (1, '=', 1)
+FALSE_LEAF = (0, '=', 1)
+
+OPERATORS = frozenset({
+    '=', '!=', '<', '>', '<=', '>=', 'in', 'not in',
+    'like', 'ilike', 'not like', 'not ilike', '=like', '=ilike',
+    'child_of', 'parent_of',
+})
+
+_OPERATOR_ALIASES = {'==': '=', '<>': '!='}
+
+# Operators that hold when the field is empty (SQL NULL) in Odoo
+_NEGATIVE_OPERATORS = frozenset({'!=', 'not in', 'not like', 'not ilike'})
+
+# Field types holding at most one value per record. Several '=' / 'in' terms
+# on a relational x2many field ask for records linked to every value, so
+# only these may be intersected.
+SCALAR_TYPES = frozenset({
+    'char', 'text', 'html', 'selection', 'integer', 'float', 'monetary',
+    'boolean', 'date', 'datetime', 'many2one',
+})
+
+Record = Dict[str, Any]
+Fields = Dict[str, Dict[str, Any]]
+Getter = Callable[[Record, List[str]], Any]
+Predicate = Callable[[Record], bool]
+
+
+# ==================== Parsing ====================
+
+def _freeze(value: Any) -> Any:
+    """Make a term value hashable and JSON-stable (lists to tuples, dates to strings)."""
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return tuple(_freeze(v) for v in value)
+    if isinstance(value, datetime):
+        return value.strftime('%Y-%m-%d %H:%M:%S')
+    if isinstance(value, date):
+        return value.isoformat()
+    return value
+
+
+def _thaw(value: Any) -> Any:
+    """Turn a frozen term value back into wire format."""
+    if isinstance(value, tuple):
+        return [_thaw(v) for v in value]
+    return value
+
+
+def _value_key(value: Any) -> str:
+    return json.dumps(_thaw(value), sort_keys=True, default=str)
+
+
+def _make_leaf(name: Any, operator: Any, value: Any) -> Tuple[Any, str, Any]:
+    """Build a canonical term."""
+    operator = str(operator).lower()
+    operator = _OPERATOR_ALIASES.get(operator, operator)
+    if operator not in OPERATORS:
+        raise OdooDomainError(f"Unsupported domain operator: {operator}", details={'field': name})
+    value = _freeze(value)
+    if operator in ('in', 'not in'):
+        values = value if isinstance(value, tuple) else (value,)
+        unique = {_value_key(v): v for v in values}
+        value = tuple(unique[k] for k in sorted(unique))
+        if len(value) == 1 and value[0] is not False:
+            operator, value = ('=' if operator == 'in' else '!='), value[0]
+    return (name, operator, value)
+
+
+def _is_leaf(node: Tuple) -> bool:
+    return len(node) == 3
+
+
+def _parse(domain: Optional[Sequence[Any]]) -> Tuple:
+    """Parse a prefix-notation domain into a tree of ('&'|'|'|'!', children) nodes and terms."""
+    items = list(domain or [])
+    position = 0
+
+    def parse() -> Tuple:
+        nonlocal position
+        if position >= len(items):
+            raise OdooDomainError("Malformed domain: missing operand", details={'domain': items})
+        item = items[position]
+        position += 1
+        if isinstance(item, str):
+            if item in ('&', '|'):
+                return (item, [parse(), parse()])
+            if item == '!':
+                return ('!', [parse()])
+            raise OdooDomainError(f"Malformed domain: unknown operator {item!r}", details={'domain': items})
+        if not isinstance(item, (list, tuple)) or len(item) != 3:
+            raise OdooDomainError(f"Malformed domain term: {item!r}", details={'domain': items})
+        return _make_leaf(*item)
+
+    children = []
+    while position < len(items):
+        children.append(parse())
+    return ('&', children)
+
+
+# ==================== Normalization ====================
+
+def _is_scalar(name: Any, fields: Fields) -> bool:
+    """Check if a term's field is known to hold one value (never for related paths)."""
+    return (
+        isinstance(name, str)
+        and '.' not in name
+        and fields.get(name, {}).get('type') in SCALAR_TYPES
+    )
+
+
+def _merge_equalities(terms: List[Tuple], fields: Fields) -> List[Tuple]:
+    """
+    Intersect '=' / 'in' terms on the same scalar field within a conjunction.
+
+    Only applied to fields whose definition has a SCALAR_TYPES type, and
+    only when every value is of one scalar type, so an id match is never
+    merged with a name match on a many2one field.
+    """
+    values_by_field: Dict[str, List[Tuple]] = {}
+    for term in terms:
+        if _is_leaf(term) and term[1] in ('=', 'in') and _is_scalar(term[0], fields):
+            values_by_field.setdefault(term[0], []).append(term)
+
+    merged: Dict[str, Tuple] = {}
+    for name, field_terms in values_by_field.items():
+        if len(field_terms) < 2:
+            continue
+        sets = [set(t[2]) if t[1] == 'in' else {t[2]} for t in field_terms]
+        kinds = {type(v) for s in sets for v in s}
+        if len(kinds) != 1 or kinds.pop() not in (int, str):
+            continue
+        merged[name] = _make_leaf(name, 'in', set.intersection(*sets))
+
+    if not merged:
+        return terms
+    result = [t for t in terms if not (_is_leaf(t) and t[0] in merged and t[1] in ('=', 'in'))]
+    return result + list(merged.values())
+
+
+def _simplify(node: Tuple, fields: Optional[Fields] = None) -> Tuple:
+    """Flatten, deduplicate and sort a parsed domain tree; intersect scalar equalities if fields are given."""
+    if _is_leaf(node):
+        return node
+    operator, children = node
+    if operator == '!':
+        child = _simplify(children[0], fields)
+        if child == TRUE_LEAF:
+            return FALSE_LEAF
+        if child == FALSE_LEAF:
+            return TRUE_LEAF
+        if not _is_leaf(child) and child[0] == '!':
+            return child[1][0]
+        return ('!', [child])
+
+    flat = []
+    for child in (_simplify(c, fields) for c in children):
+        if not _is_leaf(child) and child[0] == operator:
+            flat.extend(child[1])
+        else:
+            flat.append(child)
+
+    absorbing, neutral = (FALSE_LEAF, TRUE_LEAF) if operator == '&' else (TRUE_LEAF, FALSE_LEAF)
+    if absorbing in flat:
+        return absorbing
+    flat = [c for c in flat if c != neutral]
+    if operator == '&' and fields:
+        flat = _merge_equalities(flat, fields)
+
+    unique = {_node_key(c): c for c in flat}
+    flat = [unique[k] for k in sorted(unique)]
+    if not flat:
+        return neutral
+    if len(flat) == 1:
+        return flat[0]
+    return (operator, flat)
+
+
+def _emit(node: Tuple) -> List[Any]:
+    """Render a tree in prefix notation."""
+    if _is_leaf(node):
+        name, operator, value = node
+        return [[name, operator, _thaw(value)]]
+    operator, children = node
+    if operator == '!':
+        return ['!'] + _emit(children[0])
+    result = [operator] * (len(children) - 1)
+    for child in children:
+        result.extend(_emit(child))
+    return result
+
+
+def _node_key(node: Tuple) -> str:
+    return json.dumps(_emit(node), sort_keys=True, default=str)
+
+
+def _to_domain(tree: Tuple) -> List[Any]:
+    """Render a simplified tree as a domain, using implicit AND at the top level."""
+    if tree == TRUE_LEAF:
+        return []
+    if not _is_leaf(tree) and tree[0] == '&':
+        result = []
+        for child in tree[1]:
+            result.extend(_emit(child))
+        return result
+    return _emit(tree)
+
+
+def normalize(domain: Optional[Sequence[Any]], fields: Optional[Fields] = None) -> List[Any]:
+    """
+    Get the canonical form of a domain.
+
+    Terms are sorted and deduplicated, nested conjunctions/disjunctions are
+    flattened, single-value 'in' becomes '=', and dates become ISO strings.
+    With field definitions, '=' / 'in' terms on the same scalar field are
+    intersected as well.
+
+    Args:
+        domain: Odoo domain in prefix notation
+        fields: Field definitions of the domain's model (e.g.
+            MetadataRegistry.fields(model)). Without them no terms are merged.
+
+    Returns:
+        Equivalent canonical domain (a new list)
+
+    Raises:
+        OdooDomainError: If the domain is malformed
+    """
+    return _to_domain(_simplify(_parse(domain), fields))
+
+
+def domain_key(domain: Optional[Sequence[Any]]) -> str:
+    """Get a canonical JSON string for a domain; equivalent domains share it."""
+    return json.dumps(normalize(domain), sort_keys=True, separators=(',', ':'), default=str)
+
+
+def domain_hash(domain: Optional[Sequence[Any]]) -> str:
+    """Get a short stable hash of a domain's canonical form."""
+    return hashlib.sha1(domain_key(domain).encode('utf-8')).hexdigest()[:16]
+
+
+def and_domains(*domains: Optional[Sequence[Any]], fields: Optional[Fields] = None) -> List[Any]:
+    """
+    Combine domains with AND.
+
+    Args:
+        domains: Domains to combine
+        fields: Field definitions of the model, to intersect scalar equalities (see normalize)
+
+    Returns:
+        Canonical domain matching records matched by every domain
+    """
+    return _to_domain(_simplify(('&', [_parse(d) for d in domains]), fields))
+
+
+def or_domains(*domains: Optional[Sequence[Any]]) -> List[Any]:
+    """
+    Combine domains with OR.
+
+    Returns:
+        Canonical domain matching records matched by any domain
+    """
+    return _to_domain(_simplify(('|', [_parse(d) for d in domains])))
+
+
+def domain_fields(domain: Optional[Sequence[Any]]) -> Set[str]:
+    """Get the field paths a domain filters on (e.g. {'state', 'journal_id.type'})."""
+    return {item[0] for item in (domain or []) if isinstance(item, (list, tuple)) and isinstance(item[0], str)}
+
+
+# ==================== Fragments ====================
+# Immutable; combine with and_domains()/or_domains() to get a list to extend.
+
+POSTED = (('state', '=', 'posted'),)
+CUSTOMER_INVOICES = (('move_type', '=', 'out_invoice'),)
+VENDOR_BILLS = (('move_type', '=', 'in_invoice'),)
+INVOICES_AND_BILLS = (('move_type', 'in', ('out_invoice', 'in_invoice')),)
+ALL_INVOICE_TYPES = (('move_type', 'in', ('out_invoice', 'in_invoice', 'out_refund', 'in_refund')),)
+UNPAID = (('payment_state', 'in', ('not_paid', 'partial')),)
+POSTED_UNPAID = POSTED + UNPAID
+POSTED_UNPAID_CUSTOMER_INVOICES = CUSTOMER_INVOICES + POSTED_UNPAID
+
+# account.move.line
+POSTED_LINES = (('parent_state', '=', 'posted'),)
+LIQUIDITY_LINES = (('journal_id.type', 'in', ('bank', 'cash')),)
+POSTED_LIQUIDITY_LINES = LIQUIDITY_LINES + POSTED_LINES
+
+# account.journal
+LIQUIDITY_JOURNALS = (('type', 'in', ('bank', 'cash')),)
+
+# account.account
+INCOME_ACCOUNTS = (('account_type', 'in', ('income', 'income_other')),)
+EXPENSE_ACCOUNTS = (('account_type', 'in', ('expense', 'expense_depreciation', 'expense_direct_cost')),)
+PROFIT_LOSS_ACCOUNTS = (('account_type', 'in', INCOME_ACCOUNTS[0][2] + EXPENSE_ACCOUNTS[0][2]),)
+PROFIT_LOSS_LINES = (('account_id.account_type', 'in', PROFIT_LOSS_ACCOUNTS[0][2]),) + POSTED_LINES
+
+# sale.order
+CONFIRMED_SALES = (('state', 'in', ('sale', 'done')),)
+
+
+def date_range(field_name: str, date_from: Optional[Any] = None, date_to: Optional[Any] = None) -> List[Any]:
+    """
+    Build an inclusive date range fragment.
+
+    Args:
+        field_name: Date field to filter on
+        date_from: Start date (open if not provided)
+        date_to: End date (open if not provided)
+    """
+    domain = []
+    if date_from:
+        domain.append([field_name, '>=', _freeze(date_from)])
+    if date_to:
+        domain.append([field_name, '<=', _freeze(date_to)])
+    return domain
+
+
+# ==================== Local Evaluation ====================
+
+def get_field_value(record: Record, path: List[str]) -> Any:
+    """
+    Read a field from a search_read row.
+
+    Raises:
+        OdooDomainError: If the field is missing or the path goes through a relation
+    """
+    if len(path) > 1:
+        raise OdooDomainError(
+            f"Cannot evaluate '{'.'.join(path)}' locally: related paths need the related records"
+        )
+    try:
+        return record[path[0]]
+    except KeyError:
+        raise OdooDomainError(f"Field '{path[0]}' is not in the records") from None
+
+
+def can_evaluate_locally(domain: Optional[Sequence[Any]], fields: Iterable[str]) -> bool:
+    """
+    Check if a domain can be evaluated on rows holding the given fields.
+
+    Args:
+        domain: Odoo domain
+        fields: Fields present in the rows (plus 'id')
+    """
+    available = set(fields) | {'id'}
+    for item in domain or []:
+        if isinstance(item, (list, tuple)) and isinstance(item[0], str):
+            if item[0] not in available or str(item[1]).lower() in ('child_of', 'parent_of'):
+                return False
+    return True
+
+
+def _like_regex(pattern: str, operator: str) -> 're.Pattern':
+    """Translate a SQL LIKE pattern ('%' and '_' wildcards) to a regex."""
+    body = ''.join('.*' if c == '%' else '.' if c == '_' else re.escape(c) for c in str(pattern))
+    if not operator.startswith('='):
+        body = f'.*{body}.*'
+    flags = re.IGNORECASE | re.DOTALL if 'ilike' in operator else re.DOTALL
+    return re.compile(body, flags)
+
+
+def _empty(value: Any) -> bool:
+    return value is None or value is False or (isinstance(value, (list, tuple)) and not value)
+
+
+def _test_for(operator: str, target: Any) -> Callable[[Any], bool]:
+    """Build a test applied to a single non-relational value."""
+    if operator == '=':
+        if target is False or target is None:
+            return _empty
+        return lambda v: not _empty(v) and v == target
+    if operator == '!=':
+        if target is False or target is None:
+            return lambda v: not _empty(v)
+        return lambda v: _empty(v) or v != target
+    if operator in ('in', 'not in'):
+        allows_empty = False in target
+        try:
+            members = frozenset(target)
+        except TypeError:
+            members = list(target)
+        if operator == 'in':
+            return lambda v: allows_empty if _empty(v) else v in members
+        return lambda v: not allows_empty if _empty(v) else v not in members
+    if operator in ('like', 'ilike', '=like', '=ilike', 'not like', 'not ilike'):
+        regex = _like_regex(target, operator.replace('not ', ''))
+        if operator.startswith('not '):
+            return lambda v: _empty(v) or not regex.fullmatch(str(v))
+        return lambda v: not _empty(v) and regex.fullmatch(str(v)) is not None
+
+    compare = {
+        '<': lambda v: v < target,
+        '>': lambda v: v > target,
+        '<=': lambda v: v <= target,
+        '>=': lambda v: v >= target,
+    }[operator]
+
+    def ordered(v: Any) -> bool:
+        if _empty(v) or target is False or target is None:
+            return False
+        try:
+            return compare(v)
+        except TypeError:
+            return False
+
+    return ordered
+
+
+def _is_many2one(value: Any) -> bool:
+    return isinstance(value, (list, tuple)) and len(value) == 2 and isinstance(value[0], int) and isinstance(value[1], str)
+
+
+def _compile_leaf(leaf: Tuple, getter: Getter) -> Predicate:
+    """Compile a canonical term."""
+    if leaf == TRUE_LEAF:
+        return lambda record: True
+    if leaf == FALSE_LEAF:
+        return lambda record: False
+    name, operator, value = leaf
+    if operator in ('child_of', 'parent_of'):
+        raise OdooDomainError(f"Operator '{operator}' cannot be evaluated locally", details={'field': name})
+    if not isinstance(name, str):
+        raise OdooDomainError(f"Malformed domain term: {list(leaf)!r}")
+
+    path = name.split('.')
+    test = _test_for(operator, value)
+    # A many2one compared with text matches on the display name, otherwise on the id
+    by_name = isinstance(value, str) or (
+        isinstance(value, tuple) and any(isinstance(t, str) for t in value)
+    )
+    negative = operator in _NEGATIVE_OPERATORS
+
+    def predicate(record: Record) -> bool:
+        current = getter(record, path)
+        if _is_many2one(current):
+            return test(current[1] if by_name else current[0])
+        if isinstance(current, (list, tuple)) and current:
+            # x2many ids: positive operators need one match, negative ones all
+            matches = (test(v) for v in current)
+            return all(matches) if negative else any(matches)
+        return test(current)
+
+    return predicate
+
+
+def _compile(node: Tuple, getter: Getter) -> Predicate:
+    if _is_leaf(node):
+        return _compile_leaf(node, getter)
+    operator, children = node
+    predicates = [_compile(c, getter) for c in children]
+    if operator == '!':
+        inner = predicates[0]
+        return lambda record: not inner(record)
+    if operator == '&':
+        return lambda record: all(p(record) for p in predicates)
+    return lambda record: any(p(record) for p in predicates)
+
+
+def compile_domain(domain: Optional[Sequence[Any]], getter: Optional[Getter] = None) -> Predicate:
+    """
+    Compile a domain into a record predicate.
+
+    Follows Odoo's semantics for empty values: comparisons with an empty
+    field fail, except '= False' and the negative operators. Many2one values
+    in [id, name] form match on the id, or on the name when compared with text.
+
+    Args:
+        domain: Odoo domain in prefix notation
+        getter: Reads a field path from a record. Defaults to get_field_value
+            (search_read rows, no related paths).
+
+    Returns:
+        Callable taking a record and returning whether it matches
+
+    Raises:
+        OdooDomainError: If the domain is malformed or uses child_of/parent_of
+    """
+    return _compile(_simplify(_parse(domain)), getter or get_field_value)
+
+
+def filter_records(
+    records: Iterable[Record],
+    domain: Optional[Sequence[Any]],
+    getter: Optional[Getter] = None
+) -> List[Record]:
+    """
+    Filter in-memory records with a domain.
+
+    Args:
+        records: Records to filter (e.g. cached search_read rows)
+        domain: Odoo domain
+        getter: Field reader (see compile_domain)
+
+    Returns:
+        Matching records, in their original order
+    """
+    predicate = compile_domain(domain, getter)
+    return [r for r in records if predicate(r)]
+
+
+def sort_key(value: Any) -> Tuple[int, Any]:
+    """Sort key placing empty values first, ordering many2one values by name and keeping mixed types comparable."""
+    if value is None or value is False:
+        return (0, 0)
+    if isinstance(value, (list, tuple)):
+        value = value[1] if len(value) > 1 else value[0]
+    if isinstance(value, (int, float)):
+        return (1, value)
+    return (2, str(value))
+
+
+def sort_records(records: List[Record], order: Optional[str] = None) -> List[Record]:
+    """
+    Sort in-memory records by an Odoo order specification, in place.
+
+    Args:
+        records: Records to sort
+        order: Order like 'date desc, id' (by id if not provided)
+
+    Returns:
+        The sorted list
+    """
+    for spec in reversed([s.strip() for s in (order or 'id').split(',') if s.strip()]):
+        parts = spec.split()
+        descending = len(parts) > 1 and parts[1].lower() == 'desc'
+        records.sort(key=lambda r, f=parts[0]: sort_key(r.get(f)), reverse=descending)
+    return records
@@ -0,0 +1,17 @@
+"""Local fake Odoo server for offline development and benchmarking."""
+
+from .dataset import FakeDataset, generate_dataset
+from .engine import DatasetBackend, FakeOdooFault
+from .recorder import RecordingBackend, ReplayBackend
+from .server import FakeOdooServer, LatencyModel
+
+__all__ = [
+    "FakeDataset",
+    "generate_dataset",
+    "DatasetBackend",
+    "FakeOdooFault",
+    "RecordingBackend",
+    "ReplayBackend",
+    "FakeOdooServer",
+    "LatencyModel",
+]
@@ -0,0 +1,75 @@
+"""
+Fake Odoo Server CLI
+
+Usage:
+    python -m src.integrations.odoo.fake --invoices 100000 --employees 10000 --contracts 5000
+    python -m src.integrations.odoo.fake --record odoo-traffic.jsonl   # proxy the configured Odoo and record
+    python -m src.integrations.odoo.fake --replay odoo-traffic.jsonl   # serve recorded responses
+"""
+
+import argparse
+import time
+
+from src.config import settings
+from src.core.logging import setup_logging, get_logger
+from src.integrations.odoo.fake.dataset import generate_dataset
+from src.integrations.odoo.fake.engine import DatasetBackend
+from src.integrations.odoo.fake.recorder import RecordingBackend, ReplayBackend
+from src.integrations.odoo.fake.server import FakeOdooServer, LatencyModel
+
+logger = get_logger(__name__)
+
+
+def main():
+    """Run the fake Odoo server until interrupted."""
+    parser = argparse.ArgumentParser(description="Local fake Odoo server")
+    parser.add_argument('--invoices', type=int, default=1000, help='Customer invoices/vendor bills to generate')
+    parser.add_argument('--employees', type=int, default=200, help='Employees to generate')
+    parser.add_argument('--contracts', type=int, default=100, help='Contracts to generate')
+    parser.add_argument('--seed', type=int, default=42, help='Random seed for the dataset')
+    parser.add_argument('--host', default='127.0.0.1', help='Interface to bind')
+    parser.add_argument('--port', type=int, default=8069, help='Port to bind')
+    parser.add_argument('--latency', type=float, default=0.0, help='Injected latency per call in ms')
+    parser.add_argument('--latency-per-row', type=float, default=0.0, help='Injected latency per returned row in ms')
+    parser.add_argument('--jitter', type=float, default=0.0, help='Maximum random extra latency per call in ms')
+    parser.add_argument('--bandwidth', type=float, default=0.0, help='Response bandwidth cap in KB/s (0 = unlimited)')
+    parser.add_argument('--compress-min-bytes', type=int, default=1024, help='Gzip responses of at least this size (0 = never)')
+    parser.add_argument('--record', metavar='PATH', help='Proxy the configured Odoo server and record traffic to PATH')
+    parser.add_argument('--replay', metavar='PATH', help='Serve responses recorded in PATH')
+    parser.add_argument('--strict', action='store_true', help='With --replay, fail calls that were not recorded')
+    args = parser.parse_args()
+
+    setup_logging(level=settings.log_level)
+
+    if args.record:
+        from src.integrations.odoo.client import OdooClient
+        backend = RecordingBackend(OdooClient().config, args.record)
+        logger.info(f"Recording traffic to {settings.odoo_url} into {args.record}")
+    else:
+        dataset_backend = None
+        if not (args.replay and args.strict):
+            started = time.perf_counter()
+            dataset = generate_dataset(args.invoices, args.employees, args.contracts, seed=args.seed)
+            logger.info(f"Generated dataset in {time.perf_counter() - started:.1f}s: {dataset.counts()}")
+            dataset_backend = DatasetBackend(dataset)
+        backend = ReplayBackend(args.replay, fallback=dataset_backend) if args.replay else dataset_backend
+
+    latency = None
+    if args.latency or args.latency_per_row or args.jitter or args.bandwidth:
+        latency = LatencyModel(
+            args.latency / 1000, args.latency_per_row / 1000, args.jitter / 1000,
+            seed=args.seed, bandwidth=args.bandwidth * 1000
+        )
+
+    server = FakeOdooServer(
+        backend=backend, latency=latency, host=args.host, port=args.port,
+        compress_min_bytes=args.compress_min_bytes
+    )
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,578 @@
+"""
+Synthetic Odoo Dataset
+
+In-memory tables shaped like the Odoo models used by the operations classes
+(accounting, sales, HR and contracts), generated deterministically from a
+seed so benchmarks are reproducible.
+
+Many2one fields are stored as the related record's id; the engine renders
+them as [id, display_name] like Odoo does.
+"""
+
+import random
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta, timezone
+from typing import Any, Dict, Iterator, List, Optional
+
+
+# Many2one fields per model: field name -> related model
+RELATIONS: Dict[str, Dict[str, str]] = {
+    'res.partner': {'company_id': 'res.company'},
+    'res.company': {'currency_id': 'res.currency'},
+    'account.account': {'company_id': 'res.company'},
+    'account.journal': {'company_id': 'res.company', 'default_account_id': 'account.account'},
+    'account.move': {
+        'partner_id': 'res.partner',
+        'journal_id': 'account.journal',
+        'currency_id': 'res.currency',
+        'company_id': 'res.company',
+        'invoice_user_id': 'res.users',
+        'user_id': 'res.users',
+    },
+    'account.move.line': {
+        'move_id': 'account.move',
+        'account_id': 'account.account',
+        'journal_id': 'account.journal',
+        'partner_id': 'res.partner',
+        'product_id': 'product.product',
+        'company_id': 'res.company',
+    },
+    'account.payment': {
+        'partner_id': 'res.partner',
+        'journal_id': 'account.journal',
+        'move_id': 'account.move',
+        'currency_id': 'res.currency',
+        'company_id': 'res.company',
+    },
+    'product.product': {'company_id': 'res.company'},
+    'sale.order': {
+        'partner_id': 'res.partner',
+        'user_id': 'res.users',
+        'currency_id': 'res.currency',
+        'company_id': 'res.company',
+    },
+    'sale.order.line': {'order_id': 'sale.order', 'product_id': 'product.product'},
+    'res.users': {'company_id': 'res.company'},
+    'hr.department': {'manager_id': 'hr.employee', 'parent_id': 'hr.department', 'company_id': 'res.company'},
+    'hr.job': {'department_id': 'hr.department', 'company_id': 'res.company'},
+    'hr.employee': {
+        'department_id': 'hr.department',
+        'job_id': 'hr.job',
+        'parent_id': 'hr.employee',
+        'coach_id': 'hr.employee',
+        'company_id': 'res.company',
+    },
+    'hr.leave.type': {'company_id': 'res.company'},
+    'hr.leave.allocation': {'employee_id': 'hr.employee', 'holiday_status_id': 'hr.leave.type'},
+    'hr.leave': {'employee_id': 'hr.employee', 'holiday_status_id': 'hr.leave.type', 'department_id': 'hr.department'},
+    'hr.attendance': {'employee_id': 'hr.employee'},
+    'hr.applicant': {'job_id': 'hr.job', 'department_id': 'hr.department', 'stage_id': 'hr.recruitment.stage'},
+    'hr.recruitment.stage': {},
+    'hr.contract': {'employee_id': 'hr.employee', 'department_id': 'hr.department', 'job_id': 'hr.job', 'company_id': 'res.company'},
+    'contract.contract': {'partner_id': 'res.partner', 'company_id': 'res.company', 'user_id': 'res.users'},
+    'contract.line': {'contract_id': 'contract.contract', 'product_id': 'product.product'},
+    'ir.model': {},
+    'ir.module.module': {},
+    'res.currency': {},
+}
+
+DEPARTMENTS = [
+    'Administration', 'Sales', 'Finance', 'Human Resources', 'Research & Development',
+    'Operations', 'Marketing', 'Customer Support', 'Legal', 'Procurement',
+]
+
+JOBS = [
+    'Chief Executive Officer', 'Sales Manager', 'Account Executive', 'Accountant',
+    'Financial Analyst', 'HR Officer', 'Recruiter', 'Software Engineer',
+    'Senior Software Engineer', 'Product Manager', 'Operations Manager',
+    'Marketing Specialist', 'Support Agent', 'Legal Counsel', 'Buyer',
+]
+
+FIRST_NAMES = [
+    'Amal', 'Omar', 'Sara', 'Youssef', 'Lina', 'Karim', 'Nadia', 'Hassan', 'Maya', 'Ali',
+    'Emma', 'Lucas', 'Olivia', 'Noah', 'Sofia', 'Liam', 'Mia', 'Adam', 'Layla', 'Ziad',
+]
+
+LAST_NAMES = [
+    'Haddad', 'Khalil', 'Mansour', 'Saleh', 'Farah', 'Nasser', 'Aziz', 'Rahman',
+    'Martin', 'Dubois', 'Schmidt', 'Rossi', 'Garcia', 'Smith', 'Novak', 'Costa',
+]
+
+# account.account records: (code, name, account_type)
+ACCOUNTS = [
+    ('101000', 'Bank', 'asset_cash'),
+    ('101100', 'Cash', 'asset_cash'),
+    ('121000', 'Account Receivable', 'asset_receivable'),
+    ('211000', 'Account Payable', 'liability_payable'),
+    ('400000', 'Product Sales', 'income'),
+    ('410000', 'Service Revenue', 'income'),
+    ('600000', 'Expenses', 'expense'),
+    ('610000', 'Salaries', 'expense'),
+    ('620000', 'Rent', 'expense'),
+    ('630000', 'Cost of Goods Sold', 'expense_direct_cost'),
+]
+
+# account.journal records: (code, name, type)
+JOURNALS = [
+    ('INV', 'Customer Invoices', 'sale'),
+    ('BILL', 'Vendor Bills', 'purchase'),
+    ('BNK1', 'Bank', 'bank'),
+    ('CSH1', 'Cash', 'cash'),
+    ('MISC', 'Miscellaneous Operations', 'general'),
+]
+
+LEAVE_TYPES = [
+    ('Paid Time Off', 'day', 'fixed'),
+    ('Sick Time Off', 'day', 'no'),
+    ('Compensatory Days', 'day', 'fixed'),
+    ('Unpaid', 'day', 'no'),
+]
+
+RECRUITMENT_STAGES = ['New', 'Initial Qualification', 'First Interview', 'Second Interview', 'Contract Proposal']
+
+INSTALLED_MODULES = ['base', 'account', 'sale', 'hr', 'hr_holidays', 'hr_attendance', 'hr_recruitment', 'hr_contract', 'contract']
+
+
+@dataclass
+class FakeDataset:
+    """
+    Tables of synthetic Odoo records.
+
+    Attributes:
+        tables: Records per model, keyed by id
+        version: Value returned by the common.version call
+    """
+    tables: Dict[str, Dict[int, Dict[str, Any]]] = field(default_factory=dict)
+    version: Dict[str, Any] = field(default_factory=lambda: {
+        'server_version': '17.0',
+        'server_version_info': [17, 0, 0, 'final', 0, ''],
+        'server_serie': '17.0',
+        'protocol_version': 1,
+    })
+    _next_ids: Dict[str, int] = field(default_factory=dict, repr=False)
+
+    def table(self, model: str) -> Dict[int, Dict[str, Any]]:
+        """Get the records of a model (empty for unknown models)."""
+        return self.tables.get(model, {})
+
+    def add(self, model: str, values: Dict[str, Any]) -> int:
+        """
+        Insert a record.
+
+        Args:
+            model: Model name
+            values: Field values (without id)
+
+        Returns:
+            The new record's id
+        """
+        table = self.tables.setdefault(model, {})
+        record_id = self._next_ids.get(model, 1)
+        self._next_ids[model] = record_id + 1
+        table[record_id] = {'id': record_id, **values}
+        table[record_id].setdefault('write_date', self.timestamp())
+        return record_id
+
+    @staticmethod
+    def timestamp() -> str:
+        """Get the current UTC time in Odoo's datetime format (for write_date)."""
+        return datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S')
+
+    def relation(self, model: str, field_name: str) -> Optional[str]:
+        """Get the related model of a many2one field, if it is one."""
+        return RELATIONS.get(model, {}).get(field_name)
+
+    def display_name(self, model: str, record_id: int) -> str:
+        """Get a record's display name."""
+        record = self.table(model).get(record_id)
+        if record is None:
+            return f"{model},{record_id}"
+        if model == 'account.account':
+            return f"{record['code']} {record['name']}"
+        return str(record.get('name') or record.get('display_name') or f"{model},{record_id}")
+
+    def counts(self) -> Dict[str, int]:
+        """Get the number of records per model."""
+        return {model: len(records) for model, records in sorted(self.tables.items())}
+
+
+def generate_dataset(
+    invoices: int = 1000,
+    employees: int = 200,
+    contracts: int = 100,
+    seed: int = 42,
+    today: Optional[date] = None
+) -> FakeDataset:
+    """
+    Generate a deterministic synthetic dataset.
+
+    Each invoice gets a receivable/payable line and an income/expense line;
+    paid and partially paid invoices also get a payment and a bank line.
+    Sales orders, partners and products scale with the invoice count.
+    100k invoices take a few hundred MB of memory.
+
+    Args:
+        invoices: Customer invoices plus vendor bills
+        employees: Employees (with departments, jobs, leaves, attendances, contracts)
+        contracts: contract.contract records (two lines each)
+        seed: Random seed
+        today: Reference date for generated dates. Uses date.today() if not provided.
+
+    Returns:
+        The populated dataset
+    """
+    rng = random.Random(seed)
+    today = today or date.today()
+    ds = FakeDataset()
+
+    currency_id = ds.add('res.currency', {'name': 'USD', 'symbol': '$', 'active': True})
+    company_id = ds.add('res.company', {'name': 'Demo Company', 'currency_id': currency_id})
+    ds.add('res.users', {'name': 'Administrator', 'login': 'admin', 'company_id': company_id})
+    user_ids = [ds.add('res.users', {'name': f"Salesperson {i}", 'login': f"sales{i}", 'company_id': company_id})
+                for i in range(1, 6)]
+
+    for module in INSTALLED_MODULES:
+        ds.add('ir.module.module', {
+            'name': module, 'shortdesc': module.replace('_', ' ').title(),
+            'state': 'installed', 'installed_version': '17.0.1.0',
+        })
+
+    _generate_accounting(ds, rng, today, invoices, company_id, currency_id, user_ids)
+    _generate_hr(ds, rng, today, employees, company_id)
+    _generate_contracts(ds, rng, today, contracts, company_id, user_ids)
+
+    for model in sorted(set(RELATIONS) | set(ds.tables)):
+        ds.add('ir.model', {'model': model, 'name': model.replace('.', ' ').title(), 'state': 'base'})
+    return ds
+
+
+def _days_ago(today: date, days: int) -> str:
+    """Format a date some days before today."""
+    return (today - timedelta(days=days)).isoformat()
+
+
+def _person_name(rng: random.Random) -> str:
+    """Build a random person name."""
+    return f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}"
+
+
+def _generate_accounting(
+    ds: FakeDataset,
+    rng: random.Random,
+    today: date,
+    invoices: int,
+    company_id: int,
+    currency_id: int,
+    user_ids: List[int]
+) -> None:
+    """Generate partners, products, journals, accounts, invoices, payments and sales."""
+    partner_ids = [
+        ds.add('res.partner', {
+            'name': f"Partner {i:05d}",
+            'is_company': True,
+            'customer_rank': 1,
+            'supplier_rank': int(i % 4 == 0),
+            'email': f"contact{i}@partner{i}.example",
+            'company_id': company_id,
+            'active': True,
+        })
+        for i in range(1, max(20, invoices // 20) + 1)
+    ]
+    product_ids = [
+        ds.add('product.product', {
+            'name': f"Product {i:03d}",
+            'default_code': f"P{i:03d}",
+            'list_price': round(rng.uniform(10, 2000), 2),
+            'company_id': company_id,
+            'active': True,
+        })
+        for i in range(1, 51)
+    ]
+
+    accounts = {}
+    for code, name, account_type in ACCOUNTS:
+        accounts[code] = ds.add('account.account', {
+            'code': code, 'name': name, 'account_type': account_type, 'company_id': company_id,
+        })
+    journals = {}
+    for code, name, journal_type in JOURNALS:
+        journals[journal_type] = ds.add('account.journal', {
+            'code': code, 'name': name, 'type': journal_type, 'company_id': company_id,
+            'default_account_id': accounts['101000'] if journal_type == 'bank' else False,
+        })
+
+    counters = {'out_invoice': 0, 'in_invoice': 0, 'entry': 0}
+    for _ in range(invoices):
+        move_type = 'out_invoice' if rng.random() < 0.7 else 'in_invoice'
+        counters[move_type] += 1
+        prefix = 'INV' if move_type == 'out_invoice' else 'BILL'
+        invoice_date = today - timedelta(days=rng.randint(0, 540))
+        due = invoice_date + timedelta(days=rng.choice([0, 15, 30, 45, 60]))
+        untaxed = round(rng.uniform(50, 20000), 2)
+        tax = round(untaxed * 0.15, 2)
+        total = round(untaxed + tax, 2)
+        state = 'posted' if rng.random() < 0.92 else rng.choice(['draft', 'cancel'])
+        roll = rng.random()
+        if state != 'posted' or roll < 0.3:
+            payment_state, residual = 'not_paid', total
+        elif roll < 0.4:
+            residual = round(total * rng.uniform(0.2, 0.8), 2)
+            payment_state = 'partial'
+        else:
+            payment_state, residual = 'paid', 0.0
+        partner_id = rng.choice(partner_ids)
+        journal_id = journals['sale' if move_type == 'out_invoice' else 'purchase']
+        move_id = ds.add('account.move', {
+            'name': f"{prefix}/{invoice_date.year}/{counters[move_type]:06d}",
+            'move_type': move_type,
+            'state': state,
+            'partner_id': partner_id,
+            'journal_id': journal_id,
+            'date': invoice_date.isoformat(),
+            'invoice_date': invoice_date.isoformat(),
+            'invoice_date_due': due.isoformat(),
+            'amount_untaxed': untaxed,
+            'amount_tax': tax,
+            'amount_total': total,
+            'amount_residual': residual,
+            'payment_state': payment_state,
+            'currency_id': currency_id,
+            'company_id': company_id,
+            'invoice_user_id': rng.choice(user_ids),
+            'ref': False,
+        })
+
+        sign = 1 if move_type == 'out_invoice' else -1
+        counterpart = accounts['121000' if move_type == 'out_invoice' else '211000']
+        revenue = accounts[rng.choice(['400000', '410000'])] if move_type == 'out_invoice' \
+            else accounts[rng.choice(['600000', '610000', '620000', '630000'])]
+        common = {
+            'move_id': move_id, 'journal_id': journal_id, 'partner_id': partner_id,
+            'date': invoice_date.isoformat(), 'parent_state': state, 'company_id': company_id,
+        }
+        ds.add('account.move.line', {
+            **common, 'name': False, 'account_id': counterpart, 'display_type': 'payment_term',
+            'product_id': False, 'quantity': 0.0, 'price_unit': 0.0, 'price_subtotal': 0.0,
+            'debit': total if sign > 0 else 0.0, 'credit': total if sign < 0 else 0.0,
+            'balance': sign * total, 'amount_residual': sign * residual,
+        })
+        quantity = rng.randint(1, 20)
+        ds.add('account.move.line', {
+            **common, 'name': f"Line for {prefix}", 'account_id': revenue, 'display_type': 'product',
+            'product_id': rng.choice(product_ids), 'quantity': float(quantity),
+            'price_unit': round(untaxed / quantity, 2), 'price_subtotal': untaxed,
+            'debit': untaxed if sign < 0 else 0.0, 'credit': untaxed if sign > 0 else 0.0,
+            'balance': -sign * untaxed, 'amount_residual': 0.0,
+        })
+
+        if payment_state in ('paid', 'partial'):
+            paid = round(total - residual, 2)
+            pay_date = min(invoice_date + timedelta(days=rng.randint(0, 60)), today)
+            counters['entry'] += 1
+            bank_move = ds.add('account.move', {
+                'name': f"BNK1/{pay_date.year}/{counters['entry']:06d}",
+                'move_type': 'entry', 'state': 'posted', 'partner_id': partner_id,
+                'journal_id': journals['bank'], 'date': pay_date.isoformat(),
+                'invoice_date': False, 'invoice_date_due': False,
+                'amount_untaxed': paid, 'amount_tax': 0.0, 'amount_total': paid,
+                'amount_residual': 0.0, 'payment_state': 'not_paid',
+                'currency_id': currency_id, 'company_id': company_id,
+                'ref': ds.table('account.move')[move_id]['name'],
+            })
+            ds.add('account.payment', {
+                'name': f"PAY/{pay_date.year}/{counters['entry']:06d}",
+                'payment_type': 'inbound' if sign > 0 else 'outbound',
+                'partner_type': 'customer' if sign > 0 else 'supplier',
+                'amount': paid, 'date': pay_date.isoformat(), 'state': 'posted',
+                'partner_id': partner_id, 'journal_id': journals['bank'], 'move_id': bank_move,
+                'currency_id': currency_id, 'company_id': company_id, 'ref': False,
+            })
+            ds.add('account.move.line', {
+                'move_id': bank_move, 'journal_id': journals['bank'], 'partner_id': partner_id,
+                'date': pay_date.isoformat(), 'parent_state': 'posted', 'company_id': company_id,
+                'name': 'Payment', 'account_id': accounts['101000'], 'display_type': 'payment_term',
+                'product_id': False, 'quantity': 0.0, 'price_unit': 0.0, 'price_subtotal': 0.0,
+                'debit': paid if sign > 0 else 0.0, 'credit': paid if sign < 0 else 0.0,
+                'balance': sign * paid, 'amount_residual': 0.0,
+            })
+
+    for i in range(1, max(10, invoices // 4) + 1):
+        order_date = datetime.combine(today - timedelta(days=rng.randint(0, 365)), datetime.min.time()) \
+            + timedelta(hours=rng.randint(8, 18))
+        state = rng.choice(['draft', 'sent', 'sale', 'sale', 'sale', 'cancel'])
+        order_id = ds.add('sale.order', {
+            'name': f"S{i:05d}", 'state': state, 'partner_id': rng.choice(partner_ids),
+            'user_id': rng.choice(user_ids), 'date_order': order_date.strftime('%Y-%m-%d %H:%M:%S'),
+            'validity_date': (order_date.date() + timedelta(days=30)).isoformat(),
+            'amount_untaxed': 0.0, 'amount_tax': 0.0, 'amount_total': 0.0,
+            'invoice_status': 'invoiced' if state == 'sale' else 'no',
+            'delivery_status': 'full' if state == 'sale' else False,
+            'currency_id': currency_id, 'company_id': company_id,
+        })
+        untaxed = 0.0
+        for _ in range(2):
+            qty = float(rng.randint(1, 10))
+            price = round(rng.uniform(10, 2000), 2)
+            discount = rng.choice([0.0, 0.0, 5.0, 10.0])
+            subtotal = round(qty * price * (1 - discount / 100), 2)
+            untaxed += subtotal
+            ds.add('sale.order.line', {
+                'order_id': order_id, 'product_id': rng.choice(product_ids), 'name': 'Order line',
+                'product_uom_qty': qty, 'price_unit': price, 'discount': discount,
+                'price_subtotal': subtotal, 'price_total': round(subtotal * 1.15, 2), 'tax_id': [],
+            })
+        order = ds.table('sale.order')[order_id]
+        order['amount_untaxed'] = round(untaxed, 2)
+        order['amount_tax'] = round(untaxed * 0.15, 2)
+        order['amount_total'] = round(untaxed * 1.15, 2)
+
+
+def _generate_hr(
+    ds: FakeDataset,
+    rng: random.Random,
+    today: date,
+    employees: int,
+    company_id: int
+) -> None:
+    """Generate departments, jobs, employees, leaves, attendances, applicants and HR contracts."""
+    department_ids = [
+        ds.add('hr.department', {
+            'name': name if i < len(DEPARTMENTS) else f"{DEPARTMENTS[i % len(DEPARTMENTS)]} {i // len(DEPARTMENTS) + 1}",
+            'manager_id': False, 'parent_id': False, 'company_id': company_id, 'active': True,
+        })
+        for i, name in enumerate(_cycle(DEPARTMENTS, max(len(DEPARTMENTS), employees // 50)))
+    ]
+    job_ids = [
+        ds.add('hr.job', {
+            'name': name, 'department_id': department_ids[i % len(department_ids)],
+            'no_of_recruitment': rng.randint(0, 3), 'no_of_employee': 0,
+            'is_published': rng.random() < 0.5, 'company_id': company_id,
+            'state': rng.choice(['recruit', 'open']), 'description': f"{name} position",
+        })
+        for i, name in enumerate(JOBS)
+    ]
+
+    employee_ids: List[int] = []
+    for i in range(1, employees + 1):
+        department_id = rng.choice(department_ids)
+        employee_ids.append(ds.add('hr.employee', {
+            'name': _person_name(rng) + f" {i:05d}",
+            'department_id': department_id,
+            'job_id': rng.choice(job_ids),
+            'parent_id': rng.choice(employee_ids[:50]) if employee_ids else False,
+            'coach_id': False,
+            'work_email': f"employee{i}@example.com",
+            'work_phone': f"+1-555-{i:04d}",
+            'mobile_phone': False,
+            'work_location_id': False,
+            'company_id': company_id,
+            'active': rng.random() < 0.97,
+            'create_date': f"{_days_ago(today, rng.randint(0, 2000))} 09:00:00",
+        }))
+    for department_id in department_ids:
+        members = [e for e in employee_ids if ds.table('hr.employee')[e]['department_id'] == department_id]
+        if members:
+            ds.table('hr.department')[department_id]['manager_id'] = members[0]
+
+    leave_type_ids = [
+        ds.add('hr.leave.type', {
+            'name': name, 'request_unit': unit, 'allocation_type': allocation, 'company_id': company_id,
+        })
+        for name, unit, allocation in LEAVE_TYPES
+    ]
+    stage_ids = [ds.add('hr.recruitment.stage', {'name': name, 'sequence': i})
+                 for i, name in enumerate(RECRUITMENT_STAGES)]
+
+    for employee_id in employee_ids:
+        employee = ds.table('hr.employee')[employee_id]
+        ds.add('hr.leave.allocation', {
+            'employee_id': employee_id, 'holiday_status_id': leave_type_ids[0],
+            'number_of_days': 20.0, 'leaves_taken': float(rng.randint(0, 15)), 'state': 'validate',
+        })
+        for _ in range(2):
+            start = today + timedelta(days=rng.randint(-120, 60))
+            days = rng.randint(1, 5)
+            ds.add('hr.leave', {
+                'name': rng.choice(['Vacation', 'Family event', 'Medical appointment', False]),
+                'employee_id': employee_id, 'department_id': employee['department_id'],
+                'holiday_status_id': rng.choice(leave_type_ids),
+                'date_from': f"{start.isoformat()} 08:00:00",
+                'date_to': f"{(start + timedelta(days=days - 1)).isoformat()} 17:00:00",
+                'request_date_from': start.isoformat(),
+                'request_date_to': (start + timedelta(days=days - 1)).isoformat(),
+                'number_of_days': float(days),
+                'state': rng.choice(['draft', 'confirm', 'confirm', 'validate', 'validate', 'refuse']),
+            })
+        for days_ago in range(1, 6):
+            day = today - timedelta(days=days_ago)
+            if day.weekday() >= 5:
+                continue
+            hours = round(rng.uniform(6.5, 9.5), 2)
+            check_in = datetime.combine(day, datetime.min.time()) + timedelta(hours=8, minutes=rng.randint(0, 59))
+            ds.add('hr.attendance', {
+                'employee_id': employee_id,
+                'check_in': check_in.strftime('%Y-%m-%d %H:%M:%S'),
+                'check_out': (check_in + timedelta(hours=hours)).strftime('%Y-%m-%d %H:%M:%S'),
+                'worked_hours': hours,
+            })
+        ds.add('hr.contract', {
+            'name': f"Contract - {employee['name']}", 'employee_id': employee_id,
+            'department_id': employee['department_id'], 'job_id': employee['job_id'],
+            'wage': float(rng.randint(30, 150) * 100), 'state': 'open',
+            'date_start': _days_ago(today, rng.randint(30, 2000)),
+            'date_end': (today + timedelta(days=rng.randint(-30, 730))).isoformat() if rng.random() < 0.4 else False,
+            'company_id': company_id,
+        })
+
+    for i in range(1, max(5, employees // 10) + 1):
+        job_id = rng.choice(job_ids)
+        ds.add('hr.applicant', {
+            'name': f"Application {i:05d}", 'partner_name': _person_name(rng),
+            'email_from': f"applicant{i}@example.com", 'partner_phone': f"+1-555-9{i:03d}",
+            'job_id': job_id, 'department_id': ds.table('hr.job')[job_id]['department_id'],
+            'stage_id': rng.choice(stage_ids), 'salary_expected': float(rng.randint(30, 150) * 100),
+            'salary_proposed': 0.0, 'kanban_state': 'normal', 'active': True,
+            'create_date': f"{_days_ago(today, rng.randint(0, 90))} 10:00:00",
+        })
+
+
+def _generate_contracts(
+    ds: FakeDataset,
+    rng: random.Random,
+    today: date,
+    contracts: int,
+    company_id: int,
+    user_ids: List[int]
+) -> None:
+    """Generate contract.contract records with their lines."""
+    partner_ids = list(ds.table('res.partner'))
+    product_ids = list(ds.table('product.product'))
+    for i in range(1, contracts + 1):
+        start = today - timedelta(days=rng.randint(0, 1000))
+        end = start + timedelta(days=rng.choice([180, 365, 730, 1095]))
+        contract_id = ds.add('contract.contract', {
+            'name': f"CTR/{start.year}/{i:05d}",
+            'partner_id': rng.choice(partner_ids),
+            'user_id': rng.choice(user_ids),
+            'date_start': start.isoformat(),
+            'date_end': end.isoformat() if rng.random() < 0.9 else False,
+            'recurring_next_date': (today + timedelta(days=rng.randint(1, 30))).isoformat(),
+            'contract_type': rng.choice(['sale', 'sale', 'purchase']),
+            'state': rng.choice(['draft', 'open', 'open', 'open']) if end >= today else 'close',
+            'company_id': company_id,
+            'active': True,
+        })
+        for _ in range(2):
+            quantity = float(rng.randint(1, 5))
+            price = round(rng.uniform(50, 5000), 2)
+            ds.add('contract.line', {
+                'contract_id': contract_id, 'product_id': rng.choice(product_ids),
+                'name': 'Recurring service', 'quantity': quantity, 'price_unit': price,
+                'price_subtotal': round(quantity * price, 2),
+            })
+
+
+def _cycle(items: List[str], count: int) -> Iterator[str]:
+    """Yield count items, cycling through the list."""
+    for i in range(count):
+        yield items[i % len(items)]
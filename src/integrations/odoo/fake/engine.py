@@ -0,0 +1,372 @@
+"""
+Fake Odoo Engine
+
+Executes Odoo model methods against a FakeDataset: search, search_read,
+read, search_count, read_group, fields_get, create, write, unlink and the
+common workflow actions. Domains are evaluated with the shared domain
+compiler, resolving dotted paths through many2one fields.
+"""
+
+import calendar
+import re
+import threading
+from datetime import date, datetime, timedelta
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from src.integrations.odoo.domain import and_domains, compile_domain, domain_fields, sort_key, sort_records
+from src.integrations.odoo.fake.dataset import FakeDataset
+
+
+class FakeOdooFault(Exception):
+    """Error reported to the client as an Odoo fault."""
+
+
+# Workflow methods and the state they move records to
+WORKFLOW_ACTIONS: Dict[str, str] = {
+    'action_validate': 'validate',
+    'action_approve': 'validate',
+    'action_refuse': 'refuse',
+    'action_confirm': 'confirm',
+    'action_post': 'posted',
+    'action_cancel': 'cancel',
+    'action_draft': 'draft',
+}
+
+_DATE_RE = re.compile(r'^\d{4}-\d{2}-\d{2}$')
+_DATETIME_RE = re.compile(r'^\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}$')
+
+
+class DatasetBackend:
+    """
+    Odoo model method dispatcher over an in-memory dataset.
+
+    Thread-safe: a lock serializes writes against reads.
+
+    Usage:
+        backend = DatasetBackend(generate_dataset(invoices=1000))
+        rows = backend.execute('account.move', 'search_count', [[['state', '=', 'posted']]], {})
+    """
+
+    def __init__(self, dataset: FakeDataset):
+        """
+        Initialize backend.
+
+        Args:
+            dataset: Records to serve
+        """
+        self.dataset = dataset
+        self._lock = threading.RLock()
+
+    def version(self) -> Dict[str, Any]:
+        """Get server version information."""
+        return self.dataset.version
+
+    def authenticate(self, database: str, login: str, password: str) -> int:
+        """Accept any credentials as the administrator (uid 2)."""
+        return 2
+
+    def execute(self, model: str, method: str, args: List[Any], kwargs: Dict[str, Any]) -> Any:
+        """
+        Execute a model method.
+
+        Raises:
+            FakeOdooFault: For unknown methods or invalid arguments
+        """
+        handler = getattr(self, f"_m_{method}", None)
+        with self._lock:
+            if handler is not None:
+                return handler(model, *args, **kwargs)
+            if method in WORKFLOW_ACTIONS:
+                ids = args[0] if args else []
+                return self._m_write(model, ids, {'state': WORKFLOW_ACTIONS[method]})
+        raise FakeOdooFault(f"The method '{model}.{method}' does not exist")
+
+    # ==================== Domains ====================
+
+    def _value(self, model: str, record: Dict[str, Any], path: List[str]) -> Any:
+        """Read a field path, following many2one fields; many2one values as [id, name]."""
+        for name in path[:-1]:
+            comodel = self.dataset.relation(model, name)
+            related = self.dataset.table(comodel).get(record.get(name)) if comodel else None
+            if related is None:
+                return False
+            model, record = comodel, related
+        value = record.get(path[-1], False)
+        comodel = self.dataset.relation(model, path[-1])
+        if comodel is not None and value:
+            return [value, self.dataset.display_name(comodel, value)]
+        return value
+
+    def compile_domain(self, model: str, domain: Sequence[Any]) -> Callable[[Dict[str, Any]], bool]:
+        """
+        Compile a domain into a record predicate.
+
+        Args:
+            model: Model the domain applies to
+            domain: Odoo domain in prefix notation
+
+        Returns:
+            Callable taking a stored record and returning whether it matches
+        """
+        return compile_domain(domain, lambda record, path: self._value(model, record, path))
+
+    def _active_domain(
+        self,
+        model: str,
+        domain: Optional[Sequence[Any]],
+        context: Optional[Dict[str, Any]]
+    ) -> List[Any]:
+        """Hide archived records like Odoo does, unless the domain filters on active or active_test is off."""
+        table = self.dataset.table(model)
+        sample = next(iter(table.values()), {})
+        if (
+            'active' not in sample
+            or not (context or {}).get('active_test', True)
+            or 'active' in domain_fields(domain)
+        ):
+            return list(domain or [])
+        return and_domains(domain, [['active', '=', True]])
+
+    def _search_records(
+        self,
+        model: str,
+        domain: Sequence[Any],
+        offset: int = 0,
+        limit: Optional[int] = None,
+        order: Optional[str] = None,
+        context: Optional[Dict[str, Any]] = None
+    ) -> List[Dict[str, Any]]:
+        """Get matching records, sorted and paginated."""
+        predicate = self.compile_domain(model, self._active_domain(model, domain, context))
+        records = sort_records([r for r in self.dataset.table(model).values() if predicate(r)], order)
+        end = offset + limit if limit else None
+        return records[offset:end]
+
+    # ==================== Reads ====================
+
+    def _render(self, model: str, record: Dict[str, Any], fields: Optional[List[str]]) -> Dict[str, Any]:
+        """Render a record like Odoo's read(): many2one values as [id, name]."""
+        names = [f for f in fields if '.' not in f] if fields else list(record)
+        result = {'id': record['id']}
+        for name in names:
+            value = record.get(name, False)
+            comodel = self.dataset.relation(model, name)
+            if comodel is not None and value:
+                value = [value, self.dataset.display_name(comodel, value)]
+            elif value is None:
+                value = False
+            result[name] = value
+        return result
+
+    def _m_search(self, model, domain=None, offset=0, limit=None, order=None, **kwargs) -> List[int]:
+        return [r['id'] for r in self._search_records(model, domain, offset, limit, order, kwargs.get('context'))]
+
+    def _m_search_count(self, model, domain=None, **kwargs) -> int:
+        predicate = self.compile_domain(model, self._active_domain(model, domain, kwargs.get('context')))
+        return sum(1 for r in self.dataset.table(model).values() if predicate(r))
+
+    def _m_search_read(self, model, domain=None, fields=None, offset=0, limit=None, order=None, **kwargs):
+        records = self._search_records(model, domain, offset, limit, order, kwargs.get('context'))
+        return [self._render(model, r, fields) for r in records]
+
+    def _m_read(self, model, ids, fields=None, **kwargs) -> List[Dict[str, Any]]:
+        table = self.dataset.table(model)
+        if isinstance(ids, int):
+            ids = [ids]
+        return [self._render(model, table[i], fields) for i in ids if i in table]
+
+    def _m_fields_get(self, model, allfields=None, attributes=None, **kwargs) -> Dict[str, Any]:
+        sample = next(iter(self.dataset.table(model).values()), {'id': 0})
+        result = {}
+        for name, value in sample.items():
+            comodel = self.dataset.relation(model, name)
+            definition = {
+                'string': name.replace('_', ' ').title(),
+                'type': 'many2one' if comodel else _field_type(value),
+                'required': name in ('id', 'name'),
+                'readonly': name == 'id',
+                'store': True,
+            }
+            if comodel:
+                definition['relation'] = comodel
+            if attributes:
+                definition = {k: v for k, v in definition.items() if k in attributes}
+            result[name] = definition
+        if allfields:
+            result = {k: v for k, v in result.items() if k in allfields}
+        return result
+
+    def _m_name_get(self, model, ids, **kwargs) -> List[List[Any]]:
+        return [[i, self.dataset.display_name(model, i)] for i in ids]
+
+    def _m_read_group(
+        self,
+        model,
+        domain,
+        fields,
+        groupby,
+        offset=0,
+        limit=None,
+        orderby=False,
+        lazy=True,
+        **kwargs
+    ) -> List[Dict[str, Any]]:
+        if isinstance(groupby, str):
+            groupby = [groupby]
+        applied = list(groupby[:1]) if lazy else list(groupby)
+        records = self._search_records(model, domain, context=kwargs.get('context'))
+
+        groups: Dict[Tuple, List[Dict[str, Any]]] = {}
+        for record in records:
+            key = tuple(_group_value(record.get(spec.split(':')[0]), spec) for spec in applied)
+            groups.setdefault(key, []).append(record)
+        if not applied and not groups:
+            groups[()] = []
+
+        rows = []
+        for key in sorted(groups, key=lambda k: tuple(sort_key(v) for v in k)):
+            members = groups[key]
+            row: Dict[str, Any] = {}
+            ranges = {}
+            domain_parts = list(domain or [])
+            for spec, value in zip(applied, key):
+                name = spec.split(':')[0]
+                comodel = self.dataset.relation(model, name)
+                if ':' in spec or _DATE_RE.match(str(value or '')):
+                    granularity = spec.split(':')[1] if ':' in spec else 'month'
+                    start, end, label = _date_range(value, granularity) if value else (None, None, False)
+                    row[spec] = label
+                    if start:
+                        ranges[spec] = {'from': start, 'to': end}
+                        domain_parts += [[name, '>=', start], [name, '<', end]]
+                    else:
+                        domain_parts.append([name, '=', False])
+                elif comodel is not None and value:
+                    row[spec] = [value, self.dataset.display_name(comodel, value)]
+                    domain_parts.append([name, '=', value])
+                else:
+                    row[spec] = value if value is not None else False
+                    domain_parts.append([name, '=', row[spec]])
+            if lazy and applied:
+                row[f"{applied[0].split(':')[0]}_count"] = len(members)
+            else:
+                row['__count'] = len(members)
+            for spec in fields:
+                name, aggregate, source = _aggregate_spec(spec)
+                if name in row or name in [a.split(':')[0] for a in applied]:
+                    continue
+                row[name] = _aggregate([m.get(source) for m in members], aggregate)
+            if ranges:
+                row['__range'] = ranges
+            row['__domain'] = domain_parts
+            rows.append(row)
+
+        end = offset + limit if limit else None
+        return rows[offset:end]
+
+    # ==================== Writes ====================
+
+    def _m_create(self, model, values, **kwargs):
+        many = isinstance(values, list)
+        ids = [self.dataset.add(model, dict(v)) for v in (values if many else [values])]
+        return ids if many else ids[0]
+
+    def _m_write(self, model, ids, values, **kwargs) -> bool:
+        table = self.dataset.table(model)
+        ids = [ids] if isinstance(ids, int) else ids
+        missing = [i for i in ids if i not in table]
+        if missing:
+            raise FakeOdooFault(f"Record does not exist or has been deleted: {model}{missing}")
+        write_date = self.dataset.timestamp()
+        for i in ids:
+            table[i].update(values, write_date=write_date)
+        return True
+
+    def _m_unlink(self, model, ids, **kwargs) -> bool:
+        table = self.dataset.table(model)
+        for i in ([ids] if isinstance(ids, int) else ids):
+            table.pop(i, None)
+        return True
+
+
+def _field_type(value: Any) -> str:
+    """Infer an Odoo field type from a stored value."""
+    if isinstance(value, bool):
+        return 'boolean'
+    if isinstance(value, int):
+        return 'integer'
+    if isinstance(value, float):
+        return 'float'
+    if isinstance(value, list):
+        return 'many2many'
+    if isinstance(value, str) and _DATETIME_RE.match(value):
+        return 'datetime'
+    if isinstance(value, str) and _DATE_RE.match(value):
+        return 'date'
+    return 'char'
+
+
+def _group_value(value: Any, spec: str) -> Any:
+    """Normalize a record value for grouping (dates to their period start, by month if unspecified)."""
+    if not value or (':' not in spec and not (isinstance(value, str) and _DATE_RE.match(value[:10]))):
+        return value if value is not None else False
+    day = datetime.strptime(str(value)[:10], '%Y-%m-%d').date()
+    granularity = spec.split(':')[1] if ':' in spec else 'month'
+    if granularity == 'year':
+        day = day.replace(month=1, day=1)
+    elif granularity == 'quarter':
+        day = day.replace(month=(day.month - 1) // 3 * 3 + 1, day=1)
+    elif granularity == 'month':
+        day = day.replace(day=1)
+    elif granularity == 'week':
+        day = day - timedelta(days=day.weekday())
+    return day.isoformat()
+
+
+def _date_range(value: str, granularity: str) -> Tuple[str, str, str]:
+    """Get (from, to, label) for a grouped period start."""
+    start = datetime.strptime(str(value)[:10], '%Y-%m-%d').date()
+    if granularity == 'year':
+        end, label = date(start.year + 1, 1, 1), str(start.year)
+    elif granularity == 'quarter':
+        month = start.month + 3
+        end = date(start.year + (month > 12), (month - 1) % 12 + 1, 1)
+        label = f"Q{(start.month - 1) // 3 + 1} {start.year}"
+    elif granularity == 'week':
+        end, label = start + timedelta(days=7), f"W{start.isocalendar()[1]} {start.year}"
+    elif granularity == 'day':
+        end, label = start + timedelta(days=1), start.strftime('%d %b %Y')
+    else:
+        days = calendar.monthrange(start.year, start.month)[1]
+        end, label = start + timedelta(days=days), start.strftime('%B %Y')
+    return start.isoformat(), end.isoformat(), label
+
+
+def _aggregate_spec(spec: str) -> Tuple[str, str, str]:
+    """Split 'name:agg(field)' / 'field:agg' / 'field' into (name, aggregate, source field)."""
+    name, _, aggregate = spec.partition(':')
+    source = name
+    match = re.match(r'^(\w+)\((\w+)\)$', aggregate)
+    if match:
+        aggregate, source = match.groups()
+    return name, aggregate or 'sum', source
+
+
+def _aggregate(values: List[Any], aggregate: str) -> Any:
+    """Apply a read_group aggregate function."""
+    if aggregate == 'count':
+        return sum(1 for v in values if v not in (None, False))
+    if aggregate == 'count_distinct':
+        return len({v for v in values if v not in (None, False)})
+    numbers = [v for v in values if isinstance(v, (int, float)) and not isinstance(v, bool)]
+    if aggregate == 'sum':
+        return round(sum(numbers), 2) if numbers else 0.0
+    if not numbers:
+        return False
+    if aggregate == 'avg':
+        return sum(numbers) / len(numbers)
+    if aggregate == 'min':
+        return min(numbers)
+    if aggregate == 'max':
+        return max(numbers)
+    raise FakeOdooFault(f"Unsupported aggregate: {aggregate}")
@@ -0,0 +1,162 @@
+"""
+Odoo Traffic Record/Replay
+
+RecordingBackend forwards calls to a real Odoo server and appends every
+call and its outcome to a JSON Lines file. ReplayBackend serves those
+recordings back, so benchmarks and demos can run offline against the exact
+responses a production database gave.
+
+Each line is {"key", "model", "method", "result"} or {..., "error"}; the key
+is the canonical call key used by the result cache.
+"""
+
+import json
+import threading
+import xmlrpc.client
+from collections import defaultdict
+from typing import Any, Dict, List, Optional
+import logging
+
+from src.integrations.odoo.cache import ResultCache
+from src.integrations.odoo.fake.engine import FakeOdooFault
+from src.integrations.odoo.transport import create_transport
+
+logger = logging.getLogger(__name__)
+
+
+class RecordingBackend:
+    """
+    Backend that proxies a real Odoo server and records its traffic.
+
+    Usage:
+        backend = RecordingBackend(OdooConfig(...), 'odoo-traffic.jsonl')
+        with FakeOdooServer(backend=backend) as server:
+            ...  # point clients at server.url
+    """
+
+    def __init__(self, config, path: str):
+        """
+        Initialize recorder.
+
+        Args:
+            config: OdooConfig of the upstream server
+            path: JSON Lines file to append recordings to
+        """
+        self.config = config
+        self.path = path
+        self.transport = create_transport(config)
+        self._uid: Optional[int] = None
+        self._lock = threading.Lock()
+
+    def _upstream_uid(self) -> int:
+        if self._uid is None:
+            self._uid = self.transport.authenticate()
+            if not self._uid:
+                raise FakeOdooFault("Upstream Odoo authentication failed")
+        return self._uid
+
+    def _append(self, entry: Dict[str, Any]) -> None:
+        line = json.dumps(entry, default=str)
+        with self._lock:
+            with open(self.path, 'a', encoding='utf-8') as f:
+                f.write(line + '\n')
+
+    def version(self) -> Dict[str, Any]:
+        """Get the upstream server's version information."""
+        result = self.transport.version()
+        self._append({'key': 'version', 'model': None, 'method': 'version', 'result': result})
+        return result
+
+    def authenticate(self, database: str, login: str, password: str) -> int:
+        """Authenticate upstream with the configured credentials."""
+        return self._upstream_uid()
+
+    def execute(self, model: str, method: str, args: List[Any], kwargs: Dict[str, Any]) -> Any:
+        """Forward a call upstream and record its result or fault."""
+        key = ResultCache.make_key(model, method, tuple(args), kwargs)
+        entry = {'key': key, 'model': model, 'method': method}
+        try:
+            result = self.transport.execute_kw(self._upstream_uid(), model, method, args, kwargs)
+        except xmlrpc.client.Fault as e:
+            entry['error'] = e.faultString
+            self._append(entry)
+            raise FakeOdooFault(e.faultString)
+        entry['result'] = result
+        self._append(entry)
+        return result
+
+
+class ReplayBackend:
+    """
+    Backend that serves recorded Odoo responses.
+
+    Calls are matched on their canonical key. When the same call was recorded
+    several times its responses are served in order, the last one repeating.
+
+    Usage:
+        backend = ReplayBackend('odoo-traffic.jsonl')
+        with FakeOdooServer(backend=backend) as server:
+            ...
+    """
+
+    def __init__(self, path: str, fallback=None):
+        """
+        Initialize replay.
+
+        Args:
+            path: JSON Lines file written by RecordingBackend
+            fallback: Backend for calls that were not recorded (a fault is raised if not provided)
+        """
+        self.path = path
+        self.fallback = fallback
+        self._responses: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+        self._served: Dict[str, int] = defaultdict(int)
+        self._lock = threading.Lock()
+        self.misses = 0
+
+        with open(path, encoding='utf-8') as f:
+            for line in f:
+                if line.strip():
+                    entry = json.loads(line)
+                    self._responses[entry['key']].append(entry)
+        logger.info(f"Loaded {sum(len(v) for v in self._responses.values())} recorded Odoo calls from {path}")
+
+    def _next(self, key: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            entries = self._responses.get(key)
+            if not entries:
+                self.misses += 1
+                return None
+            position = min(self._served[key], len(entries) - 1)
+            self._served[key] += 1
+            return entries[position]
+
+    def version(self) -> Dict[str, Any]:
+        """Get the recorded server version information."""
+        entry = self._next('version')
+        if entry is not None:
+            return entry['result']
+        if self.fallback is not None:
+            return self.fallback.version()
+        return {'server_version': 'replay', 'server_version_info': [0, 0, 0, 'final', 0, ''], 'protocol_version': 1}
+
+    def authenticate(self, database: str, login: str, password: str) -> int:
+        """Accept any credentials."""
+        return 2
+
+    def execute(self, model: str, method: str, args: List[Any], kwargs: Dict[str, Any]) -> Any:
+        """
+        Serve a recorded response.
+
+        Raises:
+            FakeOdooFault: For recorded faults, and for calls not recorded when there is no fallback
+        """
+        key = ResultCache.make_key(model, method, tuple(args), kwargs)
+        entry = self._next(key)
+        if entry is None:
+            if self.fallback is not None:
+                return self.fallback.execute(model, method, args, kwargs)
+            raise FakeOdooFault(f"No recorded response for {model}.{method}")
+        if 'error' in entry:
+            raise FakeOdooFault(entry['error'])
+        return entry['result']
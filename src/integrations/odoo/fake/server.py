@@ -0,0 +1,264 @@
+"""
+Fake Odoo Server
+
+HTTP server speaking Odoo's external APIs (XML-RPC on /xmlrpc/2, JSON-RPC on
+/jsonrpc and the web session endpoints) on top of a pluggable backend: the
+synthetic DatasetBackend, or a recording/replaying proxy. Latency and a
+bandwidth cap can be injected to model a remote server, and responses are
+gzip-compressed for clients that accept it, like Odoo behind nginx.
+
+Runs in-process (background thread) or standalone via
+`python -m src.integrations.odoo.fake`.
+"""
+
+import gzip
+import json
+import random
+import socket
+import threading
+import time
+import uuid
+import xmlrpc.client
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Tuple
+import logging
+
+from src.integrations.odoo.fake.dataset import FakeDataset, generate_dataset
+from src.integrations.odoo.fake.engine import DatasetBackend, FakeOdooFault
+
+logger = logging.getLogger(__name__)
+
+
+class LatencyModel:
+    """
+    Injected per-call latency: base + per_row * rows returned, plus uniform
+    jitter, plus the transfer time of the response body at a capped bandwidth.
+
+    Usage:
+        latency = LatencyModel(base=0.02, per_row=0.00002, jitter=0.005, bandwidth=1_000_000)
+    """
+
+    def __init__(
+        self,
+        base: float = 0.0,
+        per_row: float = 0.0,
+        jitter: float = 0.0,
+        seed: int = 0,
+        bandwidth: float = 0.0
+    ):
+        """
+        Initialize latency model.
+
+        Args:
+            base: Seconds added to every call
+            per_row: Seconds added per record returned
+            jitter: Maximum random extra seconds
+            seed: Random seed, for reproducible runs
+            bandwidth: Response bytes per second (0 = unlimited)
+        """
+        self.base = base
+        self.per_row = per_row
+        self.jitter = jitter
+        self.bandwidth = bandwidth
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def delay(self, result: Any) -> float:
+        """Get the delay for a call returning result."""
+        rows = len(result) if isinstance(result, list) else 1
+        with self._lock:
+            extra = self._random.uniform(0, self.jitter) if self.jitter else 0.0
+        return self.base + self.per_row * rows + extra
+
+    def transfer_delay(self, size: int) -> float:
+        """Get the time to send size bytes at the capped bandwidth."""
+        return size / self.bandwidth if self.bandwidth else 0.0
+
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def get_request(self) -> Tuple[socket.socket, Any]:
+        connection, address = super().get_request()
+        connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        return connection, address
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """Routes Odoo RPC endpoints to the owning FakeOdooServer."""
+
+    protocol_version = 'HTTP/1.1'
+    owner: 'FakeOdooServer'
+
+    def log_message(self, format: str, *args) -> None:
+        logger.debug(format % args)
+
+    def _accepts_gzip(self) -> bool:
+        accepted = self.headers.get('Accept-Encoding', '')
+        return any(c.split(';', 1)[0].strip().lower() == 'gzip' for c in accepted.split(','))
+
+    def _reply(self, body: bytes, content_type: str, headers: Optional[Dict[str, str]] = None) -> None:
+        headers = dict(headers or {})
+        min_bytes = self.owner.compress_min_bytes
+        if min_bytes and len(body) >= min_bytes and self._accepts_gzip():
+            body = gzip.compress(body, compresslevel=6)
+            headers['Content-Encoding'] = 'gzip'
+        if self.owner.latency is not None:
+            time.sleep(self.owner.latency.transfer_delay(len(body)))
+        self.send_response(200)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_POST(self) -> None:
+        body = self.rfile.read(int(self.headers.get('Content-Length') or 0))
+        if self.headers.get('Content-Encoding', '').lower() == 'gzip':
+            body = gzip.decompress(body)
+        path = self.path.split('?', 1)[0]
+        if path.startswith('/xmlrpc/2/'):
+            self._xmlrpc(path.rsplit('/', 1)[-1], body)
+        elif path == '/jsonrpc' or path.startswith('/web/'):
+            self._jsonrpc(path, body)
+        else:
+            self.send_error(404)
+
+    def _xmlrpc(self, service: str, body: bytes) -> None:
+        params, method = xmlrpc.client.loads(body, use_builtin_types=True)
+        try:
+            result = self.owner.dispatch(service, method, list(params))
+            payload = xmlrpc.client.dumps((result,), methodresponse=True, allow_none=True)
+        except Exception as e:
+            payload = xmlrpc.client.dumps(xmlrpc.client.Fault(1, str(e)), methodresponse=True, allow_none=True)
+        self._reply(payload.encode('utf-8'), 'text/xml')
+
+    def _jsonrpc(self, path: str, body: bytes) -> None:
+        request = json.loads(body or b'{}')
+        params = request.get('params') or {}
+        headers: Dict[str, str] = {}
+        try:
+            if path == '/jsonrpc':
+                result = self.owner.dispatch(params.get('service'), params.get('method'), params.get('args') or [])
+            elif path == '/web/session/authenticate':
+                uid = self.owner.backend.authenticate(params.get('db'), params.get('login'), params.get('password'))
+                headers['Set-Cookie'] = f'session_id={uuid.uuid4().hex}; Path=/; HttpOnly'
+                result = {'uid': uid, 'db': params.get('db'), 'username': params.get('login')}
+            elif path.startswith('/web/dataset/call_kw'):
+                result = self.owner.call(
+                    params['model'], params['method'], params.get('args') or [], params.get('kwargs') or {}
+                )
+            elif path == '/web/webclient/version_info':
+                result = self.owner.backend.version()
+            else:
+                raise FakeOdooFault(f"Unknown endpoint {path}")
+            response = {'jsonrpc': '2.0', 'id': request.get('id'), 'result': result}
+        except Exception as e:
+            response = {
+                'jsonrpc': '2.0',
+                'id': request.get('id'),
+                'error': {
+                    'code': 200,
+                    'message': 'Odoo Server Error',
+                    'data': {'name': type(e).__name__, 'message': str(e)},
+                },
+            }
+        self._reply(json.dumps(response, default=str).encode('utf-8'), 'application/json', headers)
+
+
+class FakeOdooServer:
+    """
+    Local stand-in for an Odoo server.
+
+    Usage:
+        with FakeOdooServer(dataset=generate_dataset(invoices=10000)) as server:
+            client = OdooClient(OdooConfig(url=server.url, database='fake', ...))
+    """
+
+    def __init__(
+        self,
+        dataset: Optional[FakeDataset] = None,
+        backend=None,
+        latency: Optional[LatencyModel] = None,
+        host: str = '127.0.0.1',
+        port: int = 0,
+        compress_min_bytes: int = 1024
+    ):
+        """
+        Initialize server.
+
+        Args:
+            dataset: Records to serve. A default synthetic dataset is generated if neither dataset nor backend is provided.
+            backend: Call handler (DatasetBackend, RecordingBackend or ReplayBackend). Overrides dataset.
+            latency: Injected latency model (none if not provided)
+            host: Interface to bind
+            port: Port to bind (0 picks a free port)
+            compress_min_bytes: Gzip responses of at least this size for clients accepting gzip (0 = never)
+        """
+        if backend is None:
+            backend = DatasetBackend(dataset if dataset is not None else generate_dataset())
+        self.backend = backend
+        self.latency = latency
+        self.compress_min_bytes = compress_min_bytes
+        self.calls = 0
+        handler = type('FakeOdooHandler', (_Handler,), {'owner': self})
+        self._httpd = _Server((host, port), handler)
+        self._thread: Optional[threading.Thread] = None
+        self._counter_lock = threading.Lock()
+
+    @property
+    def url(self) -> str:
+        """Get the server's base URL."""
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def dispatch(self, service: str, method: str, args: List[Any]) -> Any:
+        """Handle an XML-RPC/JSON-RPC service call (common or object)."""
+        if service == 'common':
+            if method == 'version':
+                return self.backend.version()
+            if method in ('authenticate', 'login'):
+                return self.backend.authenticate(*args[:3])
+        elif service == 'object' and method == 'execute_kw':
+            model, model_method = args[3], args[4]
+            call_args = args[5] if len(args) > 5 else []
+            call_kwargs = args[6] if len(args) > 6 else {}
+            return self.call(model, model_method, call_args, call_kwargs or {})
+        raise FakeOdooFault(f"Unknown service method {service}.{method}")
+
+    def call(self, model: str, method: str, args: List[Any], kwargs: Dict[str, Any]) -> Any:
+        """Execute a model method on the backend, applying injected latency."""
+        with self._counter_lock:
+            self.calls += 1
+        result = self.backend.execute(model, method, args, kwargs)
+        if self.latency is not None:
+            time.sleep(self.latency.delay(result))
+        return result
+
+    def start(self) -> 'FakeOdooServer':
+        """Serve requests from a background thread."""
+        self._thread = threading.Thread(target=self._httpd.serve_forever, name='fake-odoo', daemon=True)
+        self._thread.start()
+        logger.info(f"Fake Odoo server listening on {self.url}")
+        return self
+
+    def serve_forever(self) -> None:
+        """Serve requests from the calling thread until interrupted."""
+        logger.info(f"Fake Odoo server listening on {self.url}")
+        self._httpd.serve_forever()
+
+    def stop(self) -> None:
+        """Stop serving and close the socket."""
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def __enter__(self) -> 'FakeOdooServer':
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
@@ -0,0 +1,155 @@
+"""
+Concurrent Fan-Out
+
+Runs independent Odoo calls concurrently so a composite operation waits for
+its slowest call instead of the sum of all of them.
+
+OdooCall describes a single execute() call; fan_out() runs arbitrary
+callables (e.g. whole operations methods) under the same parallelism cap.
+Results come back in input order, each carrying either a value or the error
+it raised, so one failing call does not discard the others.
+"""
+
+import contextvars
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
+import logging
+
+from src.integrations.odoo.instrumentation import bind_caller, detect_caller
+from src.integrations.odoo.read_group import parse_read_group
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class OdooCall:
+    """
+    Specification of a single Odoo execute() call.
+
+    Attributes:
+        model: Odoo model name
+        method: Method to call
+        args: Positional arguments
+        kwargs: Keyword arguments
+        parse: Optional post-processor applied to the raw result
+    """
+    model: str
+    method: str
+    args: Tuple[Any, ...] = ()
+    kwargs: Dict[str, Any] = field(default_factory=dict)
+    parse: Optional[Callable[[Any], Any]] = None
+
+    @classmethod
+    def search_read(
+        cls,
+        model: str,
+        domain: List[Union[Tuple, List]],
+        fields: Optional[List[str]] = None,
+        limit: Optional[int] = None,
+        order: Optional[str] = None
+    ) -> "OdooCall":
+        """Build a search_read call. See OdooClient.search_read."""
+        kwargs = {}
+        if fields:
+            kwargs['fields'] = fields
+        if limit is not None:
+            kwargs['limit'] = limit
+        if order:
+            kwargs['order'] = order
+        return cls(model, 'search_read', (domain,), kwargs)
+
+    @classmethod
+    def search_count(cls, model: str, domain: List[Union[Tuple, List]]) -> "OdooCall":
+        """Build a search_count call. See OdooClient.search_count."""
+        return cls(model, 'search_count', (domain,))
+
+    @classmethod
+    def read_group(
+        cls,
+        model: str,
+        domain: List[Union[Tuple, List]],
+        fields: List[str],
+        groupby: List[str],
+        lazy: bool = False
+    ) -> "OdooCall":
+        """Build a read_group call returning ReadGroupRow objects. See OdooClient.read_group."""
+        return cls(
+            model,
+            'read_group',
+            (domain, fields, groupby),
+            {'lazy': lazy},
+            parse=lambda rows: parse_read_group(rows, fields, groupby, lazy=lazy)
+        )
+
+
+@dataclass
+class CallResult:
+    """
+    Outcome of one fanned-out call.
+
+    Attributes:
+        value: Returned value
+        error: Raised exception, if the call failed
+        elapsed: Seconds the call ran, excluding time spent queued
+    """
+    value: Any = None
+    error: Optional[Exception] = None
+    elapsed: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        """Check if the call succeeded."""
+        return self.error is None
+
+    def unwrap(self) -> Any:
+        """Get the value, re-raising the call's error if it failed."""
+        if self.error is not None:
+            raise self.error
+        return self.value
+
+    def value_or(self, default: Any) -> Any:
+        """Get the value, or default if the call failed."""
+        return self.value if self.error is None else default
+
+
+def fan_out(
+    funcs: Sequence[Callable[[], Any]],
+    max_parallel: int = 8
+) -> List[CallResult]:
+    """
+    Run zero-argument callables concurrently on worker threads.
+
+    Each callable runs in a copy of the caller's context, so context
+    variables set by the caller (including the instrumentation caller) are
+    visible in the workers.
+
+    Args:
+        funcs: Callables to run
+        max_parallel: Maximum number running at once
+
+    Returns:
+        One CallResult per callable, in input order
+    """
+    def run(func: Callable[[], Any]) -> CallResult:
+        start = time.perf_counter()
+        try:
+            return CallResult(value=func(), elapsed=time.perf_counter() - start)
+        except Exception as e:
+            return CallResult(error=e, elapsed=time.perf_counter() - start)
+
+    if len(funcs) <= 1 or max_parallel <= 1:
+        return [run(func) for func in funcs]
+
+    with ThreadPoolExecutor(
+        max_workers=min(max_parallel, len(funcs)),
+        thread_name_prefix='odoo-fanout'
+    ) as executor:
+        caller = detect_caller()
+        futures = []
+        for func in funcs:
+            context = contextvars.copy_context()
+            context.run(bind_caller, caller)
+            futures.append(executor.submit(context.run, run, func))
+        return [future.result() for future in futures]
@@ -0,0 +1,281 @@
+"""
+Odoo RPC Instrumentation
+
+Per-call metrics for Odoo RPCs: call and error counts, a latency histogram,
+response row counts, response byte sizes (decoded and on the wire, giving
+the compression ratio) and time spent inflating compressed responses,
+labeled by model, method, calling operations method and calling agent tool.
+
+The caller is found by walking the stack for the nearest frame in an
+operations module (src.integrations.odoo.models.*) and the outermost frame
+in an agent tool module (src.agents.*.tools), falling back to a caller
+pinned in a context variable when the work was handed to another thread or
+the event loop. Metrics are exposed as a snapshot for in-process use
+and in Prometheus text format for the /metrics endpoint.
+"""
+
+import sys
+import threading
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Dict, List, NamedTuple, Optional, Tuple
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+# Latency histogram bucket upper bounds in seconds
+LATENCY_BUCKETS: Tuple[float, ...] = (
+    0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0
+)
+
+OPERATIONS_MODULE_PREFIX = 'src.integrations.odoo.models.'
+AGENTS_MODULE_PREFIX = 'src.agents.'
+
+# (operations method, agent tool) pinned for work handed off to another thread
+_caller: ContextVar[Optional[Tuple[str, str]]] = ContextVar('odoo_caller', default=None)
+
+
+class ResponseSize(NamedTuple):
+    """Size of a decoded response."""
+    size: int = 0  # payload bytes after decompression
+    wire_size: int = 0  # bytes received
+    decompress_seconds: float = 0.0
+
+
+_NO_RESPONSE = ResponseSize()
+
+# Size of the last response body decoded in this context
+_response_size: ContextVar[ResponseSize] = ContextVar('odoo_response_size', default=_NO_RESPONSE)
+
+
+def record_response_size(size: int, wire_size: Optional[int] = None, decompress_seconds: float = 0.0) -> None:
+    """
+    Record the size of a decoded response (called by transports).
+
+    Args:
+        size: Payload bytes after decompression
+        wire_size: Bytes received (defaults to size, i.e. uncompressed)
+        decompress_seconds: Time spent inflating the body
+    """
+    _response_size.set(ResponseSize(size, size if wire_size is None else wire_size, decompress_seconds))
+
+
+def take_response_size() -> ResponseSize:
+    """Get and reset the size of the last decoded response."""
+    response = _response_size.get()
+    _response_size.set(_NO_RESPONSE)
+    return response
+
+
+def detect_caller() -> Tuple[str, str]:
+    """
+    Find the operations method and agent tool issuing the current call.
+
+    Frames on the current stack win; the caller pinned with bind_caller()
+    fills in whatever the stack lacks (e.g. on a fan-out worker thread or
+    the event loop).
+
+    Returns:
+        Tuple of (operations method, agent tool); '' where there is none
+    """
+    operation = tool = ''
+    frame = sys._getframe(1)
+    while frame is not None:
+        module = frame.f_globals.get('__name__', '')
+        if not operation and module.startswith(OPERATIONS_MODULE_PREFIX):
+            # Report closures under the method that defined them
+            code = frame.f_code
+            operation = getattr(code, 'co_qualname', code.co_name).split('.<locals>', 1)[0]
+        elif module.startswith(AGENTS_MODULE_PREFIX) and module.endswith('.tools'):
+            tool = frame.f_code.co_name
+        frame = frame.f_back
+
+    pinned = _caller.get()
+    if pinned is not None:
+        operation = operation or pinned[0]
+        tool = tool or pinned[1]
+    return operation, tool
+
+
+def bind_caller(caller: Tuple[str, str]) -> None:
+    """Pin the caller for the current context (e.g. a fan-out worker)."""
+    _caller.set(caller)
+
+
+async def run_as_caller(caller: Tuple[str, str], awaitable: Awaitable) -> Any:
+    """
+    Await a coroutine with the caller pinned.
+
+    Used to carry the caller of a blocking thread over to the event loop.
+    """
+    _caller.set(caller)
+    return await awaitable
+
+
+@dataclass
+class CallStats:
+    """Aggregated metrics for one (model, method, operation, tool) label set."""
+    calls: int = 0
+    errors: int = 0
+    seconds: float = 0.0
+    max_seconds: float = 0.0
+    rows: int = 0
+    bytes: int = 0
+    max_bytes: int = 0
+    wire_bytes: int = 0
+    decompress_seconds: float = 0.0
+    buckets: List[int] = field(default_factory=lambda: [0] * len(LATENCY_BUCKETS))
+
+
+def count_rows(result: Any) -> int:
+    """Get the number of rows in a call result (1 for scalar results)."""
+    if isinstance(result, (list, tuple, dict)):
+        return len(result)
+    return 0 if result is None else 1
+
+
+class OdooMetrics:
+    """
+    Thread-safe registry of Odoo RPC metrics.
+
+    Usage:
+        metrics = get_odoo_metrics()
+        metrics.record('res.partner', 'search_read', caller, 0.042, rows=20,
+                       response=ResponseSize(5120, 1024, 0.0001))
+        slowest = metrics.snapshot()[:10]
+    """
+
+    def __init__(self):
+        """Initialize an empty registry."""
+        self._stats: Dict[Tuple[str, str, str, str], CallStats] = {}
+        self._lock = threading.Lock()
+
+    def record(
+        self,
+        model: str,
+        method: str,
+        caller: Tuple[str, str],
+        seconds: float,
+        rows: int = 0,
+        response: ResponseSize = _NO_RESPONSE,
+        error: bool = False
+    ) -> None:
+        """
+        Record one call.
+
+        Args:
+            model: Odoo model name
+            method: Method called
+            caller: (operations method, agent tool) from detect_caller()
+            seconds: Wall-clock latency
+            rows: Rows in the response
+            response: Response size from take_response_size()
+            error: Whether the call failed
+        """
+        key = (model, method, caller[0], caller[1])
+        size = response.size
+        with self._lock:
+            stats = self._stats.get(key)
+            if stats is None:
+                stats = self._stats[key] = CallStats()
+            stats.calls += 1
+            stats.errors += int(error)
+            stats.seconds += seconds
+            stats.max_seconds = max(stats.max_seconds, seconds)
+            stats.rows += rows
+            stats.bytes += size
+            stats.max_bytes = max(stats.max_bytes, size)
+            stats.wire_bytes += response.wire_size
+            stats.decompress_seconds += response.decompress_seconds
+            for i, bound in enumerate(LATENCY_BUCKETS):
+                if seconds <= bound:
+                    stats.buckets[i] += 1
+                    break
+
+    def snapshot(self) -> List[Dict[str, Any]]:
+        """
+        Get per-label metrics, slowest (by total time) first.
+
+        Returns:
+            List of dictionaries with labels, counts, timings, rows, bytes and compression
+        """
+        result = []
+        with self._lock:
+            for (model, method, operation, tool), s in self._stats.items():
+                result.append({
+                    'model': model,
+                    'method': method,
+                    'operation': operation,
+                    'tool': tool,
+                    'calls': s.calls,
+                    'errors': s.errors,
+                    'total_ms': round(s.seconds * 1000, 2),
+                    'avg_ms': round(s.seconds / s.calls * 1000, 2),
+                    'max_ms': round(s.max_seconds * 1000, 2),
+                    'rows': s.rows,
+                    'avg_rows': round(s.rows / s.calls, 1),
+                    'bytes': s.bytes,
+                    'max_bytes': s.max_bytes,
+                    'wire_bytes': s.wire_bytes,
+                    'compression_ratio': round(s.bytes / s.wire_bytes, 2) if s.wire_bytes else 1.0,
+                    'decompress_ms': round(s.decompress_seconds * 1000, 2),
+                })
+        result.sort(key=lambda r: r['total_ms'], reverse=True)
+        return result
+
+    def render_prometheus(self) -> str:
+        """Render all metrics in Prometheus text exposition format."""
+        with self._lock:
+            items = sorted(self._stats.items())
+            lines = [
+                '# HELP odoo_rpc_duration_seconds Odoo RPC latency.',
+                '# TYPE odoo_rpc_duration_seconds histogram',
+            ]
+            for key, s in items:
+                labels = _labels(key)
+                cumulative = 0
+                for bound, count in zip(LATENCY_BUCKETS, s.buckets):
+                    cumulative += count
+                    lines.append(f'odoo_rpc_duration_seconds_bucket{{{labels},le="{bound}"}} {cumulative}')
+                lines.append(f'odoo_rpc_duration_seconds_bucket{{{labels},le="+Inf"}} {s.calls}')
+                lines.append(f'odoo_rpc_duration_seconds_sum{{{labels}}} {s.seconds:.6f}')
+                lines.append(f'odoo_rpc_duration_seconds_count{{{labels}}} {s.calls}')
+
+            for name, help_text, attr in (
+                ('odoo_rpc_errors_total', 'Failed Odoo RPCs.', 'errors'),
+                ('odoo_rpc_response_rows_total', 'Rows returned by Odoo RPCs.', 'rows'),
+                ('odoo_rpc_response_bytes_total', 'Decoded response bytes of Odoo RPCs.', 'bytes'),
+                ('odoo_rpc_response_wire_bytes_total', 'Response bytes received from Odoo RPCs (compressed).', 'wire_bytes'),
+                ('odoo_rpc_decompress_seconds_total', 'Time spent inflating compressed Odoo responses.', 'decompress_seconds'),
+            ):
+                lines.append(f'# HELP {name} {help_text}')
+                lines.append(f'# TYPE {name} counter')
+                for key, s in items:
+                    lines.append(f'{name}{{{_labels(key)}}} {getattr(s, attr)}')
+        return '\n'.join(lines) + '\n'
+
+    def reset(self) -> None:
+        """Drop all recorded metrics."""
+        with self._lock:
+            self._stats.clear()
+
+
+def _labels(key: Tuple[str, str, str, str]) -> str:
+    """Format a label set for Prometheus output."""
+    names = ('model', 'method', 'operation', 'tool')
+    return ','.join(f'{name}="{_escape(value)}"' for name, value in zip(names, key))
+
+
+def _escape(value: str) -> str:
+    """Escape a Prometheus label value."""
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+# Singleton instance
+_metrics = OdooMetrics()
+
+
+def get_odoo_metrics() -> OdooMetrics:
+    """Get the process-wide Odoo metrics registry."""
+    return _metrics
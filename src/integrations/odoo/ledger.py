@@ -0,0 +1,492 @@
+"""
+Odoo Ledger Cache
+
+Keeps the posted journal items (account.move.line) of a recent horizon in
+memory as NumPy columns, so finance reports can slice them locally with
+masked, vectorized aggregations instead of querying Odoo again. A follow-up
+such as "and last quarter?" or "just for partner X" is then answered
+without an RPC.
+
+Columns: id, account_id, journal_id, partner_id (0 when empty), date (days
+since 1970-01-01), debit, credit and balance.
+
+- The first sync loads every posted item dated within ODOO_LEDGER_HORIZON_DAYS,
+  the balance per journal before the horizon, and the account and journal
+  lists.
+- Later polls fetch the items whose write_date is at or after the last
+  seen write_date (re-reading a short overlap), keep those that are posted
+  and within the horizon, and drop the rest.
+- A periodic reconcile compares local ids with Odoo's, dropping deleted
+  items and reading any that were missed, and refreshes the pre-horizon
+  balances and reference lists.
+- Writes to account.move or account.move.line through an Odoo client mark
+  the ledger dirty; reports go to Odoo until the next poll.
+
+Each sync builds a new LedgerSnapshot and swaps it in, so readers always
+see one consistent set of columns.
+"""
+
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+from typing import Any, Dict, Optional, Sequence, Tuple, Union
+import logging
+
+import numpy as np
+
+from src.config import settings
+from src.integrations.odoo.domain import POSTED_LINES, and_domains
+from src.integrations.odoo.records import RecordBatch
+from src.integrations.odoo.sync import ConnectionRegistry, max_write_date, poll_since
+
+logger = logging.getLogger(__name__)
+
+# Writes to these models may change posted journal items
+LEDGER_MODELS = frozenset({'account.move', 'account.move.line'})
+
+LINE_FIELDS = ['account_id', 'journal_id', 'partner_id', 'date', 'debit', 'credit', 'balance', 'write_date']
+
+# Records per RPC
+PAGE_SIZE = 5000
+
+DateLike = Union[date, str]
+
+
+def epoch_day(value: DateLike) -> int:
+    """Get a date (or YYYY-MM-DD string) as days since 1970-01-01."""
+    return int(np.datetime64(value, 'D').astype(np.int64))
+
+
+# ==================== Columns ====================
+
+@dataclass(frozen=True)
+class LedgerColumns:
+    """
+    Journal items as parallel NumPy arrays.
+
+    Usage:
+        mask = columns.mask(date_from='2024-01-01', date_to='2024-03-31', partner_id=[7])
+        balance_by_account = columns.sum_by('account_id', 'balance', mask)
+    """
+    id: np.ndarray
+    account_id: np.ndarray
+    journal_id: np.ndarray
+    partner_id: np.ndarray
+    date: np.ndarray
+    debit: np.ndarray
+    credit: np.ndarray
+    balance: np.ndarray
+
+    @classmethod
+    def empty(cls) -> 'LedgerColumns':
+        """Get columns without rows."""
+        ints, floats = np.zeros(0, dtype=np.int64), np.zeros(0)
+        return cls(ints, ints, ints, ints, ints, floats, floats, floats)
+
+    @classmethod
+    def from_batch(cls, batch: RecordBatch) -> 'LedgerColumns':
+        """Build columns from a columnar search_read of LINE_FIELDS."""
+        if not len(batch):
+            return cls.empty()
+        arrays = batch.to_numpy()
+        return cls(
+            id=arrays['id'].copy(),
+            account_id=arrays['account_id'].copy(),
+            journal_id=arrays['journal_id'].copy(),
+            partner_id=arrays['partner_id'].copy(),
+            date=np.array(batch['date'], dtype='datetime64[D]').astype(np.int64),
+            debit=arrays['debit'].copy(),
+            credit=arrays['credit'].copy(),
+            balance=arrays['balance'].copy(),
+        )
+
+    def __len__(self) -> int:
+        return len(self.id)
+
+    def _columns(self) -> Dict[str, np.ndarray]:
+        return {name: getattr(self, name) for name in self.__dataclass_fields__}
+
+    def replace(self, removed: np.ndarray, added: 'LedgerColumns') -> 'LedgerColumns':
+        """
+        Get new columns without some ids and with other rows appended.
+
+        Rows of added replace existing rows with the same id.
+        """
+        keep = ~np.isin(self.id, np.concatenate([removed, added.id]))
+        other = added._columns()
+        return LedgerColumns(**{
+            name: np.concatenate([column[keep], other[name]])
+            for name, column in self._columns().items()
+        })
+
+    def mask(
+        self,
+        date_from: Optional[DateLike] = None,
+        date_to: Optional[DateLike] = None,
+        **filters: Optional[Sequence[int]]
+    ) -> np.ndarray:
+        """
+        Select rows by date range and column values.
+
+        Args:
+            date_from: First day included
+            date_to: Last day included
+            **filters: Allowed ids per column (account_id, journal_id, partner_id);
+                None leaves a column unfiltered
+
+        Returns:
+            Boolean array over the rows
+        """
+        mask = np.ones(len(self), dtype=bool)
+        if date_from is not None:
+            mask &= self.date >= epoch_day(date_from)
+        if date_to is not None:
+            mask &= self.date <= epoch_day(date_to)
+        for name, values in filters.items():
+            if values is not None:
+                mask &= np.isin(getattr(self, name), np.asarray(values, dtype=np.int64))
+        return mask
+
+    def sum_by(
+        self,
+        key: Union[str, np.ndarray],
+        value: str,
+        mask: Optional[np.ndarray] = None
+    ) -> Dict[int, float]:
+        """
+        Sum a value column per key.
+
+        Args:
+            key: Column name, or an integer key per row
+            value: 'debit', 'credit' or 'balance'
+            mask: Rows to include; all if not provided
+
+        Returns:
+            Sum per key, for keys present in the selected rows, rounded to
+            cents like Odoo's sums of monetary columns
+        """
+        keys = getattr(self, key) if isinstance(key, str) else key
+        values = getattr(self, value)
+        if mask is not None:
+            keys, values = keys[mask], values[mask]
+        unique, inverse = np.unique(keys, return_inverse=True)
+        sums = np.round(np.bincount(inverse, weights=values, minlength=len(unique)), 2)
+        return dict(zip(unique.tolist(), sums.tolist()))
+
+
+@dataclass(frozen=True)
+class LedgerSnapshot:
+    """
+    Consistent state of the ledger cache.
+
+    Attributes:
+        columns: Posted journal items dated on or after horizon_start
+        horizon_start: First day held
+        carried: Balance per journal of the posted items before horizon_start
+        accounts: account.account rows (id, name, code, account_type) by id
+        journals: account.journal rows (id, name, type) by id
+    """
+    columns: LedgerColumns
+    horizon_start: date
+    carried: Dict[int, float] = field(default_factory=dict)
+    accounts: Dict[int, Dict[str, Any]] = field(default_factory=dict)
+    journals: Dict[int, Dict[str, Any]] = field(default_factory=dict)
+
+    def covers(self, date_from: Optional[DateLike]) -> bool:
+        """Check if every item on or after date_from is held."""
+        return date_from is not None and epoch_day(date_from) >= epoch_day(self.horizon_start)
+
+
+# ==================== Ledger ====================
+
+class OdooLedger:
+    """
+    In-memory columnar cache of posted journal items for one connection.
+
+    Usage:
+        ledger = OdooLedger()
+        ledger.start()
+        ...
+        snapshot = ledger.snapshot('2024-01-01')
+        if snapshot is not None:
+            mask = snapshot.columns.mask('2024-01-01', '2024-03-31')
+
+    FinanceOperations consults the running ledger of its connection
+    automatically (see get_odoo_ledger).
+    """
+
+    def __init__(
+        self,
+        client=None,
+        horizon_days: Optional[int] = None,
+        poll_interval: Optional[float] = None,
+        reconcile_interval: Optional[float] = None,
+        max_staleness: Optional[float] = None
+    ):
+        """
+        Initialize ledger.
+
+        Args:
+            client: OdooClient used to sync. A client for the active tenant's
+                server with the result cache disabled if not provided.
+            horizon_days: Days of journal items held. Uses settings if not provided.
+            poll_interval: Seconds between write_date polls. Uses settings if not provided.
+            reconcile_interval: Seconds between full id diffs. Uses settings if not provided.
+            max_staleness: Seconds after a poll during which reports are served. Uses settings if not provided.
+        """
+        if client is None:
+            from src.integrations.odoo.client import OdooClient
+            from src.integrations.odoo.tenants import current_tenant_config
+            client = OdooClient(current_tenant_config())
+            # Polls must see Odoo's current data, not cached results
+            client.cache = None
+            client.flights = None
+            client.tracing = False
+        self.client = client
+        self.horizon_days = horizon_days if horizon_days is not None else settings.odoo_ledger_horizon_days
+        self.poll_interval = poll_interval if poll_interval is not None else settings.odoo_ledger_poll_interval
+        self.reconcile_interval = (
+            reconcile_interval if reconcile_interval is not None
+            else settings.odoo_ledger_reconcile_interval
+        )
+        self.max_staleness = max_staleness if max_staleness is not None else settings.odoo_ledger_max_staleness
+
+        self._snapshot: Optional[LedgerSnapshot] = None
+        self.last_write_date: Optional[str] = None
+        self.synced_at: Optional[float] = None
+        self.reconciled_at: Optional[float] = None
+        self.dirty_since: Optional[float] = None
+        self._sync_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._wake = threading.Event()
+        self._worker: Optional[threading.Thread] = None
+        self.hits = 0
+        self.misses = 0
+
+    # ==================== Lifecycle ====================
+
+    def start(self) -> None:
+        """Start the background sync thread (the first pass loads the horizon)."""
+        if self._worker is not None:
+            return
+        self._stop.clear()
+        self._worker = threading.Thread(target=self._run, name='odoo-ledger-sync', daemon=True)
+        self._worker.start()
+
+    def stop(self) -> None:
+        """Stop the sync thread."""
+        self._stop.set()
+        self._wake.set()
+        self._worker = None
+
+    def _run(self) -> None:
+        """Sync every poll_interval, or as soon as a write marks the ledger dirty."""
+        while not self._stop.is_set():
+            try:
+                self.sync()
+            except Exception as e:
+                logger.warning(f"Odoo ledger sync failed: {e}")
+            self._wake.wait(self.poll_interval)
+            self._wake.clear()
+
+    def mark_dirty(self, model: str) -> None:
+        """
+        Record a write to a model; reports go to Odoo until the next poll.
+
+        Args:
+            model: Odoo model name
+        """
+        if model not in LEDGER_MODELS:
+            return
+        if self.dirty_since is None:
+            self.dirty_since = time.time()
+        self._wake.set()
+
+    # ==================== Sync ====================
+
+    def sync(self) -> None:
+        """Load the horizon, or poll for changes and reconcile when due."""
+        with self._sync_lock:
+            started = time.time()
+            if self._snapshot is None:
+                self._load()
+            else:
+                self._poll()
+                if self.reconciled_at is None or started - self.reconciled_at >= self.reconcile_interval:
+                    self._reconcile()
+            self.synced_at = started
+            if self.dirty_since is not None and self.dirty_since <= started:
+                self.dirty_since = None
+
+    def _fetch(self, domain: Sequence[Any]) -> LedgerColumns:
+        """Read matching journal items in id-keyset pages into columns."""
+        batch = None
+        for page in self.client.iter_search_read(
+            'account.move.line', list(domain), fields=LINE_FIELDS, batch_size=PAGE_SIZE, result='columns'
+        ):
+            self.last_write_date = max_write_date(page['write_date'], self.last_write_date)
+            if batch is None:
+                batch = page
+            else:
+                batch.extend(page)
+        return LedgerColumns.from_batch(batch) if batch is not None else LedgerColumns.empty()
+
+    def _references(self, horizon_start: date) -> Tuple[Dict[int, float], Dict[int, Dict[str, Any]], Dict[int, Dict[str, Any]]]:
+        """Fetch the pre-horizon balance per journal and the account and journal lists."""
+        from src.integrations.odoo.fanout import OdooCall
+
+        carried, accounts, journals = (r.unwrap() for r in self.client.execute_many([
+            OdooCall.read_group(
+                'account.move.line',
+                and_domains(POSTED_LINES, [['date', '<', horizon_start.isoformat()]]),
+                fields=['balance:sum'],
+                groupby=['journal_id']
+            ),
+            OdooCall.search_read('account.account', [], fields=['id', 'name', 'code', 'account_type']),
+            OdooCall.search_read('account.journal', [], fields=['id', 'name', 'type']),
+        ]))
+        return (
+            {g.key('journal_id'): g.get('balance') for g in carried if g.key('journal_id')},
+            {a['id']: a for a in accounts},
+            {j['id']: j for j in journals},
+        )
+
+    def _load(self) -> None:
+        """Load every posted journal item within the horizon."""
+        started = time.perf_counter()
+        horizon_start = date.today() - timedelta(days=self.horizon_days)
+        self.last_write_date = None
+        columns = self._fetch(and_domains(POSTED_LINES, [['date', '>=', horizon_start.isoformat()]]))
+        carried, accounts, journals = self._references(horizon_start)
+        self._snapshot = LedgerSnapshot(columns, horizon_start, carried, accounts, journals)
+        # Items written while the load was paging are caught by a reconcile on the next pass
+        self.reconciled_at = None
+        logger.info(
+            f"Loaded {len(columns)} journal items since {horizon_start} in {time.perf_counter() - started:.1f}s"
+        )
+
+    def _poll(self) -> None:
+        """Apply the journal items written since the last poll."""
+        current = self._snapshot
+        since = poll_since(self.last_write_date)
+        changed = []
+        for page in self.client.iter_search_read(
+            'account.move.line',
+            [['write_date', '>=', since]] if since else [],
+            fields=['write_date'],
+            batch_size=PAGE_SIZE,
+            result='columns'
+        ):
+            self.last_write_date = max_write_date(page['write_date'], self.last_write_date)
+            changed.extend(page.ids)
+        if not changed:
+            return
+        # Changed items still posted and within the horizon replace their rows; the others are dropped
+        kept = self._fetch(and_domains(
+            POSTED_LINES, [['id', 'in', changed], ['date', '>=', current.horizon_start.isoformat()]]
+        ))
+        self._swap(current.columns.replace(np.array(changed, dtype=np.int64), kept))
+
+    def _reconcile(self) -> None:
+        """Diff local and remote ids, and refresh the pre-horizon balances and reference lists."""
+        current = self._snapshot
+        remote = np.array(self.client.search(
+            'account.move.line',
+            and_domains(POSTED_LINES, [['date', '>=', current.horizon_start.isoformat()]])
+        ), dtype=np.int64)
+        deleted = np.setdiff1d(current.columns.id, remote)
+        missing = np.setdiff1d(remote, current.columns.id)
+        added = LedgerColumns.empty()
+        if len(missing):
+            added = self._fetch([['id', 'in', missing.tolist()]])
+        if len(deleted) or len(missing):
+            logger.info(f"Reconciled ledger: {len(deleted)} deleted, {len(missing)} read")
+        carried, accounts, journals = self._references(current.horizon_start)
+        self._snapshot = LedgerSnapshot(
+            current.columns.replace(deleted, added), current.horizon_start, carried, accounts, journals
+        )
+        self.reconciled_at = time.time()
+
+    def _swap(self, columns: LedgerColumns) -> None:
+        current = self._snapshot
+        self._snapshot = LedgerSnapshot(
+            columns, current.horizon_start, current.carried, current.accounts, current.journals
+        )
+
+    # ==================== Reads ====================
+
+    def snapshot(self, date_from: Optional[DateLike] = None) -> Optional[LedgerSnapshot]:
+        """
+        Get the current snapshot if it may serve a report.
+
+        Args:
+            date_from: First day the report needs; None for reports that only
+                need the reference lists
+
+        Returns:
+            LedgerSnapshot, or None if the ledger is not loaded, is stale or
+            dirty, or does not reach back to date_from
+        """
+        current = self._snapshot
+        if not self._fresh() or (date_from is not None and not current.covers(date_from)):
+            self.misses += 1
+            return None
+        self.hits += 1
+        return current
+
+    def _fresh(self) -> bool:
+        return (
+            self._snapshot is not None
+            and self.dirty_since is None
+            and self.synced_at is not None
+            and time.time() - self.synced_at <= self.max_staleness
+        )
+
+    def status(self) -> Dict[str, Any]:
+        """Get sync status, size and hit counts."""
+        current = self._snapshot
+        return {
+            'items': len(current.columns) if current else 0,
+            'horizon_start': current.horizon_start.isoformat() if current else None,
+            'last_write_date': self.last_write_date,
+            'age': round(time.time() - self.synced_at, 1) if self.synced_at else None,
+            'serving': self._fresh(),
+            'hits': self.hits,
+            'misses': self.misses,
+        }
+
+
+# Running ledgers by Odoo connection identity
+_ledgers = ConnectionRegistry()
+
+
+def get_odoo_ledger(config) -> Optional[OdooLedger]:
+    """
+    Get the running ledger for an Odoo connection.
+
+    Args:
+        config: OdooConfig identifying the server, database and user
+
+    Returns:
+        OdooLedger instance, or None if no ledger is running for it
+    """
+    return _ledgers.get(config)
+
+
+def start_odoo_ledger(ledger: Optional[OdooLedger] = None) -> OdooLedger:
+    """
+    Start a ledger and let its connection's finance reports use it.
+
+    Args:
+        ledger: Ledger to start. One for the active tenant's Odoo server if not provided.
+
+    Returns:
+        The running ledger
+    """
+    return _ledgers.start(ledger or OdooLedger())
+
+
+def stop_odoo_ledgers() -> None:
+    """Stop every running ledger."""
+    _ledgers.stop_all()
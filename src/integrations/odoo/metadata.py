@@ -0,0 +1,259 @@
+"""
+Odoo Metadata Registry
+
+In-memory registry of installed Odoo models and their field definitions.
+
+The model list is loaded once (one ir.model read) and field definitions are
+fetched lazily per model with fields_get. Both are persisted to a JSON file
+keyed by server, database, user and server version, so a restart serves
+model/field existence checks from disk instead of repeating the discovery
+round trips. A daemon thread refreshes the registry periodically.
+"""
+
+import json
+import os
+import re
+import threading
+import time
+from typing import Any, Dict, List, Optional, Set
+from urllib.parse import urlsplit
+import logging
+
+from src.config import settings
+from src.integrations.odoo.cache import get_result_cache
+
+logger = logging.getLogger(__name__)
+
+
+# Field attributes kept per field definition
+FIELD_ATTRIBUTES = ['string', 'type', 'relation', 'required', 'readonly', 'store']
+
+
+class MetadataRegistry:
+    """
+    Model and field metadata for one Odoo connection.
+
+    Usage:
+        registry = MetadataRegistry(client)
+        if registry.has_model('hr.attendance'):
+            ...
+        if registry.has_field('sale.order', 'validity_date'):
+            ...
+    """
+
+    def __init__(
+        self,
+        client,
+        cache_dir: Optional[str] = None,
+        refresh_interval: Optional[float] = None
+    ):
+        """
+        Initialize registry.
+
+        Args:
+            client: OdooClient used to fetch metadata
+            cache_dir: Directory for persisted metadata. Uses settings if not provided.
+            refresh_interval: Seconds between background refreshes. Uses settings if not provided.
+        """
+        self.client = client
+        self.cache_dir = cache_dir if cache_dir is not None else settings.odoo_metadata_dir
+        self.refresh_interval = (
+            refresh_interval if refresh_interval is not None
+            else settings.odoo_metadata_refresh_interval
+        )
+
+        self.server_version: Optional[str] = None
+        self.loaded_at: Optional[float] = None
+        self._models: Set[str] = set()
+        self._fields: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.RLock()
+        self._stop = threading.Event()
+        self._refresher: Optional[threading.Thread] = None
+
+    @property
+    def is_loaded(self) -> bool:
+        """Check if the model list has been loaded."""
+        return self.loaded_at is not None
+
+    # ==================== Loading ====================
+
+    def _cache_path(self) -> Optional[str]:
+        """Get the persistence file path for the current server version."""
+        if not self.cache_dir or not self.server_version:
+            return None
+        config = self.client.config
+        parts = [
+            urlsplit(config.url).netloc or config.url,
+            config.database,
+            config.username,
+            self.server_version,
+        ]
+        name = '-'.join(re.sub(r'[^A-Za-z0-9_.+]+', '_', str(p)) for p in parts)
+        return os.path.join(self.cache_dir, f"{name}.json")
+
+    def load(self) -> None:
+        """
+        Load metadata from disk, or from the server if there is no usable file.
+
+        Safe to call repeatedly; only the first call does any work. Starts
+        the background refresh thread.
+        """
+        with self._lock:
+            if self.is_loaded:
+                return
+            version = self.client.get_version()
+            self.server_version = str(version.get('server_version', 'unknown'))
+            if not self._load_file():
+                self._fetch(models_only=True)
+                self._save_file()
+        self.start_background_refresh()
+
+    def _load_file(self) -> bool:
+        """Load persisted metadata. Returns True on success."""
+        path = self._cache_path()
+        if not path or not os.path.exists(path):
+            return False
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            self._models = set(data['models'])
+            self._fields = data.get('fields', {})
+            self.loaded_at = data['saved_at']
+        except (OSError, ValueError, KeyError) as e:
+            logger.warning(f"Ignoring unreadable Odoo metadata cache {path}: {e}")
+            return False
+        logger.info(f"Loaded {len(self._models)} Odoo models from {path}")
+        return True
+
+    def _save_file(self) -> None:
+        """Persist metadata (best effort)."""
+        path = self._cache_path()
+        if not path:
+            return
+        with self._lock:
+            data = {
+                'server_version': self.server_version,
+                'database': self.client.config.database,
+                'saved_at': self.loaded_at,
+                'models': sorted(self._models),
+                'fields': self._fields,
+            }
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp_path = f"{path}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"Could not persist Odoo metadata to {path}: {e}")
+
+    def _fetch(self, models_only: bool = False) -> None:
+        """
+        Fetch metadata from the server, bypassing cached results.
+
+        Args:
+            models_only: Only reload the model list, not known field definitions
+        """
+        cache = get_result_cache(self.client.config)
+        if cache is not None:
+            cache.invalidate_model('ir.model')
+
+        records = self.client.search_read('ir.model', [], fields=['model'])
+        models = {r['model'] for r in records}
+
+        fields = {}
+        if not models_only:
+            for model in list(self._fields):
+                if model in models:
+                    if cache is not None:
+                        cache.invalidate_model(model)
+                    fields[model] = self.client.fields_get(model, attributes=FIELD_ATTRIBUTES)
+
+        with self._lock:
+            self._models = models
+            if not models_only:
+                self._fields = fields
+            self.loaded_at = time.time()
+        logger.info(f"Fetched Odoo metadata: {len(models)} models")
+
+    def refresh(self) -> None:
+        """Re-fetch the model list and every loaded field definition, then persist."""
+        version = self.client.get_version()
+        with self._lock:
+            self.server_version = str(version.get('server_version', 'unknown'))
+        self._fetch()
+        self._save_file()
+
+    # ==================== Lookups ====================
+
+    def has_model(self, model: str) -> bool:
+        """
+        Check if a model is installed.
+
+        Args:
+            model: Model name (e.g. 'hr.attendance')
+
+        Returns:
+            True if the model exists
+        """
+        self.load()
+        return model in self._models
+
+    def models(self) -> List[str]:
+        """Get all installed model names."""
+        self.load()
+        return sorted(self._models)
+
+    def fields(self, model: str) -> Dict[str, Any]:
+        """
+        Get field definitions for a model, fetching them on first use.
+
+        Args:
+            model: Model name
+
+        Returns:
+            Field definitions keyed by field name ({} for unknown models)
+        """
+        if not self.has_model(model):
+            return {}
+        if model not in self._fields:
+            definitions = self.client.fields_get(model, attributes=FIELD_ATTRIBUTES)
+            with self._lock:
+                self._fields[model] = definitions
+            self._save_file()
+        return self._fields[model]
+
+    def has_field(self, model: str, field: str) -> bool:
+        """Check if a model has a field."""
+        return field in self.fields(model)
+
+    # ==================== Background Refresh ====================
+
+    def start_background_refresh(self) -> None:
+        """Start the daemon thread that refreshes metadata every refresh_interval."""
+        if self._refresher is not None or self.refresh_interval <= 0:
+            return
+        self._stop.clear()
+        self._refresher = threading.Thread(
+            target=self._refresh_loop,
+            name='odoo-metadata-refresh',
+            daemon=True
+        )
+        self._refresher.start()
+
+    def stop_background_refresh(self) -> None:
+        """Stop the refresh thread."""
+        self._stop.set()
+        self._refresher = None
+
+    def _refresh_loop(self) -> None:
+        """Refresh metadata whenever it is older than refresh_interval."""
+        while not self._stop.is_set():
+            age = time.time() - (self.loaded_at or 0)
+            if self._stop.wait(max(self.refresh_interval - age, 0)):
+                return
+            try:
+                self.refresh()
+            except Exception as e:
+                logger.warning(f"Odoo metadata refresh failed: {e}")
+                self._stop.wait(min(self.refresh_interval, 60))
@@ -0,0 +1,646 @@
+"""
+Odoo Local Mirror
+
+Keeps a local copy of frequently read Odoo models in a SQL database
+(the project's PostgreSQL, or SQLite for development) and answers
+search_read, search_count and read calls from it while it is fresh.
+
+- The first sync takes a snapshot of each model's stored fields. Archived
+  records are included, and reads hide them like Odoo's active_test does.
+- Later polls fetch the records whose write_date is at or after the last
+  seen write_date, re-reading a short overlap for transactions that
+  committed late.
+- A periodic reconcile compares local id/write_date pairs with Odoo's,
+  dropping deleted records and repairing any missed update.
+- Writes through an Odoo client mark the model dirty; its reads go to Odoo
+  until the next poll has picked the change up.
+
+Rows are held in memory per model (hydrated from the database on restart,
+so only the changes since the last run are fetched) and filtered with the
+local domain evaluator. Reads the mirror cannot answer exactly (fields
+that are not mirrored, related paths in the domain, all-field reads) go to
+Odoo as usual. Many2one display names are as of the referencing record's
+last write.
+
+In the project database the mirror tables come from the Alembic migrations
+(alembic upgrade head); only a separate mirror database configured with
+ODOO_MIRROR_DATABASE_URL is set up by the mirror itself.
+"""
+
+import json
+import os
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Set, Tuple
+from urllib.parse import urlsplit
+import logging
+
+from sqlalchemy import (
+    Column, Float, Integer, MetaData, String, Table, Text, create_engine, delete, insert, inspect, select,
+)
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.pool import StaticPool
+
+from src.config import settings
+from src.core.exceptions import AgentSystemError, OdooDomainError
+from src.integrations.odoo.domain import (
+    Predicate,
+    and_domains,
+    can_evaluate_locally,
+    compile_domain,
+    domain_fields,
+    sort_records,
+)
+from src.integrations.odoo.sync import ConnectionRegistry, max_write_date, poll_since
+
+logger = logging.getLogger(__name__)
+
+
+# Field types never mirrored (large, or not returned by search_read as plain values)
+EXCLUDED_FIELD_TYPES = frozenset({'binary', 'one2many', 'html', 'properties', 'properties_definition'})
+
+# Odoo's default _order for models mirrored by default; other models sort by id
+DEFAULT_ORDERS: Dict[str, str] = {
+    'account.move': 'date desc, name desc, id desc',
+    'hr.employee': 'name',
+    'hr.leave': 'date_from desc',
+}
+
+# Records per RPC and per SQL statement
+PAGE_SIZE = 1000
+
+_ALL_RECORDS = {'active_test': False}
+
+# Schema of the mirror tables (created by the Alembic migrations in the project database)
+mirror_metadata = MetaData()
+
+records_table = Table(
+    'odoo_mirror_records', mirror_metadata,
+    Column('source', String(255), primary_key=True),
+    Column('model', String(128), primary_key=True),
+    Column('record_id', Integer, primary_key=True, autoincrement=False),
+    Column('write_date', String(32)),
+    Column('data', Text, nullable=False),
+)
+
+state_table = Table(
+    'odoo_mirror_state', mirror_metadata,
+    Column('source', String(255), primary_key=True),
+    Column('model', String(128), primary_key=True),
+    Column('fields', Text, nullable=False),
+    Column('last_write_date', String(32)),
+    Column('synced_at', Float),
+    Column('reconciled_at', Float),
+)
+
+
+@dataclass
+class MirroredModel:
+    """
+    Rows and sync state of one mirrored model.
+
+    Attributes:
+        model: Odoo model name
+        fields: Mirrored fields (without 'id')
+        rows: Records by id, in search_read form. Replaced, never mutated,
+            so readers can iterate a reference without locking.
+        last_write_date: Highest write_date seen
+        synced_at: Time the last successful poll started
+        reconciled_at: Time the last successful reconcile started
+        dirty_since: Time of the first write through a client since the last poll
+    """
+    model: str
+    fields: List[str]
+    rows: Dict[int, Dict[str, Any]] = field(default_factory=dict)
+    last_write_date: Optional[str] = None
+    synced_at: Optional[float] = None
+    reconciled_at: Optional[float] = None
+    dirty_since: Optional[float] = None
+
+    @property
+    def field_set(self) -> Set[str]:
+        return set(self.fields) | {'id'}
+
+    @property
+    def has_active(self) -> bool:
+        return 'active' in self.fields
+
+
+class OdooMirror:
+    """
+    Local mirror of selected Odoo models for one connection.
+
+    Usage:
+        mirror = OdooMirror()
+        mirror.start()
+        ...
+        hit, rows = mirror.search_read('hr.employee', [['department_id', '=', 3]], ['name'])
+        if not hit:
+            rows = client.search_read('hr.employee', [['department_id', '=', 3]], ['name'])
+
+    OdooClient and AsyncOdooClient consult the running mirror of their
+    connection automatically (see get_odoo_mirror).
+    """
+
+    def __init__(
+        self,
+        client=None,
+        models: Optional[Dict[str, List[str]]] = None,
+        database_url: Optional[str] = None,
+        poll_interval: Optional[float] = None,
+        reconcile_interval: Optional[float] = None,
+        max_staleness: Optional[float] = None
+    ):
+        """
+        Initialize mirror.
+
+        Args:
+            client: OdooClient used to sync. A client for the active tenant's
+                server with the result cache disabled if not provided.
+            models: Fields to mirror per model (empty list = every stored field). Uses settings if not provided.
+            database_url: SQLAlchemy URL of a separate mirror database, whose tables
+                the mirror creates. Uses ODOO_MIRROR_DATABASE_URL, then the
+                project database (tables from the migrations), if not provided.
+            poll_interval: Seconds between write_date polls. Uses settings if not provided.
+            reconcile_interval: Seconds between full id/write_date diffs. Uses settings if not provided.
+            max_staleness: Seconds after a poll during which reads are served. Uses settings if not provided.
+        """
+        if client is None:
+            from src.integrations.odoo.client import OdooClient
+            from src.integrations.odoo.tenants import current_tenant_config
+            client = OdooClient(current_tenant_config())
+            # Polls must see Odoo's current data, not cached results
+            client.cache = None
+            client.flights = None
+            client.tracing = False
+        self.client = client
+        self.models = models if models is not None else settings.odoo_mirror_models
+        self.database_url = database_url or settings.odoo_mirror_database_url or settings.database_url
+        # Only a database dedicated to the mirror is set up here; the project's is migrated
+        self.owns_database = bool(database_url or settings.odoo_mirror_database_url)
+        self.poll_interval = poll_interval if poll_interval is not None else settings.odoo_mirror_poll_interval
+        self.reconcile_interval = (
+            reconcile_interval if reconcile_interval is not None
+            else settings.odoo_mirror_reconcile_interval
+        )
+        self.max_staleness = max_staleness if max_staleness is not None else settings.odoo_mirror_max_staleness
+
+        config = self.client.config
+        self.source = f"{urlsplit(config.url).netloc or config.url}/{config.database}/{config.username}"
+        self._engine: Optional[Engine] = None
+        self._models: Dict[str, MirroredModel] = {}
+        self._prepared = False
+        self._sync_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._wake = threading.Event()
+        self._worker: Optional[threading.Thread] = None
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def engine(self) -> Engine:
+        """
+        Get the mirror database engine.
+
+        Creates the tables of a dedicated mirror database on first use.
+
+        Raises:
+            AgentSystemError: If the project database has not been migrated
+        """
+        if self._engine is None:
+            url = make_url(self.database_url)
+            options: Dict[str, Any] = {'pool_pre_ping': True}
+            if url.drivername.startswith('sqlite'):
+                # Synced from the background thread, loaded from whichever thread starts it
+                options['connect_args'] = {'check_same_thread': False}
+                if url.database and url.database != ':memory:':
+                    os.makedirs(os.path.dirname(os.path.abspath(url.database)), exist_ok=True)
+                else:
+                    options['poolclass'] = StaticPool
+            engine = create_engine(url, **options)
+            if self.owns_database:
+                mirror_metadata.create_all(engine)
+            else:
+                missing = [t for t in mirror_metadata.tables if not inspect(engine).has_table(t)]
+                if missing:
+                    engine.dispose()
+                    raise AgentSystemError(
+                        f"Odoo mirror tables missing ({', '.join(missing)}); run 'alembic upgrade head' "
+                        f"or set ODOO_MIRROR_DATABASE_URL to a separate database",
+                        code="ODOO_MIRROR_NOT_MIGRATED"
+                    )
+            self._engine = engine
+        return self._engine
+
+    # ==================== Lifecycle ====================
+
+    def start(self) -> None:
+        """Start the background sync thread (the first pass loads or snapshots every model)."""
+        if self._worker is not None:
+            return
+        self._stop.clear()
+        self._worker = threading.Thread(target=self._run, name='odoo-mirror-sync', daemon=True)
+        self._worker.start()
+
+    def stop(self) -> None:
+        """Stop the sync thread and release database connections."""
+        self._stop.set()
+        self._wake.set()
+        self._worker = None
+        if self._engine is not None:
+            self._engine.dispose()
+
+    def _run(self) -> None:
+        """Sync every poll_interval, or as soon as a write marks a model dirty."""
+        while not self._stop.is_set():
+            try:
+                self.sync()
+            except Exception as e:
+                logger.warning(f"Odoo mirror sync failed: {e}")
+            self._wake.wait(self.poll_interval)
+            self._wake.clear()
+
+    def mark_dirty(self, model: str) -> None:
+        """
+        Record a write to a model; its reads go to Odoo until the next poll.
+
+        Args:
+            model: Odoo model name
+        """
+        mirrored = self._models.get(model)
+        if mirrored is None:
+            return
+        if mirrored.dirty_since is None:
+            mirrored.dirty_since = time.time()
+        self._wake.set()
+
+    # ==================== Sync ====================
+
+    def sync(self) -> None:
+        """Bring every mirrored model up to date (snapshot, poll and, when due, reconcile)."""
+        with self._sync_lock:
+            if not self._prepared:
+                self._prepare()
+            for mirrored in list(self._models.values()):
+                if self._stop.is_set():
+                    return
+                try:
+                    self._sync_model(mirrored)
+                except Exception as e:
+                    logger.warning(f"Odoo mirror sync of {mirrored.model} failed: {e}")
+
+    def _prepare(self) -> None:
+        """Resolve the mirrored fields and load rows persisted by a previous run."""
+        metadata = self.client.metadata
+        for model, requested in self.models.items():
+            if not metadata.has_model(model):
+                logger.info(f"Not mirroring {model}: model is not installed")
+                continue
+            definitions = metadata.fields(model)
+            if requested:
+                names = [f for f in requested if f in definitions and f != 'id']
+            else:
+                names = [
+                    name for name, definition in definitions.items()
+                    if name != 'id'
+                    and definition.get('store', True)
+                    and definition.get('type') not in EXCLUDED_FIELD_TYPES
+                ]
+            if 'write_date' in definitions and 'write_date' not in names:
+                names.append('write_date')
+            if 'write_date' not in names:
+                logger.warning(f"Not mirroring {model}: it has no write_date field")
+                continue
+            mirrored = MirroredModel(model=model, fields=sorted(names))
+            self._load(mirrored)
+            self._models[model] = mirrored
+        self._prepared = True
+
+    def _load(self, mirrored: MirroredModel) -> None:
+        """Load persisted state and rows, unless the mirrored fields changed."""
+        source, model = self.source, mirrored.model
+        with self.engine.connect() as conn:
+            state = conn.execute(
+                select(state_table).where(state_table.c.source == source, state_table.c.model == model)
+            ).mappings().first()
+            if state is None or json.loads(state['fields']) != mirrored.fields:
+                return
+            rows = conn.execute(
+                select(records_table.c.record_id, records_table.c.data)
+                .where(records_table.c.source == source, records_table.c.model == model)
+            )
+            mirrored.rows = {record_id: json.loads(data) for record_id, data in rows}
+        mirrored.last_write_date = state['last_write_date']
+        mirrored.synced_at = state['synced_at']
+        mirrored.reconciled_at = state['reconciled_at']
+        logger.info(f"Loaded {len(mirrored.rows)} mirrored {model} records")
+
+    def _sync_model(self, mirrored: MirroredModel) -> None:
+        """Snapshot, poll or reconcile one model, then persist its state."""
+        started = time.time()
+        if mirrored.last_write_date is None and not mirrored.rows:
+            self._snapshot(mirrored)
+        else:
+            self._poll(mirrored)
+            if (
+                mirrored.reconciled_at is None
+                or started - mirrored.reconciled_at >= self.reconcile_interval
+            ):
+                self._reconcile(mirrored)
+                mirrored.reconciled_at = started
+        mirrored.synced_at = started
+        if mirrored.dirty_since is not None and mirrored.dirty_since <= started:
+            mirrored.dirty_since = None
+        self._save_state(mirrored)
+
+    def _fetch(self, model: str, domain: List[Any], fields: List[str]) -> Iterator[List[Dict[str, Any]]]:
+        """Stream matching records (archived included) in id-keyset pages."""
+        last_id = 0
+        while True:
+            rows = self.client.execute(
+                model, 'search_read', [['id', '>', last_id]] + domain,
+                fields=fields, limit=PAGE_SIZE, order='id asc', context=_ALL_RECORDS
+            )
+            if not rows:
+                return
+            yield rows
+            if len(rows) < PAGE_SIZE:
+                return
+            last_id = rows[-1]['id']
+
+    def _snapshot(self, mirrored: MirroredModel) -> None:
+        """Replace the model's rows with a full copy from Odoo."""
+        started = time.perf_counter()
+        model = mirrored.model
+        with self.engine.begin() as conn:
+            conn.execute(
+                delete(records_table)
+                .where(records_table.c.source == self.source, records_table.c.model == model)
+            )
+        rows: Dict[int, Dict[str, Any]] = {}
+        for page in self._fetch(model, [], mirrored.fields):
+            self._store(model, page, [])
+            rows.update((r['id'], r) for r in page)
+        mirrored.rows = rows
+        mirrored.last_write_date = max_write_date((r.get('write_date') for r in rows.values()), None)
+        # Records written while the snapshot was paging are caught by a reconcile on the next pass
+        mirrored.reconciled_at = None
+        logger.info(f"Mirrored {len(rows)} {model} records in {time.perf_counter() - started:.1f}s")
+
+    def _poll(self, mirrored: MirroredModel) -> None:
+        """Fetch the records written since the last poll."""
+        since = poll_since(mirrored.last_write_date)
+        domain = [['write_date', '>=', since]] if since else []
+        changed = []
+        for page in self._fetch(mirrored.model, domain, mirrored.fields):
+            changed.extend(page)
+        self._apply(mirrored, changed, [])
+
+    def _reconcile(self, mirrored: MirroredModel) -> None:
+        """Diff local and remote id/write_date pairs: drop deleted records, re-read changed ones."""
+        model = mirrored.model
+        remote: Dict[int, Any] = {}
+        for page in self._fetch(model, [], ['write_date']):
+            remote.update((r['id'], r['write_date']) for r in page)
+        local = mirrored.rows
+        deleted = [record_id for record_id in local if record_id not in remote]
+        stale = [
+            record_id for record_id, write_date in remote.items()
+            if record_id not in local or local[record_id].get('write_date') != write_date
+        ]
+        changed = []
+        for chunk in _chunks(stale, PAGE_SIZE):
+            changed.extend(self.client.execute(
+                model, 'read', chunk, fields=mirrored.fields, context=_ALL_RECORDS
+            ))
+        if deleted or stale:
+            logger.info(f"Reconciled mirrored {model}: {len(deleted)} deleted, {len(stale)} re-read")
+        self._apply(mirrored, changed, deleted)
+
+    def _apply(self, mirrored: MirroredModel, changed: List[Dict[str, Any]], deleted: List[int]) -> None:
+        """Persist changed and deleted records, then swap in the updated rows."""
+        if not changed and not deleted:
+            return
+        self._store(mirrored.model, changed, deleted)
+        rows = dict(mirrored.rows)
+        for record_id in deleted:
+            rows.pop(record_id, None)
+        rows.update((r['id'], r) for r in changed)
+        mirrored.rows = rows
+        mirrored.last_write_date = max_write_date((r.get('write_date') for r in changed), mirrored.last_write_date)
+
+    def _store(self, model: str, rows: List[Dict[str, Any]], deleted: Sequence[int]) -> None:
+        """Upsert rows and delete records in the mirror database."""
+        ids = [r['id'] for r in rows] + list(deleted)
+        with self.engine.begin() as conn:
+            for chunk in _chunks(ids, PAGE_SIZE):
+                conn.execute(
+                    delete(records_table).where(
+                        records_table.c.source == self.source,
+                        records_table.c.model == model,
+                        records_table.c.record_id.in_(chunk)
+                    )
+                )
+            for chunk in _chunks(rows, PAGE_SIZE):
+                conn.execute(insert(records_table), [
+                    {
+                        'source': self.source,
+                        'model': model,
+                        'record_id': r['id'],
+                        'write_date': r.get('write_date') or None,
+                        'data': json.dumps(r),
+                    }
+                    for r in chunk
+                ])
+
+    def _save_state(self, mirrored: MirroredModel) -> None:
+        """Persist a model's sync state."""
+        with self.engine.begin() as conn:
+            conn.execute(
+                delete(state_table)
+                .where(state_table.c.source == self.source, state_table.c.model == mirrored.model)
+            )
+            conn.execute(insert(state_table).values(
+                source=self.source,
+                model=mirrored.model,
+                fields=json.dumps(mirrored.fields),
+                last_write_date=mirrored.last_write_date,
+                synced_at=mirrored.synced_at,
+                reconciled_at=mirrored.reconciled_at,
+            ))
+
+    # ==================== Reads ====================
+
+    def _serving(self, model: str) -> Optional[MirroredModel]:
+        """Get a model's mirror if it is synced, fresh and has no pending write."""
+        mirrored = self._models.get(model)
+        if (
+            mirrored is None
+            or mirrored.synced_at is None
+            or mirrored.dirty_since is not None
+            or time.time() - mirrored.synced_at > self.max_staleness
+        ):
+            return None
+        return mirrored
+
+    def _predicate(self, mirrored: MirroredModel, domain: Optional[Sequence[Any]]) -> Optional[Predicate]:
+        """Compile a domain for the mirrored rows, or None if it cannot be evaluated locally."""
+        try:
+            if not can_evaluate_locally(domain, mirrored.fields):
+                return None
+            if mirrored.has_active and 'active' not in domain_fields(domain):
+                domain = and_domains(domain, [['active', '=', True]])
+            return compile_domain(domain)
+        except (OdooDomainError, TypeError, ValueError, IndexError):
+            return None
+
+    def _miss(self) -> Tuple[bool, None]:
+        self.misses += 1
+        return False, None
+
+    def search_read(
+        self,
+        model: str,
+        domain: Optional[Sequence[Any]],
+        fields: Optional[Sequence[str]] = None,
+        offset: int = 0,
+        limit: Optional[int] = None,
+        order: Optional[str] = None
+    ) -> Tuple[bool, Optional[List[Dict[str, Any]]]]:
+        """
+        Answer a search_read from the mirror.
+
+        Args:
+            model: Odoo model name
+            domain: Search domain
+            fields: Fields to read (all-field reads are not served)
+            offset: Records to skip
+            limit: Maximum records
+            order: Sort order (the model's default order if not provided)
+
+        Returns:
+            (True, rows) if served, (False, None) if the call must go to Odoo
+        """
+        mirrored = self._serving(model)
+        if mirrored is None or not fields or not set(fields) <= mirrored.field_set:
+            return self._miss()
+        order = order or DEFAULT_ORDERS.get(model)
+        if order and not _order_fields(order) <= mirrored.field_set:
+            return self._miss()
+        predicate = self._predicate(mirrored, domain)
+        if predicate is None:
+            return self._miss()
+
+        rows = sort_records([r for r in mirrored.rows.values() if predicate(r)], order)
+        end = offset + limit if limit else None
+        self.hits += 1
+        return True, [_project(r, fields) for r in rows[offset:end]]
+
+    def search_count(self, model: str, domain: Optional[Sequence[Any]]) -> Tuple[bool, Optional[int]]:
+        """
+        Answer a search_count from the mirror.
+
+        Returns:
+            (True, count) if served, (False, None) if the call must go to Odoo
+        """
+        mirrored = self._serving(model)
+        predicate = self._predicate(mirrored, domain) if mirrored is not None else None
+        if predicate is None:
+            return self._miss()
+        self.hits += 1
+        return True, sum(1 for r in mirrored.rows.values() if predicate(r))
+
+    def read(
+        self,
+        model: str,
+        ids: Sequence[int],
+        fields: Optional[Sequence[str]] = None
+    ) -> Tuple[bool, Optional[List[Dict[str, Any]]]]:
+        """
+        Answer a read by ids from the mirror.
+
+        Returns:
+            (True, rows) if every record is mirrored, (False, None) otherwise
+        """
+        mirrored = self._serving(model)
+        if mirrored is None or not fields or not set(fields) <= mirrored.field_set:
+            return self._miss()
+        rows = mirrored.rows
+        if any(record_id not in rows for record_id in ids):
+            return self._miss()
+        self.hits += 1
+        return True, [_project(rows[record_id], fields) for record_id in ids]
+
+    def status(self) -> Dict[str, Any]:
+        """Get per-model sync status and hit counts."""
+        now = time.time()
+        return {
+            'database': make_url(self.database_url).render_as_string(hide_password=True),
+            'hits': self.hits,
+            'misses': self.misses,
+            'models': {
+                model: {
+                    'records': len(mirrored.rows),
+                    'fields': len(mirrored.fields),
+                    'last_write_date': mirrored.last_write_date,
+                    'age': round(now - mirrored.synced_at, 1) if mirrored.synced_at else None,
+                    'serving': self._serving(model) is not None,
+                }
+                for model, mirrored in self._models.items()
+            },
+        }
+
+
+def _project(row: Dict[str, Any], fields: Sequence[str]) -> Dict[str, Any]:
+    """Copy the requested fields of a mirrored row (lists copied so callers may mutate them)."""
+    result = {'id': row['id']}
+    for name in fields:
+        value = row[name]
+        result[name] = list(value) if isinstance(value, list) else value
+    return result
+
+
+def _order_fields(order: str) -> Set[str]:
+    """Get the field names of an order specification."""
+    return {spec.split()[0] for spec in order.split(',') if spec.strip()}
+
+
+def _chunks(items: Sequence[Any], size: int) -> Iterator[Sequence[Any]]:
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
+# Running mirrors by Odoo connection identity
+_mirrors = ConnectionRegistry()
+
+
+def get_odoo_mirror(config) -> Optional[OdooMirror]:
+    """
+    Get the running mirror for an Odoo connection.
+
+    Args:
+        config: OdooConfig identifying the server, database and user
+
+    Returns:
+        OdooMirror instance, or None if no mirror is running for it
+    """
+    return _mirrors.get(config)
+
+
+def start_odoo_mirror(mirror: Optional[OdooMirror] = None) -> OdooMirror:
+    """
+    Start a mirror and route its connection's reads through it.
+
+    Args:
+        mirror: Mirror to start. One for the active tenant's Odoo server if not provided.
+
+    Returns:
+        The running mirror
+    """
+    return _mirrors.start(mirror or OdooMirror())
+
+
+def stop_odoo_mirrors() -> None:
+    """Stop every running mirror."""
+    _mirrors.stop_all()
@@ -10,6 +10,7 @@ from datetime import date, datetime, timedelta
 import logging
 
 from src.integrations.odoo.client import OdooClient, get_odoo_client
+from src.integrations.odoo.fanout import OdooCall
 
 logger = logging.getLogger(__name__)
 
@@ -123,7 +124,7 @@ class ContractOperations:
             domain.append(['state', '=', state])
 
         # Only filter by date if the model supports it
-        start_field, end_field = self._get_date_field()
+        _, end_field = self._get_date_field()
         has_date_fields = self._has_date_fields()
 
         if expiring_within_days is not None and has_date_fields:
@@ -131,22 +132,8 @@ class ContractOperations:
             domain.append([end_field, '<=', end_date.isoformat()])
             domain.append([end_field, '>=', date.today().isoformat()])
 
-        # Basic fields that should exist on most models
-        fields = ['name', 'partner_id', 'company_id']
-
-        # Add state field only if supported
-        if self._has_state_field():
-            fields.append('state')
-
-        # Add date fields only if supported
-        if has_date_fields:
-            fields.extend([start_field, end_field])
-
-        # Add model-specific fields
-        if self.contract_model == 'contract.contract':
-            fields.extend(['recurring_next_date', 'recurring_interval', 'recurring_rule_type'])
-        elif self.contract_model == 'sale.subscription':
-            fields.extend(['recurring_total', 'template_id'])
+        # The model's summary profile, limited to the fields it has here
+        fields = self.client.fields_for(self.contract_model)
 
         try:
             order = f'{end_field} asc' if has_date_fields else 'name asc'
@@ -170,17 +157,20 @@ class ContractOperations:
                 limit=limit
             )
 
-    def get_contract_details(self, contract_id: int) -> Dict[str, Any]:
+    def get_contract_details(self, contract_id: int, profile: str = 'detail') -> Dict[str, Any]:
         """
         Get detailed information about a specific contract.
 
         Args:
             contract_id: Odoo contract record ID
+            profile: Projection profile of the contract ('detail' or 'agent')
 
         Returns:
             Complete contract details
         """
-        contracts = self.client.read(self.contract_model, [contract_id])
+        contracts = self.client.read(
+            self.contract_model, [contract_id], fields=self.client.fields_for(self.contract_model, profile)
+        )
         if not contracts:
             return {}
 
@@ -191,7 +181,7 @@ class ContractOperations:
             lines = self.client.search_read(
                 'contract.line',
                 [['contract_id', '=', contract_id]],
-                fields=['name', 'product_id', 'quantity', 'price_unit', 'price_subtotal']
+                fields=self.client.fields_for('contract.line')
             )
             contract['contract_lines'] = lines
 
@@ -234,6 +224,41 @@ class ContractOperations:
         Returns:
             Created contract details with ID
         """
+        values = self._contract_values(name, partner_id, date_start, date_end, **kwargs)
+        contract_id = self.client.create(self.contract_model, values)
+
+        return {
+            'id': contract_id,
+            'name': name,
+            'partner_id': partner_id,
+            'date_start': date_start,
+            'date_end': date_end
+        }
+
+    def create_contracts(self, contracts: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Create many contracts (e.g. an import) in a few round trips.
+
+        Args:
+            contracts: One dict per contract with the create_contract
+                arguments (name, partner_id, date_start, optional date_end
+                and extra fields)
+
+        Returns:
+            Bulk report with the created IDs and any per-contract errors
+        """
+        values_list = [self._contract_values(**contract) for contract in contracts]
+        return self.client.create_many(self.contract_model, values_list).to_dict()
+
+    def _contract_values(
+        self,
+        name: str,
+        partner_id: int,
+        date_start: str,
+        date_end: Optional[str] = None,
+        **kwargs
+    ) -> Dict[str, Any]:
+        """Build create values using the detected contract model's date fields."""
         start_field, end_field = self._get_date_field()
 
         values = {
@@ -247,16 +272,7 @@ class ContractOperations:
 
         # Add additional fields
         values.update(kwargs)
-
-        contract_id = self.client.create(self.contract_model, values)
-
-        return {
-            'id': contract_id,
-            'name': name,
-            'partner_id': partner_id,
-            'date_start': date_start,
-            'date_end': date_end
-        }
+        return values
 
     def update_contract(
         self,
@@ -297,39 +313,38 @@ class ContractOperations:
         }
 
         try:
-            # Count total
-            summary['total'] = self.client.search_count(self.contract_model, [])
+            model = self.contract_model
+            calls = {'total': OdooCall.search_count(model, [])}
 
-            # Try to count by state only if model supports it
+            # Count by state only if model supports it
+            states = ['draft', 'open', 'close', 'cancelled']
             if self._has_state_field():
-                states = ['draft', 'open', 'close', 'cancelled']
                 for state in states:
-                    try:
-                        count = self.client.search_count(
-                            self.contract_model,
-                            [['state', '=', state]]
-                        )
-                        summary['by_state'][state] = count
-                    except:
-                        summary['by_state'][state] = 0
+                    calls[state] = OdooCall.search_count(model, [['state', '=', state]])
             else:
                 summary['by_state'] = {'note': 'State tracking not available for this model'}
 
             # Count expiring - only if model supports date fields
-            has_date_fields = self._has_date_fields()
-            if has_date_fields:
+            if self._has_date_fields():
                 _, end_field = self._get_date_field()
                 end_date = date.today() + timedelta(days=30)
-                try:
-                    summary['expiring_soon'] = self.client.search_count(
-                        self.contract_model,
-                        [
-                            [end_field, '<=', end_date.isoformat()],
-                            [end_field, '>=', date.today().isoformat()],
-                        ]
-                    )
-                except:
-                    summary['expiring_soon'] = 0
+                calls['expiring_soon'] = OdooCall.search_count(
+                    model,
+                    [
+                        [end_field, '<=', end_date.isoformat()],
+                        [end_field, '>=', date.today().isoformat()],
+                    ]
+                )
+
+            # All counts are independent; run them concurrently
+            counts = dict(zip(calls, self.client.execute_many(list(calls.values()))))
+
+            summary['total'] = counts['total'].unwrap()
+            for state in states:
+                if state in counts:
+                    summary['by_state'][state] = counts[state].value_or(0)
+            if 'expiring_soon' in counts:
+                summary['expiring_soon'] = counts['expiring_soon'].value_or(0)
 
         except Exception as e:
             logger.error(f"Error getting contract summary: {e}")
@@ -349,5 +364,6 @@ class ContractOperations:
         return self.client.search_read(
             self.contract_model,
             [['partner_id', '=', partner_id]],
+            fields=self.client.fields_for(self.contract_model),
             order='create_date desc'
         )
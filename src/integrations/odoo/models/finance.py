@@ -4,11 +4,49 @@ Finance Model Operations
 Operations for accounting and financial management in Odoo.
 """
 
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Sequence, Tuple
 from datetime import date, datetime, timedelta
 import logging
-
+import time
+
+from src.config import settings
+from src.integrations.odoo.aging import AGING_FIELDS, AGING_KINDS, build_aging
+from src.integrations.odoo.cash_flow import (
+    Bucket,
+    bucket_key,
+    bucket_start,
+    buckets,
+    build_series,
+    closed_bucket_cache,
+    group_start,
+    ledger_totals,
+    opening_key,
+)
 from src.integrations.odoo.client import OdooClient, get_odoo_client
+from src.integrations.odoo.domain import (
+    ALL_INVOICE_TYPES,
+    CONFIRMED_SALES,
+    CUSTOMER_INVOICES,
+    INVOICES_AND_BILLS,
+    LIQUIDITY_JOURNALS,
+    POSTED,
+    POSTED_LIQUIDITY_LINES,
+    POSTED_UNPAID,
+    POSTED_UNPAID_CUSTOMER_INVOICES,
+    PROFIT_LOSS_ACCOUNTS,
+    PROFIT_LOSS_LINES,
+    and_domains,
+    date_range,
+)
+from src.integrations.odoo.fanout import OdooCall, fan_out
+from src.integrations.odoo.ledger import LedgerSnapshot, get_odoo_ledger
+from src.integrations.odoo.profit_loss import (
+    account_balances,
+    build_profit_loss,
+    comparison_period,
+    ledger_balances,
+)
+from src.integrations.odoo.records import RecordBatch, many2one_name
 
 logger = logging.getLogger(__name__)
 
@@ -31,8 +69,13 @@ class FinanceOperations:
         """
         Get a comprehensive financial summary.
 
+        Every figure is an exact server-side aggregate (no record limits),
+        and the independent parts are fetched concurrently.
+
         Returns:
-            Dictionary with receivables, payables, cash balance, and alerts
+            Dictionary with receivables, payables, cash balance, overdue
+            invoices, the time the figures were taken ('as_of') and the
+            milliseconds each part took ('timings_ms')
         """
         summary = {
             'total_receivables': 0,
@@ -42,74 +85,57 @@ class FinanceOperations:
             'overdue_amount': 0,
         }
 
-        try:
-            # Get total receivables (customer invoices - out_invoice)
-            receivables = self.client.search_read(
-                'account.move',
-                [
-                    ['move_type', '=', 'out_invoice'],
-                    ['state', '=', 'posted'],
-                    ['payment_state', 'in', ['not_paid', 'partial']]
-                ],
-                fields=['amount_residual'],
-                limit=1000
-            )
-            summary['total_receivables'] = sum(r.get('amount_residual', 0) for r in receivables)
+        as_of = datetime.now().astimezone()
+        today = as_of.date().isoformat()
+        start = time.perf_counter()
 
-            # Get total payables (vendor bills - in_invoice)
-            payables = self.client.search_read(
+        # Independent aggregates, fetched concurrently
+        parts = dict(zip(('open_invoices', 'cash_balance', 'overdue'), self.client.execute_many([
+            # Receivables (out_invoice) and payables (in_invoice) in one grouped sum
+            OdooCall.read_group(
                 'account.move',
-                [
-                    ['move_type', '=', 'in_invoice'],
-                    ['state', '=', 'posted'],
-                    ['payment_state', 'in', ['not_paid', 'partial']]
-                ],
-                fields=['amount_residual'],
-                limit=1000
-            )
-            summary['total_payables'] = sum(p.get('amount_residual', 0) for p in payables)
-
-            # Get cash balance from bank journals
-            bank_journals = self.client.search_read(
-                'account.journal',
-                [['type', 'in', ['bank', 'cash']]],
-                fields=['id', 'name']
-            )
-
-            if bank_journals:
-                journal_ids = [j['id'] for j in bank_journals]
-                # Get account balances
-                for journal in bank_journals:
-                    accounts = self.client.search_read(
-                        'account.move.line',
-                        [
-                            ['journal_id', '=', journal['id']],
-                            ['parent_state', '=', 'posted']
-                        ],
-                        fields=['balance'],
-                        limit=5000
-                    )
-                    summary['cash_balance'] += sum(a.get('balance', 0) for a in accounts)
-
-            # Get overdue invoices
-            today = date.today().isoformat()
-            overdue = self.client.search_read(
+                and_domains(INVOICES_AND_BILLS, POSTED_UNPAID),
+                fields=['amount_residual:sum'],
+                groupby=['move_type']
+            ),
+            # Cash balance across bank and cash journals
+            OdooCall.read_group(
+                'account.move.line',
+                and_domains(POSTED_LIQUIDITY_LINES),
+                fields=['balance:sum'],
+                groupby=['journal_id']
+            ),
+            # Overdue customer invoices
+            OdooCall.read_group(
                 'account.move',
-                [
-                    ['move_type', '=', 'out_invoice'],
-                    ['state', '=', 'posted'],
-                    ['payment_state', 'in', ['not_paid', 'partial']],
-                    ['invoice_date_due', '<', today]
-                ],
-                fields=['amount_residual'],
-                limit=1000
-            )
-            summary['overdue_count'] = len(overdue)
-            summary['overdue_amount'] = sum(o.get('amount_residual', 0) for o in overdue)
-
-        except Exception as e:
-            logger.error(f"Error getting financial summary: {e}")
-            summary['error'] = str(e)
+                and_domains(POSTED_UNPAID_CUSTOMER_INVOICES, [['invoice_date_due', '<', today]]),
+                fields=['amount_residual:sum'],
+                groupby=[]
+            ),
+        ])))
+
+        for group in parts['open_invoices'].value_or([]):
+            if group.key('move_type') == 'out_invoice':
+                summary['total_receivables'] = group.get('amount_residual')
+            elif group.key('move_type') == 'in_invoice':
+                summary['total_payables'] = group.get('amount_residual')
+
+        summary['cash_balance'] = sum(b.get('balance') for b in parts['cash_balance'].value_or([]))
+
+        overdue = parts['overdue'].value_or([])
+        summary['overdue_count'] = sum(o.count for o in overdue)
+        summary['overdue_amount'] = sum(o.get('amount_residual') for o in overdue)
+
+        summary['as_of'] = as_of.isoformat(timespec='seconds')
+        summary['timings_ms'] = {name: round(part.elapsed * 1000, 1) for name, part in parts.items()}
+        summary['timings_ms']['total'] = round((time.perf_counter() - start) * 1000, 1)
+
+        failed = {name: part.error for name, part in parts.items() if not part.ok}
+        if failed:
+            name, error = next(iter(failed.items()))
+            logger.error(f"Error getting financial summary ({name}): {error}")
+            summary['error'] = str(error)
+            summary['failed_parts'] = list(failed)
 
         return summary
 
@@ -140,7 +166,7 @@ class FinanceOperations:
         Returns:
             List of matching invoices
         """
-        domain = [['move_type', 'in', ['out_invoice', 'in_invoice', 'out_refund', 'in_refund']]]
+        domain = and_domains(ALL_INVOICE_TYPES)
 
         if partner_name:
             domain.append(['partner_id.name', 'ilike', partner_name])
@@ -163,26 +189,25 @@ class FinanceOperations:
         return self.client.search_read(
             'account.move',
             domain,
-            fields=[
-                'name', 'partner_id', 'invoice_date', 'invoice_date_due',
-                'amount_total', 'amount_residual', 'amount_untaxed', 'amount_tax',
-                'state', 'payment_state', 'move_type', 'currency_id', 'ref'
-            ],
+            fields=self.client.fields_for('account.move'),
             limit=limit,
             order='invoice_date desc'
         )
 
-    def get_invoice_details(self, invoice_id: int) -> Dict[str, Any]:
+    def get_invoice_details(self, invoice_id: int, profile: str = 'detail') -> Dict[str, Any]:
         """
         Get detailed information about a specific invoice.
 
         Args:
             invoice_id: Odoo invoice record ID
+            profile: Projection profile of the invoice and its lines ('detail' or 'agent')
 
         Returns:
             Complete invoice details including line items
         """
-        invoices = self.client.read('account.move', [invoice_id])
+        invoices = self.client.read(
+            'account.move', [invoice_id], fields=self.client.fields_for('account.move', profile)
+        )
         if not invoices:
             return {}
 
@@ -195,10 +220,7 @@ class FinanceOperations:
                 ['move_id', '=', invoice_id],
                 ['display_type', 'in', ['product', False]]
             ],
-            fields=[
-                'name', 'product_id', 'quantity', 'price_unit',
-                'price_subtotal', 'price_total', 'tax_ids', 'account_id'
-            ]
+            fields=self.client.fields_for('account.move.line', profile)
         )
         invoice['invoice_lines'] = lines
 
@@ -225,11 +247,7 @@ class FinanceOperations:
             List of outstanding invoices with aging info
         """
         today = date.today()
-        domain = [
-            ['move_type', '=', 'out_invoice'],
-            ['state', '=', 'posted'],
-            ['payment_state', 'in', ['not_paid', 'partial']]
-        ]
+        domain = and_domains(POSTED_UNPAID_CUSTOMER_INVOICES)
 
         if days_overdue > 0:
             due_date = (today - timedelta(days=days_overdue)).isoformat()
@@ -256,6 +274,52 @@ class FinanceOperations:
 
         return invoices
 
+    def get_aging(
+        self,
+        kind: str = 'receivable',
+        as_of: Optional[str] = None,
+        limit: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """
+        Get the aging of open invoices (receivable) or bills (payable).
+
+        Args:
+            kind: 'receivable' or 'payable'
+            as_of: Day to age against (YYYY-MM-DD). Defaults to today.
+            limit: Maximum partners returned, largest balance first
+
+        Returns:
+            Amounts per aging bucket (current, 1-30, 31-60, 61-90, 90+) by
+            currency and by partner and currency
+
+        Raises:
+            ValueError: For an unknown kind or an invalid date
+        """
+        if kind not in AGING_KINDS:
+            raise ValueError(f"Unknown aging kind '{kind}'; expected one of {', '.join(AGING_KINDS)}")
+        as_of_day = date.fromisoformat(as_of) if as_of else date.today()
+
+        try:
+            batch = None
+            for page in self.client.iter_search_read(
+                'account.move',
+                and_domains(POSTED_UNPAID, [['move_type', 'in', list(AGING_KINDS[kind])]]),
+                fields=AGING_FIELDS,
+                batch_size=5000,
+                result='columns'
+            ):
+                if batch is None:
+                    batch = page
+                else:
+                    batch.extend(page)
+            if batch is None:
+                batch = RecordBatch('account.move', {})
+            return build_aging(batch, kind, as_of_day, limit=limit)
+
+        except Exception as e:
+            logger.error(f"Error getting {kind} aging: {e}")
+            return {'kind': kind, 'as_of': as_of_day.isoformat(), 'error': str(e)}
+
     # ==================== Payment Operations ====================
 
     def search_payments(
@@ -301,25 +365,25 @@ class FinanceOperations:
         return self.client.search_read(
             'account.payment',
             domain,
-            fields=[
-                'name', 'partner_id', 'amount', 'date', 'state',
-                'payment_type', 'journal_id', 'currency_id', 'ref'
-            ],
+            fields=self.client.fields_for('account.payment'),
             limit=limit,
             order='date desc'
         )
 
-    def get_payment_details(self, payment_id: int) -> Dict[str, Any]:
+    def get_payment_details(self, payment_id: int, profile: str = 'detail') -> Dict[str, Any]:
         """
         Get detailed payment information.
 
         Args:
             payment_id: Payment record ID
+            profile: Projection profile of the payment ('detail' or 'agent')
 
         Returns:
             Complete payment details
         """
-        payments = self.client.read('account.payment', [payment_id])
+        payments = self.client.read(
+            'account.payment', [payment_id], fields=self.client.fields_for('account.payment', profile)
+        )
         if not payments:
             return {}
 
@@ -468,10 +532,62 @@ class FinanceOperations:
 
     # ==================== Reports ====================
 
+    def _ledger(self, date_from: Optional[str]) -> Optional[LedgerSnapshot]:
+        """Get the ledger cache snapshot of this connection if it can answer from date_from on."""
+        ledger = get_odoo_ledger(self.client.config)
+        return ledger.snapshot(date_from) if ledger is not None else None
+
+    def _account_balances(
+        self,
+        periods: Sequence[Tuple[str, str]],
+        partner_id: Optional[int] = None
+    ) -> Tuple[List[Dict[str, Any]], List[Dict[int, Tuple[Optional[str], float]]]]:
+        """
+        Get the P&L accounts and their balances over one or more periods.
+
+        Answered from the ledger cache when it covers every period.
+        Otherwise fetches the account list and one read_group per period,
+        grouped by account, all concurrently: a fixed number of queries
+        whatever the size of the chart of accounts.
+
+        Args:
+            periods: (date_from, date_to) pairs
+            partner_id: Only count journal items of this partner
+
+        Returns:
+            Tuple of (account.account rows, balances per period)
+
+        Raises:
+            Exception: The first error of any of the calls
+        """
+        snapshot = self._ledger(min(period_from for period_from, _ in periods))
+        if snapshot is not None:
+            return ledger_balances(snapshot, periods, partner_id)
+
+        partner_domain = [['partner_id', '=', partner_id]] if partner_id else []
+        accounts, *balances = self.client.execute_many([
+            OdooCall.search_read(
+                'account.account',
+                list(PROFIT_LOSS_ACCOUNTS),
+                fields=['id', 'name', 'code', 'account_type']
+            ),
+        ] + [
+            OdooCall.read_group(
+                'account.move.line',
+                and_domains(PROFIT_LOSS_LINES, date_range('date', period_from, period_to), partner_domain),
+                fields=['balance:sum'],
+                groupby=['account_id']
+            )
+            for period_from, period_to in periods
+        ])
+        return accounts.unwrap(), [account_balances(groups.unwrap()) for groups in balances]
+
     def get_profit_loss(
         self,
         date_from: Optional[str] = None,
-        date_to: Optional[str] = None
+        date_to: Optional[str] = None,
+        compare: Optional[Sequence[str]] = None,
+        partner_id: Optional[int] = None
     ) -> Dict[str, Any]:
         """
         Get profit and loss data.
@@ -479,18 +595,35 @@ class FinanceOperations:
         Args:
             date_from: Start date (YYYY-MM-DD)
             date_to: End date (YYYY-MM-DD)
+            compare: Comparison periods to include: 'previous_period' and/or
+                'previous_year'
+            partner_id: Only count journal items of this partner
 
         Returns:
-            P&L summary with revenue and expense breakdown
+            P&L summary with revenue and expense breakdown, sections by
+            account type and, with compare, the comparison period totals
+
+        Raises:
+            ValueError: For an unknown comparison
         """
         if not date_from:
             date_from = date.today().replace(day=1).isoformat()
         if not date_to:
             date_to = date.today().isoformat()
 
+        comparisons = {
+            name: tuple(
+                day.isoformat() for day in comparison_period(
+                    date.fromisoformat(date_from), date.fromisoformat(date_to), name
+                )
+            )
+            for name in compare or []
+        }
+
         result = {
             'date_from': date_from,
             'date_to': date_to,
+            'partner_id': partner_id,
             'total_revenue': 0,
             'total_expenses': 0,
             'net_profit': 0,
@@ -499,61 +632,12 @@ class FinanceOperations:
         }
 
         try:
-            # Get revenue accounts (income type)
-            revenue_accounts = self.client.search_read(
-                'account.account',
-                [['account_type', 'in', ['income', 'income_other']]],
-                fields=['id', 'name', 'code']
-            )
-
-            for acc in revenue_accounts:
-                lines = self.client.search_read(
-                    'account.move.line',
-                    [
-                        ['account_id', '=', acc['id']],
-                        ['date', '>=', date_from],
-                        ['date', '<=', date_to],
-                        ['parent_state', '=', 'posted']
-                    ],
-                    fields=['credit', 'debit']
-                )
-                amount = sum(l.get('credit', 0) - l.get('debit', 0) for l in lines)
-                if abs(amount) > 0:
-                    result['revenue_breakdown'].append({
-                        'account': acc['name'],
-                        'code': acc['code'],
-                        'amount': amount
-                    })
-                    result['total_revenue'] += amount
-
-            # Get expense accounts
-            expense_accounts = self.client.search_read(
-                'account.account',
-                [['account_type', 'in', ['expense', 'expense_depreciation', 'expense_direct_cost']]],
-                fields=['id', 'name', 'code']
+            accounts, (balances, *compared) = self._account_balances(
+                [(date_from, date_to)] + list(comparisons.values()), partner_id
             )
-
-            for acc in expense_accounts:
-                lines = self.client.search_read(
-                    'account.move.line',
-                    [
-                        ['account_id', '=', acc['id']],
-                        ['date', '>=', date_from],
-                        ['date', '<=', date_to],
-                        ['parent_state', '=', 'posted']
-                    ],
-                    fields=['credit', 'debit']
-                )
-                amount = sum(l.get('debit', 0) - l.get('credit', 0) for l in lines)
-                if abs(amount) > 0:
-                    result['expense_breakdown'].append({
-                        'account': acc['name'],
-                        'code': acc['code'],
-                        'amount': amount
-                    })
-                    result['total_expenses'] += amount
-
-            result['net_profit'] = result['total_revenue'] - result['total_expenses']
+            result.update(build_profit_loss(accounts, balances, dict(zip(comparisons, compared))))
+            for name, (period_from, period_to) in comparisons.items():
+                result['comparisons'][name].update({'date_from': period_from, 'date_to': period_to})
 
         except Exception as e:
             logger.error(f"Error getting P&L: {e}")
@@ -561,84 +645,131 @@ class FinanceOperations:
 
         return result
 
+    def _cash_flow_totals(
+        self,
+        date_from: str,
+        date_to: str,
+        granularity: str,
+        series_buckets: Sequence[Bucket]
+    ) -> Tuple[List[Dict[str, Any]], Dict[date, Dict[int, Tuple[float, float]]], Dict[int, float]]:
+        """
+        Get bank and cash journals, bucket totals and opening balances from Odoo.
+
+        Returns:
+            Tuple of (journal rows, (inflow, outflow) per journal per bucket
+            start, balance per journal before date_from)
+
+        Raises:
+            Exception: The first error of any of the calls
+        """
+        # Buckets before the current one are closed and may come from the cache
+        current = bucket_start(date.today(), granularity)
+        cache = closed_bucket_cache(self.client.config)
+        totals: Dict[date, Dict[int, Tuple[float, float]]] = {}
+        pending = []
+        for bucket in series_buckets:
+            hit, value = cache.get(bucket_key(bucket)) if cache and bucket.date_to < current else (False, None)
+            if hit:
+                totals[bucket.start] = value
+            else:
+                pending.append(bucket)
+        # Query from the first uncached bucket on
+        pending = [b for b in series_buckets if pending and b.start >= pending[0].start]
+
+        opening_day = date.fromisoformat(date_from)
+        opening_hit, opening = (
+            cache.get(opening_key(opening_day)) if cache and opening_day <= current else (False, None)
+        )
+
+        spec = f'date:{granularity}'
+        calls = [OdooCall.search_read('account.journal', LIQUIDITY_JOURNALS, fields=['id', 'name', 'type'])]
+        if pending:
+            calls.append(OdooCall.read_group(
+                'account.move.line',
+                and_domains(POSTED_LIQUIDITY_LINES, date_range('date', pending[0].date_from, date_to)),
+                fields=['debit:sum', 'credit:sum'],
+                groupby=['journal_id', spec]
+            ))
+        if not opening_hit:
+            calls.append(OdooCall.read_group(
+                'account.move.line',
+                and_domains(POSTED_LIQUIDITY_LINES, [['date', '<', date_from]]),
+                fields=['balance:sum'],
+                groupby=['journal_id']
+            ))
+        journals, *grouped = (r.unwrap() for r in self.client.execute_many(calls))
+
+        if pending:
+            groups = grouped.pop(0)
+            fetched: Dict[date, Dict[int, Tuple[float, float]]] = {b.start: {} for b in pending}
+            for group in groups:
+                start = group_start(group, spec)
+                if start in fetched and group.key('journal_id'):
+                    fetched[start][group.key('journal_id')] = (group.get('debit'), group.get('credit'))
+            totals.update(fetched)
+            if cache:
+                for bucket in pending:
+                    if bucket.date_to < current:
+                        cache.set(bucket_key(bucket), 'account.move.line', fetched[bucket.start])
+        if not opening_hit:
+            opening = {g.key('journal_id'): g.get('balance') for g in grouped.pop(0) if g.key('journal_id')}
+            if cache and opening_day <= current:
+                cache.set(opening_key(opening_day), 'account.move.line', opening)
+        return journals, totals, opening
+
     def get_cash_flow(
         self,
         date_from: Optional[str] = None,
-        date_to: Optional[str] = None
+        date_to: Optional[str] = None,
+        granularity: str = 'month'
     ) -> Dict[str, Any]:
         """
-        Get cash flow summary.
+        Get cash flow over time for bank and cash journals.
 
         Args:
-            date_from: Start date
-            date_to: End date
+            date_from: Start date (YYYY-MM-DD)
+            date_to: End date (YYYY-MM-DD)
+            granularity: Series period: 'day', 'week' or 'month'
 
         Returns:
-            Cash flow with inflows, outflows, and balance
+            Inflows, outflows, opening/closing balance, a series of
+            periods with running balances, and the same per journal
+
+        Raises:
+            ValueError: For an unknown granularity or an invalid date
         """
         if not date_from:
             date_from = date.today().replace(day=1).isoformat()
         if not date_to:
             date_to = date.today().isoformat()
 
+        series_buckets = buckets(date.fromisoformat(date_from), date.fromisoformat(date_to), granularity)
+
         result = {
             'date_from': date_from,
             'date_to': date_to,
+            'granularity': granularity,
             'total_inflows': 0,
             'total_outflows': 0,
             'net_cash_flow': 0,
+            'opening_balance': 0,
+            'closing_balance': 0,
             'current_balance': 0,
+            'series': [],
             'by_journal': []
         }
 
         try:
-            # Get bank/cash journals
-            journals = self.client.search_read(
-                'account.journal',
-                [['type', 'in', ['bank', 'cash']]],
-                fields=['id', 'name', 'type']
-            )
-
-            for journal in journals:
-                # Get transactions for this journal
-                lines = self.client.search_read(
-                    'account.move.line',
-                    [
-                        ['journal_id', '=', journal['id']],
-                        ['date', '>=', date_from],
-                        ['date', '<=', date_to],
-                        ['parent_state', '=', 'posted']
-                    ],
-                    fields=['debit', 'credit', 'balance']
+            snapshot = self._ledger(date_from)
+            if snapshot is not None:
+                journals, totals, opening = ledger_totals(
+                    snapshot, date.fromisoformat(date_from), date.fromisoformat(date_to), series_buckets
                 )
+            else:
+                journals, totals, opening = self._cash_flow_totals(date_from, date_to, granularity, series_buckets)
 
-                inflows = sum(l.get('debit', 0) for l in lines)
-                outflows = sum(l.get('credit', 0) for l in lines)
-
-                result['by_journal'].append({
-                    'journal': journal['name'],
-                    'type': journal['type'],
-                    'inflows': inflows,
-                    'outflows': outflows,
-                    'net': inflows - outflows
-                })
-
-                result['total_inflows'] += inflows
-                result['total_outflows'] += outflows
-
-            result['net_cash_flow'] = result['total_inflows'] - result['total_outflows']
-
-            # Get current balance
-            all_lines = self.client.search_read(
-                'account.move.line',
-                [
-                    ['journal_id', 'in', [j['id'] for j in journals]],
-                    ['parent_state', '=', 'posted']
-                ],
-                fields=['balance'],
-                limit=10000
-            )
-            result['current_balance'] = sum(l.get('balance', 0) for l in all_lines)
+            result.update(build_series(journals, series_buckets, totals, opening))
+            result['current_balance'] = result['closing_balance']
 
         except Exception as e:
             logger.error(f"Error getting cash flow: {e}")
@@ -674,41 +805,19 @@ class FinanceOperations:
         }
 
         try:
-            # Get expense accounts
-            accounts = self.client.search_read(
-                'account.account',
-                [['account_type', 'in', ['expense', 'expense_depreciation', 'expense_direct_cost']]],
-                fields=['id', 'name', 'code']
-            )
-
-            for acc in accounts:
-                lines = self.client.search_read(
-                    'account.move.line',
-                    [
-                        ['account_id', '=', acc['id']],
-                        ['date', '>=', date_from],
-                        ['date', '<=', date_to],
-                        ['parent_state', '=', 'posted']
-                    ],
-                    fields=['debit', 'credit']
-                )
-                amount = sum(l.get('debit', 0) - l.get('credit', 0) for l in lines)
-                if amount > 0:
-                    result['categories'].append({
-                        'account': acc['name'],
-                        'code': acc['code'],
-                        'amount': amount
-                    })
-                    result['total_expenses'] += amount
+            accounts, (balances,) = self._account_balances([(date_from, date_to)])
+            report = build_profit_loss(accounts, balances)
+            result['categories'] = [
+                {'account': row['account'], 'code': row['code'], 'amount': row['amount']}
+                for row in report['expense_breakdown'] if row['amount'] > 0
+            ]
+            result['total_expenses'] = sum(cat['amount'] for cat in result['categories'])
 
             # Calculate percentages
             if result['total_expenses'] > 0:
                 for cat in result['categories']:
                     cat['percentage'] = round(cat['amount'] / result['total_expenses'] * 100, 1)
 
-            # Sort by amount descending
-            result['categories'].sort(key=lambda x: x['amount'], reverse=True)
-
         except Exception as e:
             logger.error(f"Error getting expense breakdown: {e}")
             result['error'] = str(e)
@@ -745,49 +854,26 @@ class FinanceOperations:
 
         try:
             # Revenue by account
-            accounts = self.client.search_read(
-                'account.account',
-                [['account_type', 'in', ['income', 'income_other']]],
-                fields=['id', 'name', 'code']
-            )
-
-            for acc in accounts:
-                lines = self.client.search_read(
-                    'account.move.line',
-                    [
-                        ['account_id', '=', acc['id']],
-                        ['date', '>=', date_from],
-                        ['date', '<=', date_to],
-                        ['parent_state', '=', 'posted']
-                    ],
-                    fields=['credit', 'debit']
-                )
-                amount = sum(l.get('credit', 0) - l.get('debit', 0) for l in lines)
-                if amount > 0:
-                    result['by_account'].append({
-                        'account': acc['name'],
-                        'code': acc['code'],
-                        'amount': amount
-                    })
-                    result['total_revenue'] += amount
+            accounts, (balances,) = self._account_balances([(date_from, date_to)])
+            report = build_profit_loss(accounts, balances)
+            result['by_account'] = [
+                {'account': row['account'], 'code': row['code'], 'amount': row['amount']}
+                for row in report['revenue_breakdown'] if row['amount'] > 0
+            ]
+            result['total_revenue'] = sum(acc['amount'] for acc in result['by_account'])
 
             # Revenue by customer (from invoices)
-            invoices = self.client.search_read(
-                'account.move',
-                [
-                    ['move_type', '=', 'out_invoice'],
-                    ['state', '=', 'posted'],
-                    ['invoice_date', '>=', date_from],
-                    ['invoice_date', '<=', date_to]
-                ],
-                fields=['partner_id', 'amount_untaxed']
-            )
-
             customer_totals = {}
-            for inv in invoices:
-                if inv.get('partner_id'):
-                    customer = inv['partner_id'][1]
-                    customer_totals[customer] = customer_totals.get(customer, 0) + inv.get('amount_untaxed', 0)
+            for invoices in self.client.iter_search_read(
+                'account.move',
+                and_domains(CUSTOMER_INVOICES, POSTED, date_range('invoice_date', date_from, date_to)),
+                fields=['partner_id', 'amount_untaxed'],
+                result='records'
+            ):
+                for inv in invoices:
+                    if inv.partner_id:
+                        customer = inv.partner_id_name
+                        customer_totals[customer] = customer_totals.get(customer, 0) + (inv.amount_untaxed or 0)
 
             result['by_customer'] = [
                 {'customer': k, 'amount': v}
@@ -821,7 +907,7 @@ class FinanceOperations:
                 'type': 'overdue_invoice',
                 'priority': priority,
                 'invoice': inv.get('name'),
-                'customer': inv.get('partner_id', [None, 'Unknown'])[1] if inv.get('partner_id') else 'Unknown',
+                'customer': many2one_name(inv.get('partner_id'), 'Unknown'),
                 'amount': inv.get('amount_residual', 0),
                 'days_overdue': inv.get('days_overdue', 0),
                 'message': f"Invoice {inv.get('name')} is {inv.get('days_overdue', 0)} days overdue"
@@ -842,24 +928,27 @@ class FinanceOperations:
         alerts = []
 
         try:
-            # Check bank balances
-            journals = self.client.search_read(
-                'account.journal',
-                [['type', 'in', ['bank', 'cash']]],
-                fields=['id', 'name']
-            )
-
-            for journal in journals:
-                lines = self.client.search_read(
+            # Bank/cash journals and their posted balances, fetched together
+            journals, balances = self.client.execute_many([
+                OdooCall.search_read(
+                    'account.journal',
+                    LIQUIDITY_JOURNALS,
+                    fields=['id', 'name']
+                ),
+                OdooCall.read_group(
                     'account.move.line',
-                    [
-                        ['journal_id', '=', journal['id']],
-                        ['parent_state', '=', 'posted']
-                    ],
-                    fields=['balance'],
-                    limit=10000
-                )
-                balance = sum(l.get('balance', 0) for l in lines)
+                    and_domains(POSTED_LIQUIDITY_LINES),
+                    fields=['balance:sum'],
+                    groupby=['journal_id']
+                ),
+            ])
+            balance_by_journal = {
+                group.key('journal_id'): group.get('balance')
+                for group in balances.unwrap()
+            }
+
+            for journal in journals.unwrap():
+                balance = balance_by_journal.get(journal['id'], 0)
 
                 if balance < low_balance_threshold:
                     alerts.append({
@@ -896,47 +985,42 @@ class FinanceOperations:
         alerts = []
 
         try:
-            # Check large invoices
-            large_invoices = self.client.search_read(
-                'account.move',
-                [
-                    ['move_type', 'in', ['out_invoice', 'in_invoice']],
-                    ['state', '=', 'posted'],
-                    ['invoice_date', '>=', date_from],
-                    ['amount_total', '>=', amount_threshold]
-                ],
-                fields=['name', 'partner_id', 'amount_total', 'move_type', 'invoice_date']
-            )
+            # Large invoices and large payments, fetched together
+            large_invoices, large_payments = (r.unwrap() for r in self.client.execute_many([
+                OdooCall.search_read(
+                    'account.move',
+                    and_domains(
+                        INVOICES_AND_BILLS,
+                        POSTED,
+                        [['invoice_date', '>=', date_from], ['amount_total', '>=', amount_threshold]]
+                    ),
+                    fields=['name', 'partner_id', 'amount_total', 'move_type', 'invoice_date']
+                ),
+                OdooCall.search_read(
+                    'account.payment',
+                    and_domains(POSTED, [['date', '>=', date_from], ['amount', '>=', amount_threshold]]),
+                    fields=['name', 'partner_id', 'amount', 'payment_type', 'date']
+                ),
+            ]))
 
             for inv in large_invoices:
                 alerts.append({
                     'type': 'large_transaction',
                     'priority': 'medium',
                     'document': inv.get('name'),
-                    'partner': inv.get('partner_id', [None, 'Unknown'])[1] if inv.get('partner_id') else 'Unknown',
+                    'partner': many2one_name(inv.get('partner_id'), 'Unknown'),
                     'amount': inv.get('amount_total', 0),
                     'transaction_type': 'Customer Invoice' if inv.get('move_type') == 'out_invoice' else 'Vendor Bill',
                     'date': inv.get('invoice_date'),
                     'message': f"Large transaction: {inv.get('name')} for {inv.get('amount_total', 0):,.2f}"
                 })
 
-            # Check large payments
-            large_payments = self.client.search_read(
-                'account.payment',
-                [
-                    ['state', '=', 'posted'],
-                    ['date', '>=', date_from],
-                    ['amount', '>=', amount_threshold]
-                ],
-                fields=['name', 'partner_id', 'amount', 'payment_type', 'date']
-            )
-
             for pay in large_payments:
                 alerts.append({
                     'type': 'large_transaction',
                     'priority': 'medium',
                     'document': pay.get('name'),
-                    'partner': pay.get('partner_id', [None, 'Unknown'])[1] if pay.get('partner_id') else 'Unknown',
+                    'partner': many2one_name(pay.get('partner_id'), 'Unknown'),
                     'amount': pay.get('amount', 0),
                     'transaction_type': 'Payment Received' if pay.get('payment_type') == 'inbound' else 'Payment Sent',
                     'date': pay.get('date'),
@@ -960,11 +1044,22 @@ class FinanceOperations:
         Returns:
             Combined alerts from all categories
         """
+        # The categories are independent; fetch them concurrently
+        results = fan_out([
+            lambda: self.get_overdue_alerts(overdue_threshold),
+            lambda: self.get_cash_flow_alerts(cash_threshold),
+            lambda: self.get_large_transaction_alerts(transaction_threshold),
+        ], settings.odoo_fanout_max_parallel)
+        for result in results:
+            if not result.ok:
+                logger.error(f"Error getting alerts: {result.error}")
+        overdue, cash_flow, large_transactions = (r.value_or([]) for r in results)
+
         return {
-            'overdue_invoices': self.get_overdue_alerts(overdue_threshold),
-            'cash_flow': self.get_cash_flow_alerts(cash_threshold),
-            'large_transactions': self.get_large_transaction_alerts(transaction_threshold),
-            'total_alerts': 0  # Will be calculated below
+            'overdue_invoices': overdue,
+            'cash_flow': cash_flow,
+            'large_transactions': large_transactions,
+            'total_alerts': len(overdue) + len(cash_flow) + len(large_transactions)
         }
 
     # ==================== Sales Operations ====================
@@ -1003,92 +1098,100 @@ class FinanceOperations:
             'sales_by_salesperson': []
         }
 
-        try:
-            # Get all sales orders in the period
-            orders = self.client.search_read(
+        period_domain = [
+            ['date_order', '>=', f"{date_from} 00:00:00"],
+            ['date_order', '<=', f"{date_to} 23:59:59"],
+        ]
+
+        def order_totals() -> Dict[str, Any]:
+            """Stream confirmed/done orders in the period."""
+            totals = {'count': 0, 'total': 0, 'confirmed': 0, 'customers': {}, 'salespeople': {}}
+            for orders in self.client.iter_search_read(
                 'sale.order',
+                and_domains(period_domain, CONFIRMED_SALES),
+                fields=['partner_id', 'amount_total', 'state', 'user_id'],
+                result='records'
+            ):
+                for order in orders:
+                    amount = order.amount_total or 0
+                    totals['count'] += 1
+                    totals['total'] += amount
+                    if order.state == 'sale':
+                        totals['confirmed'] += 1
+
+                    if order.partner_id:
+                        customer = order.partner_id_name
+                        if customer not in totals['customers']:
+                            totals['customers'][customer] = {'total': 0, 'count': 0}
+                        totals['customers'][customer]['total'] += amount
+                        totals['customers'][customer]['count'] += 1
+
+                    if order.user_id:
+                        salesperson = order.user_id_name
+                        if salesperson not in totals['salespeople']:
+                            totals['salespeople'][salesperson] = {'total': 0, 'count': 0}
+                        totals['salespeople'][salesperson]['total'] += amount
+                        totals['salespeople'][salesperson]['count'] += 1
+            return totals
+
+        def product_totals() -> Dict[str, Dict[str, float]]:
+            """Stream the lines of those orders."""
+            products = {}
+            for lines in self.client.iter_search_read(
+                'sale.order.line',
                 [
-                    ['date_order', '>=', f"{date_from} 00:00:00"],
-                    ['date_order', '<=', f"{date_to} 23:59:59"],
-                    ['state', 'in', ['sale', 'done']]  # Confirmed/Done orders only
+                    ['order_id.date_order', '>=', f"{date_from} 00:00:00"],
+                    ['order_id.date_order', '<=', f"{date_to} 23:59:59"],
+                    ['order_id.state', 'in', ['sale', 'done']]
                 ],
-                fields=[
-                    'name', 'partner_id', 'amount_total', 'amount_untaxed',
-                    'date_order', 'state', 'user_id', 'currency_id'
-                ],
-                order='date_order desc'
-            )
-
-            result['order_count'] = len(orders)
-            result['total_sales'] = sum(o.get('amount_total', 0) for o in orders)
+                fields=['product_id', 'product_uom_qty', 'price_subtotal'],
+                result='records'
+            ):
+                for line in lines:
+                    if line.product_id:
+                        product = line.product_id_name
+                        if product not in products:
+                            products[product] = {'quantity': 0, 'revenue': 0}
+                        products[product]['quantity'] += line.product_uom_qty or 0
+                        products[product]['revenue'] += line.price_subtotal or 0
+            return products
 
+        try:
+            # Orders, draft count and order lines are independent; fetch them concurrently
+            orders, draft_count, products = (r.unwrap() for r in fan_out([
+                order_totals,
+                lambda: self.client.search_count(
+                    'sale.order',
+                    period_domain + [['state', '=', 'draft']]
+                ),
+                product_totals,
+            ], settings.odoo_fanout_max_parallel))
+
+            result['order_count'] = orders['count']
+            result['total_sales'] = orders['total']
+            result['confirmed_orders'] = orders['confirmed']
             if result['order_count'] > 0:
                 result['average_order_value'] = round(result['total_sales'] / result['order_count'], 2)
 
-            # Count by state
-            result['confirmed_orders'] = len([o for o in orders if o.get('state') == 'sale'])
-
-            # Get draft orders count
-            draft_orders = self.client.search_count(
-                'sale.order',
-                [
-                    ['date_order', '>=', f"{date_from} 00:00:00"],
-                    ['date_order', '<=', f"{date_to} 23:59:59"],
-                    ['state', '=', 'draft']
-                ]
-            )
-            result['draft_orders'] = draft_orders
+            result['draft_orders'] = draft_count
 
             # Top customers
-            customer_totals = {}
-            for order in orders:
-                if order.get('partner_id'):
-                    customer = order['partner_id'][1]
-                    customer_totals[customer] = customer_totals.get(customer, 0) + order.get('amount_total', 0)
-
             result['top_customers'] = [
-                {'customer': k, 'total': v, 'order_count': len([o for o in orders if o.get('partner_id') and o['partner_id'][1] == k])}
-                for k, v in sorted(customer_totals.items(), key=lambda x: x[1], reverse=True)
+                {'customer': k, 'total': v['total'], 'order_count': v['count']}
+                for k, v in sorted(orders['customers'].items(), key=lambda x: x[1]['total'], reverse=True)
             ][:10]
 
             # Sales by salesperson
-            salesperson_totals = {}
-            for order in orders:
-                if order.get('user_id'):
-                    salesperson = order['user_id'][1]
-                    if salesperson not in salesperson_totals:
-                        salesperson_totals[salesperson] = {'total': 0, 'count': 0}
-                    salesperson_totals[salesperson]['total'] += order.get('amount_total', 0)
-                    salesperson_totals[salesperson]['count'] += 1
-
             result['sales_by_salesperson'] = [
                 {'salesperson': k, 'total': v['total'], 'order_count': v['count']}
-                for k, v in sorted(salesperson_totals.items(), key=lambda x: x[1]['total'], reverse=True)
+                for k, v in sorted(orders['salespeople'].items(), key=lambda x: x[1]['total'], reverse=True)
             ]
 
-            # Get top products from order lines
-            order_ids = [o['id'] for o in orders]
-            if order_ids:
-                lines = self.client.search_read(
-                    'sale.order.line',
-                    [['order_id', 'in', order_ids]],
-                    fields=['product_id', 'product_uom_qty', 'price_subtotal'],
-                    limit=1000
-                )
-
-                product_totals = {}
-                for line in lines:
-                    if line.get('product_id'):
-                        product = line['product_id'][1]
-                        if product not in product_totals:
-                            product_totals[product] = {'quantity': 0, 'revenue': 0}
-                        product_totals[product]['quantity'] += line.get('product_uom_qty', 0)
-                        product_totals[product]['revenue'] += line.get('price_subtotal', 0)
-
-                result['top_products'] = [
-                    {'product': k, 'quantity_sold': v['quantity'], 'revenue': v['revenue']}
-                    for k, v in sorted(product_totals.items(), key=lambda x: x[1]['revenue'], reverse=True)
-                ][:10]
+            # Top products
+            result['top_products'] = [
+                {'product': k, 'quantity_sold': v['quantity'], 'revenue': v['revenue']}
+                for k, v in sorted(products.items(), key=lambda x: x[1]['revenue'], reverse=True)
+            ][:10]
 
         except Exception as e:
             logger.error(f"Error getting sales summary: {e}")
@@ -1139,26 +1242,25 @@ class FinanceOperations:
         return self.client.search_read(
             'sale.order',
             domain,
-            fields=[
-                'name', 'partner_id', 'date_order', 'amount_total',
-                'amount_untaxed', 'state', 'user_id', 'currency_id',
-                'invoice_status', 'delivery_status'
-            ],
+            fields=self.client.fields_for('sale.order'),
             limit=limit,
             order='date_order desc'
         )
 
-    def get_sales_order_details(self, order_id: int) -> Dict[str, Any]:
+    def get_sales_order_details(self, order_id: int, profile: str = 'detail') -> Dict[str, Any]:
         """
         Get detailed sales order information.
 
         Args:
             order_id: Sales order ID
+            profile: Projection profile of the order and its lines ('detail' or 'agent')
 
         Returns:
             Complete order details with lines
         """
-        orders = self.client.read('sale.order', [order_id])
+        orders = self.client.read(
+            'sale.order', [order_id], fields=self.client.fields_for('sale.order', profile)
+        )
         if not orders:
             return {}
 
@@ -1168,10 +1270,7 @@ class FinanceOperations:
         lines = self.client.search_read(
             'sale.order.line',
             [['order_id', '=', order_id]],
-            fields=[
-                'product_id', 'name', 'product_uom_qty', 'price_unit',
-                'price_subtotal', 'price_total', 'discount', 'tax_id'
-            ]
+            fields=self.client.fields_for('sale.order.line', profile)
         )
         order['order_lines'] = lines
 
@@ -1202,29 +1301,22 @@ class FinanceOperations:
         result = []
 
         try:
-            # Get confirmed orders in period
-            orders = self.client.search(
-                'sale.order',
+            # Stream lines of confirmed orders in period
+            product_totals = {}
+            for lines in self.client.iter_search_read(
+                'sale.order.line',
                 [
-                    ['date_order', '>=', f"{date_from} 00:00:00"],
-                    ['date_order', '<=', f"{date_to} 23:59:59"],
-                    ['state', 'in', ['sale', 'done']]
-                ]
-            )
-
-            if orders:
-                # Get all lines for these orders
-                lines = self.client.search_read(
-                    'sale.order.line',
-                    [['order_id', 'in', orders]],
-                    fields=['product_id', 'product_uom_qty', 'price_subtotal']
-                )
-
-                product_totals = {}
+                    ['order_id.date_order', '>=', f"{date_from} 00:00:00"],
+                    ['order_id.date_order', '<=', f"{date_to} 23:59:59"],
+                    ['order_id.state', 'in', ['sale', 'done']]
+                ],
+                fields=['product_id', 'product_uom_qty', 'price_subtotal'],
+                result='records'
+            ):
                 for line in lines:
-                    if line.get('product_id'):
-                        pid = line['product_id'][0]
-                        pname = line['product_id'][1]
+                    if line.product_id:
+                        pid = line.product_id
+                        pname = line.product_id_name
                         if pid not in product_totals:
                             product_totals[pid] = {
                                 'id': pid,
@@ -1233,15 +1325,15 @@ class FinanceOperations:
                                 'revenue': 0,
                                 'order_count': 0
                             }
-                        product_totals[pid]['quantity'] += line.get('product_uom_qty', 0)
-                        product_totals[pid]['revenue'] += line.get('price_subtotal', 0)
+                        product_totals[pid]['quantity'] += line.product_uom_qty or 0
+                        product_totals[pid]['revenue'] += line.price_subtotal or 0
                         product_totals[pid]['order_count'] += 1
 
-                result = sorted(
-                    product_totals.values(),
-                    key=lambda x: x['revenue'],
-                    reverse=True
-                )[:limit]
+            result = sorted(
+                product_totals.values(),
+                key=lambda x: x['revenue'],
+                reverse=True
+            )[:limit]
 
         except Exception as e:
             logger.error(f"Error getting top products: {e}")
@@ -1273,30 +1365,29 @@ class FinanceOperations:
         result = []
 
         try:
-            orders = self.client.search_read(
-                'sale.order',
-                [
-                    ['date_order', '>=', f"{date_from} 00:00:00"],
-                    ['date_order', '<=', f"{date_to} 23:59:59"],
-                    ['state', 'in', ['sale', 'done']]
-                ],
-                fields=['partner_id', 'amount_total', 'amount_untaxed']
-            )
-
             customer_totals = {}
-            for order in orders:
-                if order.get('partner_id'):
-                    cid = order['partner_id'][0]
-                    cname = order['partner_id'][1]
-                    if cid not in customer_totals:
-                        customer_totals[cid] = {
-                            'id': cid,
-                            'name': cname,
-                            'total': 0,
-                            'order_count': 0
-                        }
-                    customer_totals[cid]['total'] += order.get('amount_total', 0)
-                    customer_totals[cid]['order_count'] += 1
+            for orders in self.client.iter_search_read(
+                'sale.order',
+                and_domains(
+                    date_range('date_order', f"{date_from} 00:00:00", f"{date_to} 23:59:59"),
+                    CONFIRMED_SALES
+                ),
+                fields=['partner_id', 'amount_total'],
+                result='records'
+            ):
+                for order in orders:
+                    if order.partner_id:
+                        cid = order.partner_id
+                        cname = order.partner_id_name
+                        if cid not in customer_totals:
+                            customer_totals[cid] = {
+                                'id': cid,
+                                'name': cname,
+                                'total': 0,
+                                'order_count': 0
+                            }
+                        customer_totals[cid]['total'] += order.amount_total or 0
+                        customer_totals[cid]['order_count'] += 1
 
             result = sorted(
                 customer_totals.values(),
@@ -62,26 +62,25 @@ class HROperations:
         return self.client.search_read(
             'hr.employee',
             domain,
-            fields=[
-                'name', 'work_email', 'work_phone', 'mobile_phone',
-                'department_id', 'job_id', 'parent_id', 'coach_id',
-                'work_location_id', 'company_id'
-            ],
+            fields=self.client.fields_for('hr.employee'),
             limit=limit,
             order='name asc'
         )
 
-    def get_employee_details(self, employee_id: int) -> Dict[str, Any]:
+    def get_employee_details(self, employee_id: int, profile: str = 'detail') -> Dict[str, Any]:
         """
         Get detailed information about a specific employee.
 
         Args:
             employee_id: Odoo employee record ID
+            profile: Projection profile of the employee ('detail' or 'agent')
 
         Returns:
             Complete employee details
         """
-        employees = self.client.read('hr.employee', [employee_id])
+        employees = self.client.read(
+            'hr.employee', [employee_id], fields=self.client.fields_for('hr.employee', profile)
+        )
         if not employees:
             return {}
 
@@ -95,7 +94,7 @@ class HROperations:
                     ['employee_id', '=', employee_id],
                     ['state', '=', 'open']
                 ],
-                fields=['name', 'wage', 'date_start', 'date_end', 'state'],
+                fields=self.client.fields_for('hr.contract'),
                 limit=1
             )
             employee['current_contract'] = contracts[0] if contracts else None
@@ -124,28 +123,57 @@ class HROperations:
         Returns:
             Created employee details
         """
-        values = {
+        values = self._employee_values(
+            name, job_id, department_id, work_email, manager_id, **kwargs
+        )
+        employee_id = self.client.create('hr.employee', values)
+
+        return {
+            'id': employee_id,
             'name': name,
             'job_id': job_id,
             'department_id': department_id,
-            'work_email': work_email,
+            'work_email': work_email
         }
 
-        if manager_id:
-            values['parent_id'] = manager_id
+    def create_employees(self, employees: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Create many employees (e.g. for mass onboarding) in a few round trips.
 
-        values.update(kwargs)
+        Args:
+            employees: One dict per employee with the create_employee arguments
+                (name, job_id, department_id, work_email, optional manager_id
+                and extra fields)
 
-        employee_id = self.client.create('hr.employee', values)
+        Returns:
+            Bulk report with the created IDs and any per-employee errors
+        """
+        values_list = [self._employee_values(**employee) for employee in employees]
+        return self.client.create_many('hr.employee', values_list).to_dict()
 
-        return {
-            'id': employee_id,
+    @staticmethod
+    def _employee_values(
+        name: str,
+        job_id: int,
+        department_id: int,
+        work_email: str,
+        manager_id: Optional[int] = None,
+        **kwargs
+    ) -> Dict[str, Any]:
+        """Build hr.employee create values."""
+        values = {
             'name': name,
             'job_id': job_id,
             'department_id': department_id,
-            'work_email': work_email
+            'work_email': work_email,
         }
 
+        if manager_id:
+            values['parent_id'] = manager_id
+
+        values.update(kwargs)
+        return values
+
     # ==================== Leave Operations ====================
 
     def get_leave_types(self) -> List[Dict[str, Any]]:
@@ -210,6 +238,42 @@ class HROperations:
         Returns:
             Created leave request details
         """
+        values = self._leave_values(employee_id, leave_type_id, date_from, date_to, description)
+        leave_id = self.client.create('hr.leave', values)
+
+        return {
+            'id': leave_id,
+            'employee_id': employee_id,
+            'leave_type_id': leave_type_id,
+            'date_from': date_from,
+            'date_to': date_to,
+            'state': 'draft'
+        }
+
+    def create_leave_requests(self, requests: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Create many leave requests in a few round trips.
+
+        Args:
+            requests: One dict per request with the create_leave_request
+                arguments (employee_id, leave_type_id, date_from, date_to,
+                optional description)
+
+        Returns:
+            Bulk report with the created IDs and any per-request errors
+        """
+        values_list = [self._leave_values(**request) for request in requests]
+        return self.client.create_many('hr.leave', values_list).to_dict()
+
+    @staticmethod
+    def _leave_values(
+        employee_id: int,
+        leave_type_id: int,
+        date_from: str,
+        date_to: str,
+        description: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Build hr.leave create values."""
         values = {
             'employee_id': employee_id,
             'holiday_status_id': leave_type_id,
@@ -221,17 +285,7 @@ class HROperations:
 
         if description:
             values['name'] = description
-
-        leave_id = self.client.create('hr.leave', values)
-
-        return {
-            'id': leave_id,
-            'employee_id': employee_id,
-            'leave_type_id': leave_type_id,
-            'date_from': date_from,
-            'date_to': date_to,
-            'state': 'draft'
-        }
+        return values
 
     def get_pending_leave_requests(
         self,
@@ -307,6 +361,66 @@ class HROperations:
             logger.error(f"Failed to reject leave {leave_id}: {e}")
             return False
 
+    def approve_leave_requests(self, leave_ids: List[int]) -> Dict[str, Any]:
+        """
+        Approve many pending leave requests in a few round trips.
+
+        Requests that cannot be approved (e.g. already refused) are reported
+        individually; the rest are still approved.
+
+        Args:
+            leave_ids: Leave request IDs
+
+        Returns:
+            Bulk report with approved and failed leave IDs
+        """
+        result = self.client.call_method_many('hr.leave', 'action_validate', leave_ids)
+        return {
+            'approved': result.succeeded_ids(leave_ids),
+            'failed': [vars(e).copy() for e in result.errors],
+            'calls': result.calls,
+        }
+
+    def reject_leave_requests(
+        self,
+        leave_ids: List[int],
+        reason: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Reject many leave requests in a few round trips.
+
+        The reason, if given, is logged as a note on each rejected request,
+        also in chunks (mail.message creates).
+
+        Args:
+            leave_ids: Leave request IDs
+            reason: Optional rejection reason
+
+        Returns:
+            Bulk report with rejected and failed leave IDs and, with a
+            reason, the rejected IDs whose note could not be logged
+        """
+        result = self.client.call_method_many('hr.leave', 'action_refuse', leave_ids)
+        rejected = result.succeeded_ids(leave_ids)
+        report = {
+            'rejected': rejected,
+            'failed': [vars(e).copy() for e in result.errors],
+            'calls': result.calls,
+        }
+        if reason and rejected:
+            notes = self.client.create_many('mail.message', [
+                {
+                    'model': 'hr.leave',
+                    'res_id': leave_id,
+                    'message_type': 'comment',
+                    'body': f"Refused: {reason}",
+                }
+                for leave_id in rejected
+            ])
+            report['reason_not_logged'] = [rejected[e.index] for e in notes.errors]
+            report['calls'] += notes.calls
+        return report
+
     # ==================== Recruitment Operations ====================
 
     def search_applicants(
@@ -444,41 +558,36 @@ class HROperations:
         # Get total count (with filters if any)
         total_count = self.client.search_count('hr.employee', filter_domain)
 
-        # Get all departments with employee counts
-        departments = self.client.search_read(
-            'hr.department',
-            [],
-            fields=['id', 'name'],
-            order='name asc'
-        )
-
-        by_department = {}
-        for dept in departments:
-            dept_domain = base_domain.copy()
-            dept_domain.append(['department_id', '=', dept['id']])
-            if job_title:
-                dept_domain.append(['job_id.name', 'ilike', job_title])
-            count = self.client.search_count('hr.employee', dept_domain)
-            if count > 0:
-                by_department[dept['name']] = count
-
-        # Get all job positions with employee counts
-        jobs = self.client.search_read(
-            'hr.job',
-            [],
-            fields=['id', 'name'],
-            order='name asc'
-        )
+        # Employee counts per department and per job, one grouped query each
+        dept_domain = base_domain.copy()
+        if job_title:
+            dept_domain.append(['job_id.name', 'ilike', job_title])
+        by_department = {
+            group.label('department_id'): group.count
+            for group in self.client.read_group(
+                'hr.employee',
+                dept_domain,
+                fields=[],
+                groupby=['department_id'],
+                orderby='department_id'
+            )
+            if group.key('department_id') and group.count > 0
+        }
 
-        by_job_title = {}
-        for job in jobs:
-            job_domain = base_domain.copy()
-            job_domain.append(['job_id', '=', job['id']])
-            if department:
-                job_domain.append(['department_id.name', 'ilike', department])
-            count = self.client.search_count('hr.employee', job_domain)
-            if count > 0:
-                by_job_title[job['name']] = count
+        job_domain = base_domain.copy()
+        if department:
+            job_domain.append(['department_id.name', 'ilike', department])
+        by_job_title = {
+            group.label('job_id'): group.count
+            for group in self.client.read_group(
+                'hr.employee',
+                job_domain,
+                fields=[],
+                groupby=['job_id'],
+                orderby='job_id'
+            )
+            if group.key('job_id') and group.count > 0
+        }
 
         result = {
             'total_employees': total_count,
@@ -503,7 +612,7 @@ class HROperations:
         return self.client.search_read(
             'hr.department',
             [],
-            fields=['name', 'parent_id', 'manager_id', 'company_id'],
+            fields=self.client.fields_for('hr.department'),
             order='name asc'
         )
 
@@ -518,7 +627,7 @@ class HROperations:
             Hierarchical org chart structure
         """
         # Get department info
-        depts = self.client.read('hr.department', [department_id])
+        depts = self.client.read('hr.department', [department_id], fields=['name', 'manager_id'])
         if not depts:
             return {}
 
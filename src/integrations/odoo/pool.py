@@ -0,0 +1,255 @@
+"""
+HTTP Connection Pool
+
+Bounded pool of persistent HTTP/1.1 keep-alive connections to the Odoo server.
+Each request checks out a connection for its own exclusive use, so any number
+of threads can call Odoo in parallel without sharing a socket.
+"""
+
+import http.client
+import select
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Dict, List, Mapping, Optional, Tuple
+from urllib.parse import urlsplit
+import logging
+
+from src.core.exceptions import OdooConnectionError
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class PooledConnection:
+    """An HTTP connection with pool bookkeeping."""
+    connection: http.client.HTTPConnection
+    created_at: float = field(default_factory=time.monotonic)
+    last_used: float = field(default_factory=time.monotonic)
+    requests: int = 0
+
+    def is_dropped(self) -> bool:
+        """
+        Check if the server closed this idle connection.
+
+        An idle keep-alive socket should never be readable; if it is, the
+        peer either sent EOF or garbage and the connection must be discarded.
+        """
+        sock = self.connection.sock
+        if sock is None:
+            return False
+        try:
+            readable, _, _ = select.select([sock], [], [], 0)
+        except (OSError, ValueError):
+            return True
+        return bool(readable)
+
+    def set_timeout(self, timeout: float) -> None:
+        """Set the socket timeout for the next request."""
+        self.connection.timeout = timeout
+        if self.connection.sock is not None:
+            self.connection.sock.settimeout(timeout)
+
+    def close(self) -> None:
+        """Close the underlying connection."""
+        self.connection.close()
+
+
+@dataclass
+class PoolResponse:
+    """A fully read HTTP response."""
+    status: int
+    reason: str
+    headers: http.client.HTTPMessage
+    body: bytes
+
+
+class HTTPConnectionPool:
+    """
+    Thread-safe pool of keep-alive HTTP connections to a single host.
+
+    Connections are reused most-recently-used first, evicted after sitting
+    idle for idle_timeout seconds, and health-checked before reuse. At most
+    max_size connections exist at once; callers wait for a free slot.
+
+    Usage:
+        pool = HTTPConnectionPool('https://odoo.example.com', max_size=10)
+        response = pool.request('POST', '/jsonrpc', body, headers)
+    """
+
+    def __init__(
+        self,
+        url: str,
+        max_size: int = 10,
+        timeout: float = 30,
+        idle_timeout: float = 60.0
+    ):
+        """
+        Initialize the pool.
+
+        Args:
+            url: Server base URL (scheme, host and optional port/path)
+            max_size: Maximum number of open connections
+            timeout: Socket timeout in seconds
+            idle_timeout: Seconds after which an idle connection is closed
+        """
+        parts = urlsplit(url)
+        self.scheme = parts.scheme or 'http'
+        self.host = parts.hostname
+        self.port = parts.port
+        self.base_path = parts.path.rstrip('/')
+        self.max_size = max_size
+        self.timeout = timeout
+        self.idle_timeout = idle_timeout
+
+        self._idle: List[PooledConnection] = []
+        self._slots = threading.BoundedSemaphore(max_size)
+        self._lock = threading.Lock()
+        self._in_use = 0
+        self._counters: Dict[str, int] = {
+            'created': 0,
+            'reused': 0,
+            'evicted_idle': 0,
+            'dropped': 0,
+        }
+
+    def _new_connection(self) -> PooledConnection:
+        """Open a new connection to the server."""
+        connection_class = (
+            http.client.HTTPSConnection if self.scheme == 'https'
+            else http.client.HTTPConnection
+        )
+        with self._lock:
+            self._counters['created'] += 1
+        return PooledConnection(connection_class(self.host, self.port, timeout=self.timeout))
+
+    def _evict_idle(self) -> None:
+        """Close connections idle for longer than idle_timeout (lock held)."""
+        cutoff = time.monotonic() - self.idle_timeout
+        keep = []
+        for conn in self._idle:
+            if conn.last_used < cutoff:
+                conn.close()
+                self._counters['evicted_idle'] += 1
+            else:
+                keep.append(conn)
+        self._idle = keep
+
+    def acquire(self, wait: Optional[float] = None) -> Tuple[PooledConnection, bool]:
+        """
+        Check out a connection.
+
+        Args:
+            wait: Seconds to wait for a free slot (defaults to the socket timeout)
+
+        Returns:
+            Tuple of (connection, reused) where reused is True for a keep-alive hit
+
+        Raises:
+            OdooConnectionError: If no slot frees up in time
+        """
+        if not self._slots.acquire(timeout=self.timeout if wait is None else wait):
+            raise OdooConnectionError(
+                "Odoo connection pool exhausted",
+                details={"max_size": self.max_size}
+            )
+
+        with self._lock:
+            self._in_use += 1
+            self._evict_idle()
+            while self._idle:
+                conn = self._idle.pop()
+                if conn.is_dropped():
+                    conn.close()
+                    self._counters['dropped'] += 1
+                    continue
+                self._counters['reused'] += 1
+                return conn, True
+
+        return self._new_connection(), False
+
+    def release(self, conn: PooledConnection, reusable: bool = True) -> None:
+        """
+        Return a connection to the pool.
+
+        Args:
+            conn: Connection obtained from acquire()
+            reusable: False to close the connection instead of keeping it
+        """
+        with self._lock:
+            self._in_use -= 1
+            if reusable:
+                conn.last_used = time.monotonic()
+                self._idle.append(conn)
+            else:
+                conn.close()
+        self._slots.release()
+
+    def request(
+        self,
+        method: str,
+        path: str,
+        body: Optional[bytes] = None,
+        headers: Optional[Mapping[str, str]] = None,
+        timeout: Optional[float] = None
+    ) -> PoolResponse:
+        """
+        Perform a request on a pooled connection and read the full response.
+
+        A request on a reused connection that the server dropped between the
+        health check and the write is resent on another connection:
+        when sending fails, or when the server closes the connection without
+        sending a status line. Any later failure is raised, since the server
+        may already have run the call.
+
+        Args:
+            method: HTTP method
+            path: Path relative to the base URL
+            body: Request body
+            headers: Request headers
+            timeout: Socket and pool wait timeout for this request (defaults to the pool's)
+
+        Returns:
+            The response with its body already read
+        """
+        full_path = self.base_path + path
+        if timeout is None:
+            timeout = self.timeout
+        while True:
+            conn, reused = self.acquire(wait=timeout)
+            conn.set_timeout(timeout)
+            sent = False
+            try:
+                conn.connection.request(method, full_path, body, dict(headers or {}))
+                sent = True
+                raw = conn.connection.getresponse()
+                response = PoolResponse(raw.status, raw.reason, raw.headers, raw.read())
+            except (http.client.HTTPException, ConnectionError) as e:
+                self.release(conn, reusable=False)
+                if reused and (not sent or isinstance(e, http.client.RemoteDisconnected)):
+                    logger.debug(f"Retrying on fresh connection after stale keep-alive: {e}")
+                    continue
+                raise
+            except BaseException:
+                self.release(conn, reusable=False)
+                raise
+            conn.requests += 1
+            self.release(conn, reusable=not raw.will_close)
+            return response
+
+    def stats(self) -> Dict[str, int]:
+        """Get pool usage counters."""
+        with self._lock:
+            return {
+                'max_size': self.max_size,
+                'in_use': self._in_use,
+                'idle': len(self._idle),
+                **self._counters,
+            }
+
+    def close(self) -> None:
+        """Close all idle connections."""
+        with self._lock:
+            for conn in self._idle:
+                conn.close()
+            self._idle = []
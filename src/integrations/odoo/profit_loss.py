@@ -0,0 +1,226 @@
+"""
+Profit & Loss Rollup
+
+Builds P&L reports from per-account balances: report sections by account
+type, revenue and expense breakdowns, and comparison periods.
+
+FinanceOperations fetches the balances of every income and expense account
+with one read_group per period (grouped by account_id, all periods sent
+concurrently alongside the account list), so a report costs the same
+couple of round trips however large the chart of accounts is. While the
+ledger cache (see ledger.py) covers the periods, ledger_balances() computes
+the same balances from memory. Everything in this module is local.
+"""
+
+import calendar
+from datetime import date, timedelta
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from src.integrations.odoo.domain import PROFIT_LOSS_ACCOUNTS
+from src.integrations.odoo.ledger import LedgerSnapshot
+from src.integrations.odoo.read_group import ReadGroupRow
+
+# Report sections: (key, title, account types, sign). Income accounts carry
+# credit balances, so their amount is the negated balance.
+SECTIONS: Tuple[Tuple[str, str, Tuple[str, ...], int], ...] = (
+    ('revenue', 'Revenue', ('income',), -1),
+    ('other_income', 'Other Income', ('income_other',), -1),
+    ('cost_of_revenue', 'Cost of Revenue', ('expense_direct_cost',), 1),
+    ('operating_expenses', 'Operating Expenses', ('expense',), 1),
+    ('depreciation', 'Depreciation', ('expense_depreciation',), 1),
+)
+
+REVENUE_SECTIONS = ('revenue', 'other_income')
+
+COMPARISONS = ('previous_period', 'previous_year')
+
+_SECTION_BY_TYPE = {
+    account_type: (key, sign)
+    for key, _, account_types, sign in SECTIONS
+    for account_type in account_types
+}
+
+
+# ==================== Periods ====================
+
+def _is_month_end(day: date) -> bool:
+    return day.day == calendar.monthrange(day.year, day.month)[1]
+
+
+def _shift_months(day: date, months: int, month_end: bool = False) -> date:
+    """Move a date by whole months, clamping to the target month's length."""
+    index = day.year * 12 + day.month - 1 + months
+    year, month = divmod(index, 12)
+    last = calendar.monthrange(year, month + 1)[1]
+    return date(year, month + 1, last if month_end else min(day.day, last))
+
+
+def comparison_period(date_from: date, date_to: date, comparison: str) -> Tuple[date, date]:
+    """
+    Get the period a report is compared against.
+
+    Periods starting on the 1st shift by whole months (so January-March
+    compares with October-December and month-to-date with the same days of
+    last month); other periods shift by their length in days.
+
+    Args:
+        date_from: First day of the reported period
+        date_to: Last day of the reported period
+        comparison: 'previous_period' or 'previous_year'
+
+    Returns:
+        Tuple of (first day, last day) of the comparison period
+
+    Raises:
+        ValueError: For an unknown comparison
+    """
+    month_end = _is_month_end(date_to)
+    if comparison == 'previous_year':
+        return _shift_months(date_from, -12), _shift_months(date_to, -12, month_end)
+    if comparison != 'previous_period':
+        raise ValueError(f"Unknown comparison '{comparison}'; expected one of {', '.join(COMPARISONS)}")
+    if date_from.day == 1:
+        months = (date_to.year - date_from.year) * 12 + date_to.month - date_from.month + 1
+        return _shift_months(date_from, -months), _shift_months(date_to, -months, month_end)
+    length = (date_to - date_from).days + 1
+    return date_from - timedelta(days=length), date_to - timedelta(days=length)
+
+
+# ==================== Rollup ====================
+
+def account_balances(groups: Iterable[ReadGroupRow]) -> Dict[int, Tuple[Optional[str], float]]:
+    """
+    Get the balance per account from a read_group by account_id.
+
+    Returns:
+        (display name, balance) per account id
+    """
+    return {
+        group.key('account_id'): (group.label('account_id'), group.get('balance'))
+        for group in groups
+        if group.key('account_id')
+    }
+
+
+def ledger_balances(
+    snapshot: LedgerSnapshot,
+    periods: Sequence[Tuple[str, str]],
+    partner_id: Optional[int] = None
+) -> Tuple[List[Dict[str, Any]], List[Dict[int, Tuple[Optional[str], float]]]]:
+    """
+    Get the P&L accounts and their balances per period from the ledger cache.
+
+    Args:
+        snapshot: Ledger snapshot covering every period
+        periods: (date_from, date_to) pairs
+        partner_id: Only count journal items of this partner
+
+    Returns:
+        Tuple of (account rows, balances per period), as fetched from Odoo
+        by FinanceOperations
+    """
+    types = PROFIT_LOSS_ACCOUNTS[0][2]
+    accounts = [account for account in snapshot.accounts.values() if account.get('account_type') in types]
+    names = {account['id']: account['name'] for account in accounts}
+    columns = snapshot.columns
+    balances = []
+    for period_from, period_to in periods:
+        mask = columns.mask(
+            period_from, period_to,
+            account_id=list(names),
+            partner_id=[partner_id] if partner_id else None
+        )
+        balances.append({
+            account_id: (names[account_id], balance)
+            for account_id, balance in columns.sum_by('account_id', 'balance', mask).items()
+        })
+    return accounts, balances
+
+
+def build_profit_loss(
+    accounts: Sequence[Dict[str, Any]],
+    balances: Dict[int, Tuple[Optional[str], float]],
+    comparisons: Optional[Dict[str, Dict[int, Tuple[Optional[str], float]]]] = None
+) -> Dict[str, Any]:
+    """
+    Roll account balances up into a P&L report.
+
+    Args:
+        accounts: account.account rows with id, name, code and account_type
+        balances: Balances of the reported period (see account_balances)
+        comparisons: Balances of each comparison period, by comparison name
+
+    Returns:
+        Totals, breakdowns (largest first) and sections; with comparisons,
+        every total, section and breakdown row also carries the comparison
+        amounts under 'comparisons'
+    """
+    comparisons = comparisons or {}
+    by_id = {account['id']: account for account in accounts}
+
+    def amount_of(account_id: int, sign: int, values: Dict[int, Tuple[Optional[str], float]]) -> float:
+        return sign * values.get(account_id, (None, 0.0))[1] or 0.0
+
+    sections = {
+        key: {'key': key, 'name': title, 'amount': 0.0, 'accounts': []}
+        for key, title, _, _ in SECTIONS
+    }
+    section_totals = {name: dict.fromkeys(sections, 0.0) for name in comparisons}
+
+    account_ids = set(balances)
+    for values in comparisons.values():
+        account_ids.update(values)
+
+    for account_id in account_ids:
+        account = by_id.get(account_id)
+        if account is None or account.get('account_type') not in _SECTION_BY_TYPE:
+            continue
+        key, sign = _SECTION_BY_TYPE[account['account_type']]
+        amount = amount_of(account_id, sign, balances)
+        compared = {name: amount_of(account_id, sign, values) for name, values in comparisons.items()}
+        for name, value in compared.items():
+            section_totals[name][key] += value
+        if not abs(amount) > 0 and not any(abs(value) > 0 for value in compared.values()):
+            continue
+        row = {
+            'account_id': account_id,
+            'account': account.get('name') or balances.get(account_id, (None, 0.0))[0],
+            'code': account.get('code'),
+            'amount': amount,
+        }
+        if comparisons:
+            row['comparisons'] = compared
+        sections[key]['amount'] += amount
+        sections[key]['accounts'].append(row)
+
+    for key, section in sections.items():
+        section['accounts'].sort(key=lambda r: r['amount'], reverse=True)
+        if comparisons:
+            section['comparisons'] = {name: totals[key] for name, totals in section_totals.items()}
+
+    def totals(amounts: Dict[str, float]) -> Dict[str, float]:
+        revenue = sum(amounts[key] for key in REVENUE_SECTIONS)
+        expenses = sum(amount for key, amount in amounts.items() if key not in REVENUE_SECTIONS)
+        return {'total_revenue': revenue, 'total_expenses': expenses, 'net_profit': revenue - expenses}
+
+    report = totals({key: section['amount'] for key, section in sections.items()})
+    report['revenue_breakdown'] = sorted(
+        (row for key in REVENUE_SECTIONS for row in sections[key]['accounts']),
+        key=lambda r: r['amount'], reverse=True
+    )
+    report['expense_breakdown'] = sorted(
+        (row for key, section in sections.items() if key not in REVENUE_SECTIONS for row in section['accounts']),
+        key=lambda r: r['amount'], reverse=True
+    )
+    report['sections'] = list(sections.values())
+    if comparisons:
+        report['comparisons'] = {}
+        for name, amounts in section_totals.items():
+            compared = totals(amounts)
+            previous = compared['net_profit']
+            compared['net_profit_change'] = report['net_profit'] - previous
+            compared['net_profit_change_pct'] = (
+                round((report['net_profit'] - previous) / abs(previous) * 100, 1) if previous else None
+            )
+            report['comparisons'][name] = compared
+    return report
@@ -0,0 +1,232 @@
+"""
+Odoo Field Projections
+
+Declarative field lists ("projection profiles") per model, so operations
+never read whole records. Reading without a field list makes Odoo compute
+and serialize every field, including computed, binary and one2many fields,
+which is often hundreds of KB per record.
+
+Profiles:
+- summary: list views and search results (and related lines)
+- detail: a single record as returned by the API detail endpoints
+- agent: what the agent tools format for the LLM
+
+A model that does not declare 'detail' or 'agent' uses its 'summary'
+fields. Profiles may name fields that only exist in some Odoo versions or
+modules; OdooClient.fields_for() drops those missing from the connected
+database.
+
+A guard checks every read and search_read: one that names no fields is
+logged once per model and caller, or rejected with ODOO_PROJECTION_GUARD=raise.
+"""
+
+import threading
+from typing import Any, Dict, List, Mapping, Optional, Set, Tuple
+import logging
+
+from src.config import settings
+from src.core.exceptions import OdooProjectionError
+from src.integrations.odoo.instrumentation import detect_caller
+
+logger = logging.getLogger(__name__)
+
+PROFILES = ('summary', 'detail', 'agent')
+
+# Methods returning records, and the position of their fields argument
+FIELDS_ARGUMENT: Dict[str, int] = {
+    'read': 1,
+    'search_read': 1,
+}
+
+_INVOICE_SUMMARY = [
+    'name', 'partner_id', 'invoice_date', 'invoice_date_due',
+    'amount_total', 'amount_residual', 'amount_untaxed', 'amount_tax',
+    'state', 'payment_state', 'move_type', 'currency_id', 'ref'
+]
+_PAYMENT_SUMMARY = [
+    'name', 'partner_id', 'amount', 'date', 'state',
+    'payment_type', 'journal_id', 'currency_id', 'ref'
+]
+_SALE_ORDER_SUMMARY = [
+    'name', 'partner_id', 'date_order', 'validity_date', 'amount_total',
+    'amount_untaxed', 'state', 'user_id', 'currency_id', 'company_id',
+    'invoice_status', 'delivery_status'
+]
+_EMPLOYEE_SUMMARY = [
+    'name', 'work_email', 'work_phone', 'mobile_phone',
+    'department_id', 'job_id', 'parent_id', 'coach_id',
+    'work_location_id', 'company_id'
+]
+_CONTRACT_SUMMARY = [
+    'name', 'partner_id', 'company_id', 'state', 'date_start', 'date_end',
+    'recurring_next_date', 'recurring_interval', 'recurring_rule_type'
+]
+_SUBSCRIPTION_SUMMARY = [
+    'name', 'partner_id', 'company_id', 'state', 'date_start', 'date',
+    'recurring_total', 'template_id'
+]
+
+FIELD_PROFILES: Dict[str, Dict[str, List[str]]] = {
+    # ==================== Finance ====================
+    'account.move': {
+        'summary': _INVOICE_SUMMARY,
+        'detail': _INVOICE_SUMMARY + [
+            'date', 'journal_id', 'company_id', 'invoice_user_id', 'invoice_origin',
+            'invoice_payment_term_id', 'payment_reference'
+        ],
+        'agent': [
+            'name', 'partner_id', 'invoice_date', 'invoice_date_due', 'amount_total',
+            'amount_untaxed', 'amount_tax', 'amount_residual', 'state', 'payment_state', 'ref'
+        ],
+    },
+    'account.move.line': {
+        'summary': [
+            'name', 'product_id', 'quantity', 'price_unit',
+            'price_subtotal', 'price_total', 'tax_ids', 'account_id'
+        ],
+        'agent': ['name', 'product_id', 'quantity', 'price_unit', 'price_subtotal'],
+    },
+    'account.payment': {
+        'summary': _PAYMENT_SUMMARY,
+        'detail': _PAYMENT_SUMMARY + [
+            'partner_type', 'move_id', 'company_id', 'reconciled_invoice_ids'
+        ],
+        'agent': [
+            'name', 'partner_id', 'amount', 'date', 'payment_type',
+            'journal_id', 'state', 'reconciled_invoice_ids'
+        ],
+    },
+    'sale.order': {
+        'summary': _SALE_ORDER_SUMMARY,
+        'detail': _SALE_ORDER_SUMMARY + [
+            'amount_tax', 'client_order_ref', 'payment_term_id', 'commitment_date'
+        ],
+        'agent': [
+            'name', 'partner_id', 'date_order', 'user_id', 'amount_total', 'amount_untaxed',
+            'amount_tax', 'state', 'invoice_status', 'client_order_ref'
+        ],
+    },
+    'sale.order.line': {
+        'summary': [
+            'product_id', 'name', 'product_uom_qty', 'price_unit',
+            'price_subtotal', 'price_total', 'discount', 'tax_id'
+        ],
+        'agent': ['product_id', 'name', 'product_uom_qty', 'price_unit', 'price_subtotal'],
+    },
+
+    # ==================== HR ====================
+    'hr.employee': {
+        'summary': _EMPLOYEE_SUMMARY,
+        'detail': _EMPLOYEE_SUMMARY + ['job_title', 'resource_calendar_id', 'active'],
+        'agent': [
+            'name', 'work_email', 'work_phone', 'mobile_phone',
+            'department_id', 'job_id', 'parent_id'
+        ],
+    },
+    'hr.department': {
+        'summary': ['name', 'parent_id', 'manager_id', 'company_id'],
+    },
+    'hr.contract': {
+        'summary': ['name', 'wage', 'date_start', 'date_end', 'state'],
+    },
+
+    # ==================== Contracts ====================
+    'contract.contract': {
+        'summary': _CONTRACT_SUMMARY,
+        'detail': _CONTRACT_SUMMARY + ['code', 'contract_type', 'user_id', 'journal_id', 'pricelist_id'],
+        'agent': [
+            'name', 'partner_id', 'state', 'date_start', 'date_end',
+            'recurring_next_date', 'recurring_interval', 'recurring_rule_type'
+        ],
+    },
+    'contract.line': {
+        'summary': ['name', 'product_id', 'quantity', 'price_unit', 'price_subtotal'],
+    },
+    'sale.subscription': {
+        'summary': _SUBSCRIPTION_SUMMARY,
+        'detail': _SUBSCRIPTION_SUMMARY + ['code', 'recurring_next_date', 'user_id', 'pricelist_id'],
+        'agent': ['name', 'partner_id', 'state', 'date_start', 'date', 'recurring_total'],
+    },
+    'account.analytic.account': {
+        'summary': ['name', 'code', 'partner_id', 'company_id', 'create_date'],
+    },
+}
+
+
+def projection(
+    model: str,
+    profile: str = 'summary',
+    available: Optional[Mapping[str, Any]] = None
+) -> List[str]:
+    """
+    Get the fields of a projection profile.
+
+    Args:
+        model: Odoo model name
+        profile: 'summary', 'detail' or 'agent'
+        available: Field definitions of the model (fields_get); fields missing
+            from it are dropped. Ignored when empty.
+
+    Returns:
+        Field names to read
+
+    Raises:
+        ValueError: For an unknown profile or a model without profiles
+    """
+    if profile not in PROFILES:
+        raise ValueError(f"Unknown projection profile '{profile}'; expected one of {', '.join(PROFILES)}")
+    profiles = FIELD_PROFILES.get(model)
+    if profiles is None:
+        raise ValueError(f"No projection profiles for model '{model}'")
+    fields = profiles.get(profile) or profiles['summary']
+    if available:
+        fields = [name for name in fields if name in available]
+    return list(fields)
+
+
+# ==================== Guard ====================
+
+_reported: Set[Tuple[str, str, str]] = set()
+_reported_lock = threading.Lock()
+
+
+def requests_all_fields(method: str, args: tuple, kwargs: Dict[str, Any]) -> bool:
+    """Check if a call reads records without naming any fields."""
+    position = FIELDS_ARGUMENT.get(method)
+    if position is None:
+        return False
+    if 'fields' in kwargs:
+        return not kwargs['fields']
+    return len(args) <= position or not args[position]
+
+
+def check_projection(model: str, method: str, args: tuple, kwargs: Dict[str, Any]) -> None:
+    """
+    Flag a read that requests every field.
+
+    Args:
+        model: Odoo model name
+        method: Method called
+        args: Positional arguments of the call
+        kwargs: Keyword arguments of the call
+
+    Raises:
+        OdooProjectionError: If the guard is set to 'raise'
+    """
+    action = settings.odoo_projection_guard
+    if action == 'off' or not requests_all_fields(method, args, kwargs):
+        return
+    operation, tool = detect_caller()
+    caller = operation or tool or 'unknown caller'
+    message = (
+        f"Odoo {method} on {model} from {caller} requests every field; "
+        f"pass fields or a projection profile"
+    )
+    if action == 'raise':
+        raise OdooProjectionError(message, details={'model': model, 'method': method, 'caller': caller})
+    key = (model, method, caller)
+    with _reported_lock:
+        if key in _reported:
+            return
+        _reported.add(key)
+    logger.warning(message)
@@ -0,0 +1,113 @@
+"""
+Read Group Results
+
+Typed representation of Odoo read_group() rows.
+
+Odoo returns grouped rows as loosely structured dicts whose shape varies with
+the field type and server version (many2one values as [id, name], date
+groupings as display labels plus a __range, counts under __count or
+<field>_count). ReadGroupRow normalizes those into a stable structure.
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Sequence
+
+
+def aggregate_name(spec: str) -> str:
+    """
+    Get the result key for an aggregate field spec.
+
+    Examples:
+        'amount_residual:sum' -> 'amount_residual'
+        'total:sum(amount_residual)' -> 'total'
+    """
+    return spec.split(':', 1)[0]
+
+
+@dataclass
+class ReadGroupRow:
+    """
+    A single group returned by read_group().
+
+    Attributes:
+        groups: Raw group value per groupby spec (e.g. {'journal_id': [3, 'Bank']})
+        count: Number of records in the group
+        aggregates: Aggregated values per field name (e.g. {'balance': 120.0})
+        domain: Domain selecting the records of this group
+        ranges: Date range per date groupby spec ({'from': ..., 'to': ...})
+    """
+    groups: Dict[str, Any]
+    count: int
+    aggregates: Dict[str, Any] = field(default_factory=dict)
+    domain: List[Any] = field(default_factory=list)
+    ranges: Dict[str, Dict[str, str]] = field(default_factory=dict)
+
+    def key(self, groupby: str) -> Any:
+        """
+        Get a machine-friendly key for a groupby value.
+
+        Returns the record ID for many2one groupings, the range start date
+        (YYYY-MM-DD) for date groupings when the server provides it, None for
+        empty groups and the raw value otherwise.
+        """
+        value = self.groups.get(groupby)
+        if groupby in self.ranges:
+            return self.ranges[groupby].get('from', value)
+        if isinstance(value, (list, tuple)) and value:
+            return value[0]
+        if value is False:
+            return None
+        return value
+
+    def label(self, groupby: str) -> Optional[str]:
+        """Get the display label for a groupby value."""
+        value = self.groups.get(groupby)
+        if isinstance(value, (list, tuple)) and len(value) > 1:
+            return value[1]
+        if value is False or value is None:
+            return None
+        return str(value)
+
+    def get(self, name: str, default: Any = 0) -> Any:
+        """Get an aggregated value, treating missing/False as default."""
+        value = self.aggregates.get(name)
+        return default if value is None or value is False else value
+
+
+def parse_read_group(
+    rows: List[Dict[str, Any]],
+    fields: Sequence[str],
+    groupby: Sequence[str],
+    lazy: bool = False
+) -> List[ReadGroupRow]:
+    """
+    Convert raw read_group() output into ReadGroupRow objects.
+
+    Args:
+        rows: Raw rows returned by Odoo
+        fields: Aggregate field specs passed to read_group
+        groupby: Groupby specs passed to read_group
+        lazy: Whether the call was lazy (only the first groupby applied)
+
+    Returns:
+        List of typed rows
+    """
+    applied = list(groupby[:1]) if lazy else list(groupby)
+    names = [aggregate_name(spec) for spec in fields]
+    result = []
+    for row in rows:
+        count = row.get('__count')
+        if count is None:
+            count = next(
+                (v for k, v in row.items() if k.endswith('_count') and not k.startswith('__')),
+                0
+            )
+        raw_ranges = row.get('__range') or {}
+        result.append(ReadGroupRow(
+            groups={spec: row.get(spec, row.get(spec.split(':', 1)[0])) for spec in applied},
+            count=count or 0,
+            aggregates={name: row.get(name) for name in names if name not in applied},
+            domain=row.get('__domain', []),
+            ranges={spec: raw_ranges[spec] for spec in applied if raw_ranges.get(spec)},
+        ))
+    return result
@@ -0,0 +1,362 @@
+"""
+Compact Record Results
+
+Memory-efficient alternatives to the list of dicts returned by
+search_read(), selected with its `result` argument:
+
+- 'dicts' (default): rows exactly as Odoo returns them.
+- 'records': instances of a __slots__ class generated per model and field
+  list from fields_get. Many2one values are split into an id attribute and
+  a <field>_name attribute; empty values (Odoo's False) become None, except
+  for boolean fields.
+- 'columns': a RecordBatch holding one column per field. Integers, floats
+  and many2one ids are stored in typed arrays (8 bytes per value), and
+  many2one fields are split into <field> (id, 0 when empty) and
+  <field>_name columns.
+"""
+
+import threading
+from array import array
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple, Type, Union
+
+RESULT_MODES = ('dicts', 'records', 'columns')
+
+_INTEGER_TYPES = frozenset({'integer'})
+_FLOAT_TYPES = frozenset({'float', 'monetary'})
+_X2MANY_TYPES = frozenset({'one2many', 'many2many'})
+
+
+def many2one_id(value: Any) -> Optional[int]:
+    """Get the id of a many2one value ([id, name] or False)."""
+    return value[0] if isinstance(value, (list, tuple)) and value else None
+
+
+def many2one_name(value: Any, default: Optional[str] = 'N/A') -> Optional[str]:
+    """Get the display name of a many2one value ([id, name] or False)."""
+    if isinstance(value, (list, tuple)) and len(value) > 1:
+        return value[1]
+    return default
+
+
+def _infer_type(rows: Sequence[Dict[str, Any]], name: str) -> str:
+    """Guess a field type from the first non-empty value."""
+    for row in rows:
+        value = row.get(name, False)
+        if value is False or value is None:
+            continue
+        if isinstance(value, bool):
+            return 'boolean'
+        if isinstance(value, int):
+            return 'integer'
+        if isinstance(value, float):
+            return 'float'
+        if isinstance(value, (list, tuple)):
+            if len(value) == 2 and isinstance(value[0], int) and isinstance(value[1], str):
+                return 'many2one'
+            return 'many2many'
+        return 'char'
+    return 'char'
+
+
+def field_types(
+    rows: Sequence[Dict[str, Any]],
+    fields: Optional[Sequence[str]] = None,
+    definitions: Optional[Dict[str, Any]] = None
+) -> Dict[str, str]:
+    """
+    Resolve the type of each field in a result.
+
+    Args:
+        rows: Rows returned by search_read
+        fields: Requested fields (taken from the rows if not provided)
+        definitions: fields_get() output; types are inferred from the values where missing
+
+    Returns:
+        Field type per field name, 'id' first
+    """
+    definitions = definitions or {}
+    names = list(fields) if fields else (list(rows[0]) if rows else [])
+    types = {'id': 'integer'}
+    for name in names:
+        if name == 'id' or '.' in name:
+            continue
+        types[name] = (definitions.get(name) or {}).get('type') or _infer_type(rows, name)
+    return types
+
+
+# ==================== Slotted Records ====================
+
+class OdooRecord:
+    """
+    Base class of generated record classes.
+
+    Subclasses are built by record_class(); attribute names are the field
+    names, plus <field>_name for many2one display names.
+    """
+
+    __slots__ = ()
+    _model: str = ''
+    _types: Dict[str, str] = {}
+    _name_slots: Dict[str, str] = {}
+
+    def get(self, name: str, default: Any = None) -> Any:
+        """Get a field value (None-safe like dict.get)."""
+        value = getattr(self, name, None)
+        return default if value is None else value
+
+    def display_name_of(self, name: str, default: Optional[str] = None) -> Optional[str]:
+        """Get the display name of a many2one field."""
+        value = getattr(self, self._name_slots[name], None)
+        return default if value is None else value
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert back to Odoo's row shape (many2one as [id, name], empty as False)."""
+        row = {}
+        for name, kind in self._types.items():
+            value = getattr(self, name)
+            if kind == 'many2one':
+                row[name] = [value, getattr(self, self._name_slots[name])] if value else False
+            elif kind in _X2MANY_TYPES:
+                row[name] = list(value)
+            else:
+                row[name] = False if value is None else value
+        return row
+
+    def __eq__(self, other: Any) -> bool:
+        return type(other) is type(self) and all(
+            getattr(self, s) == getattr(other, s) for s in self.__slots__
+        )
+
+    def __repr__(self) -> str:
+        values = ', '.join(f"{name}={getattr(self, name)!r}" for name in self._types)
+        return f"{type(self).__name__}({values})"
+
+
+_record_classes: Dict[Tuple[str, Tuple[Tuple[str, str], ...]], Type[OdooRecord]] = {}
+_record_classes_lock = threading.Lock()
+
+
+def _class_name(model: str) -> str:
+    return ''.join(part.capitalize() for part in model.replace('_', '.').split('.')) + 'Record'
+
+
+def record_class(model: str, types: Dict[str, str]) -> Type[OdooRecord]:
+    """
+    Get the record class for a model and field list, generating it on first use.
+
+    Args:
+        model: Odoo model name
+        types: Field type per field name (see field_types)
+
+    Returns:
+        OdooRecord subclass with one slot per field (two per many2one)
+    """
+    key = (model, tuple(types.items()))
+    cls = _record_classes.get(key)
+    if cls is not None:
+        return cls
+    with _record_classes_lock:
+        if key not in _record_classes:
+            name_slots = {}
+            for name, kind in types.items():
+                if kind == 'many2one':
+                    slot = f"{name}_name"
+                    name_slots[name] = slot if slot not in types else f"{name}__name"
+            _record_classes[key] = type(_class_name(model), (OdooRecord,), {
+                '__slots__': tuple(types) + tuple(name_slots.values()),
+                '_model': model,
+                '_types': dict(types),
+                '_name_slots': name_slots,
+            })
+        return _record_classes[key]
+
+
+def to_records(model: str, rows: Sequence[Dict[str, Any]], types: Dict[str, str]) -> List[OdooRecord]:
+    """
+    Convert search_read rows to slotted records.
+
+    Args:
+        model: Odoo model name
+        rows: Rows returned by search_read
+        types: Field type per field name (see field_types)
+
+    Returns:
+        One record per row
+    """
+    cls = record_class(model, types)
+    plan = [(name, kind, cls._name_slots.get(name)) for name, kind in types.items()]
+    new = object.__new__
+    records = []
+    for row in rows:
+        record = new(cls)
+        for name, kind, name_slot in plan:
+            value = row.get(name, False)
+            if kind == 'many2one':
+                if value:
+                    setattr(record, name, value[0])
+                    setattr(record, name_slot, value[1])
+                else:
+                    setattr(record, name, None)
+                    setattr(record, name_slot, None)
+            elif kind == 'boolean':
+                setattr(record, name, bool(value))
+            elif kind in _X2MANY_TYPES:
+                setattr(record, name, tuple(value or ()))
+            else:
+                setattr(record, name, None if value is False else value)
+        records.append(record)
+    return records
+
+
+# ==================== Columnar Batches ====================
+
+class RecordBatch:
+    """
+    Columnar search_read result.
+
+    Usage:
+        batch = client.search_read('account.move.line', domain, fields=['balance', 'partner_id'], result='columns')
+        total = sum(batch['balance'])
+        for partner_id, partner, balance in zip(batch['partner_id'], batch['partner_id_name'], batch['balance']):
+            ...
+    """
+
+    def __init__(self, model: str, types: Dict[str, str]):
+        """
+        Initialize an empty batch.
+
+        Args:
+            model: Odoo model name
+            types: Field type per field name (see field_types)
+        """
+        self.model = model
+        self.types = dict(types)
+        self.columns: Dict[str, Union[array, List[Any]]] = {}
+        self._size = 0
+        for name, kind in self.types.items():
+            if kind == 'many2one' or kind in _INTEGER_TYPES:
+                self.columns[name] = array('q')
+            elif kind in _FLOAT_TYPES:
+                self.columns[name] = array('d')
+            else:
+                self.columns[name] = []
+            if kind == 'many2one':
+                self.columns[f"{name}_name"] = []
+
+    @classmethod
+    def from_rows(cls, model: str, rows: Sequence[Dict[str, Any]], types: Dict[str, str]) -> 'RecordBatch':
+        """Build a batch from search_read rows."""
+        batch = cls(model, types)
+        batch.append_rows(rows)
+        return batch
+
+    def append_rows(self, rows: Sequence[Dict[str, Any]]) -> None:
+        """Append search_read rows."""
+        for name, kind in self.types.items():
+            column = self.columns[name]
+            values = [row.get(name, False) for row in rows]
+            if kind == 'many2one':
+                column.extend(v[0] if v else 0 for v in values)
+                self.columns[f"{name}_name"].extend(v[1] if v else None for v in values)
+            elif kind in _INTEGER_TYPES:
+                column.extend(v or 0 for v in values)
+            elif kind in _FLOAT_TYPES:
+                column.extend(float(v or 0.0) for v in values)
+            elif kind == 'boolean':
+                column.extend(bool(v) for v in values)
+            elif kind in _X2MANY_TYPES:
+                column.extend(tuple(v or ()) for v in values)
+            else:
+                column.extend(None if v is False else v for v in values)
+        self._size += len(rows)
+
+    def extend(self, other: 'RecordBatch') -> None:
+        """Append the rows of another batch with the same fields."""
+        for name, column in other.columns.items():
+            self.columns[name].extend(column)
+        self._size += len(other)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __getitem__(self, name: str) -> Union[array, List[Any]]:
+        return self.columns[name]
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.columns
+
+    @property
+    def ids(self) -> array:
+        """Get the record ids."""
+        return self.columns['id']
+
+    def sum(self, name: str) -> float:
+        """Sum a numeric column."""
+        return sum(self.columns[name])
+
+    def rows(self) -> Iterator[Dict[str, Any]]:
+        """Iterate rows in Odoo's dict shape (many2one as [id, name], empty as False)."""
+        for i in range(self._size):
+            row = {}
+            for name, kind in self.types.items():
+                value = self.columns[name][i]
+                if kind == 'many2one':
+                    row[name] = [value, self.columns[f"{name}_name"][i]] if value else False
+                elif kind in _X2MANY_TYPES:
+                    row[name] = list(value)
+                else:
+                    row[name] = False if value is None else value
+            yield row
+
+    def to_numpy(self) -> Dict[str, Any]:
+        """
+        Get the columns as numpy arrays (numeric columns without copying).
+
+        Raises:
+            ImportError: If numpy is not installed
+        """
+        import numpy as np
+
+        result = {}
+        for name, column in self.columns.items():
+            if isinstance(column, array):
+                result[name] = np.frombuffer(column, dtype=np.int64 if column.typecode == 'q' else np.float64)
+            else:
+                result[name] = np.array(column, dtype=object)
+        return result
+
+    def __repr__(self) -> str:
+        return f"RecordBatch({self.model}, {self._size} rows, fields={list(self.types)})"
+
+
+def shape_rows(
+    model: str,
+    rows: List[Dict[str, Any]],
+    result: str,
+    fields: Optional[Sequence[str]] = None,
+    definitions: Optional[Dict[str, Any]] = None
+) -> Union[List[Dict[str, Any]], List[OdooRecord], RecordBatch]:
+    """
+    Convert search_read rows to the requested result mode.
+
+    Args:
+        model: Odoo model name
+        rows: Rows returned by search_read
+        result: 'dicts', 'records' or 'columns'
+        fields: Requested fields
+        definitions: fields_get() output for the model
+
+    Returns:
+        The rows unchanged, a list of records, or a RecordBatch
+
+    Raises:
+        ValueError: For an unknown result mode
+    """
+    if result == 'dicts':
+        return rows
+    if result not in RESULT_MODES:
+        raise ValueError(f"Unknown result mode '{result}'; expected one of {', '.join(RESULT_MODES)}")
+    types = field_types(rows, fields, definitions)
+    if result == 'records':
+        return to_records(model, rows, types)
+    return RecordBatch.from_rows(model, rows, types)
@@ -0,0 +1,420 @@
+"""
+Odoo RPC Resilience
+
+Deadlines, retries and circuit breaking for Odoo calls.
+
+- Deadlines: odoo_deadline() sets an absolute deadline in a context variable
+  (so it follows fan-out workers and bridged calls); every RPC made inside it
+  gets the remaining time as its socket/HTTP timeout and fails fast once it
+  has passed.
+- Retries: transient failures (connection errors, timeouts, 429/502/503/504)
+  of idempotent reads are retried with jittered exponential backoff. Writes
+  are only retried when the request provably never reached the server.
+- Circuit breaker: after consecutive transient failures the breaker opens and
+  calls fail fast (the client serves stale cached reads where it can) until a
+  probe call succeeds.
+"""
+
+import http.client
+import random
+import threading
+import time
+import xmlrpc.client
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterator, Optional, Tuple
+import logging
+
+import httpx
+
+from src.config import settings
+from src.core.exceptions import (
+    OdooConnectionError,
+    OdooDeadlineExceeded,
+    OdooOperationError,
+    OdooUnavailableError,
+)
+from src.integrations.odoo.cache import READ_METHODS
+
+logger = logging.getLogger(__name__)
+
+
+# HTTP statuses returned by a saturated or restarting Odoo (or its proxy)
+TRANSIENT_STATUSES = frozenset({429, 502, 503, 504})
+
+# Absolute time.monotonic() deadline for Odoo calls in this context
+_deadline: ContextVar[Optional[float]] = ContextVar('odoo_deadline', default=None)
+
+
+# ==================== Deadlines ====================
+
+@contextmanager
+def odoo_deadline(seconds: Optional[float]) -> Iterator[None]:
+    """
+    Bound the total time Odoo calls made within a block may take.
+
+    Nested deadlines never extend an enclosing one.
+
+    Args:
+        seconds: Time budget from now (None or <= 0 for no deadline)
+    """
+    if not seconds or seconds <= 0:
+        yield
+        return
+    deadline = time.monotonic() + seconds
+    current = _deadline.get()
+    token = _deadline.set(deadline if current is None else min(current, deadline))
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
+
+
+def remaining_timeout(default: float) -> float:
+    """
+    Get the timeout for the next RPC.
+
+    Args:
+        default: Per-call timeout used when no deadline is active
+
+    Returns:
+        Seconds until the active deadline, capped at default
+
+    Raises:
+        OdooDeadlineExceeded: If the deadline has already passed
+    """
+    deadline = _deadline.get()
+    if deadline is None:
+        return default
+    remaining = deadline - time.monotonic()
+    if remaining <= 0:
+        raise OdooDeadlineExceeded("Odoo call deadline exceeded")
+    return min(default, remaining)
+
+
+# ==================== Error Classification ====================
+
+def is_transient(error: BaseException) -> bool:
+    """
+    Check if a failure is likely to go away on its own.
+
+    Faults (Odoo answered with an application error) are not transient.
+    """
+    if isinstance(error, OdooConnectionError):
+        # Pool exhaustion, or a wrapped network failure during authentication
+        if 'max_size' in error.details:
+            return True
+        return error.__context__ is not None and is_transient(error.__context__)
+    if isinstance(error, (ConnectionError, TimeoutError, http.client.IncompleteRead)):
+        return True
+    if isinstance(error, httpx.HTTPStatusError):
+        return error.response.status_code in TRANSIENT_STATUSES
+    if isinstance(error, httpx.TransportError):
+        return True
+    status = getattr(error, 'status', None)
+    return isinstance(error, http.client.HTTPException) and status in TRANSIENT_STATUSES
+
+
+def is_unsent(error: BaseException) -> bool:
+    """Check if a failure happened before the request reached the server."""
+    if isinstance(error, OdooConnectionError):
+        return 'max_size' in error.details
+    return isinstance(error, (
+        ConnectionRefusedError,
+        httpx.ConnectError,
+        httpx.ConnectTimeout,
+        httpx.PoolTimeout,
+    ))
+
+
+def is_fault(error: BaseException) -> bool:
+    """
+    Check if Odoo rejected a call with an application error (e.g. validation).
+
+    The server answered and rolled the call back, so it is safe to resend
+    part of it. Matches raw faults and OdooOperationError mapped from one.
+    """
+    if isinstance(error, xmlrpc.client.Fault):
+        return True
+    return isinstance(error, OdooOperationError) and 'fault_code' in error.details
+
+
+def map_call_error(
+    error: Exception,
+    model: str,
+    method: str,
+    attempts: int
+) -> Exception:
+    """
+    Map a failed call to the exception raised to callers.
+
+    Args:
+        error: Error raised by the last attempt
+        model: Odoo model name
+        method: Method called
+        attempts: Number of attempts made
+
+    Returns:
+        OdooOperationError for faults and other failures, OdooUnavailableError
+        for transient failures; errors already mapped are returned unchanged
+    """
+    if isinstance(error, (OdooOperationError, OdooUnavailableError)):
+        return error
+    if isinstance(error, xmlrpc.client.Fault):
+        return OdooOperationError(
+            f"Operation failed: {error.faultString}",
+            model=model,
+            method=method,
+            details={"fault_code": error.faultCode}
+        )
+    if is_transient(error):
+        return OdooUnavailableError(
+            f"Odoo unavailable: {error}",
+            details={"model": model, "method": method, "attempts": attempts}
+        )
+    return OdooOperationError(
+        f"Operation error: {str(error)}",
+        model=model,
+        method=method
+    )
+
+
+def circuit_open_error(model: str, method: str) -> OdooUnavailableError:
+    """Build the error raised for a call rejected by an open circuit."""
+    return OdooUnavailableError(
+        "Odoo circuit breaker is open; failing fast",
+        details={"model": model, "method": method}
+    )
+
+
+# ==================== Retries ====================
+
+class RetryPolicy:
+    """
+    Idempotency-aware retry policy with full-jitter exponential backoff.
+
+    Usage:
+        policy = RetryPolicy(max_attempts=3)
+        delay = policy.backoff('search_read', error, attempt)
+        if delay is None:
+            raise error
+    """
+
+    def __init__(
+        self,
+        max_attempts: Optional[int] = None,
+        base_delay: Optional[float] = None,
+        max_delay: Optional[float] = None
+    ):
+        """
+        Initialize policy.
+
+        Args:
+            max_attempts: Total attempts per call. Uses settings if not provided.
+            base_delay: Backoff ceiling after the first failure. Uses settings if not provided.
+            max_delay: Upper bound for any backoff. Uses settings if not provided.
+        """
+        self.max_attempts = max_attempts if max_attempts is not None else settings.odoo_retry_attempts
+        self.base_delay = base_delay if base_delay is not None else settings.odoo_retry_base_delay
+        self.max_delay = max_delay if max_delay is not None else settings.odoo_retry_max_delay
+
+    def is_retryable(self, method: str, error: BaseException) -> bool:
+        """Check if a failed call may be sent again."""
+        if is_unsent(error):
+            return True
+        return method in READ_METHODS and is_transient(error)
+
+    def backoff(self, method: str, error: BaseException, attempt: int) -> Optional[float]:
+        """
+        Get the delay before retrying a failed attempt.
+
+        Args:
+            method: Odoo method called
+            error: Error raised by the attempt
+            attempt: Zero-based number of the failed attempt
+
+        Returns:
+            Seconds to wait, or None if the call should not be retried
+        """
+        if attempt + 1 >= self.max_attempts or not self.is_retryable(method, error):
+            return None
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2 ** attempt))
+
+
+# ==================== Circuit Breaker ====================
+
+class CircuitBreaker:
+    """
+    Thread-safe circuit breaker for one Odoo server.
+
+    closed: calls flow; consecutive transient failures are counted.
+    open: calls are rejected until reset_timeout has passed.
+    half_open: a single probe call is let through; its outcome closes or
+    re-opens the circuit. A probe that never reports back (cancelled, or
+    interrupted by a non-Exception error) is released, or expires after
+    reset_timeout, so another call may probe.
+
+    Usage:
+        breaker = CircuitBreaker(failure_threshold=5, reset_timeout=30)
+        if not breaker.allow():
+            raise OdooUnavailableError(...)
+        try:
+            result = send()
+        except Exception as e:
+            breaker.record(e)
+            raise
+        except BaseException:
+            breaker.release()
+            raise
+        breaker.record()
+    """
+
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half_open'
+
+    def __init__(
+        self,
+        failure_threshold: Optional[int] = None,
+        reset_timeout: Optional[float] = None
+    ):
+        """
+        Initialize breaker.
+
+        Args:
+            failure_threshold: Consecutive failures that open the circuit. Uses settings if not provided.
+            reset_timeout: Seconds to stay open before probing. Uses settings if not provided.
+        """
+        self.failure_threshold = (
+            failure_threshold if failure_threshold is not None
+            else settings.odoo_breaker_failure_threshold
+        )
+        self.reset_timeout = (
+            reset_timeout if reset_timeout is not None
+            else settings.odoo_breaker_reset_timeout
+        )
+        self._state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probing = False
+        self._probe_started = 0.0
+        self._lock = threading.Lock()
+        self._counters: Dict[str, int] = {
+            'trips': 0,
+            'rejected': 0,
+        }
+
+    @property
+    def state(self) -> str:
+        """Get the current state, moving open to half_open once reset_timeout has passed."""
+        with self._lock:
+            self._advance()
+            return self._state
+
+    def _advance(self) -> None:
+        """Move open to half_open when due (lock held)."""
+        if self._state == self.OPEN and time.monotonic() - self._opened_at >= self.reset_timeout:
+            self._state = self.HALF_OPEN
+            self._probing = False
+
+    def allow(self) -> bool:
+        """
+        Check if a call may be sent now.
+
+        In half_open state only the first caller gets through, as the probe;
+        another one may once the probe has been out for reset_timeout.
+        """
+        with self._lock:
+            self._advance()
+            if self._state == self.CLOSED:
+                return True
+            now = time.monotonic()
+            if self._state == self.HALF_OPEN and (
+                not self._probing or now - self._probe_started >= self.reset_timeout
+            ):
+                self._probing = True
+                self._probe_started = now
+                return True
+            self._counters['rejected'] += 1
+            return False
+
+    def record(self, error: Optional[BaseException] = None) -> None:
+        """
+        Record the outcome of an allowed call.
+
+        Args:
+            error: Error raised by the call, or None on success. Only transient
+                errors count as failures; a fault means Odoo is responding.
+        """
+        failed = error is not None and is_transient(error)
+        with self._lock:
+            if not failed:
+                if self._state != self.CLOSED:
+                    logger.info("Odoo circuit breaker closed")
+                self._state = self.CLOSED
+                self._failures = 0
+                self._probing = False
+                return
+
+            self._failures += 1
+            if self._state == self.HALF_OPEN or self._failures >= self.failure_threshold:
+                if self._state != self.OPEN:
+                    self._counters['trips'] += 1
+                    logger.warning(
+                        f"Odoo circuit breaker opened after {self._failures} "
+                        f"consecutive failures: {error}"
+                    )
+                self._state = self.OPEN
+                self._opened_at = time.monotonic()
+                self._probing = False
+
+    def release(self) -> None:
+        """Give up an allowed call without an outcome (e.g. cancelled); a half_open probe may be retried."""
+        with self._lock:
+            self._probing = False
+
+    def reset(self) -> None:
+        """Close the circuit and clear the failure count."""
+        with self._lock:
+            self._state = self.CLOSED
+            self._failures = 0
+            self._probing = False
+
+    def stats(self) -> Dict[str, Any]:
+        """Get state, failure count and counters."""
+        with self._lock:
+            self._advance()
+            retry_in = 0.0
+            if self._state == self.OPEN:
+                retry_in = max(self.reset_timeout - (time.monotonic() - self._opened_at), 0.0)
+            return {
+                'state': self._state,
+                'consecutive_failures': self._failures,
+                'failure_threshold': self.failure_threshold,
+                'retry_in_seconds': round(retry_in, 1),
+                **self._counters,
+            }
+
+
+# One breaker per Odoo server and database, shared by sync and async clients
+_breakers: Dict[Tuple[str, str], CircuitBreaker] = {}
+_breakers_lock = threading.Lock()
+
+
+def get_circuit_breaker(config) -> Optional[CircuitBreaker]:
+    """
+    Get the shared circuit breaker for an Odoo server.
+
+    Args:
+        config: OdooConfig identifying the server and database
+
+    Returns:
+        CircuitBreaker instance, or None if circuit breaking is disabled
+    """
+    if not settings.odoo_breaker_enabled:
+        return None
+    key = (config.url, config.database)
+    with _breakers_lock:
+        if key not in _breakers:
+            _breakers[key] = CircuitBreaker()
+        return _breakers[key]
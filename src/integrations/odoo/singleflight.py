@@ -0,0 +1,160 @@
+"""
+Single-Flight Call Coalescing
+
+Collapses identical concurrent Odoo reads into one RPC.
+
+When a call with the same key is already in flight, later callers wait for
+that call's result instead of issuing a duplicate request. SingleFlight serves
+threaded callers (OdooClient), AsyncSingleFlight serves coroutines on a single
+event loop (AsyncOdooClient).
+"""
+
+import asyncio
+import copy
+import threading
+from concurrent.futures import Future
+from typing import Any, Awaitable, Callable, Dict, Tuple
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class SingleFlight:
+    """
+    Coalesce identical concurrent calls made from multiple threads.
+
+    The first caller for a key (the leader) runs the call; callers arriving
+    while it is in flight block on the same future. Followers receive a deep
+    copy of the result so they can mutate it independently; exceptions are
+    re-raised in every caller.
+
+    Usage:
+        flights = SingleFlight()
+        records = flights.do(key, 'hr.leave', lambda: client._call(...))
+    """
+
+    def __init__(self):
+        """Initialize with no calls in flight."""
+        self._calls: Dict[str, Tuple[str, Future]] = {}
+        self._lock = threading.Lock()
+        self._counters: Dict[str, int] = {'leaders': 0, 'coalesced': 0}
+
+    def do(self, key: str, model: str, fn: Callable[[], Any]) -> Any:
+        """
+        Run fn, or join an identical call already in flight.
+
+        Args:
+            key: Canonical call key
+            model: Odoo model name (used by forget_model)
+            fn: Zero-argument callable performing the call
+
+        Returns:
+            The call's result
+        """
+        with self._lock:
+            entry = self._calls.get(key)
+            if entry is None:
+                future: Future = Future()
+                self._calls[key] = (model, future)
+                self._counters['leaders'] += 1
+                leader = True
+            else:
+                future = entry[1]
+                self._counters['coalesced'] += 1
+                leader = False
+
+        if not leader:
+            return copy.deepcopy(future.result())
+
+        try:
+            result = fn()
+        except BaseException as e:
+            self._finish(key, future)
+            future.set_exception(e)
+            raise
+        self._finish(key, future)
+        future.set_result(result)
+        return result
+
+    def _finish(self, key: str, future: Future) -> None:
+        """Remove a completed call unless forget_model() already did."""
+        with self._lock:
+            entry = self._calls.get(key)
+            if entry is not None and entry[1] is future:
+                del self._calls[key]
+
+    def forget_model(self, model: str) -> None:
+        """
+        Stop handing out in-flight reads of a model to new callers.
+
+        Called after a write so later reads are not served data fetched
+        before it. Calls already waiting still receive their result.
+        """
+        with self._lock:
+            for key in [k for k, (m, _) in self._calls.items() if m == model]:
+                del self._calls[key]
+
+    def stats(self) -> Dict[str, int]:
+        """Get leader/coalesced counters and the number of calls in flight."""
+        with self._lock:
+            return {**self._counters, 'in_flight': len(self._calls)}
+
+
+class AsyncSingleFlight:
+    """
+    Coalesce identical concurrent calls made from coroutines.
+
+    The leader's call runs as its own task, and every caller awaits it
+    through asyncio.shield, so cancelling one waiting request does not
+    cancel the shared call for the others.
+
+    Usage:
+        flights = AsyncSingleFlight()
+        records = await flights.do(key, 'hr.leave', lambda: client._call(...))
+    """
+
+    def __init__(self):
+        """Initialize with no calls in flight."""
+        self._calls: Dict[str, Tuple[str, asyncio.Task]] = {}
+        self._counters: Dict[str, int] = {'leaders': 0, 'coalesced': 0}
+
+    async def do(self, key: str, model: str, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Await fn(), or join an identical call already in flight.
+
+        Args:
+            key: Canonical call key
+            model: Odoo model name (used by forget_model)
+            fn: Zero-argument coroutine function performing the call
+
+        Returns:
+            The call's result
+        """
+        entry = self._calls.get(key)
+        if entry is not None:
+            self._counters['coalesced'] += 1
+            return copy.deepcopy(await asyncio.shield(entry[1]))
+
+        task = asyncio.ensure_future(fn())
+        self._calls[key] = (model, task)
+        self._counters['leaders'] += 1
+
+        def finish(done: asyncio.Task) -> None:
+            current = self._calls.get(key)
+            if current is not None and current[1] is done:
+                del self._calls[key]
+            if not done.cancelled():
+                # Mark the exception retrieved when every waiter was cancelled
+                done.exception()
+
+        task.add_done_callback(finish)
+        return await asyncio.shield(task)
+
+    def forget_model(self, model: str) -> None:
+        """Stop handing out in-flight reads of a model. See SingleFlight.forget_model."""
+        for key in [k for k, (m, _) in self._calls.items() if m == model]:
+            del self._calls[key]
+
+    def stats(self) -> Dict[str, int]:
+        """Get leader/coalesced counters and the number of calls in flight."""
+        return {**self._counters, 'in_flight': len(self._calls)}
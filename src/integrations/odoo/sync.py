@@ -0,0 +1,80 @@
+"""
+Odoo Sync Helpers
+
+Shared by the local mirror and the ledger cache, which both keep a copy of
+Odoo data current by polling on write_date:
+
+- write_date helpers for the incremental polls (highest seen value, and the
+  overlap re-read before it for transactions that committed late)
+- a registry of the running syncers by Odoo connection identity
+"""
+
+import threading
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+# Seconds re-read before the last seen write_date on each poll
+WRITE_DATE_OVERLAP = 60
+
+WRITE_DATE_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+
+def max_write_date(values: Iterable[Optional[str]], current: Optional[str]) -> Optional[str]:
+    """Get the highest write_date among values and the current value."""
+    dates = [value for value in values if value]
+    if current:
+        dates.append(current)
+    return max(dates) if dates else None
+
+
+def poll_since(last_write_date: Optional[str]) -> Optional[str]:
+    """Get the write_date a poll starts from: the last seen one, less the overlap."""
+    if not last_write_date:
+        return last_write_date
+    try:
+        since = datetime.fromisoformat(last_write_date) - timedelta(seconds=WRITE_DATE_OVERLAP)
+    except ValueError:
+        return last_write_date
+    return since.strftime(WRITE_DATE_FORMAT)
+
+
+class ConnectionRegistry:
+    """
+    Running syncers by Odoo connection identity.
+
+    A syncer is anything with a client (whose config identifies the
+    connection) and start() and stop() methods.
+    """
+
+    def __init__(self):
+        self._running: Dict[Tuple[str, str, str], Any] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(config) -> Tuple[str, str, str]:
+        return (config.url, config.database, config.username)
+
+    def get(self, config) -> Optional[Any]:
+        """Get the running syncer for an Odoo connection, or None."""
+        if not self._running:
+            return None
+        return self._running.get(self._key(config))
+
+    def start(self, syncer: Any) -> Any:
+        """Start a syncer, stopping any other one running for its connection."""
+        key = self._key(syncer.client.config)
+        with self._lock:
+            previous = self._running.get(key)
+            if previous is not None and previous is not syncer:
+                previous.stop()
+            self._running[key] = syncer
+        syncer.start()
+        return syncer
+
+    def stop_all(self) -> None:
+        """Stop every running syncer."""
+        with self._lock:
+            running: List[Any] = list(self._running.values())
+            self._running.clear()
+        for syncer in running:
+            syncer.stop()
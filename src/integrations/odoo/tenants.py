@@ -0,0 +1,118 @@
+"""
+Odoo Tenants
+
+Selects the Odoo connection used by get_odoo_client() and
+get_async_odoo_client() when one process serves several companies.
+
+Tenants are configured in ODOO_TENANTS, a JSON map of tenant name to
+connection settings (url, db, username, password, transport, ...); keys
+left out fall back to the ODOO_* settings, which also form the 'default'
+tenant. Each tenant's connection gets its own shared client, and with it
+its own connection pool, metadata registry, result cache and mirror.
+
+The active tenant is held in a context variable, so it follows a request,
+an agent run or a Telegram update through awaits and into worker threads
+started with asyncio.to_thread:
+
+    with use_tenant('acme'):
+        FinanceOperations().get_financial_summary()  # acme's Odoo
+
+The API selects the tenant from the ODOO_TENANT_HEADER request header, the
+Telegram bot from ODOO_TELEGRAM_TENANTS.
+"""
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import fields as dataclass_fields
+from typing import Iterator, List, Optional, Union
+
+from src.config import settings
+from src.core.exceptions import OdooTenantError
+from src.integrations.odoo.client import OdooConfig
+
+DEFAULT_TENANT = 'default'
+
+# Settings keys named after the ODOO_* variables rather than OdooConfig fields
+_KEY_ALIASES = {'db': 'database'}
+_CONFIG_FIELDS = frozenset(f.name for f in dataclass_fields(OdooConfig))
+
+_current_tenant: ContextVar[str] = ContextVar('odoo_tenant', default=DEFAULT_TENANT)
+
+
+def tenant_names() -> List[str]:
+    """Get the configured tenant names, 'default' first."""
+    return [DEFAULT_TENANT] + sorted(name for name in settings.odoo_tenants if name != DEFAULT_TENANT)
+
+
+def tenant_config(name: str = DEFAULT_TENANT) -> OdooConfig:
+    """
+    Get the Odoo connection of a tenant.
+
+    Args:
+        name: Tenant name
+
+    Returns:
+        OdooConfig built from the tenant's settings over the ODOO_* settings
+
+    Raises:
+        OdooTenantError: If the tenant is unknown or has unknown settings
+    """
+    overrides = settings.odoo_tenants.get(name)
+    if overrides is None:
+        if name == DEFAULT_TENANT:
+            return OdooConfig.from_settings()
+        raise OdooTenantError(f"Unknown Odoo tenant '{name}'", details={'tenant': name})
+    values = {_KEY_ALIASES.get(key, key): value for key, value in overrides.items()}
+    unknown = sorted(set(values) - _CONFIG_FIELDS)
+    if unknown:
+        raise OdooTenantError(
+            f"Odoo tenant '{name}' has unknown settings: {', '.join(unknown)}",
+            details={'tenant': name, 'unknown': unknown}
+        )
+    return OdooConfig.from_settings(**values)
+
+
+def current_tenant() -> str:
+    """Get the active tenant name."""
+    return _current_tenant.get()
+
+
+def current_tenant_config() -> OdooConfig:
+    """Get the active tenant's Odoo connection."""
+    return tenant_config(_current_tenant.get())
+
+
+@contextmanager
+def use_tenant(name: Optional[str]) -> Iterator[str]:
+    """
+    Make a tenant active for the enclosed code.
+
+    Args:
+        name: Tenant name ('default' if empty)
+
+    Yields:
+        The active tenant name
+
+    Raises:
+        OdooTenantError: If the tenant is unknown
+    """
+    name = name or DEFAULT_TENANT
+    tenant_config(name)
+    token = _current_tenant.set(name)
+    try:
+        yield name
+    finally:
+        _current_tenant.reset(token)
+
+
+def tenant_for_telegram_user(user_id: Union[int, str]) -> str:
+    """
+    Get the tenant a Telegram user works in.
+
+    Args:
+        user_id: Telegram user id
+
+    Returns:
+        Tenant from ODOO_TELEGRAM_TENANTS, or 'default' for unmapped users
+    """
+    return settings.odoo_telegram_tenants.get(str(user_id), DEFAULT_TENANT)
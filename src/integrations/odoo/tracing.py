@@ -0,0 +1,295 @@
+"""
+Odoo Call Tracing
+
+Request-scoped tracing of Odoo calls with N+1 detection and call budgets.
+
+A trace is opened around a logical unit of work (an API request, an agent
+tool call, a scheduler job) and lives in a context variable, so every Odoo
+call made inside it, including on fan-out worker threads, is counted. Calls
+to the same model and method whose arguments differ only in an id filter
+are flagged as a likely N+1 pattern. An optional call budget logs or raises
+once the trace issues more calls than allowed.
+
+A trace counts logical calls, not round trips: a read answered from the
+result cache, by joining another caller's in-flight request or from the
+local mirror counts exactly like one sent to Odoo, so budgets and N+1
+findings do not depend on how warm the caches happen to be. Reports served
+entirely from the ledger make no client calls and add nothing.
+
+Usage:
+    with odoo_trace('GET /api/v1/finance/summary', budget=10) as trace:
+        ops.get_financial_summary()
+    trace.assert_within_budget()
+    trace.assert_no_n_plus_one()
+"""
+
+import functools
+import inspect
+import json
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set
+import logging
+
+from src.config import settings
+from src.core.exceptions import OdooCallBudgetExceeded
+from src.integrations.odoo.instrumentation import detect_caller
+
+logger = logging.getLogger(__name__)
+
+
+# Operators whose value is treated as an id filter when comparing call shapes
+ID_OPERATORS = frozenset({'=', 'in'})
+
+# Methods whose first positional argument is a list of record ids
+ID_METHODS = frozenset({'read', 'write', 'unlink'})
+
+_current_trace: ContextVar[Optional["OdooTrace"]] = ContextVar('odoo_trace', default=None)
+
+
+def _is_id_field(name: Any) -> bool:
+    """Check if a domain field name refers to a record id."""
+    return isinstance(name, str) and (name == 'id' or name.endswith('_id') or name.endswith('.id'))
+
+
+def _mask_domain(domain: Any) -> Any:
+    """Replace the values of id conditions in a domain with a placeholder."""
+    if not isinstance(domain, (list, tuple)):
+        return domain
+    masked = []
+    for leaf in domain:
+        if (
+            isinstance(leaf, (list, tuple)) and len(leaf) == 3
+            and _is_id_field(leaf[0]) and leaf[1] in ID_OPERATORS
+        ):
+            masked.append([leaf[0], leaf[1], '?'])
+        else:
+            masked.append(leaf)
+    return masked
+
+
+def call_shape(model: str, method: str, args: tuple, kwargs: Dict[str, Any]) -> str:
+    """
+    Get the shape of a call: its canonical form with id filters masked.
+
+    Two calls with the same shape but different arguments differ only in
+    which records they target.
+    """
+    args = list(args)
+    if args:
+        args[0] = '?' if method in ID_METHODS else _mask_domain(args[0])
+    return json.dumps([model, method, args, kwargs], sort_keys=True, default=str)
+
+
+@dataclass
+class NPlusOne:
+    """A repeated call pattern flagged by a trace."""
+    model: str
+    method: str
+    operation: str
+    count: int = 0
+
+
+@dataclass
+class OdooTrace:
+    """
+    Odoo calls made within one logical operation.
+
+    Attributes:
+        name: Operation name (e.g. 'GET /api/v1/employees' or 'tool:get_financial_summary')
+        budget: Maximum calls allowed (None for no budget)
+        on_exceed: 'log' or 'raise' when the budget is exceeded
+        n_plus_one_threshold: Repeats of one call shape that count as N+1
+        parent: Enclosing trace, which also receives every call
+    """
+    name: str
+    budget: Optional[int] = None
+    on_exceed: str = 'log'
+    n_plus_one_threshold: int = 5
+    parent: Optional["OdooTrace"] = None
+    call_count: int = 0
+    calls_by_operation: Dict[str, int] = field(default_factory=dict)
+    calls_by_model: Dict[str, int] = field(default_factory=dict)
+    n_plus_one: List[NPlusOne] = field(default_factory=list)
+    _shapes: Dict[str, Set[str]] = field(default_factory=dict, repr=False)
+    _flagged: Dict[str, NPlusOne] = field(default_factory=dict, repr=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def record(
+        self,
+        model: str,
+        method: str,
+        args: tuple,
+        kwargs: Dict[str, Any],
+        operation: str = ''
+    ) -> None:
+        """
+        Record a call in this trace and its parents.
+
+        Raises:
+            OdooCallBudgetExceeded: If a budget with on_exceed='raise' is exceeded
+        """
+        error = None
+        trace = self
+        while trace is not None:
+            try:
+                trace._record(model, method, args, kwargs, operation)
+            except OdooCallBudgetExceeded as e:
+                error = error or e
+            trace = trace.parent
+        if error is not None:
+            raise error
+
+    def _record(
+        self,
+        model: str,
+        method: str,
+        args: tuple,
+        kwargs: Dict[str, Any],
+        operation: str
+    ) -> None:
+        """Record a call in this trace only."""
+        shape = call_shape(model, method, args, kwargs)
+        key = json.dumps([args, kwargs], sort_keys=True, default=str)
+        newly_flagged = None
+        with self._lock:
+            self.call_count += 1
+            count = self.call_count
+            label = operation or '(direct)'
+            self.calls_by_operation[label] = self.calls_by_operation.get(label, 0) + 1
+            self.calls_by_model[model] = self.calls_by_model.get(model, 0) + 1
+
+            variants = self._shapes.setdefault(shape, set())
+            variants.add(key)
+            if shape in self._flagged:
+                self._flagged[shape].count = len(variants)
+            elif len(variants) >= self.n_plus_one_threshold:
+                newly_flagged = NPlusOne(model, method, operation, len(variants))
+                self._flagged[shape] = newly_flagged
+                self.n_plus_one.append(newly_flagged)
+
+        if newly_flagged is not None:
+            logger.warning(
+                f"Possible N+1 in {self.name}: {model}.{method} called "
+                f"{newly_flagged.count}+ times with only the id filter changing"
+                + (f" (from {operation})" if operation else "")
+            )
+
+        if self.budget is not None and count > self.budget:
+            message = f"Odoo call budget exceeded in {self.name}: more than {self.budget} calls"
+            if self.on_exceed == 'raise':
+                raise OdooCallBudgetExceeded(
+                    message,
+                    details={'trace': self.name, 'budget': self.budget, 'calls': count}
+                )
+            if count == self.budget + 1:
+                logger.warning(message)
+
+    @property
+    def over_budget(self) -> bool:
+        """Check if the trace made more calls than its budget."""
+        return self.budget is not None and self.call_count > self.budget
+
+    def assert_within_budget(self, budget: Optional[int] = None) -> None:
+        """
+        Assert the trace stayed within a budget (for tests).
+
+        Args:
+            budget: Budget to check against. Uses the trace's budget if not provided.
+        """
+        limit = self.budget if budget is None else budget
+        assert limit is None or self.call_count <= limit, (
+            f"{self.name} made {self.call_count} Odoo calls, budget is {limit}: "
+            f"{self.calls_by_operation}"
+        )
+
+    def assert_no_n_plus_one(self) -> None:
+        """Assert no N+1 call pattern was flagged (for tests)."""
+        assert not self.n_plus_one, f"N+1 Odoo calls in {self.name}: {self.n_plus_one}"
+
+    def summary(self) -> Dict[str, Any]:
+        """Get call counts and flagged patterns."""
+        with self._lock:
+            return {
+                'name': self.name,
+                'calls': self.call_count,
+                'budget': self.budget,
+                'by_operation': dict(self.calls_by_operation),
+                'by_model': dict(self.calls_by_model),
+                'n_plus_one': [vars(p).copy() for p in self.n_plus_one],
+            }
+
+
+def current_trace() -> Optional[OdooTrace]:
+    """Get the active trace, if any."""
+    return _current_trace.get()
+
+
+def trace_call(model: str, method: str, args: tuple, kwargs: Dict[str, Any]) -> None:
+    """Record a call in the active trace (no-op without one)."""
+    trace = _current_trace.get()
+    if trace is not None:
+        trace.record(model, method, args, kwargs, operation=detect_caller()[0])
+
+
+@contextmanager
+def odoo_trace(
+    name: str,
+    budget: Optional[int] = None,
+    on_exceed: Optional[str] = None
+) -> Iterator[OdooTrace]:
+    """
+    Trace Odoo calls made within a block.
+
+    Args:
+        name: Operation name
+        budget: Maximum calls allowed. Uses settings if not provided (0 = none).
+        on_exceed: 'log' or 'raise'. Uses settings if not provided.
+
+    Yields:
+        The active OdooTrace
+    """
+    if budget is None:
+        budget = settings.odoo_call_budget or None
+    trace = OdooTrace(
+        name=name,
+        budget=budget,
+        on_exceed=on_exceed or settings.odoo_call_budget_action,
+        n_plus_one_threshold=settings.odoo_n_plus_one_threshold,
+        parent=_current_trace.get()
+    )
+    token = _current_trace.set(trace)
+    try:
+        yield trace
+    finally:
+        _current_trace.reset(token)
+        if trace.call_count:
+            logger.debug(f"{name}: {trace.call_count} Odoo calls {trace.calls_by_operation}")
+
+
+def traced(name: Optional[str] = None) -> Callable:
+    """
+    Decorator running a function (sync or async) inside an odoo_trace.
+
+    Args:
+        name: Operation name. Uses the function's qualified name if not provided.
+    """
+    def decorator(func: Callable) -> Callable:
+        trace_name = name or func.__qualname__
+
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                with odoo_trace(trace_name):
+                    return await func(*args, **kwargs)
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with odoo_trace(trace_name):
+                return func(*args, **kwargs)
+        return wrapper
+
+    return decorator
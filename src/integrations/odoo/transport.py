@@ -0,0 +1,529 @@
+"""
+Odoo RPC Transports
+
+Pluggable wire protocols for talking to Odoo:
+
+- xmlrpc: /xmlrpc/2/common and /xmlrpc/2/object (default, works everywhere)
+- jsonrpc: stateless /jsonrpc endpoint, same credentials per call but JSON encoding
+- jsonrpc-session: /web/session/authenticate once, then /web/dataset/call_kw
+  with the session cookie so credentials are not resent on every call
+
+Each transport builds requests and parses responses without doing I/O itself,
+so the same protocol code serves the blocking OdooClient and the AsyncOdooClient.
+
+Responses are negotiated as gzip or deflate (config.compression) and inflated
+here rather than by the HTTP library, so wire and payload sizes and the time
+spent inflating are measured the same way on both clients. Request bodies of
+at least config.request_compression_min_bytes are sent gzip-compressed; Odoo
+itself does not inflate request bodies, so only enable this behind a reverse
+proxy that does (e.g. Apache with mod_deflate as an input filter).
+"""
+
+import gzip
+import http.client
+import itertools
+import json
+import threading
+import time
+import xmlrpc.client
+import zlib
+from dataclasses import dataclass, field, asdict
+from typing import Any, Dict, List, Mapping, Optional, Type
+import logging
+
+from src.integrations.odoo.instrumentation import record_response_size
+from src.integrations.odoo.pool import HTTPConnectionPool, PoolResponse
+
+logger = logging.getLogger(__name__)
+
+ACCEPT_ENCODING = 'gzip, deflate'
+
+# gzip level for request bodies; low levels already shrink XML/JSON several
+# times over at a fraction of the CPU cost of the default (9)
+REQUEST_COMPRESSION_LEVEL = 5
+
+
+class JsonRpcFault(xmlrpc.client.Fault):
+    """
+    Error returned by a JSON-RPC endpoint.
+
+    Subclasses xmlrpc.client.Fault so callers handle faults the same way
+    regardless of the transport in use.
+    """
+
+    def __init__(self, error: Dict[str, Any]):
+        data = error.get('data') or {}
+        self.error_name = data.get('name', '')
+        super().__init__(
+            error.get('code', 0),
+            data.get('message') or error.get('message', 'Unknown JSON-RPC error')
+        )
+
+    @property
+    def session_expired(self) -> bool:
+        """Check if the fault means the web session is no longer valid."""
+        return 'SessionExpired' in self.error_name
+
+
+class HTTPStatusError(http.client.HTTPException):
+    """Non-success HTTP status from an Odoo endpoint."""
+
+    def __init__(self, status: int, reason: str, path: str):
+        self.status = status
+        super().__init__(f"HTTP {status} {reason} from {path}")
+
+
+class ContentEncodingError(http.client.HTTPException):
+    """Response body with an unsupported or corrupt Content-Encoding."""
+
+    def __init__(self, encoding: str, reason: str = 'unsupported'):
+        self.encoding = encoding
+        super().__init__(f"Cannot decode Odoo response with Content-Encoding '{encoding}': {reason}")
+
+
+@dataclass
+class RpcRequest:
+    """A fully encoded HTTP request for an Odoo endpoint."""
+    path: str
+    body: bytes
+    headers: Dict[str, str] = field(default_factory=dict)
+
+
+@dataclass
+class TransportStats:
+    """
+    Cumulative wire statistics for a transport.
+
+    bytes_sent/bytes_received count what crossed the network (compressed
+    where compression applied); payload_bytes_* count the encoded XML/JSON.
+    """
+    calls: int = 0
+    bytes_sent: int = 0
+    bytes_received: int = 0
+    payload_bytes_sent: int = 0
+    payload_bytes_received: int = 0
+    encode_seconds: float = 0.0
+    decode_seconds: float = 0.0
+    compress_seconds: float = 0.0
+    decompress_seconds: float = 0.0
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Get the current counters as a dictionary, with compression ratios."""
+        result = asdict(self)
+        result['request_compression_ratio'] = _ratio(self.payload_bytes_sent, self.bytes_sent)
+        result['response_compression_ratio'] = _ratio(self.payload_bytes_received, self.bytes_received)
+        return result
+
+    def reset(self) -> None:
+        """Reset all counters to zero."""
+        self.calls = 0
+        self.bytes_sent = 0
+        self.bytes_received = 0
+        self.payload_bytes_sent = 0
+        self.payload_bytes_received = 0
+        self.encode_seconds = 0.0
+        self.decode_seconds = 0.0
+        self.compress_seconds = 0.0
+        self.decompress_seconds = 0.0
+
+
+def _ratio(payload: int, wire: int) -> float:
+    """Get payload bytes per wire byte (1.0 when nothing was compressed)."""
+    return round(payload / wire, 2) if wire else 1.0
+
+
+# ==================== Compression ====================
+
+def compress_body(body: bytes) -> bytes:
+    """Gzip a request body."""
+    return gzip.compress(body, compresslevel=REQUEST_COMPRESSION_LEVEL, mtime=0)
+
+
+def decompress_body(body: bytes, content_encoding: str) -> bytes:
+    """
+    Undo the Content-Encoding of a response body.
+
+    Args:
+        body: Body as received
+        content_encoding: Value of the Content-Encoding header (may list several codings)
+
+    Returns:
+        The decoded body
+
+    Raises:
+        ContentEncodingError: For codings other than gzip, deflate and identity, or corrupt data
+    """
+    # Codings are listed in the order they were applied; undo them in reverse
+    for coding in reversed([c.strip().lower() for c in content_encoding.split(',') if c.strip()]):
+        try:
+            if coding in ('gzip', 'x-gzip'):
+                body = gzip.decompress(body)
+            elif coding == 'deflate':
+                try:
+                    body = zlib.decompress(body)
+                except zlib.error:
+                    # Some servers send raw deflate without the zlib wrapper
+                    body = zlib.decompress(body, -zlib.MAX_WBITS)
+            elif coding != 'identity':
+                raise ContentEncodingError(coding)
+        except (OSError, EOFError, zlib.error) as e:
+            raise ContentEncodingError(coding, str(e))
+    return body
+
+
+class OdooTransport:
+    """
+    Base class for Odoo wire protocols.
+
+    Subclasses implement the request builders and parse_payload(); the
+    blocking I/O helpers (authenticate, execute_kw, version) are shared.
+    """
+
+    name = 'base'
+
+    def __init__(self, config):
+        """
+        Initialize transport.
+
+        Args:
+            config: OdooConfig with url, database and credentials
+        """
+        self.config = config
+        self.stats = TransportStats()
+        self._stats_lock = threading.Lock()
+        self._pool_lock = threading.Lock()
+        self._pool: Optional[HTTPConnectionPool] = None
+
+    # ==================== Protocol ====================
+
+    def authenticate_request(self) -> RpcRequest:
+        """Build the authentication request."""
+        raise NotImplementedError
+
+    def parse_uid(self, result: Any) -> Optional[int]:
+        """Extract the user ID from an authentication result."""
+        return result or None
+
+    def execute_request(
+        self,
+        uid: int,
+        model: str,
+        method: str,
+        args: List[Any],
+        kwargs: Dict[str, Any]
+    ) -> RpcRequest:
+        """Build a model method call request."""
+        raise NotImplementedError
+
+    def version_request(self) -> RpcRequest:
+        """Build the server version request."""
+        raise NotImplementedError
+
+    def parse_payload(self, body: bytes) -> Any:
+        """Decode a response body, raising a Fault on remote errors."""
+        raise NotImplementedError
+
+    def handle_response_headers(self, headers: Mapping[str, str]) -> None:
+        """Inspect response headers (e.g. to capture a session cookie)."""
+
+    def should_reauthenticate(self, error: Exception) -> bool:
+        """Check if a failed call should be retried after re-authenticating."""
+        return False
+
+    def encode(self, request_builder, *args) -> RpcRequest:
+        """Build a request, compressing it if large enough, while recording time and size."""
+        started = time.perf_counter()
+        request = request_builder(*args)
+        encoded = time.perf_counter()
+        payload_size = len(request.body)
+
+        request.headers['Accept-Encoding'] = ACCEPT_ENCODING if self.config.compression else 'identity'
+        min_bytes = self.config.request_compression_min_bytes
+        if min_bytes and payload_size >= min_bytes:
+            request.body = compress_body(request.body)
+            request.headers['Content-Encoding'] = 'gzip'
+        compressed = time.perf_counter()
+
+        with self._stats_lock:
+            self.stats.calls += 1
+            self.stats.bytes_sent += len(request.body)
+            self.stats.payload_bytes_sent += payload_size
+            self.stats.encode_seconds += encoded - started
+            self.stats.compress_seconds += compressed - encoded
+        return request
+
+    def parse_response(self, body: bytes, content_encoding: str = '') -> Any:
+        """
+        Decode a response body while recording decode time and size.
+
+        Args:
+            body: Body as received
+            content_encoding: Value of the response's Content-Encoding header
+
+        Returns:
+            Decoded result
+        """
+        wire_size = len(body)
+        started = time.perf_counter()
+        if content_encoding:
+            body = decompress_body(body, content_encoding)
+        decompressed = time.perf_counter()
+        try:
+            return self.parse_payload(body)
+        finally:
+            finished = time.perf_counter()
+            with self._stats_lock:
+                self.stats.bytes_received += wire_size
+                self.stats.payload_bytes_received += len(body)
+                self.stats.decompress_seconds += decompressed - started
+                self.stats.decode_seconds += finished - decompressed
+            record_response_size(len(body), wire_size, decompressed - started)
+
+    # ==================== Blocking I/O ====================
+
+    @property
+    def pool(self) -> HTTPConnectionPool:
+        """Get keep-alive connection pool (lazy initialization)."""
+        if self._pool is None:
+            with self._pool_lock:
+                if self._pool is None:
+                    self._pool = HTTPConnectionPool(
+                        self.config.url,
+                        max_size=self.config.max_connections,
+                        timeout=self.config.timeout,
+                        idle_timeout=self.config.idle_timeout
+                    )
+        return self._pool
+
+    def _post(self, request: RpcRequest, timeout: Optional[float] = None) -> PoolResponse:
+        """POST a request on a pooled connection and return the response."""
+        response = self.pool.request(
+            'POST', request.path, request.body, request.headers, timeout=timeout
+        )
+        self.handle_response_headers(response.headers)
+        if response.status >= 400:
+            raise HTTPStatusError(response.status, response.reason, request.path)
+        return response
+
+    def send(self, request: RpcRequest, timeout: Optional[float] = None) -> Any:
+        """Send a request and decode its response."""
+        response = self._post(request, timeout)
+        return self.parse_response(response.body, response.headers.get('Content-Encoding', ''))
+
+    def authenticate(self) -> Optional[int]:
+        """Authenticate and return the user ID (None if rejected)."""
+        return self.parse_uid(self.send(self.encode(self.authenticate_request)))
+
+    def execute_kw(
+        self,
+        uid: int,
+        model: str,
+        method: str,
+        args: List[Any],
+        kwargs: Dict[str, Any],
+        timeout: Optional[float] = None
+    ) -> Any:
+        """Call a model method."""
+        request = self.encode(self.execute_request, uid, model, method, args, kwargs)
+        try:
+            return self.send(request, timeout)
+        except Exception as e:
+            if not self.should_reauthenticate(e):
+                raise
+            logger.info("Odoo session expired, re-authenticating")
+            self.authenticate()
+            request = self.encode(self.execute_request, uid, model, method, args, kwargs)
+            return self.send(request, timeout)
+
+    def version(self) -> Dict[str, Any]:
+        """Get server version information."""
+        return self.send(self.encode(self.version_request))
+
+    def close(self) -> None:
+        """Close pooled connections."""
+        if self._pool is not None:
+            self._pool.close()
+
+
+class XmlRpcTransport(OdooTransport):
+    """XML-RPC over /xmlrpc/2 (Odoo's external API)."""
+
+    name = 'xmlrpc'
+
+    def _xml_request(self, service: str, method: str, params: tuple) -> RpcRequest:
+        body = xmlrpc.client.dumps(params, method, allow_none=True)
+        return RpcRequest(
+            path=f'/xmlrpc/2/{service}',
+            body=body.encode('utf-8'),
+            headers={'Content-Type': 'text/xml'}
+        )
+
+    def authenticate_request(self) -> RpcRequest:
+        return self._xml_request('common', 'authenticate', (
+            self.config.database,
+            self.config.username,
+            self.config.password,
+            {}
+        ))
+
+    def execute_request(self, uid, model, method, args, kwargs) -> RpcRequest:
+        return self._xml_request('object', 'execute_kw', (
+            self.config.database,
+            uid,
+            self.config.password,
+            model,
+            method,
+            args,
+            kwargs
+        ))
+
+    def version_request(self) -> RpcRequest:
+        return self._xml_request('common', 'version', ())
+
+    def parse_payload(self, body: bytes) -> Any:
+        result, _ = xmlrpc.client.loads(body)
+        return result[0]
+
+
+class JsonRpcTransport(OdooTransport):
+    """JSON-RPC over the stateless /jsonrpc endpoint."""
+
+    name = 'jsonrpc'
+
+    def __init__(self, config):
+        super().__init__(config)
+        self._ids = itertools.count(1)
+
+    def _json_request(self, path: str, params: Dict[str, Any]) -> RpcRequest:
+        payload = {
+            'jsonrpc': '2.0',
+            'method': 'call',
+            'params': params,
+            'id': next(self._ids),
+        }
+        return RpcRequest(
+            path=path,
+            body=json.dumps(payload, separators=(',', ':')).encode('utf-8'),
+            headers={'Content-Type': 'application/json'}
+        )
+
+    def _service_request(self, service: str, method: str, args: List[Any]) -> RpcRequest:
+        return self._json_request('/jsonrpc', {
+            'service': service,
+            'method': method,
+            'args': args,
+        })
+
+    def authenticate_request(self) -> RpcRequest:
+        return self._service_request('common', 'authenticate', [
+            self.config.database,
+            self.config.username,
+            self.config.password,
+            {}
+        ])
+
+    def execute_request(self, uid, model, method, args, kwargs) -> RpcRequest:
+        return self._service_request('object', 'execute_kw', [
+            self.config.database,
+            uid,
+            self.config.password,
+            model,
+            method,
+            args,
+            kwargs
+        ])
+
+    def version_request(self) -> RpcRequest:
+        return self._service_request('common', 'version', [])
+
+    def parse_payload(self, body: bytes) -> Any:
+        response = json.loads(body)
+        if response.get('error'):
+            raise JsonRpcFault(response['error'])
+        return response.get('result')
+
+
+class JsonRpcSessionTransport(JsonRpcTransport):
+    """
+    JSON-RPC over Odoo's web session endpoints.
+
+    Authenticates once through /web/session/authenticate and sends subsequent
+    calls to /web/dataset/call_kw with the session cookie. Expired sessions are
+    renewed transparently. Note that some Odoo versions only accept a real
+    password (not an API key) for web session login.
+    """
+
+    name = 'jsonrpc-session'
+
+    def __init__(self, config):
+        super().__init__(config)
+        self.session_id: Optional[str] = None
+
+    def _session_headers(self, request: RpcRequest) -> RpcRequest:
+        if self.session_id:
+            request.headers['Cookie'] = f'session_id={self.session_id}'
+        return request
+
+    def authenticate_request(self) -> RpcRequest:
+        return self._json_request('/web/session/authenticate', {
+            'db': self.config.database,
+            'login': self.config.username,
+            'password': self.config.password,
+        })
+
+    def parse_uid(self, result: Any) -> Optional[int]:
+        return (result or {}).get('uid') or None
+
+    def execute_request(self, uid, model, method, args, kwargs) -> RpcRequest:
+        request = self._json_request(f'/web/dataset/call_kw/{model}/{method}', {
+            'model': model,
+            'method': method,
+            'args': args,
+            'kwargs': kwargs,
+        })
+        return self._session_headers(request)
+
+    def version_request(self) -> RpcRequest:
+        return self._json_request('/web/webclient/version_info', {})
+
+    def handle_response_headers(self, headers: Mapping[str, str]) -> None:
+        items = headers.multi_items() if hasattr(headers, 'multi_items') else headers.items()
+        for name, value in items:
+            if name.lower() != 'set-cookie':
+                continue
+            cookie = value.split(';', 1)[0].strip()
+            if cookie.startswith('session_id='):
+                self.session_id = cookie[len('session_id='):]
+
+    def should_reauthenticate(self, error: Exception) -> bool:
+        return isinstance(error, JsonRpcFault) and error.session_expired
+
+
+TRANSPORTS: Dict[str, Type[OdooTransport]] = {
+    XmlRpcTransport.name: XmlRpcTransport,
+    JsonRpcTransport.name: JsonRpcTransport,
+    JsonRpcSessionTransport.name: JsonRpcSessionTransport,
+}
+
+
+def create_transport(config) -> OdooTransport:
+    """
+    Create the transport selected by config.transport.
+
+    Args:
+        config: OdooConfig instance
+
+    Returns:
+        Transport instance
+
+    Raises:
+        ValueError: If the transport name is unknown
+    """
+    try:
+        transport_class = TRANSPORTS[config.transport]
+    except KeyError:
+        raise ValueError(
+            f"Unknown Odoo transport '{config.transport}'. "
+            f"Choose one of: {', '.join(TRANSPORTS)}"
+        )
+    return transport_class(config)
@@ -21,6 +21,7 @@ from telegram.ext import (
 from src.config import settings
 from src.agents.supervisor import invoke_agent, get_last_ai_message
 from src.core.security import generate_thread_id
+from src.integrations.odoo.tenants import tenant_for_telegram_user, use_tenant
 
 logger = logging.getLogger(__name__)
 
@@ -270,11 +271,12 @@ class TelegramBotManager:
                 "username": username,
             }
 
-            result = await invoke_agent(
-                message=message_text,
-                thread_id=thread_id,
-                user_context=user_context
-            )
+            with use_tenant(tenant_for_telegram_user(user_id)):
+                result = await invoke_agent(
+                    message=message_text,
+                    thread_id=thread_id,
+                    user_context=user_context
+                )
 
             response = get_last_ai_message(result)
 
@@ -324,11 +326,12 @@ class TelegramBotManager:
             try:
                 thread_id = self._get_thread_id(user_id)
 
-                result = await invoke_agent(
-                    message=queries[data],
-                    thread_id=thread_id,
-                    user_context={"user_id": str(user_id)}
-                )
+                with use_tenant(tenant_for_telegram_user(user_id)):
+                    result = await invoke_agent(
+                        message=queries[data],
+                        thread_id=thread_id,
+                        user_context={"user_id": str(user_id)}
+                    )
 
                 response = get_last_ai_message(result)
 
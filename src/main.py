@@ -8,10 +8,12 @@ Odoo ERP integration, and Telegram bot support.
 import logging
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, PlainTextResponse
 
 from src.config import settings
+from src.core.exceptions import OdooTenantError
 from src.core.logging import setup_logging, get_logger
 from src.api.routes import (
     health_router,
@@ -22,6 +24,8 @@ from src.api.routes import (
     telegram_router
 )
 from src.api.routes.telegram import set_bot_manager
+from src.integrations.odoo.tenants import DEFAULT_TENANT, tenant_config, tenant_names, use_tenant
+from src.integrations.odoo.tracing import odoo_trace
 
 # Setup logging
 setup_logging(level=settings.log_level)
@@ -63,10 +67,33 @@ async def lifespan(app: FastAPI):
         from src.integrations.odoo.client import get_odoo_client
         client = get_odoo_client()
         client.authenticate()
+        client.metadata.load()
         logger.info("Odoo connection established")
     except Exception as e:
         logger.error(f"Failed to connect to Odoo: {e}")
 
+    # Start a local Odoo mirror per tenant (first sync runs in the background)
+    if settings.odoo_mirror_enabled:
+        from src.integrations.odoo.mirror import start_odoo_mirror
+        for tenant in tenant_names():
+            try:
+                with use_tenant(tenant):
+                    start_odoo_mirror()
+                logger.info(f"Odoo mirror started ({tenant})")
+            except Exception as e:
+                logger.error(f"Failed to start Odoo mirror ({tenant}): {e}")
+
+    # Start an in-memory ledger cache per tenant (first load runs in the background)
+    if settings.odoo_ledger_enabled:
+        from src.integrations.odoo.ledger import start_odoo_ledger
+        for tenant in tenant_names():
+            try:
+                with use_tenant(tenant):
+                    start_odoo_ledger()
+                logger.info(f"Odoo ledger cache started ({tenant})")
+            except Exception as e:
+                logger.error(f"Failed to start Odoo ledger cache ({tenant}): {e}")
+
     # Initialize agent system
     try:
         from src.agents.supervisor import get_agent_application
@@ -90,6 +117,24 @@ async def lifespan(app: FastAPI):
         except Exception as e:
             logger.error(f"Error stopping Telegram bot: {e}")
 
+    try:
+        from src.integrations.odoo.mirror import stop_odoo_mirrors
+        stop_odoo_mirrors()
+    except Exception as e:
+        logger.error(f"Error stopping Odoo mirror: {e}")
+
+    try:
+        from src.integrations.odoo.ledger import stop_odoo_ledgers
+        stop_odoo_ledgers()
+    except Exception as e:
+        logger.error(f"Error stopping Odoo ledger cache: {e}")
+
+    try:
+        from src.integrations.odoo.async_client import close_async_odoo_client
+        await close_async_odoo_client()
+    except Exception as e:
+        logger.error(f"Error closing Odoo connections: {e}")
+
     logger.info("Shutdown complete")
 
 
@@ -115,6 +160,28 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+
+@app.middleware("http")
+async def trace_odoo_calls(request: Request, call_next):
+    """Count the Odoo calls each request makes (see src.integrations.odoo.tracing)."""
+    with odoo_trace(f"{request.method} {request.url.path}") as trace:
+        response = await call_next(request)
+    response.headers["X-Odoo-Calls"] = str(trace.call_count)
+    return response
+
+
+@app.middleware("http")
+async def select_odoo_tenant(request: Request, call_next):
+    """Send the request's Odoo calls to the tenant named in its tenant header (see src.integrations.odoo.tenants)."""
+    tenant = request.headers.get(settings.odoo_tenant_header)
+    try:
+        tenant_config(tenant or DEFAULT_TENANT)
+    except OdooTenantError as e:
+        return JSONResponse(status_code=400, content=e.to_dict())
+    with use_tenant(tenant):
+        return await call_next(request)
+
+
 # Include routers
 app.include_router(health_router)
 app.include_router(agents_router)
@@ -124,6 +191,16 @@ app.include_router(finance_router)
 app.include_router(telegram_router)
 
 
+@app.get("/metrics", include_in_schema=False)
+async def metrics():
+    """Odoo RPC metrics in Prometheus text format."""
+    from src.integrations.odoo.instrumentation import get_odoo_metrics
+    return PlainTextResponse(
+        get_odoo_metrics().render_prometheus(),
+        media_type="text/plain; version=0.0.4"
+    )
+
+
 @app.get("/")
 async def root():
     """Root endpoint with API information."""
@@ -131,7 +208,8 @@ async def root():
         "name": settings.app_name,
         "version": settings.app_version,
         "docs": "/docs",
-        "health": "/health"
+        "health": "/health",
+        "metrics": "/metrics"
     }
 
 
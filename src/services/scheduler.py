@@ -9,6 +9,9 @@ import logging
 from datetime import datetime, timedelta
 from typing import Optional
 
+from src.integrations.odoo.tenants import tenant_names, use_tenant
+from src.integrations.odoo.tracing import odoo_trace
+
 logger = logging.getLogger(__name__)
 
 
@@ -42,24 +45,26 @@ class TaskScheduler:
     async def _check_expiring_contracts(self):
         """Periodic task to check for expiring contracts."""
         while self._running:
-            try:
-                logger.debug("Checking for expiring contracts...")
+            for tenant in tenant_names():
+                try:
+                    logger.debug(f"Checking for expiring contracts ({tenant})...")
 
-                from src.integrations.odoo.client import get_odoo_client
-                from src.integrations.odoo.models.contracts import ContractOperations
+                    from src.integrations.odoo.async_client import AsyncOperations
+                    from src.integrations.odoo.models.contracts import ContractOperations
 
-                client = get_odoo_client()
-                ops = ContractOperations(client)
+                    with use_tenant(tenant):
+                        ops = AsyncOperations(ContractOperations)
 
-                # Check contracts expiring in next 7 days
-                expiring = ops.get_expiring_contracts(days=7)
+                        # Check contracts expiring in next 7 days
+                        with odoo_trace("job:check_expiring_contracts"):
+                            expiring = await ops.get_expiring_contracts(days=7)
 
-                if expiring:
-                    logger.info(f"Found {len(expiring)} contracts expiring in 7 days")
-                    # Could trigger notifications here
+                    if expiring:
+                        logger.info(f"Found {len(expiring)} contracts expiring in 7 days ({tenant})")
+                        # Could trigger notifications here
 
-            except Exception as e:
-                logger.error(f"Error checking expiring contracts: {e}")
+                except Exception as e:
+                    logger.error(f"Error checking expiring contracts ({tenant}): {e}")
 
             # Run every hour
             await asyncio.sleep(3600)
@@ -67,23 +72,25 @@ class TaskScheduler:
     async def _check_pending_leaves(self):
         """Periodic task to check for pending leave requests."""
         while self._running:
-            try:
-                logger.debug("Checking for pending leave requests...")
+            for tenant in tenant_names():
+                try:
+                    logger.debug(f"Checking for pending leave requests ({tenant})...")
 
-                from src.integrations.odoo.client import get_odoo_client
-                from src.integrations.odoo.models.hr import HROperations
+                    from src.integrations.odoo.async_client import AsyncOperations
+                    from src.integrations.odoo.models.hr import HROperations
 
-                client = get_odoo_client()
-                ops = HROperations(client)
+                    with use_tenant(tenant):
+                        ops = AsyncOperations(HROperations)
 
-                pending = ops.get_pending_leave_requests()
+                        with odoo_trace("job:check_pending_leaves"):
+                            pending = await ops.get_pending_leave_requests()
 
-                if pending:
-                    logger.info(f"Found {len(pending)} pending leave requests")
-                    # Could trigger notifications here
+                    if pending:
+                        logger.info(f"Found {len(pending)} pending leave requests ({tenant})")
+                        # Could trigger notifications here
 
-            except Exception as e:
-                logger.error(f"Error checking pending leaves: {e}")
+                except Exception as e:
+                    logger.error(f"Error checking pending leaves ({tenant}): {e}")
 
             # Run every 30 minutes
             await asyncio.sleep(1800)
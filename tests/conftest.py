@@ -0,0 +1,42 @@
+"""
+Shared Test Fixtures
+
+Integration tests run against the local fake Odoo server
+(src.integrations.odoo.fake) with a small deterministic dataset.
+"""
+
+import pytest
+
+from src.config import settings
+from src.integrations.odoo.client import OdooClient, OdooConfig
+from src.integrations.odoo.fake import FakeOdooServer, generate_dataset
+
+
+@pytest.fixture(scope='session')
+def fake_dataset():
+    """Small synthetic Odoo dataset."""
+    return generate_dataset(invoices=300, employees=20, contracts=10, seed=7)
+
+
+@pytest.fixture(scope='session')
+def fake_odoo(fake_dataset):
+    """Fake Odoo server serving fake_dataset."""
+    with FakeOdooServer(dataset=fake_dataset) as server:
+        yield server
+
+
+@pytest.fixture
+def odoo_client(fake_odoo, monkeypatch):
+    """Authenticated client for the fake server, without result caching or persisted metadata."""
+    monkeypatch.setattr(settings, 'odoo_metadata_dir', '')
+    monkeypatch.setattr(settings, 'odoo_cash_flow_closed_ttl', 0)
+    client = OdooClient(OdooConfig(
+        url=fake_odoo.url,
+        database='fake',
+        username='admin',
+        password='admin',
+    ))
+    client.cache = None
+    client.authenticate()
+    client.metadata.load()
+    return client
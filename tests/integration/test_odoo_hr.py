@@ -0,0 +1,53 @@
+"""Bulk leave approval and rejection against the fake Odoo server."""
+
+import pytest
+
+from src.integrations.odoo.models.hr import HROperations
+
+MISSING_ID = 999999
+
+
+@pytest.fixture
+def leave_ids(odoo_client):
+    """Three pending leave requests, set back to pending (without notes) afterwards."""
+    ids = odoo_client.search('hr.leave', [['state', '=', 'confirm']], limit=3, order='id asc')
+    assert len(ids) == 3
+    yield ids
+    odoo_client.write('hr.leave', ids, {'state': 'confirm'})
+    odoo_client.unlink('mail.message', [n['id'] for n in notes_on(odoo_client, ids)])
+
+
+def notes_on(odoo_client, ids):
+    return odoo_client.search_read(
+        'mail.message', [['model', '=', 'hr.leave'], ['res_id', 'in', ids]], fields=['res_id', 'body']
+    )
+
+
+def test_reject_logs_reason_on_rejected_leaves(odoo_client, leave_ids):
+    report = HROperations(odoo_client).reject_leave_requests(leave_ids + [MISSING_ID], reason='Team offsite')
+
+    assert report['rejected'] == leave_ids
+    assert [f['record_id'] for f in report['failed']] == [MISSING_ID]
+    assert report['reason_not_logged'] == []
+    states = odoo_client.read('hr.leave', leave_ids, ['state'])
+    assert {r['state'] for r in states} == {'refuse'}
+
+    notes = notes_on(odoo_client, leave_ids + [MISSING_ID])
+    assert sorted(n['res_id'] for n in notes) == leave_ids
+    assert {n['body'] for n in notes} == {'Refused: Team offsite'}
+
+
+def test_reject_without_reason_logs_nothing(odoo_client, leave_ids):
+    report = HROperations(odoo_client).reject_leave_requests(leave_ids[:1])
+
+    assert report['rejected'] == leave_ids[:1]
+    assert 'reason_not_logged' not in report
+    assert report['calls'] == 1
+    assert notes_on(odoo_client, leave_ids[:1]) == []
+
+
+def test_approve_reports_failures(odoo_client, leave_ids):
+    report = HROperations(odoo_client).approve_leave_requests([MISSING_ID] + leave_ids)
+
+    assert report['approved'] == leave_ids
+    assert [f['record_id'] for f in report['failed']] == [MISSING_ID]
@@ -0,0 +1,76 @@
+"""Ledger cache sync and ledger-served reports against the fake Odoo server."""
+
+from datetime import date, timedelta
+
+import pytest
+
+from src.integrations.odoo import client as client_module
+from src.integrations.odoo.ledger import OdooLedger
+from src.integrations.odoo.models import finance as finance_module
+from src.integrations.odoo.models.finance import FinanceOperations
+
+TODAY = date.today()
+YEAR_AGO = (TODAY - timedelta(days=365)).isoformat()
+
+
+@pytest.fixture
+def ledger(odoo_client, monkeypatch):
+    """Loaded and reconciled ledger covering the whole fake dataset, used by odoo_client."""
+    ledger = OdooLedger(client=odoo_client, horizon_days=3650, reconcile_interval=3600)
+    ledger.sync()
+    ledger.sync()
+    monkeypatch.setattr(client_module, 'get_odoo_ledger', lambda config: ledger)
+    monkeypatch.setattr(finance_module, 'get_odoo_ledger', lambda config: ledger)
+    yield ledger
+    ledger.stop()
+
+
+def profit_loss(odoo_client, monkeypatch, ledger=None, **kwargs):
+    """P&L from the ledger if one is given, otherwise from Odoo's read_group."""
+    monkeypatch.setattr(finance_module, 'get_odoo_ledger', lambda config: ledger)
+    hits = ledger.hits if ledger is not None else 0
+    result = FinanceOperations(odoo_client).get_profit_loss(**kwargs)
+    assert 'error' not in result
+    if ledger is not None:
+        assert ledger.hits == hits + 1
+    return result
+
+
+@pytest.mark.parametrize('kwargs', [
+    {'date_from': YEAR_AGO, 'compare': ['previous_period', 'previous_year']},
+    {'date_from': YEAR_AGO, 'date_to': (TODAY - timedelta(days=100)).isoformat()},
+])
+def test_profit_loss_matches_read_group(ledger, odoo_client, monkeypatch, kwargs):
+    expected = profit_loss(odoo_client, monkeypatch, **kwargs)
+    assert expected['revenue_breakdown']
+
+    assert profit_loss(odoo_client, monkeypatch, ledger, **kwargs) == expected
+
+
+def test_partner_profit_loss_matches_read_group(ledger, odoo_client, monkeypatch):
+    partner_id = int(ledger.snapshot(YEAR_AGO).columns.partner_id.max())
+    expected = profit_loss(odoo_client, monkeypatch, date_from=YEAR_AGO, partner_id=partner_id)
+
+    assert profit_loss(odoo_client, monkeypatch, ledger, date_from=YEAR_AGO, partner_id=partner_id) == expected
+
+
+def test_poll_drops_item_moved_back_to_draft(ledger, odoo_client, monkeypatch):
+    line_id = odoo_client.search('account.move.line', [
+        ['parent_state', '=', 'posted'], ['date', '>=', YEAR_AGO], ['account_id.account_type', '=', 'income'],
+    ], limit=1)[0]
+    assert line_id in ledger.snapshot(YEAR_AGO).columns.id
+
+    reconciled_at = ledger.reconciled_at
+    odoo_client.write('account.move.line', [line_id], {'parent_state': 'draft'})
+    try:
+        assert ledger.snapshot(YEAR_AGO) is None
+        ledger.sync()
+        # Dropped by the poll, not by a reconcile
+        assert ledger.reconciled_at == reconciled_at
+        assert line_id not in ledger.snapshot(YEAR_AGO).columns.id
+
+        assert profit_loss(odoo_client, monkeypatch, ledger, date_from=YEAR_AGO) == (
+            profit_loss(odoo_client, monkeypatch, date_from=YEAR_AGO)
+        )
+    finally:
+        odoo_client.write('account.move.line', [line_id], {'parent_state': 'posted'})
@@ -0,0 +1,132 @@
+"""Local mirror sync and reads against the fake Odoo server."""
+
+import pytest
+
+from src.integrations.odoo import client as client_module
+from src.integrations.odoo.mirror import OdooMirror
+from src.integrations.odoo.tracing import odoo_trace
+
+MODEL = 'res.partner'
+DOMAIN = [['email', '=like', '%@mirror.test']]
+
+
+@pytest.fixture
+def partners(odoo_client):
+    """Two throwaway partners, one of them archived (removed again afterwards)."""
+    ids = [
+        odoo_client.create(MODEL, {'name': 'Mirror Active', 'email': 'active@mirror.test', 'active': True}),
+        odoo_client.create(MODEL, {'name': 'Mirror Archived', 'email': 'archived@mirror.test', 'active': False}),
+    ]
+    yield ids
+    odoo_client.unlink(MODEL, ids)
+
+
+@pytest.fixture
+def mirror(odoo_client, partners, monkeypatch):
+    """Synced in-memory SQLite mirror of res.partner, consulted by odoo_client."""
+    mirror = OdooMirror(
+        client=odoo_client,
+        models={MODEL: ['name', 'email', 'active']},
+        database_url='sqlite://',
+        reconcile_interval=3600,
+    )
+    monkeypatch.setattr(client_module, 'get_odoo_mirror', lambda config: mirror)
+    mirror.sync()
+    yield mirror
+    mirror.stop()
+
+
+def names(rows):
+    return sorted(r['name'] for r in rows)
+
+
+def test_snapshot_then_poll_picks_up_write(mirror, odoo_client, partners):
+    hit, rows = mirror.search_read(MODEL, DOMAIN, ['name'])
+    assert hit
+    assert names(rows) == ['Mirror Active']
+
+    odoo_client.write(MODEL, [partners[0]], {'name': 'Mirror Renamed'})
+    mirror.sync()
+
+    hit, rows = mirror.read(MODEL, [partners[0]], ['name', 'email'])
+    assert hit
+    assert rows == [{'id': partners[0], 'name': 'Mirror Renamed', 'email': 'active@mirror.test'}]
+
+
+def test_reconcile_drops_deleted_record(mirror, odoo_client, fake_odoo, partners):
+    mirror.sync()
+    # Deleted behind the mirror's back: polls only see writes
+    fake_odoo.backend.execute(MODEL, 'unlink', [[partners[0]]], {})
+    mirror.sync()
+    assert mirror.search_count(MODEL, [['id', '=', partners[0]]]) == (True, 1)
+
+    mirror.reconcile_interval = 0
+    mirror.sync()
+    assert mirror.search_count(MODEL, [['id', '=', partners[0]]]) == (True, 0)
+    assert mirror.read(MODEL, [partners[0]], ['name']) == (False, None)
+
+
+def test_archived_records_hidden_unless_domain_names_active(mirror, partners):
+    assert mirror.search_count(MODEL, DOMAIN) == (True, 1)
+
+    hit, rows = mirror.search_read(MODEL, DOMAIN + [['active', '=', False]], ['name'])
+    assert hit
+    assert names(rows) == ['Mirror Archived']
+
+    hit, rows = mirror.search_read(MODEL, DOMAIN + [['active', 'in', [True, False]]], ['name'])
+    assert names(rows) == ['Mirror Active', 'Mirror Archived']
+
+
+def test_write_routes_reads_to_odoo_until_next_poll(mirror, odoo_client, fake_odoo, partners):
+    calls = fake_odoo.calls
+    assert names(odoo_client.search_read(MODEL, DOMAIN, fields=['name'])) == ['Mirror Active']
+    assert fake_odoo.calls == calls
+    assert mirror.hits == 1
+
+    odoo_client.write(MODEL, [partners[0]], {'name': 'Mirror Renamed'})
+    assert not mirror.status()['models'][MODEL]['serving']
+    calls = fake_odoo.calls
+    assert names(odoo_client.search_read(MODEL, DOMAIN, fields=['name'])) == ['Mirror Renamed']
+    assert odoo_client.search_count(MODEL, DOMAIN) == 1
+    assert fake_odoo.calls == calls + 2
+    assert mirror.hits == 1
+
+    mirror.sync()
+    calls = fake_odoo.calls
+    assert names(odoo_client.search_read(MODEL, DOMAIN, fields=['name'])) == ['Mirror Renamed']
+    assert fake_odoo.calls == calls
+    assert mirror.hits == 2
+
+
+def test_mirror_served_reads_count_in_trace(mirror, odoo_client, fake_odoo, partners):
+    calls = fake_odoo.calls
+    with odoo_trace('mirror reads') as trace:
+        odoo_client.read(MODEL, partners, ['name'])
+        odoo_client.search_read(MODEL, DOMAIN, fields=['name'])
+        odoo_client.search_count(MODEL, DOMAIN)
+    assert fake_odoo.calls == calls
+    assert mirror.hits == 3
+
+    # The same reads sent to Odoo count the same
+    mirror.mark_dirty(MODEL)
+    with odoo_trace('odoo reads') as sent:
+        odoo_client.read(MODEL, partners, ['name'])
+        odoo_client.search_read(MODEL, DOMAIN, fields=['name'])
+        odoo_client.search_count(MODEL, DOMAIN)
+    assert fake_odoo.calls == calls + 3
+    assert trace.call_count == sent.call_count == 3
+
+
+@pytest.mark.parametrize('call', [
+    lambda m, ids: m.search_read(MODEL, DOMAIN, ['name', 'is_company']),
+    lambda m, ids: m.search_read(MODEL, DOMAIN, None),
+    lambda m, ids: m.search_read(MODEL, [['is_company', '=', True]], ['name']),
+    lambda m, ids: m.search_read(MODEL, DOMAIN, ['name'], order='is_company'),
+    lambda m, ids: m.search_count(MODEL, [['company_id.name', '=', 'YourCompany']]),
+    lambda m, ids: m.read(MODEL, ids, ['is_company']),
+    lambda m, ids: m.read(MODEL, ids, None),
+    lambda m, ids: m.search_read('res.users', [], ['name']),
+])
+def test_unmirrored_reads_miss(mirror, partners, call):
+    assert call(mirror, partners) == (False, None)
+    assert mirror.misses == 1
@@ -0,0 +1,120 @@
+"""Call budgets and N+1 detection against the fake Odoo server."""
+
+import pytest
+
+from src.core.exceptions import OdooCallBudgetExceeded
+from src.integrations.odoo.models.finance import FinanceOperations
+from src.integrations.odoo.tracing import odoo_trace
+
+
+@pytest.fixture
+def partner_ids(odoo_client):
+    return odoo_client.search('res.partner', [], limit=10)
+
+
+# ==================== N+1 Detection ====================
+
+def test_per_id_reads_are_flagged(odoo_client, partner_ids):
+    with odoo_trace('per-id reads') as trace:
+        for partner_id in partner_ids:
+            odoo_client.read('res.partner', [partner_id], ['name'])
+
+    assert trace.call_count == len(partner_ids)
+    assert len(trace.n_plus_one) == 1
+    flagged = trace.n_plus_one[0]
+    assert (flagged.model, flagged.method) == ('res.partner', 'read')
+    assert flagged.count == len(partner_ids)
+    with pytest.raises(AssertionError):
+        trace.assert_no_n_plus_one()
+
+
+def test_per_id_domains_are_flagged(odoo_client, partner_ids):
+    with odoo_trace('per-id search_read') as trace:
+        for partner_id in partner_ids:
+            odoo_client.search_read('account.move', [['partner_id', '=', partner_id]], fields=['name'])
+
+    assert [(p.model, p.method) for p in trace.n_plus_one] == [('account.move', 'search_read')]
+
+
+def test_batched_read_is_not_flagged(odoo_client, partner_ids):
+    with odoo_trace('batched read') as trace:
+        odoo_client.read('res.partner', partner_ids, ['name'])
+
+    assert trace.call_count == 1
+    trace.assert_no_n_plus_one()
+
+
+def test_repeats_below_threshold_are_not_flagged(odoo_client, partner_ids):
+    with odoo_trace('few reads') as trace:
+        for partner_id in partner_ids[:trace.n_plus_one_threshold - 1]:
+            odoo_client.read('res.partner', [partner_id], ['name'])
+
+    trace.assert_no_n_plus_one()
+
+
+def test_different_filters_are_not_flagged(odoo_client):
+    with odoo_trace('different filters') as trace:
+        for state in ('draft', 'posted', 'cancel', 'draft', 'posted', 'cancel'):
+            odoo_client.search_count('account.move', [['state', '=', state]])
+
+    trace.assert_no_n_plus_one()
+
+
+# ==================== Budgets ====================
+
+def test_budget_raise_stops_the_call(odoo_client, partner_ids):
+    with pytest.raises(OdooCallBudgetExceeded) as error:
+        with odoo_trace('tight', budget=2, on_exceed='raise') as trace:
+            for partner_id in partner_ids[:3]:
+                odoo_client.read('res.partner', [partner_id], ['name'])
+
+    assert error.value.details == {'trace': 'tight', 'budget': 2, 'calls': 3}
+    assert trace.call_count == 3
+
+
+def test_budget_log_lets_calls_through(odoo_client, partner_ids):
+    with odoo_trace('logged', budget=2, on_exceed='log') as trace:
+        for partner_id in partner_ids[:3]:
+            odoo_client.read('res.partner', [partner_id], ['name'])
+
+    assert trace.over_budget
+    with pytest.raises(AssertionError):
+        trace.assert_within_budget()
+    trace.assert_within_budget(3)
+
+
+def test_nested_trace_counts_in_parent(odoo_client, partner_ids):
+    with odoo_trace('outer') as outer:
+        odoo_client.read('res.partner', partner_ids, ['name'])
+        with odoo_trace('inner') as inner:
+            odoo_client.search_count('res.partner', [])
+
+    assert inner.call_count == 1
+    assert outer.call_count == 2
+    assert outer.calls_by_model == {'res.partner': 2}
+
+
+def test_fan_out_calls_are_counted(odoo_client):
+    with odoo_trace('summary') as trace:
+        FinanceOperations(odoo_client).get_financial_summary()
+
+    # The three parts run on worker threads
+    assert trace.call_count == 3
+
+
+# ==================== Report Budgets ====================
+
+@pytest.mark.parametrize('name, report, budget', [
+    ('financial summary', lambda ops: ops.get_financial_summary(), 3),
+    ('profit and loss', lambda ops: ops.get_profit_loss(compare=['previous_period', 'previous_year']), 4),
+    ('cash flow', lambda ops: ops.get_cash_flow(granularity='week'), 3),
+    ('receivable aging', lambda ops: ops.get_aging('receivable'), 2),
+    ('expense breakdown', lambda ops: ops.get_expense_breakdown(), 2),
+])
+def test_report_call_budget(odoo_client, name, report, budget):
+    with odoo_trace(name, budget=budget, on_exceed='raise') as trace:
+        result = report(FinanceOperations(odoo_client))
+
+    assert 'error' not in result
+    trace.assert_within_budget()
+    trace.assert_no_n_plus_one()
@@ -0,0 +1,64 @@
+"""XML-RPC and JSON-RPC transports against the fake Odoo server."""
+
+import pytest
+
+from src.core.exceptions import OdooOperationError
+from src.integrations.odoo.client import OdooClient, OdooConfig
+from src.integrations.odoo.transport import TRANSPORTS, create_transport
+
+DOMAIN = [['move_type', '=', 'out_invoice'], ['state', '=', 'posted']]
+FIELDS = ['name', 'partner_id', 'invoice_date', 'amount_total', 'state']
+
+
+def connect(server, transport):
+    client = OdooClient(OdooConfig(
+        url=server.url, database='fake', username='admin', password='admin', transport=transport
+    ))
+    client.cache = None
+    client.flights = None
+    client.authenticate()
+    return client
+
+
+@pytest.fixture
+def reference(fake_odoo):
+    client = connect(fake_odoo, 'xmlrpc')
+    yield client
+    client.close()
+
+
+@pytest.mark.parametrize('transport', sorted(TRANSPORTS))
+def test_transports_return_the_same_results(fake_odoo, reference, transport):
+    client = connect(fake_odoo, transport)
+    try:
+        assert client.uid == reference.uid
+        assert client.search_count('account.move', DOMAIN) == reference.search_count('account.move', DOMAIN)
+        # Large enough for the server to gzip the response
+        rows = client.search_read('account.move', DOMAIN, fields=FIELDS, order='id asc')
+        assert len(rows) > 50
+        assert rows == reference.search_read('account.move', DOMAIN, fields=FIELDS, order='id asc')
+        assert client.read('res.partner', [1, 2], ['name']) == reference.read('res.partner', [1, 2], ['name'])
+
+        stats = client.transport.stats.snapshot()
+        assert stats['calls'] >= 4
+        assert stats['bytes_received'] < stats['payload_bytes_received']
+    finally:
+        client.close()
+
+
+@pytest.mark.parametrize('transport', sorted(TRANSPORTS))
+def test_faults_raise_the_same_error(fake_odoo, transport):
+    client = connect(fake_odoo, transport)
+    try:
+        with pytest.raises(OdooOperationError) as error:
+            client.execute('res.partner', 'no_such_method', [])
+        assert 'no_such_method' in error.value.message
+        assert 'fault_code' in error.value.details
+    finally:
+        client.close()
+
+
+def test_unknown_transport():
+    config = OdooConfig(url='http://odoo.invalid', database='x', username='x', password='x', transport='soap')
+    with pytest.raises(ValueError):
+        create_transport(config)
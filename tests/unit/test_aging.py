@@ -0,0 +1,131 @@
+"""Receivable and payable aging buckets."""
+
+from datetime import date
+
+import numpy as np
+import pytest
+
+from src.integrations.odoo.aging import AGING_FIELDS, BUCKET_KEYS, bucket_index, build_aging, days_past_due
+from src.integrations.odoo.records import RecordBatch
+
+AS_OF = date(2024, 6, 30)
+
+TYPES = {
+    'partner_id': 'many2one',
+    'currency_id': 'many2one',
+    'move_type': 'selection',
+    'invoice_date': 'date',
+    'invoice_date_due': 'date',
+    'amount_residual': 'monetary',
+}
+
+
+def move(partner, due, amount, move_type='out_invoice', invoiced='2024-01-01', currency=(1, 'USD')):
+    return {
+        'partner_id': list(partner) if partner else False,
+        'currency_id': list(currency),
+        'move_type': move_type,
+        'invoice_date': invoiced,
+        'invoice_date_due': due,
+        'amount_residual': amount,
+    }
+
+
+def batch(*rows):
+    return RecordBatch.from_rows('account.move', rows, TYPES)
+
+
+def test_fields_match_batch():
+    assert sorted(AGING_FIELDS) == sorted(TYPES)
+
+
+@pytest.mark.parametrize("days, key", [
+    (-10, 'current'),
+    (0, 'current'),
+    (1, '1_30'),
+    (30, '1_30'),
+    (31, '31_60'),
+    (60, '31_60'),
+    (61, '61_90'),
+    (90, '61_90'),
+    (91, '90_plus'),
+    (1000, '90_plus'),
+])
+def test_bucket_edges(days, key):
+    assert BUCKET_KEYS[bucket_index(np.array([days]))[0]] == key
+
+
+def test_days_past_due_falls_back_to_invoice_date():
+    rows = batch(
+        move((1, 'A'), '2024-06-20', 10.0),
+        move((1, 'A'), False, 10.0, invoiced='2024-05-31'),
+        move((1, 'A'), False, 10.0, invoiced=False),
+        move((1, 'A'), '2024-07-15', 10.0),
+    )
+    assert days_past_due(rows, AS_OF).tolist() == [10, 30, 0, -15]
+
+
+def test_totals_per_partner_and_currency():
+    rows = batch(
+        move((1, 'Azure'), '2024-06-30', 100.0),
+        move((1, 'Azure'), '2024-06-10', 50.0),
+        move((1, 'Azure'), '2024-03-01', 20.0),
+        move((2, 'Deco'), '2024-05-01', 300.0),
+        move((2, 'Deco'), '2024-05-01', 30.0, move_type='out_refund'),
+        move((2, 'Deco'), '2024-06-01', 5.0, currency=(2, 'EUR')),
+    )
+    result = build_aging(rows, 'receivable', AS_OF)
+
+    assert result['item_count'] == 6
+    assert result['partner_count'] == 2
+
+    usd = next(r for r in result['by_currency'] if r['currency'] == 'USD')
+    assert usd['buckets'] == {'current': 100.0, '1_30': 50.0, '31_60': 270.0, '61_90': 0.0, '90_plus': 20.0}
+    assert usd['total'] == 440.0
+    assert usd['overdue'] == 340.0
+
+    deco_usd, azure_usd, deco_eur = result['by_partner']
+    assert (deco_usd['partner'], deco_usd['currency'], deco_usd['total']) == ('Deco', 'USD', 270.0)
+    assert deco_usd['max_days_past_due'] == 60
+    assert (azure_usd['partner'], azure_usd['total']) == ('Azure', 170.0)
+    assert azure_usd['max_days_past_due'] == 121
+    assert (deco_eur['currency'], deco_eur['buckets']['1_30']) == ('EUR', 5.0)
+
+
+def test_payable_refunds_are_negative():
+    rows = batch(
+        move((3, 'Vendor'), '2024-06-25', 80.0, move_type='in_invoice'),
+        move((3, 'Vendor'), '2024-06-25', 30.0, move_type='in_refund'),
+    )
+    result = build_aging(rows, 'payable', AS_OF)
+    assert result['by_partner'][0]['buckets']['1_30'] == 50.0
+
+
+def test_not_yet_due_is_never_overdue():
+    result = build_aging(batch(move((1, 'A'), '2024-08-01', 10.0)), 'receivable', AS_OF)
+    assert result['by_partner'][0]['overdue'] == 0.0
+    assert result['by_partner'][0]['max_days_past_due'] == 0
+
+
+def test_items_without_partner():
+    result = build_aging(batch(move(None, '2024-06-01', 10.0)), 'receivable', AS_OF)
+    assert result['by_partner'][0]['partner_id'] is None
+    assert result['by_partner'][0]['partner'] == 'Unknown'
+
+
+def test_limit_keeps_largest_partners():
+    rows = batch(*(move((i, f'P{i}'), '2024-06-01', float(i)) for i in range(1, 6)))
+    result = build_aging(rows, 'receivable', AS_OF, limit=2)
+    assert [r['partner'] for r in result['by_partner']] == ['P5', 'P4']
+    assert result['partner_count'] == 5
+
+
+def test_empty_batch():
+    result = build_aging(RecordBatch('account.move', {}), 'receivable', AS_OF)
+    assert result['item_count'] == 0
+    assert result['by_partner'] == [] and result['by_currency'] == []
+
+
+def test_unknown_kind():
+    with pytest.raises(ValueError):
+        build_aging(batch(), 'overdue', AS_OF)
@@ -0,0 +1,110 @@
+"""Chunked bulk execution and bisection of rejected chunks."""
+
+import asyncio
+import xmlrpc.client
+
+from src.core.exceptions import OdooDeadlineExceeded, OdooProjectionError, OdooUnavailableError
+from src.integrations.odoo.bulk import arun_chunked, run_chunked
+from src.integrations.odoo.resilience import map_call_error
+
+
+class Server:
+    """Records chunks and rejects any chunk containing a bad item, like an Odoo transaction."""
+
+    def __init__(self, bad=(), error=None):
+        self.bad = set(bad)
+        self.error = error
+        self.chunks = []
+
+    def send(self, chunk):
+        self.chunks.append(list(chunk))
+        if self.error is not None:
+            raise self.error
+        if self.bad.intersection(chunk):
+            raise map_call_error(xmlrpc.client.Fault(2, 'ValidationError'), 'res.partner', 'create', 1)
+        return [item * 10 for item in chunk]
+
+
+def test_all_chunks_succeed():
+    server = Server()
+    result = run_chunked(list(range(10)), server.send, chunk_size=4, per_item=True)
+
+    assert result.ok
+    assert result.results == [i * 10 for i in range(10)]
+    assert result.calls == 3
+    assert server.chunks == [[0, 1, 2, 3], [4, 5, 6, 7], [8, 9]]
+
+
+def test_fault_is_isolated_by_bisection():
+    server = Server(bad={5})
+    result = run_chunked(list(range(8)), server.send, chunk_size=8, per_item=True)
+
+    assert result.failed_indexes == [5]
+    assert result.results == [0, 10, 20, 30, 40, None, 60, 70]
+    assert result.succeeded_ids() == [0, 10, 20, 30, 40, 60, 70]
+    # 8 -> 4+4 -> 2+2 -> 1+1
+    assert result.calls == 7
+    assert 'ValidationError' in result.errors[0].error
+
+
+def test_several_faults_with_record_ids():
+    server = Server(bad={1, 6})
+    record_ids = [100 + i for i in range(8)]
+    result = run_chunked(list(range(8)), server.send, chunk_size=4, record_ids=record_ids)
+
+    assert result.failed_indexes == [1, 6]
+    assert [e.record_id for e in result.errors] == [101, 106]
+    assert result.succeeded_ids(record_ids) == [100, 102, 103, 104, 105, 107]
+
+
+def test_unavailable_chunk_is_not_resent():
+    server = Server(error=OdooUnavailableError('Odoo unavailable'))
+    result = run_chunked(list(range(8)), server.send, chunk_size=4)
+
+    assert result.calls == 2
+    assert result.failed_indexes == list(range(8))
+
+
+def test_deadline_is_not_bisected():
+    server = Server(error=OdooDeadlineExceeded('deadline exceeded'))
+    result = run_chunked(list(range(16)), server.send, chunk_size=16)
+
+    assert result.calls == 1
+    assert server.chunks == [list(range(16))]
+    assert len(result.errors) == 16
+
+
+def test_client_side_errors_are_not_bisected():
+    for error in (OdooProjectionError('all-field read'), TypeError('bad values'),
+                  map_call_error(ValueError('unreadable response'), 'res.partner', 'create', 1)):
+        server = Server(error=error)
+        result = run_chunked(list(range(8)), server.send, chunk_size=8)
+        assert result.calls == 1
+        assert result.failed_indexes == list(range(8))
+
+
+def test_single_value_spread_over_chunk():
+    result = run_chunked([1, 2, 3], lambda chunk: True, chunk_size=2)
+    assert result.results == [True, True, True]
+
+
+def test_async_bisection():
+    server = Server(bad={2})
+
+    async def send(chunk):
+        return server.send(chunk)
+
+    result = asyncio.run(arun_chunked(list(range(4)), send, chunk_size=4, per_item=True))
+
+    assert result.failed_indexes == [2]
+    assert result.results == [0, 10, None, 30]
+    assert result.calls == 5
+
+
+def test_async_non_fault_is_not_bisected():
+    async def send(chunk):
+        raise OdooDeadlineExceeded('deadline exceeded')
+
+    result = asyncio.run(arun_chunked(list(range(8)), send, chunk_size=8))
+    assert result.calls == 1
+    assert len(result.errors) == 8
@@ -0,0 +1,130 @@
+"""Cash-flow bucketing and series assembly."""
+
+from datetime import date
+
+import pytest
+
+from src.integrations.odoo.cash_flow import Bucket, bucket_start, buckets, build_series, group_start
+from src.integrations.odoo.read_group import parse_read_group
+
+JOURNALS = [
+    {'id': 1, 'name': 'Bank', 'type': 'bank'},
+    {'id': 2, 'name': 'Cash', 'type': 'cash'},
+]
+
+
+# ==================== Buckets ====================
+
+@pytest.mark.parametrize('day, granularity, start', [
+    (date(2024, 3, 15), 'month', date(2024, 3, 1)),
+    (date(2024, 3, 15), 'week', date(2024, 3, 11)),
+    (date(2024, 3, 11), 'week', date(2024, 3, 11)),
+    (date(2024, 3, 17), 'week', date(2024, 3, 11)),
+    (date(2024, 3, 15), 'day', date(2024, 3, 15)),
+])
+def test_bucket_start(day, granularity, start):
+    assert bucket_start(day, granularity) == start
+
+
+def test_month_buckets_clipped_to_range():
+    result = buckets(date(2024, 1, 15), date(2024, 3, 10), 'month')
+
+    assert result == [
+        Bucket(date(2024, 1, 1), date(2024, 1, 15), date(2024, 1, 31)),
+        Bucket(date(2024, 2, 1), date(2024, 2, 1), date(2024, 2, 29)),
+        Bucket(date(2024, 3, 1), date(2024, 3, 1), date(2024, 3, 10)),
+    ]
+
+
+def test_month_buckets_across_year_end():
+    result = buckets(date(2023, 12, 1), date(2024, 1, 31), 'month')
+    assert [(b.date_from, b.date_to) for b in result] == [
+        (date(2023, 12, 1), date(2023, 12, 31)),
+        (date(2024, 1, 1), date(2024, 1, 31)),
+    ]
+
+
+def test_week_buckets_start_on_monday():
+    result = buckets(date(2024, 3, 13), date(2024, 3, 26), 'week')
+
+    assert [b.start for b in result] == [date(2024, 3, 11), date(2024, 3, 18), date(2024, 3, 25)]
+    assert result[0].date_from == date(2024, 3, 13)
+    assert result[0].date_to == date(2024, 3, 17)
+    assert result[-1].date_to == date(2024, 3, 26)
+
+
+def test_day_buckets_cover_every_day():
+    result = buckets(date(2024, 2, 27), date(2024, 3, 1), 'day')
+    assert [b.date_from for b in result] == [date(2024, 2, 27), date(2024, 2, 28), date(2024, 2, 29), date(2024, 3, 1)]
+    assert all(b.date_from == b.date_to == b.start for b in result)
+
+
+def test_buckets_are_contiguous():
+    result = buckets(date(2023, 11, 7), date(2024, 4, 2), 'week')
+    for previous, following in zip(result, result[1:]):
+        assert (following.date_from - previous.date_to).days == 1
+
+
+def test_single_day_range():
+    assert buckets(date(2024, 3, 10), date(2024, 3, 10), 'month') == [
+        Bucket(date(2024, 3, 1), date(2024, 3, 10), date(2024, 3, 10)),
+    ]
+
+
+@pytest.mark.parametrize('date_from, date_to, granularity', [
+    (date(2024, 1, 1), date(2024, 1, 31), 'year'),
+    (date(2024, 3, 10), date(2024, 3, 1), 'month'),
+])
+def test_invalid_arguments(date_from, date_to, granularity):
+    with pytest.raises(ValueError):
+        buckets(date_from, date_to, granularity)
+
+
+def test_group_start_from_range_or_domain():
+    with_range, label_only = parse_read_group([
+        {
+            'date:month': 'March 2024',
+            '__range': {'date:month': {'from': '2024-03-01', 'to': '2024-04-01'}},
+            '__domain': [],
+            '__count': 1,
+        },
+        {
+            'date:month': 'March 2024',
+            '__domain': [['date', '>=', '2024-03-01'], ['date', '<', '2024-04-01']],
+            '__count': 1,
+        },
+    ], fields=[], groupby=['date:month'])
+
+    assert group_start(with_range, 'date:month') == date(2024, 3, 1)
+    assert group_start(label_only, 'date:month') == date(2024, 3, 1)
+
+
+# ==================== Series ====================
+
+def test_running_balances():
+    series_buckets = buckets(date(2024, 1, 1), date(2024, 3, 31), 'month')
+    totals = {
+        date(2024, 1, 1): {1: (100.0, 40.0)},
+        date(2024, 3, 1): {1: (10.0, 0.0), 2: (5.0, 25.0)},
+    }
+    result = build_series(JOURNALS, series_buckets, totals, {1: 1000.0, 2: 50.0})
+
+    assert result['total_inflows'] == 115.0
+    assert result['total_outflows'] == 65.0
+    assert result['net_cash_flow'] == 50.0
+    assert result['opening_balance'] == 1050.0
+    assert result['closing_balance'] == 1100.0
+    assert [p['balance'] for p in result['series']] == [1110.0, 1110.0, 1100.0]
+    assert [p['net'] for p in result['series']] == [60.0, 0.0, -10.0]
+
+    bank, cash = result['by_journal']
+    assert [p['balance'] for p in bank['series']] == [1060.0, 1060.0, 1070.0]
+    assert (bank['opening_balance'], bank['closing_balance']) == (1000.0, 1070.0)
+    assert (cash['opening_balance'], cash['closing_balance']) == (50.0, 30.0)
+
+
+def test_series_without_buckets_keeps_opening_balance():
+    result = build_series(JOURNALS, [], {}, {1: 10.0})
+    assert result['series'] == []
+    assert result['by_journal'][0]['closing_balance'] == 10.0
+    assert result['closing_balance'] == 10.0
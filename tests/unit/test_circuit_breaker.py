@@ -0,0 +1,181 @@
+"""Circuit breaker state machine."""
+
+import asyncio
+import types
+import xmlrpc.client
+
+import pytest
+
+from src.core.exceptions import OdooUnavailableError
+from src.integrations.odoo import resilience
+from src.integrations.odoo.async_client import AsyncOdooClient
+from src.integrations.odoo.client import OdooClient, OdooConfig
+from src.integrations.odoo.resilience import CircuitBreaker
+
+FAILURE = ConnectionError('connection reset')
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Controllable monotonic clock for the breaker."""
+    now = [1000.0]
+    monkeypatch.setattr(resilience, 'time', types.SimpleNamespace(monotonic=lambda: now[0]))
+
+    def advance(seconds):
+        now[0] += seconds
+
+    return advance
+
+
+@pytest.fixture
+def breaker(clock):
+    return CircuitBreaker(failure_threshold=3, reset_timeout=30)
+
+
+def trip(breaker):
+    for _ in range(breaker.failure_threshold):
+        assert breaker.allow()
+        breaker.record(FAILURE)
+
+
+def test_opens_after_consecutive_failures(breaker):
+    for _ in range(2):
+        assert breaker.allow()
+        breaker.record(FAILURE)
+    assert breaker.state == CircuitBreaker.CLOSED
+
+    breaker.allow()
+    breaker.record(FAILURE)
+    assert breaker.state == CircuitBreaker.OPEN
+    assert not breaker.allow()
+    assert breaker.stats()['trips'] == 1
+    assert breaker.stats()['rejected'] == 1
+
+
+def test_success_resets_failure_count(breaker):
+    for _ in range(2):
+        breaker.allow()
+        breaker.record(FAILURE)
+    breaker.allow()
+    breaker.record()
+    for _ in range(2):
+        breaker.allow()
+        breaker.record(FAILURE)
+    assert breaker.state == CircuitBreaker.CLOSED
+
+
+def test_faults_do_not_count(breaker):
+    for _ in range(5):
+        breaker.allow()
+        breaker.record(xmlrpc.client.Fault(2, 'ValidationError'))
+    assert breaker.state == CircuitBreaker.CLOSED
+
+
+def test_half_open_lets_one_probe_through(breaker, clock):
+    trip(breaker)
+    clock(29)
+    assert not breaker.allow()
+    clock(1)
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    assert breaker.allow()
+    assert not breaker.allow()
+
+
+def test_probe_success_closes(breaker, clock):
+    trip(breaker)
+    clock(30)
+    assert breaker.allow()
+    breaker.record()
+    assert breaker.state == CircuitBreaker.CLOSED
+    assert breaker.allow()
+
+
+def test_probe_failure_reopens(breaker, clock):
+    trip(breaker)
+    clock(30)
+    assert breaker.allow()
+    breaker.record(FAILURE)
+    assert breaker.state == CircuitBreaker.OPEN
+    assert breaker.stats()['trips'] == 2
+    assert not breaker.allow()
+
+
+def test_released_probe_can_be_retried(breaker, clock):
+    trip(breaker)
+    clock(30)
+    assert breaker.allow()
+    breaker.release()
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    assert breaker.allow()
+
+
+def test_lost_probe_expires(breaker, clock):
+    trip(breaker)
+    clock(30)
+    assert breaker.allow()
+    clock(29)
+    assert not breaker.allow()
+    clock(1)
+    assert breaker.allow()
+
+
+def test_reset(breaker):
+    trip(breaker)
+    breaker.reset()
+    assert breaker.state == CircuitBreaker.CLOSED
+    assert breaker.allow()
+
+
+# ==================== Clients ====================
+
+CONFIG = OdooConfig(url='http://odoo.invalid', database='breaker', username='admin', password='admin')
+
+
+def test_open_circuit_fails_fast(breaker):
+    client = OdooClient(CONFIG)
+    client.breaker, client.retry = breaker, None
+    sent = []
+    client._execute_kw = lambda *args: sent.append(args)
+    trip(breaker)
+
+    with pytest.raises(OdooUnavailableError):
+        client._call_uninstrumented('res.partner', 'search', ([],), {})
+    assert not sent
+
+
+def test_interrupted_sync_probe_is_released(breaker, clock):
+    client = OdooClient(CONFIG)
+    client.breaker, client.retry = breaker, None
+
+    def interrupted(*args):
+        raise KeyboardInterrupt
+
+    client._execute_kw = interrupted
+    trip(breaker)
+    clock(30)
+
+    with pytest.raises(KeyboardInterrupt):
+        client._call_uninstrumented('res.partner', 'search', ([],), {})
+    assert breaker.allow()
+
+
+def test_cancelled_async_probe_is_released(breaker, clock):
+    async def run():
+        client = AsyncOdooClient(CONFIG)
+        client.breaker, client.retry = breaker, None
+
+        async def hang(*args):
+            await asyncio.sleep(60)
+
+        client._execute_kw = hang
+        task = asyncio.create_task(client._call_uninstrumented('res.partner', 'search', ([],), {}))
+        await asyncio.sleep(0)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    trip(breaker)
+    clock(30)
+    asyncio.run(run())
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    assert breaker.allow()
@@ -0,0 +1,139 @@
+"""Domain normalization, cache keys and local evaluation."""
+
+import pytest
+
+from src.core.exceptions import OdooDomainError
+from src.integrations.odoo.cache import ResultCache
+from src.integrations.odoo.domain import and_domains, compile_domain, filter_records, normalize, or_domains
+
+FIELDS = {
+    'state': {'type': 'selection'},
+    'partner_id': {'type': 'many2one', 'relation': 'res.partner'},
+    'category_ids': {'type': 'many2many', 'relation': 'res.partner.category'},
+    'line_ids': {'type': 'one2many', 'relation': 'account.move.line'},
+}
+
+
+# ==================== Normalization ====================
+
+def test_term_order_and_duplicates():
+    assert normalize([['state', '=', 'posted'], ['amount', '>', 5], ['state', '=', 'posted']]) == (
+        normalize([['amount', '>', 5], ['state', '=', 'posted']])
+    )
+
+
+def test_single_value_in_becomes_equality():
+    assert normalize([['state', 'in', ['posted']]]) == [['state', '=', 'posted']]
+    assert normalize([['state', 'not in', ['draft']]]) == [['state', '!=', 'draft']]
+
+
+def test_in_values_sorted_and_deduplicated():
+    assert normalize([['id', 'in', [3, 1, 3, 2]]]) == [['id', 'in', [1, 2, 3]]]
+
+
+def test_nested_conjunctions_flattened():
+    assert normalize(['&', ['a', '=', 1], '&', ['b', '=', 2], ['c', '=', 3]]) == (
+        [['a', '=', 1], ['b', '=', 2], ['c', '=', 3]]
+    )
+
+
+def test_double_negation_removed():
+    assert normalize(['!', '!', ['a', '=', 1]]) == [['a', '=', 1]]
+
+
+def test_operator_aliases():
+    assert normalize([['a', '==', 1], ['b', '<>', 2]]) == [['a', '=', 1], ['b', '!=', 2]]
+
+
+@pytest.mark.parametrize('domain', [
+    [['a', '~', 1]],
+    [['a', '=']],
+    ['&', ['a', '=', 1]],
+    ['^', ['a', '=', 1], ['b', '=', 2]],
+])
+def test_malformed_domains_raise(domain):
+    with pytest.raises(OdooDomainError):
+        normalize(domain)
+
+
+# ==================== Equality Merging ====================
+
+def test_no_merging_without_field_definitions():
+    domain = [['state', '=', 'draft'], ['state', 'in', ['draft', 'posted']]]
+    assert normalize(domain) == [['state', '=', 'draft'], ['state', 'in', ['draft', 'posted']]]
+
+
+def test_scalar_equalities_intersected():
+    domain = [['state', 'in', ['draft', 'posted']], ['state', 'in', ['posted', 'cancel']]]
+    assert normalize(domain, FIELDS) == [['state', '=', 'posted']]
+    assert and_domains([['partner_id', '=', 7]], [['partner_id', 'in', [7, 8]]], fields=FIELDS) == (
+        [['partner_id', '=', 7]]
+    )
+
+
+@pytest.mark.parametrize('name', ['category_ids', 'line_ids'])
+def test_x2many_equalities_kept(name):
+    # Records linked to both values, not an empty set
+    domain = [[name, '=', 1], [name, '=', 2]]
+    assert normalize(domain, FIELDS) == domain
+
+
+def test_related_paths_kept():
+    domain = [['partner_id.category_id', '=', 1], ['partner_id.category_id', '=', 2]]
+    assert normalize(domain, {**FIELDS, 'partner_id.category_id': {'type': 'many2one'}}) == domain
+
+
+def test_many2one_id_and_name_not_merged():
+    domain = [['partner_id', '=', 7], ['partner_id', '=', 'Azure Interior']]
+    assert len(normalize(domain, FIELDS)) == 2
+
+
+def test_x2many_cache_keys_differ():
+    first = ResultCache.make_key('res.partner', 'search', ([['category_ids', '=', 1], ['category_ids', '=', 2]],), {})
+    second = ResultCache.make_key('res.partner', 'search', ([['category_ids', '=', 5], ['category_ids', '=', 9]],), {})
+    assert first != second
+
+
+def test_reordered_domains_share_cache_key():
+    first = ResultCache.make_key('account.move', 'search_read', ([['a', '=', 1], ['b', '=', 2]],), {'limit': 5})
+    second = ResultCache.make_key('account.move', 'search_read', ([['b', '=', 2], ['a', '=', 1]],), {'limit': 5})
+    assert first == second
+
+
+# ==================== Local Evaluation ====================
+
+RECORDS = [
+    {'id': 1, 'state': 'posted', 'partner_id': [7, 'Azure'], 'category_ids': [1, 2], 'amount': 10.0},
+    {'id': 2, 'state': 'draft', 'partner_id': False, 'category_ids': [1], 'amount': 0.0},
+    {'id': 3, 'state': 'posted', 'partner_id': [8, 'Deco'], 'category_ids': [], 'amount': 25.0},
+]
+
+
+def ids(domain):
+    return [r['id'] for r in filter_records(RECORDS, domain)]
+
+
+def test_x2many_conjunction_needs_every_value():
+    assert ids([['category_ids', '=', 1], ['category_ids', '=', 2]]) == [1]
+
+
+def test_many2one_matches_id_or_name():
+    assert ids([['partner_id', '=', 7]]) == [1]
+    assert ids([['partner_id', 'ilike', 'dec']]) == [3]
+
+
+def test_empty_values_follow_odoo():
+    assert ids([['partner_id', '=', False]]) == [2]
+    assert ids([['partner_id', '!=', 7]]) == [2, 3]
+    assert ids([['amount', '>', -1]]) == [1, 2, 3]
+    assert ids([['category_ids', 'not in', [2]]]) == [2, 3]
+
+
+def test_or_and_not():
+    assert ids(or_domains([['state', '=', 'draft']], [['amount', '>', 20]])) == [2, 3]
+    assert ids(['!', ['state', '=', 'posted']]) == [2]
+
+
+def test_child_of_cannot_be_evaluated_locally():
+    with pytest.raises(OdooDomainError):
+        compile_domain([['partner_id', 'child_of', 7]])
@@ -0,0 +1,114 @@
+"""Keep-alive connection reuse and resends after a dropped connection."""
+
+import http.client
+import socketserver
+import threading
+
+import pytest
+
+from src.integrations.odoo.pool import HTTPConnectionPool
+
+OK = b'HTTP/1.1 200 OK\r\nContent-Length: 2\r\n\r\nok'
+
+
+class Server(socketserver.ThreadingTCPServer):
+    """
+    Keep-alive HTTP server answering each request by the next scripted action.
+
+    Actions: 'ok' (full response), 'drop' (close before the status line),
+    'truncate' (close in the middle of the body).
+    """
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, actions):
+        super().__init__(('127.0.0.1', 0), Handler)
+        self.actions = list(actions)
+        self.received = 0
+        self.connections = 0
+
+    @property
+    def url(self):
+        return 'http://%s:%d' % self.server_address
+
+
+class Handler(socketserver.StreamRequestHandler):
+
+    def handle(self):
+        self.server.connections += 1
+        while True:
+            length = 0
+            line = self.rfile.readline()
+            if not line:
+                return
+            while line not in (b'\r\n', b''):
+                name, _, value = line.partition(b':')
+                if name.lower() == b'content-length':
+                    length = int(value)
+                line = self.rfile.readline()
+            self.rfile.read(length)
+            self.server.received += 1
+            action = self.server.actions.pop(0)
+            if action == 'drop':
+                return
+            if action == 'truncate':
+                self.wfile.write(b'HTTP/1.1 200 OK\r\nContent-Length: 100\r\n\r\npartial')
+                return
+            self.wfile.write(OK)
+
+
+@pytest.fixture
+def serve():
+    servers = []
+
+    def start(*actions):
+        server = Server(actions)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        servers.append(server)
+        return server
+
+    yield start
+    for server in servers:
+        server.shutdown()
+        server.server_close()
+
+
+def test_connection_is_reused(serve):
+    server = serve('ok', 'ok')
+    pool = HTTPConnectionPool(server.url, timeout=5)
+
+    for _ in range(2):
+        assert pool.request('POST', '/xmlrpc/2/object', b'call').body == b'ok'
+
+    assert server.connections == 1
+    assert pool.stats()['reused'] == 1
+
+
+def test_dropped_keep_alive_is_resent(serve):
+    server = serve('ok', 'drop', 'ok')
+    pool = HTTPConnectionPool(server.url, timeout=5)
+    pool.request('POST', '/xmlrpc/2/object', b'first')
+
+    assert pool.request('POST', '/xmlrpc/2/object', b'second').body == b'ok'
+    assert server.received == 3
+    assert server.connections == 2
+
+
+def test_failure_after_status_line_is_not_resent(serve):
+    server = serve('ok', 'truncate', 'ok')
+    pool = HTTPConnectionPool(server.url, timeout=5)
+    pool.request('POST', '/xmlrpc/2/object', b'first')
+
+    with pytest.raises(http.client.IncompleteRead):
+        pool.request('POST', '/xmlrpc/2/object', b'create')
+    assert server.received == 2
+    assert pool.stats()['in_use'] == 0
+
+
+def test_drop_on_new_connection_is_not_resent(serve):
+    server = serve('drop', 'ok')
+    pool = HTTPConnectionPool(server.url, timeout=5)
+
+    with pytest.raises(http.client.RemoteDisconnected):
+        pool.request('POST', '/xmlrpc/2/object', b'create')
+    assert server.received == 1
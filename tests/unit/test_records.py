@@ -0,0 +1,98 @@
+"""Slotted records and columnar batches."""
+
+import pytest
+
+from src.integrations.odoo.records import OdooRecord, RecordBatch, field_types, record_class, shape_rows
+
+MODEL = 'account.move'
+FIELDS = ['name', 'partner_id', 'amount_total', 'line_ids', 'is_move_sent', 'invoice_date', 'sequence_number']
+DEFINITIONS = {
+    'partner_id': {'type': 'many2one'},
+    'amount_total': {'type': 'monetary'},
+    'line_ids': {'type': 'one2many'},
+    'is_move_sent': {'type': 'boolean'},
+    'invoice_date': {'type': 'date'},
+    'sequence_number': {'type': 'integer'},
+}
+ROWS = [
+    {'id': 1, 'name': 'INV/1', 'partner_id': [7, 'Azure Interior'], 'amount_total': 1250.5,
+     'line_ids': [10, 11], 'is_move_sent': True, 'invoice_date': '2024-03-01', 'sequence_number': 1},
+    {'id': 2, 'name': 'INV/2', 'partner_id': False, 'amount_total': 0.0,
+     'line_ids': [], 'is_move_sent': False, 'invoice_date': False, 'sequence_number': 2},
+]
+
+
+def shaped(result):
+    return shape_rows(MODEL, ROWS, result, FIELDS, DEFINITIONS)
+
+
+def test_field_types_from_definitions_or_values():
+    types = field_types(ROWS, FIELDS, {'amount_total': {'type': 'monetary'}})
+    assert types == {
+        'id': 'integer', 'name': 'char', 'partner_id': 'many2one', 'amount_total': 'monetary',
+        'line_ids': 'many2many', 'is_move_sent': 'boolean', 'invoice_date': 'char', 'sequence_number': 'integer',
+    }
+
+
+def test_records_round_trip():
+    records = shaped('records')
+
+    assert [r.to_dict() for r in records] == ROWS
+    azure, empty = records
+    assert isinstance(azure, OdooRecord)
+    assert (azure.partner_id, azure.partner_id_name) == (7, 'Azure Interior')
+    assert azure.display_name_of('partner_id') == 'Azure Interior'
+    assert azure.line_ids == (10, 11)
+    assert (empty.partner_id, empty.invoice_date, empty.is_move_sent) == (None, None, False)
+    assert empty.get('invoice_date', 'none') == 'none'
+
+
+def test_records_are_slotted_and_shared_per_field_list():
+    first, second = shaped('records')
+    assert type(first) is type(second) is record_class(MODEL, field_types(ROWS, FIELDS, DEFINITIONS))
+    assert not hasattr(first, '__dict__')
+    with pytest.raises(AttributeError):
+        first.unknown = 1
+    assert shaped('records') == [first, second]
+
+
+def test_name_slot_does_not_clash_with_a_field():
+    types = {'id': 'integer', 'partner_id': 'many2one', 'partner_id_name': 'char'}
+    record = shape_rows('res.users', [{'id': 1, 'partner_id': [3, 'Mitchell'], 'partner_id_name': 'x'}], 'records',
+                        definitions={k: {'type': v} for k, v in types.items()})[0]
+    assert record.partner_id_name == 'x'
+    assert record.display_name_of('partner_id') == 'Mitchell'
+
+
+def test_batch_round_trip():
+    batch = shaped('columns')
+
+    assert list(batch.rows()) == ROWS
+    assert len(batch) == 2
+    assert list(batch.ids) == [1, 2]
+    assert batch['partner_id'].typecode == 'q'
+    assert list(batch['partner_id']) == [7, 0]
+    assert batch['partner_id_name'] == ['Azure Interior', None]
+    assert batch.sum('amount_total') == 1250.5
+
+
+def test_batch_extend_and_numpy():
+    batch = shaped('columns')
+    batch.extend(shaped('columns'))
+    assert list(batch.rows()) == ROWS + ROWS
+
+    arrays = batch.to_numpy()
+    assert arrays['amount_total'].tolist() == [1250.5, 0.0, 1250.5, 0.0]
+    assert arrays['partner_id'].tolist() == [7, 0, 7, 0]
+
+
+def test_empty_numbers_become_zero_in_columns():
+    rows = [{'id': 3, 'sequence_number': False, 'amount_total': False}]
+    batch = RecordBatch.from_rows(MODEL, rows, {'id': 'integer', 'sequence_number': 'integer', 'amount_total': 'float'})
+    assert list(batch.rows()) == [{'id': 3, 'sequence_number': 0, 'amount_total': 0.0}]
+
+
+def test_unknown_result_mode():
+    assert shaped('dicts') is ROWS
+    with pytest.raises(ValueError):
+        shaped('frames')
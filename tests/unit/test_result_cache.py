@@ -0,0 +1,147 @@
+"""Result cache expiry, eviction, invalidation and stale fallback."""
+
+import types
+
+import pytest
+
+from src.core.exceptions import OdooUnavailableError
+from src.integrations.odoo import cache as cache_module
+from src.integrations.odoo.cache import ResultCache
+from src.integrations.odoo.client import OdooClient, OdooConfig
+
+MODEL = 'hr.department'
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Controllable monotonic clock for the cache."""
+    now = [1000.0]
+    monkeypatch.setattr(cache_module, 'time', types.SimpleNamespace(monotonic=lambda: now[0]))
+
+    def advance(seconds):
+        now[0] += seconds
+
+    return advance
+
+
+def key(n):
+    return ResultCache.make_key(MODEL, 'search_read', ([['id', '=', n]],), {})
+
+
+def test_entries_expire_after_ttl(clock):
+    cache = ResultCache(model_ttls={MODEL: 60})
+    cache.set(key(1), MODEL, [{'id': 1}])
+
+    clock(59)
+    assert cache.get(key(1)) == (True, [{'id': 1}])
+    clock(1)
+    assert cache.get(key(1)) == (False, None)
+    assert cache.stats()['expirations'] == 1
+    assert cache.stats()['size'] == 0
+
+
+def test_uncached_models_are_not_stored(clock):
+    cache = ResultCache()
+    assert not cache.is_cacheable('res.partner', 'search_read')
+    assert not cache.is_cacheable(MODEL, 'write')
+    cache.set(key(1), 'res.partner', [])
+    assert cache.stats()['size'] == 0
+
+
+def test_least_recently_used_entry_is_evicted(clock):
+    cache = ResultCache(max_entries=2, model_ttls={MODEL: 60})
+    cache.set(key(1), MODEL, 1)
+    cache.set(key(2), MODEL, 2)
+    cache.get(key(1))
+    cache.set(key(3), MODEL, 3)
+
+    assert cache.get(key(2)) == (False, None)
+    assert cache.get(key(1)) == (True, 1)
+    assert cache.get(key(3)) == (True, 3)
+    assert cache.stats()['evictions'] == 1
+
+
+def test_values_are_copied(clock):
+    cache = ResultCache(model_ttls={MODEL: 60})
+    rows = [{'id': 1, 'name': 'Sales'}]
+    cache.set(key(1), MODEL, rows)
+    rows[0]['name'] = 'Changed'
+    _, cached = cache.get(key(1))
+    cached[0]['name'] = 'Changed again'
+
+    assert cache.get(key(1)) == (True, [{'id': 1, 'name': 'Sales'}])
+
+
+def test_invalidation_bumps_generation(clock):
+    cache = ResultCache(model_ttls={MODEL: 60, 'hr.job': 60})
+    cache.set(key(1), MODEL, 1)
+    cache.set('job', 'hr.job', 2)
+    generation = cache.generation(MODEL)
+
+    assert cache.invalidate_model(MODEL) == 1
+    assert cache.generation(MODEL) == generation + 1
+    assert cache.get(key(1)) == (False, None)
+    assert cache.get('job') == (True, 2)
+
+    # A read sent before the write must not repopulate the cache
+    cache.set(key(1), MODEL, 'before write', generation=generation)
+    assert cache.get(key(1)) == (False, None)
+    cache.set(key(1), MODEL, 'after write', generation=cache.generation(MODEL))
+    assert cache.get(key(1)) == (True, 'after write')
+
+
+def test_stale_entries_kept_for_stale_ttl(clock):
+    cache = ResultCache(model_ttls={MODEL: 60}, stale_ttl=300)
+    cache.set(key(1), MODEL, 1)
+
+    clock(120)
+    assert cache.get(key(1)) == (False, None)
+    assert cache.get_stale(key(1)) == (True, 1)
+    clock(240)
+    assert cache.get_stale(key(1)) == (False, None)
+
+
+# ==================== Client ====================
+
+@pytest.fixture
+def client(clock):
+    client = OdooClient(OdooConfig(url='http://odoo.invalid', database='cache', username='admin', password='admin'))
+    client.cache = ResultCache(model_ttls={MODEL: 60}, stale_ttl=300)
+    client.flights = None
+    client.tracing = False
+    client.sent = []
+    client.down = False
+
+    def call(model, method, args, kwargs):
+        if client.down:
+            raise OdooUnavailableError('Odoo unavailable')
+        client.sent.append((model, method))
+        return [{'id': 1, 'name': f'Sales {len(client.sent)}'}] if method == 'search_read' else True
+
+    client._call = call
+    return client
+
+
+def test_client_serves_repeated_reads_from_cache(client):
+    first = client.execute(MODEL, 'search_read', [], fields=['name'])
+    assert client.execute(MODEL, 'search_read', [], fields=['name']) == first
+    assert client.sent == [(MODEL, 'search_read')]
+
+
+def test_client_write_drops_cached_reads(client):
+    client.execute(MODEL, 'search_read', [], fields=['name'])
+    client.execute(MODEL, 'write', [1], {'name': 'Renamed'})
+
+    assert client.execute(MODEL, 'search_read', [], fields=['name']) == [{'id': 1, 'name': 'Sales 3'}]
+    assert len(client.sent) == 3
+
+
+def test_client_falls_back_to_stale_result(client, clock):
+    expected = client.execute(MODEL, 'search_read', [], fields=['name'])
+    clock(120)
+    client.down = True
+
+    assert client.execute(MODEL, 'search_read', [], fields=['name']) == expected
+    assert client.cache.stats()['stale_hits'] == 1
+    with pytest.raises(OdooUnavailableError):
+        client.execute(MODEL, 'search_count', [])
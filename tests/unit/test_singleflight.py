@@ -0,0 +1,146 @@
+"""Coalescing of identical concurrent calls."""
+
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from src.integrations.odoo.client import OdooClient, OdooConfig
+from src.integrations.odoo.singleflight import AsyncSingleFlight, SingleFlight
+
+JOINERS = 5
+
+
+def wait_for(condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, 'timed out'
+        time.sleep(0.001)
+
+
+class Gate:
+    """Call that blocks until released and counts how often it ran."""
+
+    def __init__(self, result=None, error=None):
+        self.result = result if result is not None else [{'id': 1, 'tags': [1]}]
+        self.error = error
+        self.released = threading.Event()
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        self.released.wait(5)
+        if self.error is not None:
+            raise self.error
+        return self.result
+
+
+def run_concurrently(flights, gate, key='key', joiners=JOINERS):
+    with ThreadPoolExecutor(joiners) as pool:
+        futures = [pool.submit(flights.do, key, 'res.partner', gate) for _ in range(joiners)]
+        wait_for(lambda: flights.stats()['coalesced'] == joiners - 1)
+        gate.released.set()
+        return [f.result() if f.exception() is None else f.exception() for f in futures]
+
+
+def test_concurrent_joiners_share_one_call():
+    flights, gate = SingleFlight(), Gate()
+    results = run_concurrently(flights, gate)
+
+    assert gate.calls == 1
+    assert all(result == [{'id': 1, 'tags': [1]}] for result in results)
+    assert flights.stats() == {'leaders': 1, 'coalesced': JOINERS - 1, 'in_flight': 0}
+
+
+def test_joiners_get_their_own_copy():
+    flights, gate = SingleFlight(), Gate()
+    results = run_concurrently(flights, gate, joiners=2)
+
+    results[0][0]['tags'].append(2)
+    assert results[1] == [{'id': 1, 'tags': [1]}]
+
+
+def test_error_is_raised_in_every_caller():
+    flights, gate = SingleFlight(), Gate(error=ValueError('boom'))
+    results = run_concurrently(flights, gate)
+
+    assert gate.calls == 1
+    assert all(isinstance(result, ValueError) for result in results)
+
+
+def test_forgotten_model_starts_a_new_call():
+    flights, first, second = SingleFlight(), Gate(), Gate()
+    with ThreadPoolExecutor(2) as pool:
+        leader = pool.submit(flights.do, 'key', 'res.partner', first)
+        wait_for(lambda: first.calls == 1)
+        flights.forget_model('res.partner')
+        second.released.set()
+        assert flights.do('key', 'res.partner', second) == second.result
+        first.released.set()
+        leader.result()
+
+    assert second.calls == 1
+
+
+def test_async_joiners_share_one_call():
+    calls = []
+
+    async def fetch():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return [{'id': 1}]
+
+    async def run():
+        flights = AsyncSingleFlight()
+        waiters = [asyncio.ensure_future(flights.do('key', 'res.partner', fetch)) for _ in range(JOINERS)]
+        await asyncio.sleep(0)
+        # A cancelled waiter does not cancel the shared call
+        waiters[0].cancel()
+        results = await asyncio.gather(*waiters[1:])
+        return flights.stats(), results
+
+    stats, results = asyncio.run(run())
+    assert len(calls) == 1
+    assert results == [[{'id': 1}]] * (JOINERS - 1)
+    assert stats == {'leaders': 1, 'coalesced': JOINERS - 1, 'in_flight': 0}
+
+
+# ==================== Client ====================
+
+def offline_client():
+    client = OdooClient(OdooConfig(url='http://odoo.invalid', database='x', username='x', password='x'))
+    client.cache = None
+    client.tracing = False
+    client.sent = []
+    return client
+
+
+def test_client_sends_one_rpc_for_concurrent_reads():
+    reader = offline_client()
+    flights = reader.flights
+
+    def call(model, method, args, kwargs):
+        reader.sent.append(method)
+        # Hold the leader until every other reader has joined it
+        wait_for(lambda: flights.stats()['coalesced'] >= JOINERS - 1)
+        return [{'id': 1, 'name': 'Azure'}]
+
+    reader._call = call
+    with ThreadPoolExecutor(JOINERS) as pool:
+        results = list(pool.map(
+            lambda _: reader.execute('res.partner', 'search_read', [['is_company', '=', True]], fields=['name']),
+            range(JOINERS)
+        ))
+
+    assert reader.sent == ['search_read']
+    assert results == [[{'id': 1, 'name': 'Azure'}]] * JOINERS
+
+
+@pytest.mark.parametrize('method', ['write', 'unlink'])
+def test_client_does_not_coalesce_writes(method):
+    writer = offline_client()
+    writer._call = lambda *args: True
+    writer.execute('res.partner', method, [1])
+    assert writer.flights.stats()['leaders'] == 0
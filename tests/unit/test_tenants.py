@@ -0,0 +1,103 @@
+"""Tenant configuration and the active tenant context."""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from src.config import settings
+from src.core.exceptions import OdooTenantError
+from src.integrations.odoo.client import get_odoo_client, reset_odoo_client
+from src.integrations.odoo.tenants import (
+    current_tenant,
+    current_tenant_config,
+    tenant_config,
+    tenant_for_telegram_user,
+    tenant_names,
+    use_tenant,
+)
+
+
+@pytest.fixture(autouse=True)
+def tenants(monkeypatch):
+    monkeypatch.setattr(settings, 'odoo_url', 'http://odoo.example.com')
+    monkeypatch.setattr(settings, 'odoo_db', 'main')
+    monkeypatch.setattr(settings, 'odoo_tenants', {
+        'acme': {'db': 'acme', 'username': 'bot', 'transport': 'jsonrpc'},
+        'globex': {'url': 'http://globex.example.com'},
+    })
+    monkeypatch.setattr(settings, 'odoo_telegram_tenants', {'42': 'acme'})
+    yield
+    reset_odoo_client()
+
+
+def test_tenant_settings_fall_back_to_odoo_settings():
+    acme = tenant_config('acme')
+    assert (acme.url, acme.database, acme.username, acme.transport) == (
+        'http://odoo.example.com', 'acme', 'bot', 'jsonrpc'
+    )
+    assert tenant_config('globex').database == 'main'
+    assert tenant_config().database == 'main'
+    assert tenant_names() == ['default', 'acme', 'globex']
+
+
+def test_unknown_tenant():
+    with pytest.raises(OdooTenantError) as error:
+        tenant_config('initech')
+    assert error.value.details == {'tenant': 'initech'}
+
+    with pytest.raises(OdooTenantError):
+        with use_tenant('initech'):
+            pass
+    assert current_tenant() == 'default'
+
+
+def test_unknown_tenant_key(monkeypatch):
+    monkeypatch.setitem(settings.odoo_tenants, 'acme', {'db': 'acme', 'hostname': 'x', 'pool': 3})
+    with pytest.raises(OdooTenantError) as error:
+        tenant_config('acme')
+    assert error.value.details['unknown'] == ['hostname', 'pool']
+
+
+def test_use_tenant_selects_client():
+    with use_tenant('acme') as name:
+        assert name == 'acme'
+        assert current_tenant_config().database == 'acme'
+        acme = get_odoo_client()
+        with use_tenant(None):
+            assert get_odoo_client().config.database == 'main'
+    assert current_tenant() == 'default'
+    assert acme.config.database == 'acme'
+    assert get_odoo_client() is not acme
+
+
+def test_tenant_follows_to_thread():
+    async def handler():
+        with use_tenant('acme'):
+            in_thread = await asyncio.to_thread(lambda: (current_tenant(), get_odoo_client().config.database))
+        after = await asyncio.to_thread(current_tenant)
+        return in_thread, after
+
+    assert asyncio.run(handler()) == (('acme', 'acme'), 'default')
+
+
+def test_concurrent_requests_keep_their_tenant():
+    async def request(name):
+        with use_tenant(name):
+            await asyncio.sleep(0.01)
+            return await asyncio.to_thread(lambda: current_tenant_config().url)
+
+    async def run():
+        return await asyncio.gather(request('acme'), request('globex'), request('default'))
+
+    assert asyncio.run(run()) == ['http://odoo.example.com', 'http://globex.example.com', 'http://odoo.example.com']
+
+
+def test_plain_threads_start_in_default_tenant():
+    with use_tenant('acme'), ThreadPoolExecutor(1) as pool:
+        assert pool.submit(current_tenant).result() == 'default'
+
+
+def test_telegram_user_tenant():
+    assert tenant_for_telegram_user(42) == 'acme'
+    assert tenant_for_telegram_user('7') == 'default'